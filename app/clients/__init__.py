@@ -1,11 +1,13 @@
 from app.clients.base import BaseHTTPClient, CircuitBreakerOpen, HTTPClientError, TransportError
 from app.clients.lyrics import LRCLibClient
 from app.clients.ollama import OllamaClient, OllamaResponseError
+from app.clients.pool import ConnectionPools
 from app.clients.translate import TranslateClient, Translation, TranslationError
 
 __all__ = (
     'BaseHTTPClient',
     'CircuitBreakerOpen',
+    'ConnectionPools',
     'HTTPClientError',
     'LRCLibClient',
     'OllamaClient',
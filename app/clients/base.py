@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import weakref
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import aiohttp
 import discord
 import yarl
 
+from app.clients.cache import CacheControl, CachedResponse, ResponseCache, payload_size, request_key
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import AsyncIterator, Mapping
 
 log = logging.getLogger(__name__)
 
@@ -17,6 +22,7 @@ __all__ = (
     'BaseHTTPClient',
     'CircuitBreakerOpen',
     'HTTPClientError',
+    'RequestStats',
     'StaleResult',
 )
 
@@ -81,6 +87,26 @@ class StaleResult:
         return f"<StaleResult age={self.age_seconds:.0f}s>"
 
 
+@dataclass(slots=True)
+class RequestStats:
+    """Requests a client has in flight or queued behind its concurrency cap, and how long they waited."""
+
+    in_flight: int = 0
+    waiting: int = 0
+    requests: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.requests += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+    @property
+    def wait_avg(self) -> float:
+        return self.wait_total / self.requests if self.requests else 0.0
+
+
 class BaseHTTPClient:
     """Shared async HTTP client with rate-limit handling, retries, and a circuit breaker.
 
@@ -96,6 +122,12 @@ class BaseHTTPClient:
       :class:`CircuitBreakerOpen`, protecting the event loop from a dead upstream.
     * **Standardized errors** — non-2xx responses raise :class:`HTTPClientError` (a
       :class:`discord.HTTPException`); subclasses refine the message via :meth:`_build_error`.
+    * **Response cache** — requests in :attr:`CACHE_METHODS` go through a bounded
+      :class:`~app.clients.cache.ResponseCache` keyed on the full request. ``Cache-Control``
+      (or :attr:`CACHE_TTL`) decides freshness, ``ETag``/``Last-Modified`` responses are
+      revalidated conditionally, and identical requests in flight share one upstream call.
+    * **Concurrency cap** — at most :attr:`MAX_CONCURRENCY` requests are on the wire at once;
+      the rest queue, and :attr:`stats` records in-flight requests and the time spent waiting.
 
     Subclasses customise behaviour by overriding the hooks: :meth:`_should_retry`,
     :meth:`_retry_after`, and :meth:`_build_error`. Relative ``url`` arguments are joined
@@ -116,13 +148,38 @@ class BaseHTTPClient:
     #: Whether to serve stale cached responses when the circuit breaker is open.
     SERVE_STALE: ClassVar[bool] = True
 
+    #: Methods whose responses are cached and whose identical in-flight requests are coalesced.
+    CACHE_METHODS: ClassVar[frozenset[str]] = frozenset({'GET'})
+    #: Seconds a response without a ``Cache-Control`` max-age is served from the cache.
+    CACHE_TTL: ClassVar[float] = 0.0
+    #: Cached responses kept per client; ``0`` disables the cache (and coalescing).
+    CACHE_MAX_ENTRIES: ClassVar[int] = 256
+    #: Upper bound on the summed size of the cached bodies, in bytes.
+    CACHE_MAX_BYTES: ClassVar[int] = 4 * 1024 * 1024
+
+    #: Requests this client sends at once; ``0`` leaves it to the session's connection pool.
+    MAX_CONCURRENCY: ClassVar[int] = 0
+
+    # Every live client, for the per-client counters in ``/bot/metrics`` and ``bothealth``.
+    _instances: ClassVar[weakref.WeakSet[BaseHTTPClient]] = weakref.WeakSet()
+
     def __init__(self, session: aiohttp.ClientSession, *, name: str | None = None) -> None:
         self.session: aiohttp.ClientSession = session
         self.name: str = name or type(self).__name__
         self.log: logging.Logger = logging.getLogger(f'{__name__}.{self.name}')
         self._consecutive_failures: int = 0
         self._breaker_until: float = 0.0
-        self._response_cache: dict[str, tuple[Any, float]] = {}
+        self.cache: ResponseCache | None = (
+            ResponseCache(max_entries=self.CACHE_MAX_ENTRIES, max_bytes=self.CACHE_MAX_BYTES)
+            if self.CACHE_MAX_ENTRIES > 0
+            else None
+        )
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._slots: asyncio.Semaphore | None = (
+            asyncio.Semaphore(self.MAX_CONCURRENCY) if self.MAX_CONCURRENCY > 0 else None
+        )
+        self.stats: RequestStats = RequestStats()
+        BaseHTTPClient._instances.add(self)
 
     # -- circuit breaker -------------------------------------------------
 
@@ -199,59 +256,169 @@ class BaseHTTPClient:
             data: Any = None,
             json: Any = None,
             headers: Mapping[str, Any] | None = None,
+            cache: bool = True,
             **kwargs: Any,
     ) -> Any:
         """Perform an HTTP request, returning the decoded JSON/text body.
 
-        Applies rate-limit retries, transport-error backoff and the circuit breaker.
-        Raises :class:`CircuitBreakerOpen` if the breaker is open,
-        :class:`HTTPClientError` (or a subclass) for a non-2xx response, or
-        :class:`TransportError` when the upstream stays unreachable after all retries
-        (never a raw :class:`aiohttp.ClientError` — every failure mode is an
-        :class:`HTTPClientError`).
+        Applies the response cache, rate-limit retries, transport-error backoff and the
+        circuit breaker. Raises :class:`CircuitBreakerOpen` if the breaker is open (and no
+        cached copy can be served stale), :class:`HTTPClientError` (or a subclass) for a
+        non-2xx response, or :class:`TransportError` when the upstream stays unreachable
+        after all retries (never a raw :class:`aiohttp.ClientError` — every failure mode
+        is an :class:`HTTPClientError`). ``cache=False`` bypasses the response cache for
+        one request, e.g. for a mutation sent with an otherwise cached method.
         """
-        cache_key = f'{method}:{url}'
+        method = method.upper()
+        full_url = self._build_url(url)
+        request = {'params': params, 'data': data, 'json': json, 'headers': headers, **kwargs}
+
+        if not cache or self.cache is None or method not in self.CACHE_METHODS:
+            if self.breaker_open:
+                raise CircuitBreakerOpen(self.name, self._breaker_until - self._now())
+            payload, _ = await self._send(method, full_url, **request)
+            return payload
+
+        key = request_key(method, str(full_url), params=params, data=data, json_body=json, headers=headers)
+        entry = self.cache.get(key)
+        now = self._now()
+        if entry is not None and entry.fresh(now):
+            self.cache.stats.hits += 1
+            return entry.payload
 
         if self.breaker_open:
-            if self.SERVE_STALE and cache_key in self._response_cache:
-                data_cached, cached_at = self._response_cache[cache_key]
-                age = self._now() - cached_at
+            if self.SERVE_STALE and entry is not None:
+                self.cache.stats.stale += 1
+                age = now - entry.stored_at
                 self.log.info('Serving stale response for %s %s (age=%.0fs)', method, url, age)
-                return StaleResult(data_cached, age)
-            raise CircuitBreakerOpen(self.name, self._breaker_until - self._now())
+                return StaleResult(entry.payload, age)
+            raise CircuitBreakerOpen(self.name, self._breaker_until - now)
 
-        full_url = self._build_url(url)
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                payload = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                continue  # the request that started the load was cancelled; take over
+            self.cache.stats.coalesced += 1
+            return payload
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            payload = await self._fetch_into_cache(key, entry, method, full_url, request)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # waiters re-raise it; don't warn about an unretrieved exception
+            raise
+        else:
+            future.set_result(payload)
+            return payload
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch_into_cache(
+            self,
+            key: str,
+            entry: CachedResponse | None,
+            method: str,
+            full_url: yarl.URL | str,
+            request: dict[str, Any],
+    ) -> Any:
+        """Loads (or conditionally revalidates) a cacheable request and stores the result."""
+        assert self.cache is not None
+        conditional = entry.conditional_headers() if entry is not None else {}
+        if conditional:
+            request = {**request, 'headers': {**(request['headers'] or {}), **conditional}}
+
+        payload, response = await self._send(method, full_url, not_modified_ok=bool(conditional), **request)
+        control = CacheControl.parse(response.headers.get('Cache-Control'))
+        now = self._now()
+        ttl = control.max_age if control.max_age is not None else self.CACHE_TTL
+        expires_at = now if control.no_cache else now + ttl
+
+        if response.status == 304 and entry is not None:
+            self.cache.stats.revalidated += 1
+            entry.stored_at = now
+            entry.expires_at = expires_at
+            return entry.payload
+
+        self.cache.stats.misses += 1
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if control.no_store or not (expires_at > now or etag or last_modified or self.SERVE_STALE):
+            self.cache.pop(key)
+            return payload
+
+        self.cache.put(key, CachedResponse(
+            payload=payload,
+            size=payload_size(payload),
+            stored_at=now,
+            expires_at=expires_at,
+            etag=etag,
+            last_modified=last_modified,
+        ))
+        return payload
+
+    @contextlib.asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Holds one of the :attr:`MAX_CONCURRENCY` slots for a single attempt."""
+        stats = self.stats
+        queued_at = self._now()
+        stats.waiting += 1
+        try:
+            if self._slots is not None:
+                await self._slots.acquire()
+        finally:
+            stats.waiting -= 1
+        stats.record_wait(self._now() - queued_at)
+        stats.in_flight += 1
+        try:
+            yield
+        finally:
+            stats.in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+    async def _send(
+            self,
+            method: str,
+            full_url: yarl.URL | str,
+            *,
+            not_modified_ok: bool = False,
+            **kwargs: Any,
+    ) -> tuple[Any, aiohttp.ClientResponse]:
+        """The retry loop behind :meth:`fetch`: returns the decoded body and the (released) response.
 
+        With ``not_modified_ok`` a ``304 Not Modified`` counts as success, for conditional requests.
+        """
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
-                async with self.session.request(
-                        method, full_url, params=params, data=data, json=json, headers=headers, **kwargs,
-                ) as response:
+                async with self._request_slot(), self.session.request(method, full_url, **kwargs) as response:
                     payload = await self._read(response)
 
-                    if self._should_retry(response, payload):
-                        if attempt >= self.MAX_RETRIES:
-                            self._record_failure()
-                            raise self._build_error(response, payload)
-                        delay = self._retry_after(response, attempt)
-                        self.log.warning(
-                            'Rate limited on %s %s (status=%s); retry %d/%d in %.2fs',
-                            method, full_url, response.status, attempt, self.MAX_RETRIES, delay,
-                        )
-                        await asyncio.sleep(delay)
-                        continue
-
-                    if 200 <= response.status < 300:
-                        self._record_success()
-                        # Only retain a copy when this client actually serves stale
-                        # responses; otherwise the cache is dead weight (never read) and
-                        # would grow unbounded for the lifetime of the client.
-                        if self.SERVE_STALE and method.upper() == 'GET':
-                            self._response_cache[cache_key] = (payload, self._now())
-                        return payload
-
-                    self._record_failure()
-                    raise self._build_error(response, payload)
+                    if not self._should_retry(response, payload):
+                        if 200 <= response.status < 300 or (not_modified_ok and response.status == 304):
+                            self._record_success()
+                            return payload, response
+
+                        self._record_failure()
+                        raise self._build_error(response, payload)
+
+                    if attempt >= self.MAX_RETRIES:
+                        self._record_failure()
+                        raise self._build_error(response, payload)
+                    delay = self._retry_after(response, attempt)
+                    self.log.warning(
+                        'Rate limited on %s %s (status=%s); retry %d/%d in %.2fs',
+                        method, full_url, response.status, attempt, self.MAX_RETRIES, delay,
+                    )
+                # Back off outside the concurrency slot, so other requests can use it meanwhile.
+                await asyncio.sleep(delay)
 
             except aiohttp.ClientError as exc:
                 if attempt >= self.MAX_RETRIES:
@@ -267,3 +434,21 @@ class BaseHTTPClient:
 
         # Unreachable: the loop either returns, raises, or sleeps and continues.
         raise RuntimeError('unreachable: fetch retry loop exited without a result')
+
+    def cache_summary(self) -> dict[str, Any] | None:
+        """Response cache size and hit/miss/stale/coalesced counters, ``None`` if caching is off."""
+        return self.cache.summary() if self.cache is not None else None
+
+    @classmethod
+    def instances(cls) -> list[BaseHTTPClient]:
+        """Every live client, by name."""
+        return sorted(cls._instances, key=lambda client: client.name)
+
+    @classmethod
+    def cache_summaries(cls) -> list[dict[str, Any]]:
+        """:meth:`cache_summary` of every live client with caching enabled, by name."""
+        return [
+            {'client': client.name, **summary}
+            for client in cls.instances()
+            if (summary := client.cache_summary()) is not None
+        ]
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+__all__ = (
+    'CacheControl',
+    'CachedResponse',
+    'ResponseCache',
+    'ResponseCacheStats',
+    'payload_size',
+    'request_key',
+)
+
+_DIRECTIVE = re.compile(r'([\w-]+)(?:=(?:"([^"]*)"|([^,\s]*)))?')
+
+
+def request_key(
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        data: Any = None,
+        json_body: Any = None,
+        headers: Mapping[str, Any] | None = None,
+) -> str:
+    """A stable key for everything that can change a response: method, URL, query, body and headers.
+
+    Headers are part of the key so responses fetched with different credentials never mix.
+    """
+    parts = [method.upper(), url]
+    if params:
+        parts.append(json.dumps(sorted((str(k), str(v)) for k, v in params.items())))
+    if json_body is not None:
+        parts.append(json.dumps(json_body, sort_keys=True, default=str))
+    if data is not None:
+        parts.append(repr(data))
+    if headers:
+        parts.append(json.dumps(sorted((str(k).lower(), str(v)) for k, v in headers.items())))
+    return '\n'.join(parts)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheControl:
+    """The ``Cache-Control`` directives a client-side cache acts on."""
+
+    max_age: float | None = None
+    no_store: bool = False
+    no_cache: bool = False
+
+    @classmethod
+    def parse(cls, header: str | None) -> CacheControl:
+        if not header:
+            return cls()
+        directives = {
+            name.lower(): quoted or bare for name, quoted, bare in _DIRECTIVE.findall(header)
+        }
+        max_age: float | None = None
+        raw = directives.get('s-maxage') or directives.get('max-age')
+        if raw:
+            try:
+                max_age = max(float(raw), 0.0)
+            except ValueError:
+                max_age = None
+        return cls(max_age=max_age, no_store='no-store' in directives, no_cache='no-cache' in directives)
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A decoded response body plus what is needed to reuse or revalidate it."""
+
+    payload: Any
+    size: int
+    stored_at: float
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def fresh(self, now: float) -> bool:
+        return self.expires_at > now
+
+    @property
+    def revalidatable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+@dataclass(slots=True)
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    coalesced: int = 0
+    revalidated: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses + self.revalidated + self.coalesced
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'coalesced': self.coalesced,
+            'revalidated': self.revalidated,
+            'evictions': self.evictions,
+            'hit_ratio': round((self.hits + self.revalidated + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ResponseCache:
+    """LRU of :class:`CachedResponse` bounded by entry count and total payload bytes.
+
+    Expired entries are kept until evicted: they can still be revalidated with their
+    validators or served as a :class:`~app.clients.base.StaleResult` while the breaker is open.
+    """
+
+    def __init__(self, *, max_entries: int = 256, max_bytes: int = 4 * 1024 * 1024) -> None:
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.size: int = 0
+        self.stats: ResponseCacheStats = ResponseCacheStats()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> bool:
+        """Stores ``entry``, evicting the least recently used; returns ``False`` if it can never fit."""
+        if entry.size > self.max_bytes or self.max_entries <= 0:
+            self.pop(key)
+            return False
+        self.pop(key)
+        self._entries[key] = entry
+        self.size += entry.size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+            self.stats.evictions += 1
+        return True
+
+    def pop(self, key: str) -> CachedResponse | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def summary(self) -> dict[str, Any]:
+        return {'entries': len(self._entries), 'bytes': self.size, **self.stats.to_dict()}
+
+
+def payload_size(payload: Any) -> int:
+    """Approximate memory footprint of a decoded body, by its serialised length."""
+    if isinstance(payload, bytes):
+        return len(payload)
+    if isinstance(payload, str):
+        return len(payload.encode())
+    try:
+        return len(json.dumps(payload, separators=(',', ':'), default=str))
+    except (TypeError, ValueError):
+        return len(repr(payload))
@@ -28,9 +28,12 @@ class LRCLibClient(BaseHTTPClient):
     BASE_URL: ClassVar[str] = "https://lrclib.net/"
     # LRCLIB asks clients to identify themselves via User-Agent.
     HEADERS: ClassVar[dict[str, str]] = {"User-Agent": "Percy-Bot (https://klappstuhl.me)"}
-    # Lyrics are keyed per song, so a cached response served for a *different* query would
-    # be wrong (and the shared cache key ignores query params). Never serve stale here.
+    # The live-lyrics view expects a plain record, not a StaleResult. Never serve stale here.
     SERVE_STALE: ClassVar[bool] = False
+    # Published lyrics practically never change; the same song is looked up every time it plays.
+    CACHE_TTL: ClassVar[float] = 6 * 3600.0
+    # Live lyrics for a busy shard shouldn't take over the shared connection pool.
+    MAX_CONCURRENCY: ClassVar[int] = 4
 
     def __init__(self, session: aiohttp.ClientSession) -> None:
         super().__init__(session, name="LRCLib")
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+import yarl
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import SimpleNamespace
+
+__all__ = (
+    'ConnectionPools',
+    'PoolStats',
+)
+
+
+@dataclass(slots=True)
+class PoolStats:
+    """Connection-level counters of one pool, fed by an :class:`aiohttp.TraceConfig`."""
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    queued: int = 0
+    queue_wait_total: float = 0.0
+    queue_wait_max: float = 0.0
+    dns_hits: int = 0
+    dns_misses: int = 0
+
+    def record_queue_wait(self, seconds: float) -> None:
+        self.queued += 1
+        self.queue_wait_total += seconds
+        self.queue_wait_max = max(self.queue_wait_max, seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        connections = self.connections_created + self.connections_reused
+        lookups = self.dns_hits + self.dns_misses
+        return {
+            'requests': self.requests,
+            'connections_created': self.connections_created,
+            'connections_reused': self.connections_reused,
+            'keepalive_reuse_ratio': round(self.connections_reused / connections, 4) if connections else 0.0,
+            'queued': self.queued,
+            'queue_wait_avg_ms': round(self.queue_wait_total / self.queued * 1000, 2) if self.queued else 0.0,
+            'queue_wait_max_ms': round(self.queue_wait_max * 1000, 2),
+            'dns_hits': self.dns_hits,
+            'dns_misses': self.dns_misses,
+            'dns_hit_ratio': round(self.dns_hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """A trace config recording this pool's requests, keep-alive reuse, pool queueing and DNS cache use."""
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(_session: Any, _ctx: Any, _params: Any) -> None:
+            self.requests += 1
+
+        async def on_queued_start(_session: Any, ctx: Any, _params: Any) -> None:
+            ctx.queued_at = time.perf_counter()
+
+        async def on_queued_end(_session: Any, ctx: Any, _params: Any) -> None:
+            self.record_queue_wait(time.perf_counter() - ctx.queued_at)
+
+        async def on_created(_session: Any, _ctx: Any, _params: Any) -> None:
+            self.connections_created += 1
+
+        async def on_reused(_session: Any, _ctx: Any, _params: Any) -> None:
+            self.connections_reused += 1
+
+        async def on_dns_hit(_session: Any, _ctx: Any, _params: Any) -> None:
+            self.dns_hits += 1
+
+        async def on_dns_miss(_session: Any, _ctx: Any, _params: Any) -> None:
+            self.dns_misses += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_connection_queued_start.append(on_queued_start)
+        trace.on_connection_queued_end.append(on_queued_end)
+        trace.on_connection_create_end.append(on_created)
+        trace.on_connection_reuseconn.append(on_reused)
+        trace.on_dns_cache_hit.append(on_dns_hit)
+        trace.on_dns_cache_miss.append(on_dns_miss)
+        return trace
+
+
+class _Pool:
+    __slots__ = ('limit', 'limit_per_host', 'session', 'stats')
+
+    def __init__(self, limit: int, limit_per_host: int) -> None:
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.session: aiohttp.ClientSession | None = None
+        self.stats: PoolStats = PoolStats()
+
+
+class ConnectionPools:
+    """Outbound HTTP sessions: one shared pool plus dedicated pools for selected hosts.
+
+    Every pool has its own :class:`aiohttp.TCPConnector`, so a host with a pool of its own
+    (a slow Ollama generation, say) can never hold the connections other clients need.
+    All connectors cache DNS lookups for ``dns_ttl`` seconds and keep idle connections
+    alive for ``keepalive_timeout`` seconds; :meth:`summary` reports how often a request
+    reused a kept-alive connection, waited for a free one, or hit the DNS cache.
+
+    Sessions are created on first use, which must happen inside the running event loop.
+
+    Parameters
+    ----------
+    limit: int
+        Connections the shared pool opens at once.
+    limit_per_host: int
+        Connections the shared pool opens to one host at once.
+    dns_ttl: int
+        Seconds a resolved address is cached.
+    keepalive_timeout: float
+        Seconds an idle connection is kept for reuse.
+    hosts: Mapping[str, int]
+        Hosts that get a dedicated pool, mapped to that pool's connection limit.
+    """
+
+    DEFAULT: str = 'default'
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 16,
+        dns_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        hosts: Mapping[str, int] | None = None,
+    ) -> None:
+        self.dns_ttl: int = dns_ttl
+        self.keepalive_timeout: float = keepalive_timeout
+        self._pools: dict[str, _Pool] = {self.DEFAULT: _Pool(limit, limit_per_host)}
+        for host, host_limit in (hosts or {}).items():
+            self.dedicate(host, host_limit)
+
+    @classmethod
+    def from_config(cls, config: SimpleNamespace) -> ConnectionPools:
+        return cls(
+            limit=config.limit,
+            limit_per_host=config.limit_per_host,
+            dns_ttl=config.dns_ttl,
+            keepalive_timeout=config.keepalive_timeout,
+            hosts=config.hosts,
+        )
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        if '://' in url_or_host:
+            return (yarl.URL(url_or_host).host or url_or_host).lower()
+        return url_or_host.lower()
+
+    def dedicate(self, url_or_host: str, limit: int) -> None:
+        """Gives a host its own pool of ``limit`` connections; the first call for a host wins."""
+        host = self._host(url_or_host)
+        if host not in self._pools:
+            self._pools[host] = _Pool(limit, limit)
+
+    def _session(self, name: str) -> aiohttp.ClientSession:
+        pool = self._pools[name]
+        if pool.session is None or pool.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=pool.limit,
+                limit_per_host=pool.limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            pool.session = aiohttp.ClientSession(connector=connector, trace_configs=[pool.stats.trace_config()])
+        return pool.session
+
+    @property
+    def default(self) -> aiohttp.ClientSession:
+        """The shared session, for every host without a pool of its own."""
+        return self._session(self.DEFAULT)
+
+    def session_for(self, url_or_host: str) -> aiohttp.ClientSession:
+        """The session of the host's dedicated pool, or the shared one."""
+        host = self._host(url_or_host)
+        return self._session(host if host in self._pools else self.DEFAULT)
+
+    def summary(self) -> list[dict[str, Any]]:
+        return [
+            {'pool': name, 'limit': pool.limit, 'limit_per_host': pool.limit_per_host, **pool.stats.to_dict()}
+            for name, pool in self._pools.items()
+        ]
+
+    async def close(self) -> None:
+        for pool in self._pools.values():
+            if pool.session is not None and not pool.session.closed:
+                await pool.session.close()
@@ -11,7 +11,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from app.clients.base import BaseHTTPClient
+from app.clients.base import BaseHTTPClient, StaleResult
 
 if TYPE_CHECKING:
     import aiohttp
@@ -36,6 +36,10 @@ class TranslateClient(BaseHTTPClient):
     """Minimal async client for Google's keyless translation endpoint."""
 
     BASE_URL: ClassVar[str] = 'https://translate.googleapis.com/translate_a/single'
+    # The same message tends to be translated by several people in a row.
+    CACHE_TTL: ClassVar[float] = 3600.0
+    # The keyless endpoint starts answering 429 quickly when hit in parallel.
+    MAX_CONCURRENCY: ClassVar[int] = 4
 
     def __init__(self, session: aiohttp.ClientSession) -> None:
         super().__init__(session, name='Translate')
@@ -56,6 +60,8 @@ class TranslateClient(BaseHTTPClient):
             'q': text,
         }
         data: Any = await self.fetch('GET', self.BASE_URL, params=params)
+        if isinstance(data, StaleResult):
+            data = data.data
 
         try:
             translated = ''.join(chunk[0] for chunk in data[0] if chunk and chunk[0])
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from app.clients import BaseHTTPClient, HTTPClientError
+from app.clients.base import StaleResult
 
 if TYPE_CHECKING:
     import aiohttp
@@ -16,22 +17,34 @@ class AniListClient(BaseHTTPClient):
     Rate-limit retries, transport-error backoff and circuit-breaking are inherited;
     this class only owns the GraphQL queries and AniList's quirk of returning HTTP 500
     for transient/empty results (surfaced as ``None`` so callers fall back to empty).
+    GraphQL reads are POSTs, so they are opted into the response cache explicitly;
+    mutations bypass it and drop what was cached, since lists and favourites just changed.
     """
 
+    CACHE_METHODS: ClassVar[frozenset[str]] = frozenset({'GET', 'POST'})
+    CACHE_TTL: ClassVar[float] = 300.0
+    # AniList allows 90 requests a minute; a burst of autocompletes should queue, not 429.
+    MAX_CONCURRENCY: ClassVar[int] = 4
+
     def __init__(self, session: aiohttp.ClientSession) -> None:
         super().__init__(session, name='AniList')
 
     async def _request(self, query: str, **variables: dict[str, Any]) -> dict[str, Any] | None:
         headers = variables.pop('headers', {})
+        mutation = query.lstrip().startswith('mutation')
         try:
-            return await self.fetch(
+            result = await self.fetch(
                 'POST', API_ENDPOINT,
-                json={'query': query, 'variables': variables}, headers=headers,
+                json={'query': query, 'variables': variables}, headers=headers, cache=not mutation,
             )
         except HTTPClientError as exc:
             if exc.status == 500:
                 return None
             raise
+        if mutation and self.cache is not None:
+            self.cache.clear()
+        # Served from the cache while AniList's breaker is open.
+        return result.data if isinstance(result, StaleResult) else result
 
     async def media(self, **variables: Any) -> list[dict[str, Any]]:
         data = await self._request(query=self._media_query, **variables)
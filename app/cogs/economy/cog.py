@@ -1,6 +1,5 @@
 import datetime
 import random
-from contextlib import nullcontext
 from typing import Annotated, Any, Literal
 
 import discord
@@ -9,7 +8,14 @@ from discord.app_commands import Choice
 from discord.ext import commands
 from discord.ext.commands import Range
 
-from app.cogs.economy.ui import BOOST_LABELS, EconomyHub, SearchView, boost_display_line, progress_bar
+from app.cogs.economy.ui import (
+    BOOST_LABELS,
+    EconomyHub,
+    LeaderboardPaginator,
+    SearchView,
+    boost_display_line,
+    progress_bar,
+)
 from app.core import Accent, Bot, Cog, converter, make_notice
 from app.core.models import Context, PermissionTemplate, command, cooldown, describe, group
 from app.core.pagination import LinePaginator
@@ -120,8 +126,7 @@ class Economy(Cog):
 
         board = {q.key: q for q in generate_daily_quests(ctx.guild.id, ctx.author.id, today)}
         total = sum(row['reward'] for row in completed)
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=total)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=total)
 
         lines = '\n'.join(
             f'\N{SCROLL} **Quest complete:** {board[row["quest"]].description if row["quest"] in board else row["quest"]} '
@@ -275,20 +280,12 @@ class Economy(Cog):
         self, ctx: Context, role: Annotated[discord.Role, commands.RoleConverter], amount: Range[int, 1], to: Literal["bank", "cash"]
     ) -> None:
         """Sets a user's balance"""
-        humans = [member for member in role.members if not member.bot]
-        total = len(humans)
-        # Each member is a balance fetch + write, so surface progress for large roles.
-        tracker = ctx.progress(f"Adding money to {total} members...") if total >= 10 else nullcontext()
-        async with tracker as progress:
-            for i, member in enumerate(humans, 1):
-                balance = await ctx.db.get_user_balance(member.id, ctx.guild.id)  # type: ignore[union-attr]
-                if to == "bank":
-                    await balance.add(bank=amount)
-                else:
-                    await balance.add(cash=amount)
-
-                if progress is not None and (i == total or i % 10 == 0):
-                    await progress.tick(i, total, "Adding money")
+        assert ctx.guild is not None
+        cash, bank = (0, amount) if to == "bank" else (amount, 0)
+        # One ledger statement for the whole role rather than a fetch and write per member.
+        await self.bot.db.economy.apply_balance_deltas(
+            ctx.guild.id, [(member.id, cash, bank) for member in role.members if not member.bot]
+        )
 
         await ctx.send_success(
             f"Successfully added {Emojis.Economy.cash} **{fnumb(amount)}** to all users with the role **{role.name}**."
@@ -318,17 +315,11 @@ class Economy(Cog):
             await ctx.send_error("Cannot remove from a bot's balance.")
             return
 
-        balance = await ctx.db.get_user_balance(member.id, ctx.guild.id)  # type: ignore[union-attr]
-
-        if (to == "bank" and balance.bank < amount) or (to == "cash" and balance.cash < amount):
+        removed = await self.bot.db.economy.adjust_balance(member.id, ctx.guild.id, **{to: -amount})  # type: ignore[union-attr]
+        if removed is None:
             await ctx.send_error("Cannot remove more than the user's balance.")
             return
 
-        if to == "bank":
-            await balance.remove(bank=amount)
-        else:
-            await balance.remove(cash=amount)
-
         await ctx.send_success(
             f"Successfully removed {Emojis.Economy.cash} **{fnumb(amount)}** from **{member.display_name}'s** {to}."
         )
@@ -337,13 +328,11 @@ class Economy(Cog):
     @describe(amount="The amount to deposit.")
     async def deposit(self, ctx: Context, amount: Range[int, 1]) -> None:
         """Deposits money into your bank."""
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)  # type: ignore[union-attr]
-        if balance.cash < amount:
+        moved = await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=-amount, bank=amount)  # type: ignore[union-attr]
+        if moved is None:
             await ctx.send_error("Cannot deposit more than your balance.")
             return
 
-        await balance.remove(cash=amount)
-        await balance.add(bank=amount)
         await ctx.send_success(f"Successfully deposited {Emojis.Economy.cash} **{fnumb(amount)}** into your bank.")
         await self._bump_quests(ctx, "deposit", amount)
 
@@ -351,13 +340,11 @@ class Economy(Cog):
     @describe(amount="The amount to withdraw.")
     async def withdraw(self, ctx: Context, amount: Range[int, 1]) -> None:
         """Withdraws money from your bank."""
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)  # type: ignore[union-attr]
-        if balance.bank < amount:
+        moved = await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount, bank=-amount)  # type: ignore[union-attr]
+        if moved is None:
             await ctx.send_error("Cannot withdraw more than your bank balance.")
             return
 
-        await balance.remove(bank=amount)
-        await balance.add(cash=amount)
         await ctx.send_success(f"Successfully withdrew {Emojis.Economy.cash} **{fnumb(amount)}** from your bank.")
 
     @command("transfer", description="Transfers money to another user.", guild_only=True, hybrid=True)
@@ -370,14 +357,11 @@ class Economy(Cog):
             await ctx.send_error("Cannot transfer to a bot.")
             return
 
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)  # type: ignore[union-attr]
-        if balance.cash < amount:
+        moved = await self.bot.db.economy.transfer_cash(ctx.guild.id, ctx.author.id, member.id, amount)  # type: ignore[union-attr]
+        if moved is None:
             await ctx.send_error("Cannot transfer more than your balance.")
             return
 
-        await balance.remove(cash=amount)
-        balance = await ctx.db.get_user_balance(member.id, ctx.guild.id)  # type: ignore[union-attr]
-        await balance.add(cash=amount)
         await ctx.send_success(
             f"Successfully transferred {Emojis.Economy.cash} **{fnumb(amount)}** to **{member.display_name}**."
         )
@@ -405,24 +389,17 @@ class Economy(Cog):
     async def leaderboard(self, ctx: Context) -> None:
         """Shows the leaderboard of the server."""
         assert ctx.guild is not None
-        balances = await ctx.db.get_guild_balances(ctx.guild.id)
-        total = sum(balance.total for balance in balances)
-        # The underlying query returns rows in arbitrary order, so rank richest-first here.
-        balances = sorted(balances, key=lambda balance: balance.total, reverse=True)
-
-        users = [
-            f"**{index}.** <@{balance.user_id}> • {Emojis.Economy.cash} **{fnumb(balance.total)}**"
-            for index, balance in enumerate(balances, 1)
-        ]
+        totals = await ctx.db.users.get_balance_totals(ctx.guild.id)
 
         embed = discord.Embed(
             title="Economy Leaderboard", description="This is the server's leaderboard.\n\n", colour=helpers.Colour.white()
         )
         embed.set_author(name=ctx.guild.name, icon_url=get_asset_url(ctx.guild))  # type: ignore[arg-type]
         embed.set_footer(
-            text=f"Total Server Money: {fnumb(total)}", icon_url=discord.PartialEmoji.from_str(Emojis.Economy.cash).url
+            text=f"Total Server Money: {fnumb(totals['total'])}",
+            icon_url=discord.PartialEmoji.from_str(Emojis.Economy.cash).url,
         )
-        await LinePaginator.start(ctx, entries=users, embed=embed, location='description')
+        await LeaderboardPaginator.start(ctx, guild_id=ctx.guild.id, ranked=totals['ranked'], embed=embed)
 
     @command("daily", description="Claim your daily reward and build a streak.", guild_only=True, hybrid=True)
     async def daily(self, ctx: Context) -> None:
@@ -445,8 +422,7 @@ class Economy(Cog):
 
         scale = await self._payout_scale(ctx.author.id, ctx.guild.id, settings=settings)
         amount = round(result.amount * scale)
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=amount)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount)
         await self.bot.db.economy.set_daily(ctx.author.id, ctx.guild.id, now, result.streak)
 
         await ctx.send_success(
@@ -473,8 +449,7 @@ class Economy(Cog):
 
         scale = await self._payout_scale(ctx.author.id, ctx.guild.id)
         amount = round(WEEKLY_AMOUNT * scale)
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=amount)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount)
         await self.bot.db.economy.set_weekly(ctx.author.id, ctx.guild.id, now)
         await ctx.send_success(
             f"You claimed your weekly {Emojis.Economy.cash} **{fnumb(amount)}**!{self._scale_suffix(scale)}"
@@ -498,8 +473,7 @@ class Economy(Cog):
 
         scale = await self._payout_scale(ctx.author.id, ctx.guild.id)
         amount = round(MONTHLY_AMOUNT * scale)
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=amount)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount)
         await self.bot.db.economy.set_monthly(ctx.author.id, ctx.guild.id, now)
         await ctx.send_success(
             f"You claimed your monthly {Emojis.Economy.cash} **{fnumb(amount)}**!{self._scale_suffix(scale)}"
@@ -627,14 +601,13 @@ class Economy(Cog):
             return
 
         total = item["price"] * quantity
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        if balance.cash < total:
+        if await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=-total) is None:
+            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
             await ctx.send_error(
                 f"You need {Emojis.Economy.cash} **{fnumb(total)}** but only have **{fnumb(balance.cash)}**."
             )
             return
 
-        await balance.remove(cash=total)
         await self.bot.db.economy.add_to_inventory(ctx.author.id, ctx.guild.id, item["id"], quantity)
         await ctx.send_success(
             f"Bought **{quantity}× {item['name']}** for {Emojis.Economy.cash} **{fnumb(total)}**."
@@ -659,8 +632,7 @@ class Economy(Cog):
 
         payout = sell_price(item["price"]) * quantity
         await self.bot.db.economy.remove_from_inventory(ctx.author.id, ctx.guild.id, item["id"], quantity)
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=payout)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=payout)
         await ctx.send_success(
             f"Sold **{quantity}× {item['name']}** for {Emojis.Economy.cash} **{fnumb(payout)}**."
         )
@@ -741,13 +713,11 @@ class Economy(Cog):
         left = f"You have **{owned - 1}** left."
 
         if effect == "cash":
-            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-            await balance.add(cash=value)
+            await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=value)
             message = f"You redeemed **{item['name']}** for {Emojis.Economy.cash} **{fnumb(value)}**. {left}"
         elif effect == "lootbox":
             payout = roll_lootbox(value)
-            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-            await balance.add(cash=payout)
+            await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=payout)
             flavour = (
                 "\N{PARTY POPPER} Jackpot!" if payout >= value * 2
                 else "Unlucky..." if payout < value // 2
@@ -803,8 +773,7 @@ class Economy(Cog):
         boost = await self.bot.db.economy.get_boost_multiplier(ctx.author.id, ctx.guild.id, "loot")
         scale = await self._payout_scale(ctx.author.id, ctx.guild.id)
         amount = round(catch.amount * boost * scale)
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=amount)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount)
 
         if catch.amount <= 5:
             await ctx.send_info(f"{catch.emoji} You reeled in **{catch.name}** — barely worth it.")
@@ -825,8 +794,7 @@ class Economy(Cog):
         boost = await self.bot.db.economy.get_boost_multiplier(ctx.author.id, ctx.guild.id, "loot")
         scale = await self._payout_scale(ctx.author.id, ctx.guild.id)
         amount = round(catch.amount * boost * scale)
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=amount)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount)
 
         if catch.amount <= 10:
             await ctx.send_info(f"{catch.emoji} You found **{catch.name}** and came back empty-handed.")
@@ -849,8 +817,7 @@ class Economy(Cog):
         else:
             scale = await self._payout_scale(ctx.author.id, ctx.guild.id)
             amount = round(catch.amount * scale)
-            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-            await balance.add(cash=amount)
+            await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount)
             line = random.choice(BEG_SUCCESS_LINES).format(
                 donor=f'**{random.choice(BEG_DONORS).title()}**',
                 coins=f'{Emojis.Economy.cash} **{fnumb(amount)}**',
@@ -867,8 +834,7 @@ class Economy(Cog):
         boost = await self.bot.db.economy.get_boost_multiplier(ctx.author.id, ctx.guild.id, "loot")
         scale = await self._payout_scale(ctx.author.id, ctx.guild.id)
         amount = round(catch.amount * boost * scale)
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=amount)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount)
 
         if catch.amount <= 8:
             await ctx.send_info(f"{catch.emoji} You dug up **{catch.name}** — hardly a treasure.")
@@ -937,8 +903,7 @@ class Economy(Cog):
         amount = round(result.amount * scale)
         shifts = await self.bot.db.economy.add_shift(ctx.author.id, ctx.guild.id, job.id)
 
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=amount)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount)
 
         message = (
             f"{job.emoji} You worked a shift as **{job.name}** and earned "
@@ -1152,14 +1117,13 @@ class Economy(Cog):
             return
 
         cost = record["ticket_price"] * amount
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        if balance.cash < cost:
+        if await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=-cost) is None:
+            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
             await ctx.send_error(
                 f"You need {Emojis.Economy.cash} **{fnumb(cost)}** but only have **{fnumb(balance.cash)}**."
             )
             return
 
-        await balance.remove(cash=cost)
         total = await self.bot.db.economy.add_lottery_tickets(ctx.guild.id, ctx.author.id, amount, cost)
         await ctx.send_success(
             f"Bought **{pluralize(amount):ticket}** for {Emojis.Economy.cash} **{fnumb(cost)}**. "
@@ -1191,8 +1155,7 @@ class Economy(Cog):
             await channel.send(view=view)
             return
 
-        balance = await self.bot.db.get_user_balance(winner_id, guild_id)
-        await balance.add(cash=jackpot)
+        await self.bot.db.economy.adjust_balance(winner_id, guild_id, cash=jackpot)
         # The mention lives inside the container's text display, which still pings.
         view = make_notice(
             "\N{PARTY POPPER} Lottery Winner!",
@@ -1433,20 +1396,21 @@ class Economy(Cog):
         assert spec is not None
 
         pet_name = (name or spec.name).strip()[:32]
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        if balance.cash < spec.cost:
+        economy = self.bot.db.economy
+        if await economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=-spec.cost) is None:
+            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
             await ctx.send_error(
                 f"Adopting a {spec.name} costs {Emojis.Economy.cash} **{fnumb(spec.cost)}** — "
                 f"you only have **{fnumb(balance.cash)}** in cash."
             )
             return
 
-        record = await self.bot.db.economy.create_pet(ctx.author.id, ctx.guild.id, spec.id, pet_name)
+        record = await economy.create_pet(ctx.author.id, ctx.guild.id, spec.id, pet_name)
         if record is None:
+            await economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=spec.cost)
             await ctx.send_error("You already have a pet. Abandon it first with `pet abandon` (how could you?).")
             return
 
-        await balance.remove(cash=spec.cost)
         await ctx.send_success(
             f"{spec.emoji} You adopted **{pet_name}** the {spec.name}! "
             f"They earn {Emojis.Economy.cash} **{fnumb(spec.hourly_rate)}/h** while fed — collect with `pet claim`."
@@ -1466,15 +1430,14 @@ class Economy(Cog):
             await ctx.send_error("Your pet's species no longer exists.")
             return
 
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        if balance.cash < species.feed_cost:
+        if await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=-species.feed_cost) is None:
+            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
             await ctx.send_error(
                 f"Feeding **{row['name']}** costs {Emojis.Economy.cash} **{fnumb(species.feed_cost)}** — "
                 f"you only have **{fnumb(balance.cash)}** in cash."
             )
             return
 
-        await balance.remove(cash=species.feed_cost)
         now = ctx.message.created_at.replace(tzinfo=None)
         await self.bot.db.economy.update_pet(ctx.author.id, ctx.guild.id, {"last_fed": now})
         await ctx.send_success(f"{species.emoji} **{row['name']}** happily munches away. Fully fed!")
@@ -1508,8 +1471,7 @@ class Economy(Cog):
 
         scale = await self._payout_scale(ctx.author.id, ctx.guild.id)
         amount = round(claim.amount * scale)
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        await balance.add(cash=amount)
+        await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=amount)
         await self.bot.db.economy.update_pet(
             ctx.author.id, ctx.guild.id, {"last_claim": now.replace(tzinfo=None)})
         await ctx.send_success(
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import datetime
+import functools
 from typing import TYPE_CHECKING, Any
 
 import discord
 
 from app.core import LayoutView
+from app.core.pagination import KeysetPageSource, SourcePaginator
 from app.services.economy import (
     ACHIEVEMENTS,
     JOB_LADDER,
@@ -24,11 +26,13 @@ from config import Emojis
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable, Sequence
 
+    import asyncpg
+
     from app.cogs.economy.cog import Economy
     from app.core.models import Context
     from app.services.economy import SearchLocation
 
-__all__ = ('BOOST_LABELS', 'EconomyHub', 'SearchView', 'boost_display_line', 'progress_bar')
+__all__ = ('BOOST_LABELS', 'EconomyHub', 'LeaderboardPaginator', 'SearchView', 'boost_display_line', 'progress_bar')
 
 #: Display labels for active boost kinds.
 BOOST_LABELS = {'xp': 'leveling XP', 'loot': 'fishing & hunting payouts'}
@@ -126,6 +130,42 @@ _HUNGER_LABELS = {
 }
 
 
+class LeaderboardPaginator(SourcePaginator['asyncpg.Record']):
+    """The economy leaderboard, read from the database one page at a time.
+
+    Wallets come from :meth:`~app.database.repositories.UsersRepository.get_balance_page`
+    through a :class:`~app.core.pagination.KeysetPageSource`, so only pages that are
+    viewed (and the one after) are ever read.
+    """
+
+    empty_page = '*Nobody is ranked on this page anymore.*'
+
+    def format_row(self, row: asyncpg.Record, position: int, /) -> str:
+        return f"**{position}.** <@{row['user_id']}> • {Emojis.Economy.cash} **{fnumb(row['total'])}**"
+
+    @classmethod
+    async def start(  # type: ignore[override]
+        cls,
+        context: Context,
+        /,
+        *,
+        guild_id: int,
+        ranked: int,
+        embed: discord.Embed,
+        per_page: int = 15,
+        timeout: int = 180,
+        ephemeral: bool = False,
+    ) -> LeaderboardPaginator:
+        """Shows the first page; ``ranked`` (the guild's non-empty wallet count) sizes the page bar."""
+        source = KeysetPageSource(
+            functools.partial(context.db.users.get_balance_page, guild_id),
+            key=lambda row: (row['total'], row['user_id']),
+            per_page=per_page,
+            count=ranked,
+        )
+        return await super().start(context, source=source, embed=embed, timeout=timeout, ephemeral=ephemeral)
+
+
 class _HubSelect(discord.ui.Select['EconomyHub']):
     """The page switcher at the bottom of the hub."""
 
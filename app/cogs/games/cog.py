@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Literal, cast
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 from expiringdict import ExpiringDict
 
 from app.cogs.games import (
@@ -35,6 +35,7 @@ from app.cogs.games.engine import dice as dice_engine
 from app.cogs.games.engine import horserace as horserace_engine
 from app.cogs.games.engine import roulette as roulette_engine
 from app.cogs.games.engine.cards import MinimumBet, Payouts
+from app.cogs.games.engine.equity import EquityService
 from app.cogs.games.engine.trivia import RawQuestion, build_round
 from app.cogs.games.engine.wordle import WORD_LENGTH, daily_index
 from app.cogs.games.models import Game, GameResult
@@ -52,7 +53,7 @@ from app.utils import (
     helpers,
     txt,
 )
-from config import Emojis, path
+from config import Emojis, data_path, path, poker_equity
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -60,7 +61,6 @@ if TYPE_CHECKING:
     from discord.app_commands import Choice
 
     from app.core.timer import Timer
-    from app.database.base import Balance
 
 
 async def roulette_space_autocomplete(_, current: str) -> list[Choice[str | int | float]]:
@@ -90,6 +90,7 @@ class Games(Cog):
         self.blackjack_tables: dict[int, blackjack_bridge.Blackjack] = ExpiringDict(max_len=1000, max_age_seconds=21600)
         self.roulette_tables: dict[int, roulette_ui.Table] = {}
         self.poker_tables: dict[int, poker_bridge.PokerSession] = {}
+        self.equity: EquityService = EquityService.from_config(poker_equity, cache_path=data_path / "poker_preflop_v1.json")
         self.russian_tables: dict[int, russianroulette_ui.RussianRoulette] = {}
         self.horse_tables: dict[int, horserace_ui.Table] = {}
 
@@ -98,6 +99,23 @@ class Games(Cog):
         self._trivia_questions: list[RawQuestion] | None = None
         self._wordle_words: list[str] | None = None
 
+        self.flush_game_results.start()
+
+    async def cog_unload(self) -> None:
+        self.equity.close()
+        self.flush_game_results.cancel()
+        await self.bot.db.game_stats.flush()
+
+    @tasks.loop(seconds=30.0)
+    async def flush_game_results(self) -> None:
+        """|coro|
+
+        A task that writes the buffered game results to the database.
+        """
+        # Shielded so that cancelling the loop on unload lets the write finish; the final
+        # flush in cog_unload waits for it.
+        await asyncio.shield(self.bot.db.game_stats.flush())
+
     def _load_trivia(self) -> list[RawQuestion]:
         """Lazily loads and caches the bundled trivia question bank."""
         if self._trivia_questions is None:
@@ -142,16 +160,24 @@ class Games(Cog):
             return False
         if not await self._check_max_bet(ctx, bet):
             return False
+        return await self._debit_bet(ctx, bet)
+
+    async def _debit_bet(self, ctx: Context, bet: int) -> bool:
+        """Takes ``bet`` from the author's cash in one statement. Returns success.
+
+        The balance check happens in the same ``UPDATE`` as the debit, so two bets
+        placed at once cannot both spend the same cash. Sends the error itself when
+        the author cannot cover the bet.
+        """
+        assert ctx.guild is not None
+        if await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=-bet) is not None:
+            return True
         balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        assert balance is not None
-        if bet > balance.cash:
-            await ctx.send_error(
-                f"You do not have enough money to bet that amount.\n"
-                f"You currently have {Emojis.Economy.cash} **{fnumb(balance.cash)}** in **cash**."
-            )
-            return False
-        await balance.remove(cash=bet)
-        return True
+        await ctx.send_error(
+            f"You do not have enough money to bet that amount.\n"
+            f"You currently have {Emojis.Economy.cash} **{fnumb(balance.cash)}** in **cash**."
+        )
+        return False
 
     @command(
         "games", aliases=["arcade"], description="Browse every game and your personal records.",
@@ -294,19 +320,9 @@ class Games(Cog):
         if not await self._check_max_bet(ctx, bet):
             return
 
-        assert ctx.guild is not None
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        assert balance is not None
-
-        if bet > balance.cash:
-            await ctx.send_error(
-                f"You do not have enough money to bet that amount.\n"
-                f"You currently have {Emojis.Economy.cash} **{fnumb(balance.cash)}** in **cash**."
-            )
+        if not await self._debit_bet(ctx, bet):
             return
 
-        await balance.remove(cash=bet)
-
         tower = tower_ui.Tower(cast("discord.Member", ctx.author), bet)
         await ctx.send(view=tower)
 
@@ -325,19 +341,9 @@ class Games(Cog):
         if not await self._check_max_bet(ctx, bet):
             return
 
-        assert ctx.guild is not None
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        assert balance is not None
-
-        if bet > balance.cash:
-            await ctx.send_error(
-                f"You do not have enough money to bet that amount.\n"
-                f"You currently have {Emojis.Economy.cash} **{fnumb(balance.cash)}** in **cash**."
-            )
+        if not await self._debit_bet(ctx, bet):
             return
 
-        await balance.remove(cash=bet)
-
         slots = slot_ui.SlotMachine(cast("discord.Member", ctx.author), bet)
         await ctx.send(view=slots)
 
@@ -355,19 +361,9 @@ class Games(Cog):
         if not await self._check_max_bet(ctx, bet):
             return
 
-        assert ctx.guild is not None
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        assert balance is not None
-
-        if bet > balance.cash:
-            await ctx.send_error(
-                f"You do not have enough money to bet that amount.\n"
-                f"You currently have {Emojis.Economy.cash} **{fnumb(balance.cash)}** in **cash**."
-            )
+        if not await self._debit_bet(ctx, bet):
             return
 
-        await balance.remove(cash=bet)
-
         if ctx.author.id in self.blackjack_tables:
             blackjack = self.blackjack_tables[ctx.author.id]
             if blackjack.is_running:
@@ -450,9 +446,7 @@ class Games(Cog):
         result = random.choice(coinflip_ui.SIDES)
         won = result == side
         if won:
-            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-            assert balance is not None
-            await balance.add(cash=bet * 2)
+            await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=bet * 2)
             embed = discord.Embed(
                 title=f"{coinflip_ui.COIN} Coinflip",
                 colour=helpers.Colour.lime_green(),
@@ -588,8 +582,9 @@ class Games(Cog):
 
         rate = random.uniform(0, 1)
         if rate > ROB_FAIL_RATE:
-            await robber_balance.add(cash=amount)
-            await robbed_balance.remove(cash=amount)
+            if await self.bot.db.economy.transfer_cash(ctx.guild.id, user.id, ctx.author.id, amount) is None:
+                await ctx.send_error(f"**{user.display_name}** spent their cash before you could grab it.")
+                return
             await ctx.send_success(
                 f"You were able to rob {Emojis.Economy.cash} **{fnumb(amount)}** from **{user.display_name}**."
             )
@@ -620,19 +615,9 @@ class Games(Cog):
         if not await self._check_max_bet(ctx, bet):
             return
 
-        assert ctx.guild is not None
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        assert balance is not None
-
-        if bet > balance.cash:
-            await ctx.send_error(
-                f"You do not have enough money to bet that amount.\n"
-                f"You currently have {Emojis.Economy.cash} **{fnumb(balance.cash)}** in **cash**."
-            )
+        if not await self._debit_bet(ctx, bet):
             return
 
-        await balance.remove(cash=bet)
-
         if ctx.channel.id in self.roulette_tables:
             roulette = self.roulette_tables[ctx.channel.id]
 
@@ -673,19 +658,9 @@ class Games(Cog):
         if not await self._check_max_bet(ctx, stack):
             return
 
-        assert ctx.guild is not None
-        balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-        assert balance is not None
-
-        if stack > balance.cash:
-            await ctx.send_error(
-                f"You do not have enough money to bet that amount.\n"
-                f"You currently have {Emojis.Economy.cash} **{fnumb(balance.cash)}** in **cash**."
-            )
+        if not await self._debit_bet(ctx, stack):
             return
 
-        await balance.remove(cash=stack)
-
         if ctx.channel.id in self.poker_tables:
             poker = self.poker_tables[ctx.channel.id]
             if len(poker.players) == 4:
@@ -748,9 +723,7 @@ class Games(Cog):
         if total == target:
             multiplier = dice_engine.payout_multiplier(target)
             payout = round(bet * multiplier)
-            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-            assert balance is not None
-            await balance.add(cash=payout)
+            await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=payout)
             embed = discord.Embed(
                 title="\N{DIRECT HIT} Dice",
                 colour=helpers.Colour.lime_green(),
@@ -835,9 +808,7 @@ class Games(Cog):
         self.wordle_played.add(key)
         if game.won:
             reward = max(50, 350 - (game.tries_used - 1) * 50)
-            balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-            assert balance is not None
-            await balance.add(cash=reward)
+            await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=reward)
             await ctx.send(
                 f"{Emojis.success} Solved in **{game.tries_used}**! You won {Emojis.Economy.cash} **{fnumb(reward)}**.",
                 reference=origin,
@@ -882,9 +853,7 @@ class Games(Cog):
         if ctx.channel.id in self.horse_tables:
             table = self.horse_tables[ctx.channel.id]
             if not table.open:
-                balance = await ctx.db.get_user_balance(ctx.author.id, ctx.guild.id)
-                assert balance is not None
-                await balance.add(cash=bet)
+                await self.bot.db.economy.adjust_balance(ctx.author.id, ctx.guild.id, cash=bet)
                 await ctx.send_error("The gates are closed for this race. Wait for the next one.")
                 return
             table.place(horserace_ui.Bet(member, horse, bet))
@@ -905,15 +874,13 @@ class Games(Cog):
         with suppress(discord.HTTPException):
             await ctx.message.add_reaction(Emojis.success)
 
-    async def _balances_for(self, guild_id: int, user_ids: Iterable[int]) -> dict[int, Balance]:
-        """Fetch balances for the given users in a single query, keyed by user id.
+    async def _credit_all(self, guild_id: int, credits: Iterable[tuple[int, int]]) -> None:
+        """Credits every ``(user_id, amount)`` pair of a table's payout or refund at once.
 
-        Bettors always have a row (placing a bet debits them), but any missing
-        user falls back to a single fetch which inserts an empty record. This
-        replaces per-bet ``get_user_balance`` calls in the payout/refund loops.
+        One ledger statement for the whole table instead of an ``UPDATE`` per bet;
+        several bets by the same member are summed into one row.
         """
-        balances = {b.user_id: b for b in await self.bot.db.get_guild_balances(guild_id)}
-        return {uid: balances.get(uid) or await self.bot.db.get_user_balance(uid, guild_id) for uid in set(user_ids)}
+        await self.bot.db.economy.apply_balance_deltas(guild_id, [(user_id, amount, 0) for user_id, amount in credits])
 
     @Cog.listener()
     async def on_roulette_timer_complete(self, timer: Timer) -> None:
@@ -934,9 +901,7 @@ class Games(Cog):
                 roulette.message = await channel.fetch_message(message_id)
             except discord.HTTPException:
                 assert roulette.ctx.guild is not None
-                balances = await self._balances_for(roulette.ctx.guild.id, [bet.placed_by.id for bet in roulette.bets])
-                for bet in roulette.bets:
-                    await balances[bet.placed_by.id].add(cash=bet.amount)
+                await self._credit_all(roulette.ctx.guild.id, [(bet.placed_by.id, bet.amount) for bet in roulette.bets])
                 # give people their money back
                 await channel.send(f"{Emojis.warning} The roulette game message has not been found. *Returning bets.*")
                 self.roulette_tables.pop(channel_id)
@@ -956,11 +921,11 @@ class Games(Cog):
 
         assert roulette.ctx.guild is not None
         guild_id = roulette.ctx.guild.id
-        balances = await self._balances_for(guild_id, [bet.placed_by.id for bet in roulette.bets])
+        payouts: list[tuple[int, int]] = []
         for bet in roulette.bets:
             if bet in winning_bets:
                 payout = round(bet.amount * Payout.by_value(bet.space.value))
-                await balances[bet.placed_by.id].add(cash=payout)
+                payouts.append((bet.placed_by.id, payout))
                 await self.bot.db.game_stats.record_result(
                     guild_id, bet.placed_by.id, Game.ROULETTE, GameResult.WIN, wagered=bet.amount, profit=payout - bet.amount
                 )
@@ -968,6 +933,7 @@ class Games(Cog):
                 await self.bot.db.game_stats.record_result(
                     guild_id, bet.placed_by.id, Game.ROULETTE, GameResult.LOSS, wagered=bet.amount, profit=-bet.amount
                 )
+        await self._credit_all(guild_id, payouts)
 
         try:
             await roulette.message.edit(
@@ -997,9 +963,7 @@ class Games(Cog):
             try:
                 table.message = await channel.fetch_message(message_id)
             except discord.HTTPException:
-                balances = await self._balances_for(guild_id, [bet.placed_by.id for bet in table.bets])
-                for bet in table.bets:
-                    await balances[bet.placed_by.id].add(cash=bet.amount)
+                await self._credit_all(guild_id, [(bet.placed_by.id, bet.amount) for bet in table.bets])
                 await channel.send(f"{Emojis.warning} The horse race message was lost. *Refunding bets.*")
                 self.horse_tables.pop(channel_id, None)
                 return
@@ -1015,11 +979,11 @@ class Games(Cog):
 
         pool = table.pool
         multiplier = horserace_engine.parimutuel_multiplier(pool, table.total_on(winner + 1))
-        balances = await self._balances_for(guild_id, [bet.placed_by.id for bet in table.bets])
+        payouts: list[tuple[int, int]] = []
         for bet in table.bets:
             if bet.horse == winner + 1:
                 payout = round(bet.amount * multiplier)
-                await balances[bet.placed_by.id].add(cash=payout)
+                payouts.append((bet.placed_by.id, payout))
                 await self.bot.db.game_stats.record_result(
                     guild_id, bet.placed_by.id, Game.HORSERACE, GameResult.WIN, wagered=bet.amount, profit=payout - bet.amount
                 )
@@ -1027,6 +991,7 @@ class Games(Cog):
                 await self.bot.db.game_stats.record_result(
                     guild_id, bet.placed_by.id, Game.HORSERACE, GameResult.LOSS, wagered=bet.amount, profit=-bet.amount
                 )
+        await self._credit_all(guild_id, payouts)
 
         with suppress(discord.HTTPException):
             await table.message.edit(view=table.view.render(frames[-1], winner=winner))
@@ -64,28 +64,25 @@ class DuelPrompt(LayoutView):
         guild_id = self.ctx.guild.id
         challenger = self.ctx.author
 
-        challenger_balance = await self.ctx.db.get_user_balance(challenger.id, guild_id)
-        opponent_balance = await self.ctx.db.get_user_balance(self.opponent.id, guild_id)
-        assert challenger_balance is not None and opponent_balance is not None
-
-        for member, balance in ((challenger, challenger_balance), (self.opponent, opponent_balance)):
-            if self.bet > balance.cash:
-                await interaction.response.edit_message(view=make_notice(
-                    f'{COIN} Coinflip Duel',
-                    f'**{member.display_name}** cannot cover the stake anymore — duel cancelled.',
-                    accent=Accent.error,
-                ))
-                return
-
-        await challenger_balance.remove(cash=self.bet)
-        await opponent_balance.remove(cash=self.bet)
+        economy = self.cog.bot.db.economy
+        # Both stakes are taken together or not at all.
+        stakes = await economy.apply_balance_deltas(
+            guild_id, [(challenger.id, -self.bet, 0), (self.opponent.id, -self.bet, 0)])
+        if stakes is None:
+            short = challenger
+            if (await self.ctx.db.get_user_balance(challenger.id, guild_id)).cash >= self.bet:
+                short = self.opponent
+            await interaction.response.edit_message(view=make_notice(
+                f'{COIN} Coinflip Duel',
+                f'**{short.display_name}** cannot cover the stake anymore — duel cancelled.',
+                accent=Accent.error,
+            ))
+            return
 
         result = random.choice(SIDES)
         challenger_won = result == self.side
-        winner, winner_balance = (
-            (challenger, challenger_balance) if challenger_won else (self.opponent, opponent_balance)
-        )
-        await winner_balance.add(cash=self.bet * 2)
+        winner = challenger if challenger_won else self.opponent
+        await economy.adjust_balance(winner.id, guild_id, cash=self.bet * 2)
 
         stats = self.cog.bot.db.game_stats
         await stats.record_result(
@@ -1,6 +1,7 @@
 from app.cogs.games.engine.blackjack import BlackjackGame, WinningType
+from app.cogs.games.engine.equity import EquityResult, EquityService, EquitySpot
+from app.cogs.games.engine.evaluator import HandEvaluator
 from app.cogs.games.engine.minesweeper import Board as MinesweeperBoard
-from app.cogs.games.engine.minesweeper import MSField
 from app.cogs.games.engine.poker import (
     Card,
     CombResult,
@@ -25,9 +26,12 @@ __all__ = (
     'BoardState',
     'Card',
     'CombResult',
+    'EquityResult',
+    'EquityService',
+    'EquitySpot',
     'Hand',
+    'HandEvaluator',
     'HandResult',
-    'MSField',
     'MinesweeperBoard',
     'Payout',
     'Player',
@@ -0,0 +1,455 @@
+"""Off-loop equity calculation for the Texas Hold'em engine.
+
+The engine records an :class:`EquitySpot` per street -- the hole cards, the board and the
+cards still in the deck, all plain arrays -- and :class:`EquityService` computes its odds in
+a process pool, so a street never blocks the event loop. :func:`compute_equity` is the
+pure worker function:
+
+* When few runouts remain (the flop and the turn) every one of them is enumerated and the
+  odds are exact.
+* Otherwise ``samples`` runouts are drawn and the result carries the 95% confidence
+  margin of its percentages.
+* Pre-flop spots are cached by their canonical form: hole cards up to a relabelling of
+  suits, which leaves every equity unchanged. The cache is saved to disk, so the
+  equities of common deals are precomputed by the time they are dealt again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import combinations, permutations
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+import numpy as np
+from scipy.special import comb
+
+from app.cogs.games.engine.cards import NAMED_HAND
+from app.cogs.games.engine.evaluator import CATEGORY_BASE, HandEvaluator
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from concurrent.futures import Executor
+    from pathlib import Path
+    from types import SimpleNamespace
+
+__all__ = (
+    "EXACT_LIMIT",
+    "PREFLOP_SAMPLES",
+    "SAMPLES",
+    "EquityResult",
+    "EquityService",
+    "EquitySpot",
+    "EquityStats",
+    "compute_equity",
+    "hand_strength",
+    "outcome_odds",
+    "preflop_key",
+)
+
+log = logging.getLogger(__name__)
+
+type OddsType = Literal["win_any", "tie_win", "precise"]
+
+#: Runouts enumerated exactly at most; spots with more are sampled.
+EXACT_LIMIT: int = 50_000
+#: Runouts sampled for a spot with too many to enumerate.
+SAMPLES: int = 150_000
+#: Runouts sampled for a pre-flop spot, which is computed once and cached.
+PREFLOP_SAMPLES: int = 400_000
+
+_Z95: float = 1.96
+_SUIT_PERMUTATIONS: tuple[tuple[int, ...], ...] = tuple(permutations(range(4)))
+
+
+class EquitySpot(NamedTuple):
+    """One street of a hand, as plain arrays a worker process can receive.
+
+    Parameters
+    ----------
+    hole_cards : np.ndarray
+        Every seat's two cards, of shape ``(players, 2, 2)``.
+    board : np.ndarray
+        The community cards dealt so far, of shape ``(0-5, 2)``.
+    deck : np.ndarray
+        The cards runouts are drawn from.
+    active : tuple[int, ...]
+        Seats that have not folded, for the live odds.
+    """
+
+    hole_cards: np.ndarray
+    board: np.ndarray
+    deck: np.ndarray
+    active: tuple[int, ...]
+
+
+class EquityResult(NamedTuple):
+    """The odds of one street.
+
+    The first three fields are what the poker analysis has always shown, so the
+    result still unpacks as ``(live, full, hand_strength)``.
+    """
+
+    live: dict[str, float]
+    full: dict[str, float]
+    hand_strength: dict[int, dict[str, float]]
+    scenarios: int = 0
+    exact: bool = True
+    margin: float = 0.0
+    """Half-width of the 95% confidence interval of every percentage, in points."""
+
+
+def outcome_odds(odds_type: OddsType, res_arr: np.ndarray, active_indices: list[int] | None = None) -> dict[str, float]:
+    """Win and tie percentages per seat from the hand values of each runout.
+
+    Parameters
+    ----------
+    odds_type : Literal["win_any", "tie_win", "precise"]
+        The type of odds calculation.
+    res_arr : np.ndarray
+        The hand values, of shape ``(runouts, players)``.
+    active_indices : list[int] | None
+        If provided, only consider these player indices for odds calculation.
+        Players not in this list will have 0% odds (as if they folded).
+    """
+    players = res_arr.shape[1]
+    if active_indices is None:
+        active_indices = list(range(players))
+
+    # For live odds, we only consider active players when determining the "best hand"
+    # Create a masked result array where folded players have minimum values
+    if len(active_indices) < players:
+        masked_res = res_arr.copy()
+        for i in range(players):
+            if i not in active_indices:
+                masked_res[:, i] = -1  # Set to -1 so they can never "win"
+        outcome_arr = masked_res == np.expand_dims(np.max(masked_res, axis=1), axis=1)
+    else:
+        outcome_arr = res_arr == np.expand_dims(np.max(res_arr, axis=1), axis=1)
+
+    num_outcomes = len(outcome_arr)
+    outcome_dict: dict[str, float] = {}
+
+    # Any Tied Win counts as a Win
+    if odds_type == "win_any":
+        tie_indices = np.all(outcome_arr, axis=1)  # multi-way tie
+        outcome_dict["Tie"] = float(np.round(np.mean(tie_indices) * 100, 2))
+
+        for player in range(players):
+            if player in active_indices:
+                outcome_dict["Player " + str(player + 1)] = float(
+                    np.round(np.sum(outcome_arr[~tie_indices, player]) / num_outcomes * 100, 2)
+                )
+            else:
+                outcome_dict["Player " + str(player + 1)] = 0.0
+
+    # Any Multi-way Tie/Tied Win counts as a Tie, Win must be exclusive
+    elif odds_type == "tie_win":
+        for player in range(players):
+            if player in active_indices:
+                tie_win_scenarios = outcome_arr[outcome_arr[:, player] == 1].sum(axis=1)
+                outcome_dict["Player " + str(player + 1) + " Win"] = float(
+                    np.round(np.sum(tie_win_scenarios == 1) / num_outcomes * 100, 2)
+                )
+                outcome_dict["Player " + str(player + 1) + " Tie"] = float(
+                    np.round(np.sum(tie_win_scenarios > 1) / num_outcomes * 100, 2)
+                )
+            else:
+                outcome_dict["Player " + str(player + 1) + " Win"] = 0.0
+                outcome_dict["Player " + str(player + 1) + " Tie"] = 0.0
+
+    # Every possible outcome
+    elif odds_type == "precise":
+        for num_player in range(1, players + 1):
+            for player_arr in _combinations(players, num_player):
+                temp_arr = np.ones(shape=(outcome_arr.shape[0]), dtype=bool)
+                for player in player_arr:
+                    temp_arr = temp_arr & (outcome_arr[:, player] == 1)
+                for non_player in [player for player in range(players) if player not in player_arr]:
+                    temp_arr = temp_arr & (outcome_arr[:, non_player] == 0)
+
+                if len(player_arr) == 1:
+                    outcome_key = f"Player {player_arr[0] + 1} Win"
+                else:
+                    outcome_key = f"Player {','.join([str(player + 1) for player in player_arr])} Tie"
+
+                outcome_dict[outcome_key] = float(np.round(temp_arr.sum() / num_outcomes * 100, 2))
+    return outcome_dict
+
+
+def hand_strength(res_arr: np.ndarray) -> dict[int, dict[str, float]]:
+    """The share of runouts ending in each hand category, per seat (numbered from 1)."""
+    final_hand_dict = {}
+    for player in range(res_arr.shape[1]):
+        hand_type, hand_freq = np.unique(res_arr[:, player] // CATEGORY_BASE, return_counts=True)
+        final_hand_dict[player + 1] = {
+            NAMED_HAND[int(category)]: float(np.round(freq / hand_freq.sum() * 100, 2))
+            for category, freq in zip(hand_type, hand_freq)
+        }
+    return final_hand_dict
+
+
+def _combinations(n: int, k: int) -> np.ndarray:
+    return np.array(list(combinations(range(n), k)), dtype=np.intp).reshape(-1, k)
+
+
+def _sample_runouts(rng: np.random.Generator, deck_size: int, draw: int, samples: int) -> np.ndarray:
+    """``samples`` rows of ``draw`` distinct deck indices."""
+    runouts = rng.integers(0, deck_size, size=(samples, draw))
+    while draw > 1:
+        ordered = np.sort(runouts, axis=1)
+        repeated = np.flatnonzero((ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+        if not len(repeated):
+            break
+        runouts[repeated] = rng.integers(0, deck_size, size=(len(repeated), draw))
+    return runouts
+
+
+def compute_equity(
+    spot: EquitySpot,
+    *,
+    odds_type: OddsType = "tie_win",
+    samples: int = SAMPLES,
+    exact_limit: int = EXACT_LIMIT,
+    seed: int | None = None,
+) -> EquityResult:
+    """Odds of every seat over the runouts of ``spot``; the worker function of :class:`EquityService`."""
+    draw = 5 - len(spot.board)
+    total = int(comb(len(spot.deck), draw, exact=True))
+    exact = total <= exact_limit
+    if draw == 0:
+        runouts = np.zeros((1, 0), dtype=np.intp)
+    elif exact:
+        runouts = _combinations(len(spot.deck), draw)
+    else:
+        runouts = _sample_runouts(np.random.default_rng(seed), len(spot.deck), draw, samples)
+
+    scenarios = len(runouts)
+    drawn = spot.deck[runouts]
+    board = np.repeat(spot.board[np.newaxis], scenarios, axis=0)
+    evaluator = HandEvaluator.default()
+
+    res_arr = np.zeros((scenarios, len(spot.hole_cards)), dtype=np.int64)
+    for player, hole in enumerate(spot.hole_cards):
+        cards = np.concatenate([np.repeat(hole[np.newaxis], scenarios, axis=0), board, drawn], axis=1)
+        res_arr[:, player] = evaluator.evaluate(cards)
+
+    live = outcome_odds(odds_type, res_arr, list(spot.active))
+    full = outcome_odds(odds_type, res_arr)
+    margin = 0.0
+    if not exact:
+        shares = np.array([*live.values(), *full.values()]) / 100
+        margin = round(float(np.max(_Z95 * np.sqrt(shares * (1 - shares) / scenarios))) * 100, 2)
+
+    return EquityResult(
+        live=live, full=full, hand_strength=hand_strength(res_arr), scenarios=scenarios, exact=exact, margin=margin
+    )
+
+
+def preflop_key(spot: EquitySpot) -> Hashable | None:
+    """The canonical form of a pre-flop spot, or ``None`` once the board has cards.
+
+    Relabelling suits changes no equity, so every spot is keyed by the relabelling with
+    the smallest hole cards; seats keep their order.
+    """
+    if len(spot.board):
+        return None
+
+    holes = [[(int(value), int(suit)) for value, suit in hole] for hole in spot.hole_cards]
+    canonical = min(
+        tuple(tuple(sorted((value, permutation[suit]) for value, suit in hole)) for hole in holes)
+        for permutation in _SUIT_PERMUTATIONS
+    )
+    return len(spot.deck), spot.active, canonical
+
+
+@dataclass(slots=True)
+class EquityStats:
+    computed: int = 0
+    exact: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "computed": self.computed,
+            "exact": self.exact,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+        }
+
+
+class EquityService:
+    """Computes :class:`EquitySpot` odds in worker processes, with a pre-flop cache.
+
+    Parameters
+    ----------
+    workers : int
+        Worker processes, started on first use.
+    samples : int
+        Runouts sampled when a spot has more than ``exact_limit``.
+    preflop_samples : int
+        Runouts sampled for a pre-flop spot that is not cached yet.
+    exact_limit : int
+        Runouts enumerated exactly at most.
+    cache_size : int
+        Pre-flop results kept, least recently used first out.
+    cache_path : Path | None
+        Where the pre-flop cache is loaded from and saved to.
+    executor : Executor | None
+        Runs :func:`compute_equity`; a process pool of ``workers`` by default. An executor
+        passed in is not shut down by :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 2,
+        samples: int = SAMPLES,
+        preflop_samples: int = PREFLOP_SAMPLES,
+        exact_limit: int = EXACT_LIMIT,
+        cache_size: int = 4096,
+        cache_path: Path | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        self.workers: int = workers
+        self.samples: int = samples
+        self.preflop_samples: int = preflop_samples
+        self.exact_limit: int = exact_limit
+        self.cache_size: int = cache_size
+        self.cache_path: Path | None = cache_path
+        self.stats: EquityStats = EquityStats()
+
+        self._executor: Executor | None = executor
+        self._owns_executor: bool = executor is None
+        self._cache: OrderedDict[Hashable, EquityResult] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task[EquityResult]] = {}
+        self._dirty: bool = False
+        self._load_cache()
+
+    @classmethod
+    def from_config(cls, config: SimpleNamespace, *, cache_path: Path | None = None) -> EquityService:
+        return cls(
+            workers=config.workers,
+            samples=config.samples,
+            exact_limit=config.exact_limit,
+            cache_size=config.cache_size,
+            cache_path=cache_path,
+        )
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            # Spawned, not forked: the bot's threads must not be copied into the workers.
+            self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    async def compute(self, spot: EquitySpot) -> EquityResult:
+        """|coro| The odds of ``spot``, from the cache or a worker process."""
+        key = preflop_key(spot)
+        if key is None:
+            return await self._run(spot, self.samples)
+
+        if (cached := self._cache.get(key)) is not None:
+            self._cache.move_to_end(key)
+            self.stats.cache_hits += 1
+            return cached
+
+        if (pending := self._inflight.get(key)) is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(pending)
+
+        # The computation is a task of its own, so cancelling the caller that started it
+        # (a table moving on to the next round) leaves the other tables waiting on it alone.
+        task = asyncio.create_task(self._run_preflop(key, spot))
+        self._inflight[key] = task
+        task.add_done_callback(functools.partial(self._settled, key))
+        return await asyncio.shield(task)
+
+    async def _run_preflop(self, key: Hashable, spot: EquitySpot) -> EquityResult:
+        result = await self._run(spot, self.preflop_samples)
+        self._store(key, result)
+        return result
+
+    def _settled(self, key: Hashable, task: asyncio.Task[EquityResult]) -> None:
+        del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved, so waiters alone decide whether to surface it
+
+    async def _run(self, spot: EquitySpot, samples: int) -> EquityResult:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, _compute, spot, samples, self.exact_limit)
+        self.stats.computed += 1
+        self.stats.exact += result.exact
+        return result
+
+    def _store(self, key: Hashable, result: EquityResult) -> None:
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        self._dirty = True
+
+    def summary(self) -> dict[str, Any]:
+        return {"workers": self.workers, "cached": len(self._cache), **self.stats.to_dict()}
+
+    def _load_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            entries = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return
+
+        # Filled aside, so a file of some other shape leaves the cache empty rather than half loaded.
+        cache: OrderedDict[Hashable, EquityResult] = OrderedDict()
+        try:
+            for (deck, active, holes), (live, full, strength, scenarios, margin) in entries[-self.cache_size:]:
+                key = (deck, tuple(active), tuple(tuple(tuple(card) for card in hole) for hole in holes))
+                cache[key] = EquityResult(
+                    live=live,
+                    full=full,
+                    hand_strength={int(seat): shares for seat, shares in strength.items()},
+                    scenarios=scenarios,
+                    exact=False,
+                    margin=margin,
+                )
+        except (TypeError, ValueError, KeyError, AttributeError):
+            log.warning("Discarding the pre-flop equity cache at %s: unexpected contents", self.cache_path, exc_info=True)
+            return
+        self._cache = cache
+
+    def save_cache(self) -> None:
+        """Writes the pre-flop cache to ``cache_path``, if it changed."""
+        if self.cache_path is None or not self._dirty:
+            return
+
+        entries = [
+            [key, [r.live, r.full, r.hand_strength, r.scenarios, r.margin]] for key, r in self._cache.items()
+        ]
+        tmp = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(entries, separators=(",", ":")))
+            tmp.replace(self.cache_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+        else:
+            self._dirty = False
+
+    def close(self) -> None:
+        """Saves the pre-flop cache and stops the worker processes."""
+        self.save_cache()
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _compute(spot: EquitySpot, samples: int, exact_limit: int) -> EquityResult:
+    return compute_equity(spot, samples=samples, exact_limit=exact_limit)
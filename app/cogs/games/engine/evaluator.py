@@ -0,0 +1,257 @@
+"""Lookup-table hand evaluator for the poker engine.
+
+Every 5-, 6- and 7-card hand is ranked with one table lookup (two for hands holding a
+flush) instead of ranking its 5-card combinations one by one. The value of a hand only
+depends on the multiset of its ranks, plus -- when five or more cards share a suit --
+the ranks of those suited cards. A sorted rank multiset has a perfect hash, its
+combinatorial (colex) index, so each table is a dense ``int32`` array:
+
+* ``base[n]``: best value of an ``n``-card rank multiset, ignoring suits.
+* ``suited[k]``: best value of ``k`` cards of one suit, flushes included.
+
+The tables (~590 KiB) are computed once, saved next to the other runtime data and
+memory-mapped on every later start, so the engine's processes share one copy.
+
+Values use the encoding the engine has always used:
+``category * 16**5 + sum(rank_i * 16**i)`` with the most significant card last, where
+``category`` is the :data:`~app.cogs.games.engine.cards.NAMED_HAND` key. Comparing two
+values compares the hands, and ``value // 16**5`` is the hand category.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import Counter
+from itertools import combinations, combinations_with_replacement
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
+from scipy.special import comb
+
+from app.cogs.games.engine.cards import SUITS, UNAMED
+from app.utils import RevDict
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = (
+    "CATEGORY_BASE",
+    "HandEvaluator",
+    "five_card_value",
+)
+
+#: Multiplier of the hand category in a hand value.
+CATEGORY_BASE: int = 16**5
+
+_RANKS: int = 13
+_SIZES: tuple[int, ...] = (5, 6, 7)
+_TABLE_VERSION: int = 1
+
+# _BINOM[i, x] = C(x, i + 1), for the colex index of sorted multisets of up to 7 ranks.
+_BINOM: np.ndarray = np.array(
+    [[comb(x, i + 1, exact=True) for x in range(_RANKS + max(_SIZES))] for i in range(max(_SIZES))], dtype=np.int64
+)
+
+
+def _table_size(n: int) -> int:
+    return int(comb(_RANKS + n - 1, n, exact=True))
+
+
+def _multiset_index(sorted_ranks: np.ndarray) -> np.ndarray:
+    """Perfect hash of rank multisets: the colex index of each row of ascending ranks (0-12)."""
+    n = sorted_ranks.shape[-1]
+    positions = np.arange(n)
+    return _BINOM[positions, sorted_ranks + positions].sum(axis=-1)
+
+
+def _combinations(n: int, k: int) -> np.ndarray:
+    return np.array(list(combinations(range(n), k)), dtype=np.intp)
+
+
+def five_card_value(values: tuple[int, ...] | list[int], suited: bool = False) -> int:
+    """The value of five cards given by their ranks (2-14); ``suited`` if they share a suit.
+
+    This is the reference the lookup tables are built from.
+    """
+    counts = Counter(values)
+    # Cards from the most to the least significant: bigger groups first, then higher ranks.
+    ordered = [rank for rank, count in sorted(counts.items(), key=lambda x: (x[1], x[0]), reverse=True) for _ in range(count)]
+    pattern = sorted(counts.values(), reverse=True)
+
+    distinct = sorted(counts, reverse=True)
+    straight = len(distinct) == 5 and (distinct[0] - distinct[4] == 4 or distinct == [14, 5, 4, 3, 2])
+    if straight and distinct[0] == 14 and distinct[1] == 5:
+        ordered = [5, 4, 3, 2, 14]  # the wheel, five high
+
+    if pattern[0] >= 4:
+        category = 7
+    elif pattern[:2] == [3, 2]:
+        category = 6
+    elif straight:
+        category = 8 if suited else 4
+    elif suited:
+        category, ordered = 5, sorted(values, reverse=True)
+    elif pattern[0] == 3:
+        category = 3
+    elif pattern[:2] == [2, 2]:
+        category = 2
+    elif pattern[0] == 2:
+        category = 1
+    else:
+        category = 0
+
+    return category * CATEGORY_BASE + sum(rank * 16 ** (4 - i) for i, rank in enumerate(ordered))
+
+
+def _build_tables() -> np.ndarray:
+    five = np.array(list(combinations_with_replacement(range(_RANKS), 5)), dtype=np.int64)
+    base: dict[int, np.ndarray] = {5: np.zeros(_table_size(5), dtype=np.int32)}
+    suited: dict[int, np.ndarray] = {5: np.zeros(_table_size(5), dtype=np.int32)}
+
+    index = _multiset_index(five)
+    for row, ranks in zip(index, five + 2):
+        base[5][row] = five_card_value(tuple(ranks))
+        suited[5][row] = five_card_value(tuple(ranks), suited=True)
+
+    for n in _SIZES[1:]:
+        multisets = np.array(list(combinations_with_replacement(range(_RANKS), n)), dtype=np.int64)
+        # Subsets of an ascending row stay ascending, so they can be hashed as they are.
+        subsets = _multiset_index(multisets[:, _combinations(n, 5)])
+        index = _multiset_index(multisets)
+        base[n] = np.zeros(_table_size(n), dtype=np.int32)
+        suited[n] = np.zeros(_table_size(n), dtype=np.int32)
+        base[n][index] = base[5][subsets].max(axis=1)
+        suited[n][index] = suited[5][subsets].max(axis=1)
+
+    return np.concatenate([base[n] for n in _SIZES] + [suited[n] for n in _SIZES])
+
+
+class HandEvaluator:
+    """Ranks 5- to 7-card poker hands with precomputed lookup tables.
+
+    Cards are ``(value, suit)`` rows as everywhere else in the engine, with values 2-14 and
+    suits 0-3. Multi-deck tables are supported: duplicate cards rank like the
+    :class:`~app.cogs.games.engine.poker.Ranker` always did (five of a kind counts as four).
+
+    Parameters
+    ----------
+    tables: np.ndarray
+        The concatenated lookup tables, as built by :meth:`load`.
+    """
+
+    _default: ClassVar[HandEvaluator | None] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, tables: np.ndarray) -> None:
+        expected = 2 * sum(_table_size(n) for n in _SIZES)
+        if tables.shape != (expected,):
+            raise ValueError(f"expected {expected} table entries, got {tables.shape}")
+        self.tables: np.ndarray = tables
+        self._base: dict[int, np.ndarray] = {}
+        self._suited: dict[int, np.ndarray] = {}
+        offset = 0
+        for target in (self._base, self._suited):
+            for n in _SIZES:
+                target[n] = tables[offset:offset + _table_size(n)]
+                offset += _table_size(n)
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> HandEvaluator:
+        """Memory-maps the tables at ``path``, building and saving them first if needed.
+
+        Without a ``path`` the tables are only built in memory. A file that cannot be
+        written or read back is rebuilt in memory instead.
+        """
+        if path is None:
+            return cls(_build_tables())
+
+        try:
+            return cls(np.load(path, mmap_mode="r"))
+        except (OSError, ValueError):
+            pass
+
+        tables = _build_tables()
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp.open("wb") as fp:
+                np.save(fp, tables)
+            tmp.replace(path)
+            return cls(np.load(path, mmap_mode="r"))
+        except (OSError, ValueError):
+            tmp.unlink(missing_ok=True)
+            return cls(tables)
+
+    @classmethod
+    def default(cls) -> HandEvaluator:
+        """The shared evaluator, memory-mapped from the data directory on first use."""
+        if cls._default is None:
+            with cls._lock:
+                if cls._default is None:
+                    from config import data_path
+
+                    cls._default = cls.load(data_path / f"poker_tables_v{_TABLE_VERSION}.npy")
+        return cls._default
+
+    def evaluate(self, cards: np.ndarray) -> np.ndarray:
+        """Values of hands of 5 to 7 cards.
+
+        Parameters
+        ----------
+        cards: np.ndarray
+            Hands of shape ``(..., n, 2)`` with ``5 <= n <= 7``.
+
+        Returns
+        -------
+        np.ndarray
+            An ``int64`` array of shape ``cards.shape[:-2]``; higher is better.
+        """
+        n = cards.shape[-2]
+        if n not in self._base:
+            raise ValueError(f"can only evaluate hands of 5 to 7 cards, not {n}")
+
+        hands = cards.reshape(-1, n, 2)
+        ranks = np.sort(hands[:, :, 0] - 2, axis=1)
+        suits = hands[:, :, 1]
+        values = self._base[n][_multiset_index(ranks)].astype(np.int64)
+
+        # At most one suit can hold five of seven cards; rank those cards with the suited table.
+        suit_counts = np.stack([(suits == suit).sum(axis=1) for suit in range(4)], axis=1)
+        flush_suit = suit_counts.argmax(axis=1)
+        flush_size = suit_counts.max(axis=1)
+        for k in range(5, n + 1):
+            rows = np.flatnonzero(flush_size == k)
+            if not len(rows):
+                continue
+            in_suit = suits[rows] == flush_suit[rows, np.newaxis]
+            suited_ranks = np.sort((hands[rows, :, 0] - 2)[in_suit].reshape(-1, k), axis=1)
+            values[rows] = np.maximum(values[rows], self._suited[k][_multiset_index(suited_ranks)])
+
+        return values.reshape(cards.shape[:-2])
+
+    def best_five(self, cards: np.ndarray) -> tuple[int, np.ndarray]:
+        """The value of a 5- to 7-card hand and the five cards that make it."""
+        combos = cards[_combinations(len(cards), 5)]
+        values = self.evaluate(combos)
+        best = int(np.argmax(values))
+        return int(values[best]), combos[best]
+
+    @staticmethod
+    def hand_name(value: int, cards: np.ndarray) -> str:
+        """Describes the five ``cards`` worth ``value``, e.g. ``"Kings over Fours"``."""
+        category = value // CATEGORY_BASE
+        # Ranks from the most to the least significant card.
+        top, _, third, fourth, last = ((value >> (4 * i)) & 0xF for i in range(4, -1, -1))
+
+        if category in (4, 8):
+            return "Ace Low" if last == 14 and top == 5 else f"{UNAMED[top]} High"
+        if category == 5:
+            suit = Counter(int(s) for s in cards[:, 1]).most_common(1)[0][0]
+            return RevDict(SUITS)[suit].title()
+        if category == 6:
+            return f"{UNAMED[top]}s over {UNAMED[fourth]}s"
+        if category == 2:
+            return f"{UNAMED[third]}s and {UNAMED[top]}s"
+        if category in (1, 3, 7):
+            return f"{UNAMED[top]}s"
+        return f"{UNAMED[top]} High"
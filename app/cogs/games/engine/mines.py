@@ -9,8 +9,9 @@ busts the run. No Discord imports — fully unit-testable.
 from __future__ import annotations
 
 import random
+from functools import cache
 
-__all__ = ('COLS', 'ROWS', 'TILES', 'Mines')
+__all__ = ('COLS', 'ROWS', 'TILES', 'Mines', 'multipliers')
 
 COLS: int = 5
 ROWS: int = 4
@@ -18,17 +19,45 @@ TILES: int = COLS * ROWS
 HOUSE_EDGE: float = 0.97
 
 
+@cache
+def multipliers(mine_count: int) -> tuple[float, ...]:
+    """Cash-out multiplier after ``0..safe`` gems for a mine count, computed once."""
+    safe_total = TILES - mine_count
+    table, fair = [1.0], 1.0
+    for i in range(safe_total):
+        fair *= (TILES - i) / (safe_total - i)
+        table.append(round(fair * HOUSE_EDGE, 2))
+    return tuple(table)
+
+
 class Mines:
-    """Stateful single-run Mines game over a :data:`TILES`-tile grid."""
+    """Stateful single-run Mines game over a :data:`TILES`-tile grid.
+
+    Mines and revealed gems are bitmasks over the tile indices.
+    """
+
+    __slots__ = ('_multipliers', '_rng', 'busted', 'mine_count', 'mine_mask', 'revealed_mask')
 
     def __init__(self, mine_count: int, rng: random.Random | None = None) -> None:
         if not 1 <= mine_count <= TILES - 1:
             raise ValueError(f"mine_count must be between 1 and {TILES - 1}")
         self._rng = rng or random.Random()
         self.mine_count: int = mine_count
-        self.mine_positions: set[int] = set(self._rng.sample(range(TILES), mine_count))
-        self.revealed: set[int] = set()
+        self.mine_mask: int = sum(1 << i for i in self._rng.sample(range(TILES), mine_count))
+        self.revealed_mask: int = 0
         self.busted: bool = False
+        self._multipliers: tuple[float, ...] = multipliers(mine_count)
+
+    @property
+    def mine_positions(self) -> frozenset[int]:
+        """Indices of the mine tiles."""
+        return frozenset(i for i in range(TILES) if self.mine_mask >> i & 1)
+
+    def is_mine(self, index: int) -> bool:
+        return bool(self.mine_mask >> index & 1)
+
+    def is_revealed(self, index: int) -> bool:
+        return bool(self.revealed_mask >> index & 1)
 
     @property
     def safe_total(self) -> int:
@@ -37,7 +66,7 @@ class Mines:
 
     @property
     def safe_revealed(self) -> int:
-        return len(self.revealed)
+        return self.revealed_mask.bit_count()
 
     @property
     def cleared(self) -> bool:
@@ -47,28 +76,18 @@ class Mines:
     @property
     def multiplier(self) -> float:
         """Current cash-out multiplier for the gems revealed so far."""
-        if self.safe_revealed == 0:
-            return 1.0
-        fair = 1.0
-        for i in range(self.safe_revealed):
-            fair *= (TILES - i) / (self.safe_total - i)
-        return round(fair * HOUSE_EDGE, 2)
+        return self._multipliers[self.revealed_mask.bit_count()]
 
     def next_multiplier(self) -> float:
         """The multiplier the player would reach by revealing one more gem."""
-        if self.safe_revealed >= self.safe_total:
-            return self.multiplier
-        fair = 1.0
-        for i in range(self.safe_revealed + 1):
-            fair *= (TILES - i) / (self.safe_total - i)
-        return round(fair * HOUSE_EDGE, 2)
+        return self._multipliers[min(self.safe_revealed + 1, self.safe_total)]
 
     def reveal(self, index: int) -> bool:
         """Reveals a tile. Returns ``True`` for a gem, ``False`` (and busts) for a mine."""
         if self.busted:
             raise RuntimeError("cannot reveal after busting")
-        if index in self.mine_positions:
+        if self.mine_mask >> index & 1:
             self.busted = True
             return False
-        self.revealed.add(index)
+        self.revealed_mask |= 1 << index
         return True
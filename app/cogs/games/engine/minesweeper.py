@@ -1,30 +1,42 @@
 """Pure minesweeper engine.
 
-Owns the board, mine placement, the iterative flood-fill reveal and win detection with
-**zero** Discord dependencies. The Discord-facing binding (the view, the per-cell buttons
-and the embeds) lives in ``app/cogs/games/minesweeper_ui.py``.
+Owns the board, mine placement, the flood-fill reveal and win detection with **zero**
+Discord dependencies. The Discord-facing binding (the view, the per-cell buttons and the
+embeds) lives in ``app/cogs/games/minesweeper_ui.py``.
+
+A board is a single :class:`bytearray`, one byte per cell: the low nibble holds the
+number of neighbouring mines and two flag bits mark mines and revealed cells. Cell
+indices run row by row (``row * cols + col``). Neighbour indices come from a table that
+is built once per board shape and shared by every game of that shape.
 """
 
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
-from itertools import chain
+from functools import cache
 from typing import Final
 
-NEIGHBOURS: Final[list[tuple[int, int]]] = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+__all__ = ('MINE', 'REVEALED', 'VALUE', 'Board', 'neighbour_table')
+
+VALUE: Final[int] = 0x0F
+MINE: Final[int] = 0x10
+REVEALED: Final[int] = 0x20
 
+NEIGHBOURS: Final[list[tuple[int, int]]] = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
 
-@dataclass
-class MSField:
-    x: int
-    y: int
-    value: int = 0
-    revealed: bool = False
-    mine: bool = False
 
-    def __eq__(self, other: MSField) -> bool:
-        return self.x == other.x and self.y == other.y
+@cache
+def neighbour_table(rows: int, cols: int) -> tuple[tuple[int, ...], ...]:
+    """The neighbour indices of every cell of a board shape, shared by all its boards."""
+    return tuple(
+        tuple(
+            (r + dr) * cols + c + dc
+            for dr, dc in NEIGHBOURS
+            if 0 <= r + dr < rows and 0 <= c + dc < cols
+        )
+        for r in range(rows)
+        for c in range(cols)
+    )
 
 
 class Board:
@@ -32,58 +44,72 @@ class Board:
 
     SIZE: Final[int] = 5
 
-    def __init__(self, mines: int) -> None:
+    __slots__ = ('_hidden_safe', 'cells', 'cols', 'mines', 'rows')
+
+    def __init__(self, mines: int, *, rows: int = SIZE, cols: int = SIZE, rng: random.Random | None = None) -> None:
+        if not 1 <= mines < rows * cols:
+            raise ValueError(f"mines must be between 1 and {rows * cols - 1}")
+        self.rows: int = rows
+        self.cols: int = cols
         self.mines: int = mines
-        self.board: list[list[MSField]] = [[MSField(x=x, y=y) for x in range(self.SIZE)] for y in range(self.SIZE)]
-        self.place_mines()
+        self.cells: bytearray = bytearray(rows * cols)
+        self._hidden_safe: int = rows * cols - mines
+        self.place_mines(rng or random.Random())
 
-    def place_mines(self) -> None:
-        """Place the mines on the board.
+    def place_mines(self, rng: random.Random) -> None:
+        """Place the mines on the board and count every cell's neighbouring mines."""
+        table = neighbour_table(self.rows, self.cols)
+        cells = self.cells
+        for index in rng.sample(range(len(cells)), self.mines):
+            cells[index] |= MINE
+            for neighbour in table[index]:
+                cells[neighbour] += 1  # at most 8, never reaches the flag bits
 
-        This is done by setting the `mine` attribute of a MSField to `true`
-        and incrementing the value of the surrounding cells.
-        """
-        for field in random.sample(list(chain.from_iterable(self.board)), self.mines):
-            field.mine = True
+    def index(self, row: int, col: int) -> int:
+        return row * self.cols + col
 
-            for j, i in self.get_neighbours(field):
-                if not self.board[j][i].mine:
-                    self.board[j][i].value += 1
+    def is_mine(self, index: int) -> bool:
+        return bool(self.cells[index] & MINE)
 
-    @staticmethod
-    def get_neighbours(field: MSField) -> list[tuple[int, int]]:
-        """Get the neighbours of a cell"""
-        return [
-            (field.x + i, field.y + j)
-            for i, j in NEIGHBOURS
-            if (0 <= field.x + i < Board.SIZE) and (0 <= field.y + j < Board.SIZE)
-        ]
+    def is_revealed(self, index: int) -> bool:
+        return bool(self.cells[index] & REVEALED)
 
-    def mark(self, field: MSField) -> bool:
-        """Mark a cell as selected, iterative flood-fill to avoid RecursionError.
+    def value(self, index: int) -> int:
+        """The number of mines around a cell."""
+        return self.cells[index] & VALUE
+
+    def reveal(self, index: int) -> bool:
+        """Reveal a cell, flooding outwards from cells without neighbouring mines.
 
         Returns ``False`` if a mine was hit, ``True`` otherwise.
         """
-        stack = [field]
-
+        cell = self.cells[index]
+        if cell & REVEALED:
+            return True
+        self.cells[index] = cell | REVEALED
+        if cell & MINE:
+            return False  # hit a mine
+        self._hidden_safe -= 1
+        if cell & VALUE:
+            return True
+
+        table = neighbour_table(self.rows, self.cols)
+        cells = self.cells
+        stack = [index]
         while stack:
-            current = stack.pop()
-            if current.revealed:
-                continue
-            current.revealed = True
-
-            if current.mine:
-                return False  # hit a mine
-
-            if current.value == 0:
-                for i, j in self.get_neighbours(current):
-                    neighbour = self.board[i][j]
-                    if not neighbour.revealed:
-                        stack.append(neighbour)
+            for neighbour in table[stack.pop()]:
+                cell = cells[neighbour]
+                if cell & REVEALED:
+                    continue
+                # Cells next to an empty cell are never mines.
+                cells[neighbour] = cell | REVEALED
+                self._hidden_safe -= 1
+                if not cell & VALUE:
+                    stack.append(neighbour)
 
         return True
 
     @property
     def is_won(self) -> bool:
         """Whether every non-mine cell has been revealed."""
-        return all(all(kind.revealed for kind in row if not kind.mine) for row in self.board)
+        return self._hidden_safe == 0
@@ -1,9 +1,10 @@
 """Pure Texas Hold'em poker engine.
 
 This module contains the complete game logic and state machine for Texas
-Hold'em: card ranking, hand evaluation, pots/side-pots, the betting actions and
-the Monte-Carlo odds simulation. It has **no** ``discord`` imports and performs
-no IO. ``Player.member`` is an opaque identity token (the cog passes a
+Hold'em: card ranking, hand evaluation, pots/side-pots and the betting actions.
+Each street's odds are queued as an :class:`~app.cogs.games.engine.equity.EquitySpot`
+and computed off the event loop by the bridge. It has **no** ``discord`` imports and
+performs no IO. ``Player.member`` is an opaque identity token (the cog passes a
 ``discord.Member``); the engine never calls Discord APIs on it.
 
 Rendering (embeds), the autoplay timer and the economy refund live in the
@@ -13,18 +14,18 @@ Rendering (embeds), the autoplay timer and the economy refund live in the
 from __future__ import annotations
 
 import enum
-import multiprocessing
-import random
+import sys
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from itertools import chain, combinations
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
 
 import numpy as np
-from joblib import Parallel, delayed
 from scipy.special import comb
 
 from app.cogs.games.engine.cards import NAMED_HAND, SUITS, UNAMED, BaseCard, BaseHand, Deck
+from app.cogs.games.engine.equity import SAMPLES, EquityResult, EquitySpot, compute_equity
+from app.cogs.games.engine.evaluator import CATEGORY_BASE, HandEvaluator
 from app.utils import RevDict, fnumb
 
 if TYPE_CHECKING:
@@ -122,38 +123,33 @@ class Hand(BaseHand[Card]):
                 value=sum(self.card_arr[:, 0]),
             )
 
-        best_comb: RankingItem = np.max(combs.ranking)
-
-        name = NAMED_HAND[np.max(best_comb.rank) // 16**5]
-        if best_comb.name is not None:
-            name += f", {best_comb.name}"
+        best = int(np.argmax(combs.ranking))
+        value = int(combs.ranking[best])
+        best_cards = combs.all_combos[best]
 
         return HandResult(
-            name=name,
-            cards=[Card(suit=x[1], value=x[0]) for x in combs.all_combos[0, np.argmax(combs.ranking), :, :]],
-            value=best_comb.rank,
+            name=f"{NAMED_HAND[value // CATEGORY_BASE]}, {HandEvaluator.hand_name(value, best_cards)}",
+            cards=[Card(suit=x[1], value=x[0]) for x in best_cards],
+            value=value,
         )
 
     def hand_value(self, community_arr: np.ndarray) -> CombResult | None:
-        """Returns the value of the player's hand.
+        """Returns the value of every 5-card combination of the player's hand.
 
-        The value is calculated by combining the hand of the player with the community cards and
-        calculating the value of each combination. The combination with the highest value is returned.
+        The hand of the player is combined with the community cards and each combination of
+        five cards is ranked with the :class:`HandEvaluator` lookup tables.
 
         Returns
         -------
         CombResult | None
-            The value of the player's hand.
+            The combinations and their values, or ``None`` before the flop.
         """
         if len(community_arr) < 3:
             return None
 
         player_valid_hand = np.concatenate([self.card_arr, community_arr], axis=0)
-        all_combos = np.expand_dims(player_valid_hand, axis=0)[:, comb_index(len(player_valid_hand), 5), :]
-        ranking: np.ndarray[Any, np.dtype[Any]] = cast(
-            "np.ndarray[Any, np.dtype[Any]]", Ranker.rank_all_hands(all_combos, return_all=True)
-        )
-        return CombResult(all_combos=all_combos, ranking=ranking)
+        all_combos = player_valid_hand[comb_index(len(player_valid_hand), 5)]
+        return CombResult(all_combos=all_combos, ranking=HandEvaluator.default().evaluate(all_combos))
 
 
 class CombResult(NamedTuple):
@@ -162,13 +158,13 @@ class CombResult(NamedTuple):
     Parameters
     ----------
     all_combos : np.ndarray
-        An array of all combinations of cards.
-    ranking : np.ndarray[Any, np.dtype[Any]]
-        An array of the ranking of each combination of cards.
+        An array of all 5-card combinations, of shape ``(combinations, 5, 2)``.
+    ranking : np.ndarray
+        The value of each combination of cards.
     """
 
     all_combos: np.ndarray
-    ranking: np.ndarray[Any, np.dtype[Any]]
+    ranking: np.ndarray
 
 
 class HandResult(NamedTuple):
@@ -230,7 +226,11 @@ class RankingItem:
 
 
 class Ranker:
-    """Represents the ranking of a hand of cards"""
+    """Represents the ranking of a hand of cards
+
+    Superseded by the lookup tables of :class:`HandEvaluator`, which the engine uses; kept for
+    callers of the ``RankingItem`` API and as the baseline of ``tests/bench_poker_eval.py``.
+    """
 
     @classmethod
     def rank_all_hands(
@@ -651,11 +651,13 @@ class TexasHoldem:
         self.winners: list[tuple[list[Player], Pot]] = []
         self.eliminated_players: list[Player] = []
 
-        # Analysis data: list of (live_analysis, full_analysis, hand_strength) per street
+        # Analysis data: one EquityResult (live_analysis, full_analysis, hand_strength) per street
         # live_analysis: odds among active players only
         # full_analysis: odds including folded players (hypothetical)
         # hand_strength: hand type distribution per player
-        self.analysis: list[tuple[dict[str, float], dict[str, float], dict[int, dict[str, float]]]] = []
+        # The streets are queued in equity_spots; the bridge computes them and fills analysis.
+        self.analysis: list[EquityResult] = []
+        self.equity_spots: list[EquitySpot] = []
         self.odds_mode: OddsMode = OddsMode.LIVE  # Default to live odds
 
     def __repr__(self) -> str:
@@ -788,6 +790,7 @@ class TexasHoldem:
         self.pot = Pot(amount=0)
         self.tie = False
         self.analysis = []
+        self.equity_spots = []
         self.straddle_index = None
         self.straddle_amount = 0
         self.run_it_twice_offered = False
@@ -854,7 +857,7 @@ class TexasHoldem:
                 player.folded_on_street = 0  # Folded pre-flop
 
         if self.odds_mode != OddsMode.NONE:
-            self.analysis.append(cast("tuple[dict[str, float], dict[str, float], dict[int, dict[str, float]]]", self.simulate(final_hand=True)))
+            self._record_equity_spot()
 
     def end(self) -> None:
         """Ends the game by calculating the winner(s).
@@ -1373,9 +1376,7 @@ class TexasHoldem:
         while len(self.community_arr) < 5:
             if len(self.community_arr) in (3, 4) and self.odds_mode != OddsMode.NONE:
                 # add analysis data for the flop and turn
-                self.analysis.append(
-                    cast("tuple[dict[str, float], dict[str, float], dict[int, dict[str, float]]]", self.simulate(final_hand=True))
-                )
+                self._record_equity_spot()
 
             self.community_arr = np.concatenate([self.community_arr, self.deck.draw()], axis=0)
 
@@ -1453,9 +1454,7 @@ class TexasHoldem:
 
         # Calculate odds if game is not over and odds mode is enabled
         if len(self.community_arr) != 5 and self.odds_mode != OddsMode.NONE:
-            self.analysis.append(
-                cast("tuple[dict[str, float], dict[str, float], dict[int, dict[str, float]]]", self.simulate(final_hand=True))
-            )
+            self._record_equity_spot()
 
     def autoplay_turn(self, player: Player) -> bool:
         """Applies the automatic action for a player who took too long.
@@ -1505,210 +1504,30 @@ class TexasHoldem:
 
     # Simulation
 
-    def _simulation_preparation(self, num_scenarios: int | Literal["all"]) -> tuple[np.ndarray | None, np.ndarray]:
-        """Prepares the simulation by generating the community cards and undrawn cards
-
-        Parameters
-        ----------
-        num_scenarios: int
-            The number of scenarios to simulate, if 'all' then all scenarios will be simulated.
-
-        Returns
-        -------
-        tuple[np.ndarray, np.ndarray]
-            The community cards and undrawn cards.
-        """
-        total_idx = comb_index(len(self.deck.cards), 5 - len(self.community_arr))
-        undrawn_combos = self.deck.cards[total_idx]
-        if num_scenarios != "all":
-            assert isinstance(num_scenarios, int), "'num_scenarios' must be an integer"
-            if len(undrawn_combos) > num_scenarios:
-                undrawn_combos = undrawn_combos[np.array(random.sample(range(len(undrawn_combos)), num_scenarios))]
-
-        if len(self.community_arr) > 0:
-            community_cards = np.repeat([self.community_arr], len(undrawn_combos), axis=0)
-        else:
-            community_cards = None
-        return community_cards, undrawn_combos
-
-    def _hand_strength_analysis(self, res_arr: np.ndarray) -> dict:  # type: ignore[type-var]
-        """Returns the hand strength of each player
-
-        Parameters
-        ----------
-        res_arr: np.ndarray
-            The result array from the simulation.
-
-        Returns
-        -------
-        dict
-            The hand strength of each player.
-        """
-        final_hand_dict = {}
-        for player in range(len(self.players)):
-            hand_type, hand_freq = np.unique((res_arr // 16**5)[:, player], return_counts=True)  # type: ignore[operator]
-            final_hand_dict[player + 1] = dict(
-                zip(np.vectorize(NAMED_HAND.get)(hand_type), np.round(hand_freq / hand_freq.sum() * 100, 2).astype(float))
-            )
-        return final_hand_dict
-
-    def _simulation_analysis(
-        self,
-        odds_type: Literal["win_any", "tie_win", "precise"],
-        res_arr: np.ndarray[Any, np.dtype[Any]],
-        active_indices: list[int] | None = None,
-    ) -> dict:
-        """Analyze simulation results to compute odds.
-
-        Parameters
-        ----------
-        odds_type : Literal["win_any", "tie_win", "precise"]
-            The type of odds calculation.
-        res_arr : np.ndarray
-            The simulation result array (scenarios x players).
-        active_indices : list[int] | None
-            If provided, only consider these player indices for odds calculation.
-            Players not in this list will have 0% odds (as if they folded).
-        """
-        if active_indices is None:
-            active_indices = list(range(len(self.players)))
-
-        # For live odds, we only consider active players when determining the "best hand"
-        # Create a masked result array where folded players have minimum values
-        if len(active_indices) < len(self.players):
-            masked_res = res_arr.copy()
-            for i in range(len(self.players)):
-                if i not in active_indices:
-                    masked_res[:, i] = -1  # Set to -1 so they can never "win"
-            outcome_arr = masked_res == np.expand_dims(np.max(masked_res, axis=1), axis=1)
-        else:
-            outcome_arr = res_arr == np.expand_dims(np.max(res_arr, axis=1), axis=1)
-
-        num_outcomes = len(outcome_arr)  # type: ignore # lying
-        outcome_dict: dict[str, float] = {}
-
-        # Any Tied Win counts as a Win
-        if odds_type == "win_any":
-            tie_indices = np.all(outcome_arr, axis=1)  # multi-way tie
-            outcome_dict["Tie"] = float(np.round(np.mean(tie_indices) * 100, 2))
-
-            for player in range(len(self.players)):
-                if player in active_indices:
-                    outcome_dict["Player " + str(player + 1)] = float(np.round(
-                        np.sum(outcome_arr[~tie_indices, player]) / num_outcomes * 100, 2
-                    ))  # type: ignore # lying
-                else:
-                    outcome_dict["Player " + str(player + 1)] = 0.0
-
-        # Any Multi-way Tie/Tied Win counts as a Tie, Win must be exclusive
-        elif odds_type == "tie_win":
-            for player in range(len(self.players)):
-                if player in active_indices:
-                    tie_win_scenarios = outcome_arr[outcome_arr[:, player] == 1].sum(axis=1)  # type: ignore # lying
-                    outcome_dict["Player " + str(player + 1) + " Win"] = float(np.round(
-                        np.sum(tie_win_scenarios == 1) / num_outcomes * 100, 2
-                    ))
-                    outcome_dict["Player " + str(player + 1) + " Tie"] = float(np.round(
-                        np.sum(tie_win_scenarios > 1) / num_outcomes * 100, 2
-                    ))
-                else:
-                    outcome_dict["Player " + str(player + 1) + " Win"] = 0.0
-                    outcome_dict["Player " + str(player + 1) + " Tie"] = 0.0
-
-        # Every possible outcome
-        elif odds_type == "precise":
-            for num_player in range(1, len(self.players) + 1):
-                for player_arr in comb_index(len(self.players), num_player):
-                    temp_arr = np.ones(shape=(outcome_arr.shape[0]), dtype=bool)  # type: ignore # lying
-                    for player in player_arr:
-                        temp_arr = temp_arr & (outcome_arr[:, player] == 1)
-                    for non_player in [player for player in range(len(self.players)) if player not in player_arr]:
-                        temp_arr = temp_arr & (outcome_arr[:, non_player] == 0)
-
-                    if len(player_arr) == 1:
-                        outcome_key = f"Player {player_arr[0] + 1} Win"
-                    else:
-                        outcome_key = f"Player {','.join([str(player + 1) for player in player_arr])} Tie"
-
-                    outcome_dict[outcome_key] = float(np.round(temp_arr.sum() / num_outcomes * 100, 2))
-        return outcome_dict
-
-    def _simulate_calculation(
-        self, community_cards: np.ndarray | None, undrawn_combos: np.ndarray
-    ) -> np.ndarray[Any, np.dtype[Any]]:
-        """Simulates the game by calculating the hand strength of each player
-
-        Parameters
-        ----------
-        community_cards: np.ndarray
-            The community cards.
-        undrawn_combos: np.ndarray
-            The undrawn cards.
-
-        Returns
-        -------
-        np.ndarray
-            The result array.
-        """
-        res_arr: np.ndarray[Any, np.dtype[Any]] = np.zeros(  # type: ignore
-            shape=(len(undrawn_combos), len(self.players)), dtype=RankingItem
+    def equity_spot(self) -> EquitySpot:
+        """Returns the current street as an :class:`EquitySpot` for :func:`compute_equity`."""
+        return EquitySpot(
+            hole_cards=np.stack([player.hand.card_arr for player in self.players]),
+            board=self.community_arr.copy(),
+            deck=self.deck.cards.copy(),
+            active=tuple(index for index, player in enumerate(self.players) if not player.folded),
         )
 
-        if len(self.players) >= 2:
-            (
-                Parallel(n_jobs=multiprocessing.cpu_count(), backend="threading")(
-                    delayed(self.gen_single_hand)(community_cards, player, undrawn_combos, res_arr)
-                    for player in range(len(self.players))
-                )
-            )
-        else:
-            for player in range(len(self.players)):
-                self.gen_single_hand(community_cards, player, undrawn_combos, res_arr)
-        return res_arr
-
-    def gen_single_hand(
-        self,
-        community_cards: np.ndarray | None,
-        player: int,
-        undrawn_combos: np.ndarray,
-        res_arr: np.ndarray[Any, np.dtype[Any]],
-    ) -> None:
-        """Generates a single hand
-
-        Parameters
-        ----------
-        community_cards: np.ndarray
-            The community cards.
-        player: int
-            The player index.
-        undrawn_combos: np.ndarray
-            The undrawn cards.
-        res_arr: np.ndarray
-            The result array.
-        """
-        if community_cards is None:
-            cur_player_cards = np.concatenate(
-                [np.repeat([self.players[player].hand.card_arr], len(undrawn_combos), axis=0), undrawn_combos], axis=1
-            )
-        else:
-            cur_player_cards = np.concatenate(
-                [
-                    np.repeat([self.players[player].hand.card_arr], len(undrawn_combos), axis=0),
-                    community_cards,
-                    undrawn_combos,
-                ],
-                axis=1,
-            )
-        res_arr[:, player] = Ranker.rank_all_hands(cur_player_cards[:, comb_index(7, 5), :])
+    def _record_equity_spot(self) -> None:
+        """Queues the current street for the odds analysis, which the bridge computes off the event loop."""
+        self.equity_spots.append(self.equity_spot())
 
     def simulate(
         self,
-        num_scenarios: int | Literal["all"] = 150000,
+        num_scenarios: int | Literal["all"] = SAMPLES,
         odds_type: Literal["win_any", "tie_win", "precise"] = "tie_win",
         final_hand: bool = False,
     ) -> tuple[dict[str, float], dict[str, float], dict[int, dict[str, float]]] | dict[str, float]:
         """Simulates the game and returns both live and full odds.
 
+        Runs in the calling thread; the table itself queues its streets in
+        :attr:`equity_spots` for an :class:`~app.cogs.games.engine.equity.EquityService`.
+
         Parameters
         ----------
         num_scenarios: int
@@ -1725,17 +1544,14 @@ class TexasHoldem:
             If final_hand=True: (live_odds, full_odds, hand_strength)
             Otherwise: full_odds only (for backward compat)
         """
-        community_cards, undrawn_combos = self._simulation_preparation(num_scenarios)
-        res_arr = self._simulate_calculation(community_cards, undrawn_combos)
-
-        # Full odds: all players (hypothetical "what if everyone stayed in")
-        full_odds = self._simulation_analysis(odds_type, res_arr)
+        result = compute_equity(
+            self.equity_spot(),
+            odds_type=odds_type,
+            samples=SAMPLES if num_scenarios == "all" else num_scenarios,
+            exact_limit=sys.maxsize if num_scenarios == "all" else num_scenarios,
+        )
 
         if final_hand:
-            # Live odds: only players who haven't folded yet
-            active_indices = [i for i, p in enumerate(self.players) if not p.folded]
-            live_odds = self._simulation_analysis(odds_type, res_arr, active_indices)
-            final_hand_dict = self._hand_strength_analysis(res_arr)
-            return live_odds, full_odds, final_hand_dict
+            return result.live, result.full, result.hand_strength
 
-        return full_odds
+        return result.full
@@ -56,8 +56,8 @@ class MinesGame(LayoutView):
 
     def _paint_tiles(self, *, reveal_all: bool = False) -> None:
         for tile in self.tiles:
-            is_mine = tile.index in self.engine.mine_positions
-            if tile.index in self.engine.revealed:
+            is_mine = self.engine.is_mine(tile.index)
+            if self.engine.is_revealed(tile.index):
                 tile.style, tile.label, tile.emoji, tile.disabled = discord.ButtonStyle.secondary, None, _GEM, True
             elif reveal_all and is_mine:
                 tile.style, tile.label, tile.emoji, tile.disabled = discord.ButtonStyle.red, None, _MINE, True
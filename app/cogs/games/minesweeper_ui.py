@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 import discord
 
-from app.cogs.games.engine.minesweeper import Board, MSField
+from app.cogs.games.engine.minesweeper import Board
 from app.cogs.games.models import Game, GameResult
 from app.core.views import LayoutView
 from app.utils import fnumb, helpers, humanize_duration
@@ -30,41 +30,34 @@ class Minesweeper(LayoutView):
 
         self.engine: Board = Board(mines)
 
-        self.items: list[MinesweeperButton] = []
-
-        for x in range(Board.SIZE):
-            for y in range(Board.SIZE):
-                self.items.append(MinesweeperButton(self.engine.board[x][y], (x, y)))
+        self.items: list[MinesweeperButton] = [MinesweeperButton(index) for index in range(len(self.engine.cells))]
 
         self.container: discord.ui.Container = discord.ui.Container(id=1)
 
         self.refresh_container()
 
-    @property
-    def board(self) -> list[list[MSField]]:
-        return self.engine.board
-
     @property
     def mines(self) -> int:
         return self.engine.mines
 
     async def end(
-        self, interaction: discord.Interaction | None = None, won: bool = False, *, field: MSField | None = None
+        self, interaction: discord.Interaction | None = None, won: bool = False, *, hit: int | None = None
     ) -> None:
         """End the game."""
         for item in self.container.walk_children():
             if isinstance(item, MinesweeperButton):
                 item.disabled = True
 
-                if item.cell.mine:
-                    if not won and item.cell == field:
+                if self.engine.is_mine(item.index):
+                    if not won and item.index == hit:
                         item.label = "\N{COLLISION SYMBOL}"
                     else:
                         item.label = "\N{TRIANGULAR FLAG ON POST}" if won else "\N{BOMB}"
                     item.style = discord.ButtonStyle.green if won else discord.ButtonStyle.red
                 else:
                     item.style = discord.ButtonStyle.gray
-                    item.label = str(item.cell.value) if item.cell.value != 0 else "‎"  # Zero width space
+                    value = self.engine.value(item.index)
+                    item.label = str(value) if value != 0 else "‎"  # Zero width space
 
         amount: int = 0
         if won:
@@ -120,10 +113,10 @@ class Minesweeper(LayoutView):
         container.add_item(discord.ui.Separator())
 
         # acutal buttons
-        for x in range(Board.SIZE):
+        for r in range(self.engine.rows):
             row = discord.ui.ActionRow()
-            for y in range(Board.SIZE):
-                row.add_item(self.items[x * Board.SIZE + y])
+            for c in range(self.engine.cols):
+                row.add_item(self.items[self.engine.index(r, c)])
             container.add_item(row)
 
         container.add_item(discord.ui.Separator())
@@ -138,47 +131,42 @@ class MinesweeperButton(discord.ui.Button["Minesweeper"]):
 
     view: Minesweeper
 
-    def __init__(self, field: MSField, position: tuple[int, int]) -> None:
-        self.position: tuple[int, int] = position
-        self.cell: MSField = field
+    def __init__(self, index: int) -> None:
+        self.index: int = index
         super().__init__()
 
         self._update_labels()
 
     def _update_labels(self) -> None:
-        if self.view is not None:
-            self.cell = self.view.board[self.position[0]][self.position[1]]
-
-        if self.cell.revealed:
+        revealed = self.view is not None and self.view.engine.is_revealed(self.index)
+        if revealed:
+            value = self.view.engine.value(self.index)
             self.style = discord.ButtonStyle.secondary
-            self.label = str(self.cell.value) if self.cell.value != 0 else "‎"
+            self.label = str(value) if value != 0 else "‎"
         else:
             self.label = "‎"
             self.style = discord.ButtonStyle.blurple
 
-        self.disabled = self.cell.revealed
+        self.disabled = revealed
 
     async def callback(self: MinesweeperButton, interaction: discord.Interaction) -> None:
         assert self.view is not None
 
         self.view.moves += 1
-        self.cell = self.view.board[self.position[0]][self.position[1]]
-
-        x, y = self.position
-        field = self.view.board[x][y]
+        engine = self.view.engine
 
-        if not self.view.engine.mark(field):
-            await self.view.end(interaction, field=field)
+        if not engine.reveal(self.index):
+            await self.view.end(interaction, hit=self.index)
             return
 
-        if self.cell.value == 0:
+        if engine.value(self.index) == 0:
             for button in self.view.container.walk_children():
                 if isinstance(button, MinesweeperButton) and not button.disabled:
                     button._update_labels()
         else:
             self._update_labels()
 
-        if self.view.engine.is_won:
+        if engine.is_won:
             await self.view.end(interaction, True)
             return
 
@@ -11,10 +11,13 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import logging
+from itertools import takewhile
 from typing import TYPE_CHECKING, cast
 
 import discord
 
+from app.cogs.games.engine.equity import EquityResult
 from app.cogs.games.engine.poker import Card, OddsMode, TableState, TexasHoldem
 from app.cogs.games.models import Game, GameResult
 from app.cogs.games.poker_ui import TableView
@@ -36,6 +39,8 @@ __all__ = (
     "TexasHoldem",
 )
 
+log = logging.getLogger(__name__)
+
 
 class PokerSession:
     """Bridges a :class:`~app.cogs.games.engine.poker.TexasHoldem` engine to Discord.
@@ -71,6 +76,9 @@ class PokerSession:
         # Guards :meth:`settle_round_stats` so each finished round is recorded once.
         self._round_settled: bool = True
 
+        # Odds of the round's streets, computed off the event loop (see :meth:`schedule_equity`).
+        self._equity_tasks: list[asyncio.Task[EquityResult]] = []
+
     def __repr__(self) -> str:
         return f"<PokerSession engine={self.engine!r}>"
 
@@ -145,13 +153,51 @@ class PokerSession:
         return self.engine.first_buy_in
 
     @property
-    def analysis(self) -> list:
+    def analysis(self) -> list[EquityResult]:
         return self.engine.analysis
 
     def add_player(self, member: discord.Member, stack: int) -> None:
         """Adds a player to the underlying engine."""
         self.engine.add_player(member, stack)
 
+    # -- Odds analysis ----------------------------------------------------
+
+    @property
+    def has_analysis(self) -> bool:
+        """Whether odds were queued this round, computed or not."""
+        return bool(self.engine.analysis or self.engine.equity_spots or self._equity_tasks)
+
+    def schedule_equity(self) -> None:
+        """Starts computing the streets the engine queued since the last call.
+
+        The odds run in the cog's :class:`~app.cogs.games.engine.equity.EquityService`
+        worker processes while the hand goes on; :meth:`equity_analysis` collects them.
+        """
+        while self.engine.equity_spots:
+            spot = self.engine.equity_spots.pop(0)
+            self._equity_tasks.append(self.loop.create_task(self.cog.equity.compute(spot)))
+
+    def cancel_equity(self) -> None:
+        """Drops the odds of the current round, computed or not."""
+        for task in self._equity_tasks:
+            task.cancel()
+        self._equity_tasks.clear()
+
+    async def equity_analysis(self) -> list[EquityResult]:
+        """|coro|
+
+        Waits for the odds of every street queued so far and stores them as the engine's
+        ``analysis``. A street that failed to compute ends the analysis there.
+        """
+        self.schedule_equity()
+        if len(self.engine.analysis) < len(self._equity_tasks):
+            results = await asyncio.gather(*self._equity_tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException) and not isinstance(result, asyncio.CancelledError):
+                    log.error("Computing poker odds failed", exc_info=result)
+            self.engine.analysis = list(takewhile(lambda r: isinstance(r, EquityResult), results))
+        return self.engine.analysis
+
     # -- Autoplay timer ---------------------------------------------------
 
     def cancel_timer(self) -> None:
@@ -164,9 +210,11 @@ class PokerSession:
 
         Doubles as the single chokepoint for round-end detection: every player
         action and autoplay turn funnels through here, so a transition to
-        ``FINISHED`` settles the round's win/loss stats exactly once.
+        ``FINISHED`` settles the round's win/loss stats exactly once. It also starts
+        the odds of any street the action dealt.
         """
         self.cancel_timer()
+        self.schedule_equity()
         if self.engine.state == TableState.RUNNING:
             self._round_settled = False
             self.running_autoplay_loop = self.loop.create_task(self.start_timer(self.engine.current_player))
@@ -236,6 +284,7 @@ class PokerSession:
 
         Prepares the next round and announces players who ran out of chips.
         """
+        self.cancel_equity()
         removed = self.engine.prepare_next_game()
         for player in removed:
             if self.message is not None:
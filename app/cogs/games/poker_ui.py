@@ -204,7 +204,7 @@ class TableView(LayoutView):
                 if engine.hand_history:
                     third.append(self.history_button)
             if engine.state == TableState.FINISHED:
-                if engine.odds_mode != OddsMode.NONE and engine.analysis:
+                if engine.odds_mode != OddsMode.NONE and self.session.has_analysis:
                     second.append(self.analysis_button)
                 second.append(self.odds_mode_button)
                 second.append(self.rebuy_button)
@@ -280,10 +280,8 @@ class TableView(LayoutView):
             await interaction.response.send_message(f"{Emojis.error} Invalid amount.", ephemeral=True)
             return
 
-        balance: Balance = await cast("Bot", interaction.client).db.get_user_balance(
-            interaction.user.id, interaction.guild_id
-        )
-        if balance.cash < amount:
+        economy = cast("Bot", interaction.client).db.economy
+        if await economy.adjust_balance(interaction.user.id, interaction.guild_id, cash=-amount) is None:
             await interaction.response.send_message(
                 f"{Emojis.error} You don't have enough **cash** money to buy yourself in.\n"
                 f"You need at least {Emojis.Economy.coin} **{fnumb(self.engine.min_buy_in)}**.",
@@ -291,7 +289,6 @@ class TableView(LayoutView):
             )
             return
 
-        await balance.remove(cash=amount)
         self.engine.add_player(cast("discord.Member", interaction.user), stack=amount)
 
         view = self
@@ -501,15 +498,16 @@ class TableView(LayoutView):
             )
             return
 
-        if not self.engine.analysis:
+        # Streets computed in the background; waits for any still running.
+        data = await self.session.equity_analysis()
+        if not data:
             await interaction.followup.send(
                 f"{Emojis.error} No analysis data available. Odds calculation may have been disabled.", ephemeral=True
             )
             return
 
         embed = discord.Embed(title="Game Odds Analysis", color=helpers.Colour.white())
-        # Data format: (live_odds, full_odds, hand_strength) per street
-        data: list[tuple[dict[str, float], dict[str, float], dict[int, dict[str, float]]]] = self.engine.analysis
+        # Data format: EquityResult (live_odds, full_odds, hand_strength, ...) per street
 
         # Determine which odds to display based on current mode
         use_live = self.engine.odds_mode == OddsMode.LIVE
@@ -546,7 +544,10 @@ class TableView(LayoutView):
                 if folded_street is not None and street_idx >= folded_street:
                     fold_indicator = " *(folded)*" if use_live else ""
 
-                embed.description += f"{street_name}: Win: **{win_pct}**% | Tie: **{tie_pct}**%{fold_indicator}\n"
+                # Sampled streets are accurate to within their 95% confidence margin
+                margin = f" *(±{data[street_idx].margin}%)*" if not data[street_idx].exact else ""
+
+                embed.description += f"{street_name}: Win: **{win_pct}**% | Tie: **{tie_pct}**%{margin}{fold_indicator}\n"
 
             if not data:
                 embed.description += "***NO DATA***"
@@ -814,19 +815,16 @@ class TableView(LayoutView):
             )
             return
 
-        # Check balance
-        balance: Balance = await cast("Bot", interaction.client).db.get_user_balance(
-            interaction.user.id, interaction.guild_id
-        )
-        if balance.cash < amount:
+        # Deduct, if the balance covers it, and add chips
+        db = cast("Bot", interaction.client).db
+        if await db.economy.adjust_balance(interaction.user.id, interaction.guild_id, cash=-amount) is None:
+            balance: Balance = await db.get_user_balance(interaction.user.id, interaction.guild_id)
             await interaction.response.send_message(
                 f"{Emojis.error} You don't have enough cash. You have {Emojis.Economy.coin} **{fnumb(balance.cash)}**.",
                 ephemeral=True,
             )
             return
 
-        # Deduct and add chips
-        await balance.remove(cash=amount)
         success = self.engine.rebuy(cast("discord.Member", interaction.user), amount)
 
         if success:
@@ -838,7 +836,7 @@ class TableView(LayoutView):
                 )
         else:
             # Refund if engine rejected
-            await balance.add(cash=amount)
+            await db.economy.adjust_balance(interaction.user.id, interaction.guild_id, cash=amount)
             await interaction.response.send_message(f"{Emojis.error} Rebuy failed.", ephemeral=True)
 
     async def _on_leave(self, interaction: discord.Interaction) -> None:
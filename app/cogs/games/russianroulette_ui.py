@@ -155,14 +155,12 @@ class RussianRoulette(LayoutView):
             return
 
         assert interaction.guild is not None
-        balance = await interaction.client.db.get_user_balance(interaction.user.id, interaction.guild.id)
-        if balance.cash < self.ante:
+        economy = interaction.client.db.economy
+        if await economy.adjust_balance(interaction.user.id, interaction.guild.id, cash=-self.ante) is None:
             await interaction.response.send_message(
                 f"{Emojis.error} You need {Emojis.Economy.cash} **{fnumb(self.ante)}** to join.", ephemeral=True
             )
             return
-
-        await balance.remove(cash=self.ante)
         self.players.append(RRPlayer(interaction.user))  # type: ignore[arg-type]
         await self._refresh(interaction)
 
@@ -267,8 +267,9 @@ class SlotMachine(LayoutView):
         self._start.disabled = False
         self._reset.disabled = True
 
-        balance = await interaction.client.db.get_user_balance(self.player.id, interaction.guild_id)
-        if self.bet > balance.cash:
+        db = interaction.client.db
+        if await db.economy.adjust_balance(self.player.id, interaction.guild_id, cash=-self.bet) is None:
+            balance = await db.get_user_balance(self.player.id, interaction.guild_id)
             await interaction.response.send_message(
                 f"{Emojis.error} You do not have enough money to bet that amount.\n"
                 f"You currently have {Emojis.Economy.cash} **{fnumb(balance.cash)}** in **cash**.",
@@ -276,7 +277,5 @@ class SlotMachine(LayoutView):
             )
             return
 
-        await balance.remove(cash=self.bet)
-
         self._compose()
         await interaction.response.edit_message(view=self)
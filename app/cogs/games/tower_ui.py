@@ -126,9 +126,9 @@ class Tower(LayoutView):
         return True
 
     async def _on_restart(self, interaction: discord.Interaction) -> None:
-        balance = await interaction.client.db.get_user_balance(interaction.user.id, interaction.guild.id)
-
-        if self.bet > balance.cash:
+        db = interaction.client.db
+        if await db.economy.adjust_balance(interaction.user.id, interaction.guild.id, cash=-self.bet) is None:
+            balance = await db.get_user_balance(interaction.user.id, interaction.guild.id)
             await interaction.response.send_message(
                 f"{Emojis.error} You do not have enough money to bet that amount.\n"
                 f"You currently have {Emojis.Economy.cash} **{fnumb(balance.cash)}** in **cash**.",
@@ -136,8 +136,6 @@ class Tower(LayoutView):
             )
             return
 
-        await balance.remove(cash=self.bet)
-
         self.reset()
         self._compose()
         await interaction.response.edit_message(view=self)
@@ -0,0 +1,223 @@
+"""Message metadata index: records who said what where, for guilds that opted in.
+
+Guilds enable the index by setting a retention (``guild_config.message_index_days``) from
+the dashboard. For those guilds every new message is recorded as a row of ids, author,
+timestamp and a short snippet (see :mod:`app.services.message_index`), edits refresh the
+snippet and deletes drop the row. The members endpoints of the internal API then answer
+"this member's recent messages" and the purge action from the index instead of reading
+channel history through the REST API.
+
+Gateway events are buffered and written in batches; the raw edit/delete events are used so
+messages that fell out of discord.py's message cache are still kept in sync. While the
+database is unreachable the buffer holds at most ``_MAX_PENDING`` changes; later events are
+dropped and counted, and the next successful flush logs how many were lost.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+from discord.ext import tasks
+from discord.utils import parse_time
+
+from app.core import Cog
+from app.services import make_snippet, naive_utc
+
+if TYPE_CHECKING:
+    import discord
+
+    from app.core import Bot
+
+log = logging.getLogger(__name__)
+
+#: How long the "which guilds index messages" map is cached before a refresh.
+_ENABLED_TTL = 60.0
+#: Pending inserts that trigger a flush ahead of the regular interval.
+_FLUSH_THRESHOLD = 2000
+#: Pending changes (inserts, edits and deletes together) held while flushes keep failing.
+_MAX_PENDING = 100_000
+
+
+class MessageIndex(Cog, name="Message Index"):
+    """Keeps the opt-in per-guild message metadata index in sync with the gateway."""
+
+    __hidden__ = True
+    emoji = "\N{CARD INDEX}"
+
+    def __init__(self, bot: Bot) -> None:
+        super().__init__(bot)
+        self.bot = bot
+        self._enabled: dict[int, int] = {}
+        self._enabled_loaded_at: float = 0.0
+        self._flush_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+        self._pending_inserts: dict[int, tuple[Any, ...]] = {}
+        self._pending_edits: dict[int, tuple[int, str, Any]] = {}
+        self._pending_deletes: set[int] = set()
+        #: Changes dropped because the buffer was full, since the cog loaded.
+        self.dropped: int = 0
+        self._unreported: int = 0
+
+        for loop in (self.flush_index, self.prune_index):
+            loop.add_exception_type(asyncpg.PostgresConnectionError)
+            loop.start()
+
+    async def cog_unload(self) -> None:
+        self.flush_index.cancel()
+        self.prune_index.cancel()
+        await self.flush()
+
+    # -- opt-in ------------------------------------------------------------
+
+    def is_enabled(self, guild_id: int) -> bool:
+        """Whether ``guild_id`` indexes messages, as of the last refresh."""
+        if time.monotonic() - self._enabled_loaded_at > _ENABLED_TTL:
+            self._schedule_refresh()
+        return guild_id in self._enabled
+
+    def _schedule_refresh(self) -> None:
+        # Stamped before the query runs so a burst of messages schedules a single refresh.
+        self._enabled_loaded_at = time.monotonic()
+        self._spawn(self._refresh_enabled())
+
+    async def _refresh_enabled(self) -> None:
+        try:
+            self._enabled = await self.bot.db.message_index.guilds_enabled()
+        except Exception:
+            log.exception("Failed to refresh message index guilds")
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # -- gateway listeners ---------------------------------------------------
+
+    @Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        if message.guild is None or not self.is_enabled(message.guild.id):
+            return
+        if message.is_system() or not self._has_room():
+            return
+
+        self._pending_inserts[message.id] = (
+            message.id,
+            message.guild.id,
+            message.channel.id,
+            message.author.id,
+            naive_utc(message.created_at),
+            make_snippet(message.content),
+            len(message.attachments),
+            len(message.embeds),
+        )
+        if len(self._pending_inserts) >= _FLUSH_THRESHOLD and not self._flush_lock.locked():
+            self._spawn(self.flush())
+
+    @Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        if payload.guild_id is None or not self.is_enabled(payload.guild_id):
+            return
+        content = payload.data.get("content")
+        if content is None:
+            # Embed-only updates (link previews resolving) carry no content change.
+            return
+
+        snippet = make_snippet(content)
+        edited = parse_time(payload.data.get("edited_timestamp"))
+        pending = self._pending_inserts.get(payload.message_id)
+        if pending is not None:
+            self._pending_inserts[payload.message_id] = (*pending[:5], snippet, *pending[6:])
+        elif payload.message_id in self._pending_edits or self._has_room():
+            self._pending_edits[payload.message_id] = (payload.message_id, snippet, edited and naive_utc(edited))
+
+    @Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        if payload.guild_id is not None and self.is_enabled(payload.guild_id):
+            self._forget(payload.message_id)
+
+    @Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        if payload.guild_id is not None and self.is_enabled(payload.guild_id):
+            for message_id in payload.message_ids:
+                self._forget(message_id)
+
+    def _forget(self, message_id: int) -> None:
+        self._pending_edits.pop(message_id, None)
+        if self._pending_inserts.pop(message_id, None) is None and self._has_room():
+            self._pending_deletes.add(message_id)
+
+    def _has_room(self) -> bool:
+        """Whether another change fits in the buffer; counts it as dropped if not."""
+        if len(self._pending_inserts) + len(self._pending_edits) + len(self._pending_deletes) < _MAX_PENDING:
+            return True
+        self.dropped += 1
+        self._unreported += 1
+        return False
+
+    # -- persistence ---------------------------------------------------------
+
+    async def flush(self) -> None:
+        """|coro|
+
+        Writes all buffered inserts, edits and deletes, each as a single statement.
+
+        If one of the statements fails, or the flush is cancelled, everything drained for
+        this flush is put back under the events that arrived meanwhile, and written by the
+        next one. Some of it may already be stored: inserts skip existing rows, and edits
+        and deletes set the final state, so writing it again changes nothing.
+        """
+        async with self._flush_lock:
+            inserts, self._pending_inserts = self._pending_inserts, {}
+            edits, self._pending_edits = self._pending_edits, {}
+            deletes, self._pending_deletes = self._pending_deletes, set()
+
+            repo = self.bot.db.message_index
+            try:
+                await repo.insert_many(list(inserts.values()))
+                await repo.update_many(list(edits.values()))
+                await repo.delete_many(list(deletes))
+            except Exception:
+                log.exception("Failed to write %d buffered message index changes", len(inserts) + len(edits) + len(deletes))
+                self._requeue(inserts, edits, deletes)
+            except BaseException:
+                self._requeue(inserts, edits, deletes)
+                raise
+            else:
+                if self._unreported:
+                    log.warning("Dropped %d message index change(s) while the buffer was full", self._unreported)
+                    self._unreported = 0
+
+    def _requeue(
+        self, inserts: dict[int, tuple[Any, ...]], edits: dict[int, tuple[int, str, Any]], deletes: set[int]
+    ) -> None:
+        # Events buffered while the write was in flight came after the drained ones, so they
+        # win. Deletes are applied last, so a message deleted meanwhile still ends up gone.
+        self._pending_inserts = inserts | self._pending_inserts
+        self._pending_edits = edits | self._pending_edits
+        self._pending_deletes = deletes | self._pending_deletes
+
+    @tasks.loop(seconds=5.0)
+    async def flush_index(self) -> None:
+        """|coro|
+
+        A task that flushes the buffered index writes to the database.
+        """
+        await self.flush()
+
+    @tasks.loop(hours=6.0)
+    async def prune_index(self) -> None:
+        """|coro|
+
+        A task that drops rows past their guild's retention, and all rows of guilds that
+        disabled the index.
+        """
+        status = await self.bot.db.message_index.prune()
+        log.debug("Pruned message index: %s", status)
+
+
+async def setup(bot: Bot) -> None:
+    await bot.add_cog(MessageIndex(bot))
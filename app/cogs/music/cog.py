@@ -23,7 +23,16 @@ import config
 from app.clients import LRCLibClient
 from app.core import Bot, Cog, Context, Flags, PermissionTemplate, command, describe, flag, group, store_true
 from app.core.pagination import BasePaginator
-from app.services import LyricsResult, MusicIntentParser, SyncedLyrics, clean_track_title, parse_lrc
+from app.services import (
+    LyricsResult,
+    MusicIntentParser,
+    RestoreProgress,
+    RestoreScheduler,
+    SyncedLyrics,
+    TrackResolutionCache,
+    clean_track_title,
+    parse_lrc,
+)
 from app.utils import (
     ProgressBar,
     WrapList,
@@ -122,6 +131,23 @@ class Music(Cog):
         self._restored: bool = False
         # Guards the rebuild that runs after Lavalink comes back without resuming.
         self._resyncing: bool = False
+        # Query/URL -> Lavalink load result, in memory and in the `track_cache` table.
+        self.track_cache: TrackResolutionCache = TrackResolutionCache(
+            store=self.bot.db.track_cache,
+            max_entries=config.track_cache.max_entries,
+            ttl=config.track_cache.ttl,
+            store_ttl=config.track_cache.store_ttl,
+            bypass=config.track_cache.bypass,
+        )
+        Player.track_cache = self.track_cache
+        self.prune_track_cache.start()
+        # Restores persisted players concurrently within the voice-connect budget.
+        self.restore_scheduler: RestoreScheduler = RestoreScheduler(
+            rate=config.music_restore.rate,
+            burst=config.music_restore.burst,
+            concurrency=config.music_restore.concurrency,
+        )
+        self.restore_progress: RestoreProgress | None = None
         # dont persists sessions on beta
         if not config.beta:
             self.persist_sessions.start()
@@ -136,6 +162,8 @@ class Music(Cog):
 
     async def cog_unload(self) -> None:
         self.persist_sessions.cancel()
+        self.prune_track_cache.cancel()
+        Player.track_cache = None
         # Persist final state and destroy players on the Lavalink node so it
         # doesn't keep streaming audio after the bot process exits. We call
         # _destroy() directly (not disconnect()) because discord.py will handle
@@ -145,7 +173,7 @@ class Music(Cog):
             player = guild.voice_client
             if isinstance(player, Player) and player.connected:
                 with suppress(Exception):
-                    await player.persist()
+                    await player.persist(force=True)
                 with suppress(Exception):
                     await player._destroy()
 
@@ -153,17 +181,47 @@ class Music(Cog):
     async def persist_sessions(self) -> None:
         """Periodically snapshot active players so a crash/restart can resume them.
 
-        Runs cheaply: only touches guilds that currently have a connected player.
+        Runs cheaply: only players whose state changed since their last snapshot are
+        written, all of them in one batched upsert. Players with a write of their own
+        in flight are picked up on the next tick.
         """
-        for guild in list(self.bot.guilds):
-            player = guild.voice_client
-            if isinstance(player, Player) and player.connected and player.current is not None:
-                await player.persist()
+        players = [
+            player for guild in list(self.bot.guilds)
+            if isinstance(player := guild.voice_client, Player)
+            and player.connected
+            and player.current is not None
+            and not player.session_tracker.lock.locked()
+        ]
+        for player in players:
+            await player.session_tracker.lock.acquire()
+        try:
+            writes = [(player, write) for player in players if (write := player.session_write()) is not None]
+            if not writes:
+                return
+            try:
+                await self.bot.db.music_sessions.upsert_sessions([write for _, write in writes])
+            except Exception as exc:
+                log.debug("Failed to persist %d music session(s): %s", len(writes), exc)
+                return
+            for player, write in writes:
+                player.session_tracker.commit(write)
+        finally:
+            for player in players:
+                player.session_tracker.lock.release()
 
     @persist_sessions.before_loop
     async def _before_persist(self) -> None:
         await self.bot.wait_until_ready()
 
+    @tasks.loop(hours=6)
+    async def prune_track_cache(self) -> None:
+        """Drop expired entries from the persistent tier of the track resolution cache."""
+        try:
+            await self.bot.db.track_cache.prune()
+        except Exception:
+            log.warning("Failed to prune the persistent track cache", exc_info=True)
+        log.debug("Track cache: %s", self.track_cache.summary())
+
     async def _purge_music_channels(self) -> None:
         """Delete non-pinned messages that accumulated in music panel channels while offline."""
         rows = await self.bot.db.fetch(
@@ -183,6 +241,52 @@ class Music(Cog):
             except discord.HTTPException:
                 pass
 
+    def _restore_priority(self, record: Any) -> int:
+        """Listeners (non-bot members) currently in a session's voice channel."""
+        guild = self.bot.get_guild(record["guild_id"])
+        channel = guild.get_channel(record["voice_channel_id"]) if guild is not None else None
+        if not isinstance(channel, discord.VoiceChannel | discord.StageChannel):
+            return 0
+        return sum(not member.bot for member in channel.members)
+
+    def _restore_key(self, record: Any) -> int | None:
+        """Voice connects are paced per shard, the gateway connection they go through."""
+        guild = self.bot.get_guild(record["guild_id"])
+        return guild.shard_id if guild is not None else None
+
+    async def _restore_record(self, record: Any) -> bool:
+        guild = self.bot.get_guild(record["guild_id"])
+        if guild is None or guild.voice_client is not None:
+            return False  # gone, or already reconnected by some other path
+        try:
+            return await Player.restore(self.bot, record) is not None
+        except Exception as exc:
+            log.error("Failed to restore music session for guild %s: %s", record["guild_id"], exc)
+            raise
+
+    async def _run_restores(self, records: list[Any], *, reason: str) -> None:
+        """Restores ``records`` through the paced scheduler, busiest voice channels first."""
+        progress = RestoreProgress()
+        self.restore_progress = progress
+
+        def report(p: RestoreProgress) -> None:
+            if p.done % 25 == 0 and p.done < p.total:
+                log.info("Music %s: %d/%d session(s) done after %.1fs.", reason, p.done, p.total, p.elapsed())
+
+        await self.restore_scheduler.run(
+            records,
+            self._restore_record,
+            priority=self._restore_priority,
+            key=self._restore_key,
+            progress=progress,
+            on_progress=report,
+        )
+        log.info(
+            "Music %s finished in %.1fs: %d restored, %d skipped, %d failed (first after %ss).",
+            reason, progress.elapsed(), progress.restored, progress.skipped, progress.failed,
+            progress.to_dict()["first_restored_s"],
+        )
+
     async def _restore_sessions(self) -> None:
         """Reconnect and resume every persisted player after a (re)start."""
         await self.bot.wait_until_ready()
@@ -193,6 +297,7 @@ class Music(Cog):
             log.error("Failed to load persisted music sessions: %s", exc)
             return
         log.info("Restoring %d persisted music session(s).", len(records))
+        pending: list[Any] = []
         for record in records:
             guild = self.bot.get_guild(record["guild_id"])
             if guild is None:
@@ -208,12 +313,9 @@ class Music(Cog):
                 continue
             if vc is not None:
                 continue  # some other/unknown voice client; leave it alone
+            pending.append(record)
 
-            try:
-                await Player.restore(self.bot, record)
-            except Exception as exc:
-                log.error("Failed to restore music session for guild %s: %s", record["guild_id"], exc)
-            await asyncio.sleep(1)  # stagger reconnects to avoid a thundering herd
+        await self._run_restores(pending, reason="restore")
 
     async def _resync_after_node_loss(self) -> None:
         """Rebuild orphaned players after Lavalink came back without resuming.
@@ -231,13 +333,13 @@ class Music(Cog):
         try:
             await self.bot.wait_until_ready()
 
-            stale: list[int] = []
+            stale: set[int] = set()
             for guild in list(self.bot.guilds):
                 player = guild.voice_client
                 if isinstance(player, Player) and player.connected:
-                    stale.append(guild.id)
+                    stale.add(guild.id)
                     with suppress(Exception):
-                        await player.persist()
+                        await player.persist(force=True)
                     with suppress(Exception):
                         # force=True keeps the persisted session row for the restore below.
                         await player.disconnect(force=True)
@@ -248,22 +350,12 @@ class Music(Cog):
             log.warning("Lavalink lost %d player session(s) on reconnect; rebuilding.", len(stale))
             await asyncio.sleep(1)  # let Discord settle the voice-state teardown first
 
-            for guild_id in stale:
-                guild = self.bot.get_guild(guild_id)
-                if guild is None or isinstance(guild.voice_client, Player):
-                    continue  # gone, or already reconnected by some other path
-                try:
-                    record = await self.bot.db.music_sessions.get_session(guild_id)
-                except Exception as exc:
-                    log.error("Failed to load music session for guild %s during resync: %s", guild_id, exc)
-                    continue
-                if record is None:
-                    continue
-                try:
-                    await Player.restore(self.bot, record)
-                except Exception as exc:
-                    log.error("Failed to rebuild music session for guild %s: %s", guild_id, exc)
-                await asyncio.sleep(1)  # stagger reconnects to avoid a thundering herd
+            try:
+                records = await self.bot.db.music_sessions.get_all_sessions()
+            except Exception as exc:
+                log.error("Failed to load music sessions during resync: %s", exc)
+                return
+            await self._run_restores([r for r in records if r["guild_id"] in stale], reason="resync")
         finally:
             self._resyncing = False
 
@@ -2170,16 +2262,18 @@ class Music(Cog):
         if not player:
             player = await Player.join(ctx)
 
-        old_stamp = len(player.queue.all)
         wait_message = await ctx.send(f"*{Emojis.loading} adding tracks from your playlist to the queue... please wait...*")
 
-        for track in playlist.tracks:
-            resolved: Playable | Playlist | SearchReturn = await player.search(track.url, ctx=ctx)
-            if not resolved or isinstance(resolved, SearchReturn):
-                continue
-            await player.queue.put_wait(resolved)
+        started = False
 
-        new_queue = len(player.queue.all) - old_stamp
+        async def start() -> None:
+            nonlocal started
+            if not player.playing:
+                player.autoplay = wavelink.AutoPlayMode.enabled
+                await player.play(player.queue.get(), volume=70)
+                started = True
+
+        new_queue = await player.enqueue_playlist(playlist.tracks, requester_id=ctx.user.id, on_first=start)
         succeeded = bool(new_queue == len(playlist.tracks))
 
         description = (
@@ -2193,10 +2287,7 @@ class Music(Cog):
         await wait_message.delete()
         await ctx.send(embed=embed, delete_after=15)
 
-        if not player.playing:
-            player.autoplay = wavelink.AutoPlayMode.enabled
-            await player.play(player.queue.get(), volume=70)
-        else:
+        if not started:
             await player.refresh_panel()
 
     @playlist.command(name="add", description="Adds the current playing track or a track via a direct-url to your playlist.")
@@ -2367,6 +2458,9 @@ class Music(Cog):
 
 
 async def setup(bot: Bot) -> None:
+    # Extensions load alongside the Lavalink connect, and the pool only lists a node
+    # once its handshake is done.
+    await bot.wait_until_lavalink_connected()
     try:
         wavelink.Pool.get_node()
     except wavelink.InvalidNodeException:
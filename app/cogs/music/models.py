@@ -187,7 +187,7 @@ class Playlist(BaseRecord, table="playlist", pk="id"):
         PlaylistTrack
             The track that was added to the playlist.
         """
-        record = await self.cog.bot.db.playlists.add_track(self.id, track.title, track.uri)
+        record = await self.cog.bot.db.playlists.add_track(self.id, track.title, track.uri, track.encoded)
 
         playlist_track = PlaylistTrack(record=record)
         self.tracks.append(playlist_track)
@@ -244,8 +244,9 @@ class PlaylistTrack(BaseRecord, table="playlist_lookup", pk="id"):
     id: int
     name: str
     url: str
+    encoded: str | None
 
-    __slots__ = ('id', 'name', 'url')
+    __slots__ = ('encoded', 'id', 'name', 'url')
 
     @property
     def text(self) -> str:
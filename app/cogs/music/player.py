@@ -4,7 +4,7 @@ import datetime
 import json
 import logging
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any, Literal, Self
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self
 
 import discord
 import wavelink
@@ -14,15 +14,27 @@ from discord.utils import MISSING
 from wavelink import ChannelTimeoutException, Playable, Playlist
 
 from app.core import Context
+from app.services import (
+    PLAYLIST_RESOLVE_CONCURRENCY,
+    SessionState,
+    SessionTracker,
+    compact_track,
+    resolve_ordered,
+    session_track_uris,
+    track_cache_key,
+)
 from app.utils import convert_duration, helpers
 from config import Emojis
 
-from .models import PlayerState, Queue, SearchReturn, ShuffleMode, is_dj
+from .models import PlayerState, PlaylistTrack, Queue, SearchReturn, ShuffleMode, is_dj
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
     from discord.abc import Connectable
 
     from app.database import GuildConfig
+    from app.services import SessionWrite, TrackResolutionCache
 
     from .ui import PlayerPanel
 
@@ -46,6 +58,10 @@ RADIO_ARTWORK_URL = "https://klappstuhl.me/gallery/raw/gERCu.avif"
 class Player(wavelink.Player):
     """Custom mdded-wavelink Player class."""
 
+    #: Resolution cache consulted by :meth:`search`; installed by the Music cog. ``None``
+    #: sends every lookup to Lavalink.
+    track_cache: ClassVar[TrackResolutionCache | None] = None
+
     def __init__(self, client: discord.Client = MISSING, channel: Connectable = MISSING) -> None:
         super().__init__(client, channel)
 
@@ -68,6 +84,8 @@ class Player(wavelink.Player):
         self._consecutive_errors: int = 0
         # Active live-lyrics session (a ui.LiveLyricsView), if one is running.
         self.lyrics_session: Any = None
+        # What was last written to ``music_sessions``; only changes get persisted.
+        self.session_tracker: SessionTracker = SessionTracker()
 
     @property
     def djs(self) -> list[discord.Member]:
@@ -165,7 +183,7 @@ class Player(wavelink.Player):
 
         try:
             if not is_url:
-                results = await wavelink.Playable.search(query, source=source)
+                results = await cls._fetch_tracks(query, source=source)
                 if return_first and isinstance(results, list):
                     results = results[0]
                 else:
@@ -183,7 +201,7 @@ class Player(wavelink.Player):
                 if 'music.amazon.' in lowered or 'amazon.com/music' in lowered:
                     return SearchReturn.AMAZON_UNSUPPORTED
 
-                results = await wavelink.Playable.search(query)
+                results = await cls._fetch_tracks(query)
         except wavelink.LavalinkLoadException as exc:
             # Expected "can't load this" outcome (bad/unsupported URL, non-stream page,
             # geo-blocked track, ...). Not a code error — log concisely, no traceback.
@@ -219,6 +237,134 @@ class Player(wavelink.Player):
 
         return results
 
+    @classmethod
+    async def _fetch_tracks(
+            cls, query: str, *, source: wavelink.TrackSource | str = wavelink.TrackSource.YouTubeMusic
+    ) -> wavelink.Search:
+        """``wavelink.Playable.search`` through :attr:`track_cache`.
+
+        Cached load results are rebuilt into fresh ``Playable`` objects on every call, so
+        per-request state (requester extras, normalised artwork) never leaks between lookups.
+        """
+        if cls.track_cache is None:
+            return await wavelink.Playable.search(query, source=source)
+
+        async def load() -> dict[str, Any]:
+            return cls._to_load_result(await wavelink.Playable.search(query, source=source))
+
+        prefix = source if isinstance(source, str) else source.name.lower()
+        result = await cls.track_cache.resolve(track_cache_key(query, prefix), load)
+        return cls._from_load_result(result)
+
+    @staticmethod
+    def _to_load_result(results: wavelink.Search) -> dict[str, Any]:
+        """Turns a search result back into Lavalink's ``{"loadType", "data"}`` shape."""
+        if isinstance(results, Playlist):
+            plugin_info = {
+                'type': results.type,
+                'url': results.url,
+                'artworkUrl': results.artwork,
+                'author': results.author,
+            }
+            return {
+                'loadType': 'playlist',
+                'data': {
+                    'info': {'name': results.name, 'selectedTrack': results.selected},
+                    'pluginInfo': {k: v for k, v in plugin_info.items() if v is not None},
+                    'tracks': [track.raw_data for track in results.tracks],
+                },
+            }
+        if not results:
+            return {'loadType': 'empty', 'data': {}}
+        return {'loadType': 'search', 'data': [track.raw_data for track in results]}
+
+    @staticmethod
+    def _from_load_result(result: dict[str, Any] | None) -> wavelink.Search:
+        if not result:
+            return []
+        load_type, data = result['loadType'], result['data']
+        if load_type == 'playlist':
+            return Playlist(data)
+        if load_type == 'search':
+            return [Playable(data=track) for track in data]
+        if load_type == 'track':
+            return [Playable(data=data)]
+        return []
+
+    @classmethod
+    async def decode_tracks(cls, encoded: list[str]) -> list[Playable]:
+        """|coro|
+
+        Rebuilds tracks from Lavalink-encoded strings with a single ``/v4/decodetracks``
+        request, in the given order.
+        """
+        if not encoded:
+            return []
+        data = await wavelink.Pool.get_node().send('POST', path='v4/decodetracks', data=encoded)
+        tracks = [Playable(data=payload) for payload in data]
+        for track in tracks:
+            cls._normalise_artwork(track)
+        return tracks
+
+    async def enqueue_playlist(
+            self,
+            tracks: Sequence[PlaylistTrack],
+            *,
+            requester_id: int | None = None,
+            on_first: Callable[[], Awaitable[None]] | None = None,
+    ) -> int:
+        """|coro|
+
+        Queues saved playlist tracks in their saved order and returns how many were queued.
+
+        Tracks with a stored encoding are rebuilt with one bulk decode; the rest are searched
+        by URL, :data:`PLAYLIST_RESOLVE_CONCURRENCY` at a time, and their encodings are written
+        back so the next load skips the search. ``on_first`` is awaited right after the first
+        track is queued, so playback can start while the rest are still resolving.
+        """
+        decoded: dict[int, Playable] = {}
+        stored = [track for track in tracks if track.encoded]
+        if stored:
+            try:
+                playables = await self.decode_tracks([track.encoded for track in stored])  # type: ignore[misc]
+                decoded = {track.id: playable for track, playable in zip(stored, playables, strict=True)}
+            except Exception as exc:
+                log.warning('Failed to bulk decode %s playlist tracks, searching instead: %s', len(stored), exc)
+
+        async def resolve(track: PlaylistTrack) -> Playable | Playlist | None:
+            if (playable := decoded.get(track.id)) is not None:
+                return playable
+            result = await self.search(track.url, return_first=True)
+            return result if isinstance(result, (Playable, Playlist)) else None
+
+        queued = 0
+        backfill_ids: list[int] = []
+        backfill: list[str] = []
+        async for track, result in resolve_ordered(tracks, resolve, concurrency=PLAYLIST_RESOLVE_CONCURRENCY):
+            if result is None:
+                continue
+            if isinstance(result, Playable) and track.id not in decoded:
+                track.encoded = result.encoded
+                backfill_ids.append(track.id)
+                backfill.append(result.encoded)
+            if requester_id is not None:
+                if isinstance(result, Playlist):
+                    result.track_extras(requester_id=requester_id)
+                else:
+                    result.extras.requester_id = requester_id
+
+            await self.queue.put_wait(result)
+            queued += 1
+            if queued == 1 and on_first is not None:
+                await on_first()
+
+        if backfill_ids:
+            try:
+                await self.db.playlists.set_track_encodings(backfill_ids, backfill)
+            except Exception as exc:
+                log.debug('Failed to store playlist track encodings: %s', exc)
+        return queued
+
     @classmethod
     async def join(cls, obj: discord.Interaction | Context) -> Self:
         """Join a voice channel and apply the Player class to the voice client."""
@@ -281,22 +427,22 @@ class Player(wavelink.Player):
         track._artwork = cls._resolve_artwork(track)
 
     @staticmethod
-    def _serialize_track(track: wavelink.Playable) -> dict[str, Any]:
-        """Serialise a track to the minimal JSON we persist for restore."""
-        return {
-            'uri': track.uri,
-            'title': track.title,
-            'requester_id': getattr(track.extras, 'requester_id', None),
-        }
-
-    async def persist(self, *, position: int | None = None) -> None:
-        """|coro|
-
-        Snapshots the current player state into the ``music_sessions`` table so it can
-        be restored after a restart or node reconnect. Best-effort: never raises.
-        """
+    def _serialize_track(track: wavelink.Playable) -> list[Any]:
+        """Serialise a track to the compact entry we persist for restore."""
+        return compact_track(track.uri, track.title, getattr(track.extras, 'requester_id', None))
+
+    def _filters_state(self) -> str | None:
+        """The active filters as canonical JSON, ``None`` when only defaults are set."""
+        payload: dict[str, Any] = dict(self.filters())
+        if not any(band['gain'] for band in payload.get('equalizer', ())):
+            payload.pop('equalizer', None)
+        return json.dumps(payload, sort_keys=True, separators=(',', ':')) if payload else None
+
+    def session_write(self, *, position: int | None = None, force: bool = False) -> SessionWrite | None:
+        """The ``music_sessions`` change needed to persist the current state, ``None`` if the
+        persisted row is already up to date (see :class:`~app.services.SessionTracker`)."""
         if self.guild is None or self.channel is None:
-            return
+            return None
 
         text_channel_id: int | None = None
         panel_message_id: int | None = None
@@ -310,26 +456,45 @@ class Player(wavelink.Player):
         if self.current is not None and self.current.is_stream:
             resume_position = 0
 
-        try:
-            await self.db.music_sessions.upsert_session(
-                self.guild.id,
-                voice_channel_id=self.channel.id,
-                text_channel_id=text_channel_id,
-                panel_message_id=panel_message_id,
-                volume=self.volume,
-                paused=self.paused,
-                queue_mode=_QUEUE_MODE_TO_INT.get(self.queue.mode, 0),
-                shuffle=bool(self.queue.shuffle),
-                autoplay=self.autoplay.value,
-                always_on=self.always_on,
-                always_on_mode=self.always_on_mode,
-                always_on_source=self.always_on_source,
-                current_uri=self.current.uri if self.current else None,
-                position=resume_position,
-                tracks=[self._serialize_track(t) for t in self.queue],
-            )
-        except Exception as exc:
-            log.debug('Failed to persist music session for guild %s: %s', self.guild.id, exc)
+        state = SessionState(
+            guild_id=self.guild.id,
+            voice_channel_id=self.channel.id,
+            text_channel_id=text_channel_id,
+            panel_message_id=panel_message_id,
+            volume=self.volume,
+            paused=self.paused,
+            queue_mode=_QUEUE_MODE_TO_INT.get(self.queue.mode, 0),
+            shuffle=bool(self.queue.shuffle),
+            autoplay=self.autoplay.value,
+            always_on=self.always_on,
+            always_on_mode=self.always_on_mode,
+            always_on_source=self.always_on_source,
+            current_uri=self.current.uri if self.current else None,
+            filters=self._filters_state(),
+        )
+        playing = self.current is not None and not self.current.is_stream and not self.paused
+        return self.session_tracker.diff(
+            state, resume_position, list(self.queue), self._serialize_track, playing=playing, force=force
+        )
+
+    async def persist(self, *, position: int | None = None, force: bool = False) -> None:
+        """|coro|
+
+        Writes whatever changed since the last snapshot into the ``music_sessions`` table so
+        the player can be restored after a restart or node reconnect. ``force`` also writes
+        an unchanged session (e.g. to record the exact position on shutdown). Best-effort:
+        never raises. The cog's ``persist_sessions`` loop batches this for every player.
+        """
+        async with self.session_tracker.lock:
+            write = self.session_write(position=position, force=force)
+            if write is None:
+                return
+            try:
+                await self.db.music_sessions.upsert_sessions([write])
+            except Exception as exc:
+                log.debug('Failed to persist music session for guild %s: %s', write.guild_id, exc)
+            else:
+                self.session_tracker.commit(write)
 
     async def refill_always_on(self) -> None:
         """|coro|
@@ -355,11 +520,15 @@ class Player(wavelink.Player):
             elif mode == 'playlist':
                 if source.startswith('percy:playlist:'):
                     playlist_id = int(source.removeprefix('percy:playlist:'))
-                    tracks = await self.db.playlists.get_playlist_tracks(playlist_id)
-                    for track_record in tracks:
-                        resolved = await self.search(track_record['url'], return_first=True)
-                        if isinstance(resolved, (Playable, Playlist)):
-                            await self.queue.put_wait(resolved)
+                    records = await self.db.playlists.get_playlist_tracks(playlist_id)
+
+                    async def start() -> None:
+                        # Start on the first resolved track; the rest keep streaming in.
+                        if not self.playing:
+                            populate = self.autoplay is wavelink.AutoPlayMode.enabled
+                            await self.play(self.queue.get(), populate=populate, max_populate=10)
+
+                    await self.enqueue_playlist([PlaylistTrack(record=r) for r in records], on_first=start)
                 else:
                     result = await self.search(source, return_first=True)
                     if isinstance(result, (Playable, Playlist)):
@@ -451,7 +620,7 @@ class Player(wavelink.Player):
         uris: list[str] = []
         if record['current_uri']:
             uris.append(record['current_uri'])
-        uris.extend(t['uri'] for t in (tracks or []) if t.get('uri'))
+        uris.extend(session_track_uris(tracks))
 
         for uri in uris:
             result = await cls.search(uri, return_first=True)
@@ -474,6 +643,11 @@ class Player(wavelink.Player):
 
         with suppress(Exception):
             await self.set_volume(record['volume'])
+        if filters := record.get('filters'):
+            if isinstance(filters, str):
+                filters = json.loads(filters)
+            with suppress(Exception):
+                await self.set_filters(wavelink.Filters(data=filters))
         if self.panel is not MISSING:
             try:
                 await self.panel.update()
@@ -525,10 +699,7 @@ class Player(wavelink.Player):
             tracks = record['tracks']
             if isinstance(tracks, str):
                 tracks = json.loads(tracks)
-            for entry in (tracks or []):
-                uri = entry.get('uri')
-                if not uri:
-                    continue
+            for uri in session_track_uris(tracks):
                 result = await self.search(uri, return_first=True)
                 if isinstance(result, Playable | Playlist):
                     await self.queue.put_wait(result)
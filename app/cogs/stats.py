@@ -24,6 +24,7 @@ from discord.utils import MISSING
 from expiringdict import ExpiringDict
 
 import config
+from app.clients import BaseHTTPClient
 from app.cogs.games.models import Game
 from app.core import Bot, Cog, Context
 from app.core.models import command, cooldown, describe, group
@@ -33,6 +34,7 @@ from app.rendering import resize_to_limit
 from app.services import (
     ConnectionState,
     HealthLevel,
+    HTTPClientState,
     LavalinkMetrics,
     assess_bot_health,
     count_code_stats,
@@ -1425,6 +1427,19 @@ class Stats(Cog):
         inner_tasks = [t for t in all_tasks if cogs_directory in repr(t) or tasks_directory in repr(t)]
         bad_inner_tasks = ", ".join(hex(id(t)) for t in inner_tasks if t.done() and t._exception is not None)
 
+        http_clients = [
+            HTTPClientState(
+                name=client.name,
+                breaker_open=client.breaker_open,
+                in_flight=client.stats.in_flight,
+                waiting=client.stats.waiting,
+                max_concurrency=client.MAX_CONCURRENCY,
+                wait_avg_ms=client.stats.wait_avg * 1000,
+                wait_max_ms=client.stats.wait_max * 1000,
+            )
+            for client in BaseHTTPClient.instances()
+        ]
+
         report = assess_bot_health(
             connections,
             current_generation=current_generation,
@@ -1432,6 +1447,7 @@ class Stats(Cog):
             command_waiters=command_waiters,
             has_failed_inner_tasks=bool(bad_inner_tasks),
             global_rate_limit=global_rate_limit,
+            http_clients=http_clients,
         )
 
         uptime = human_timedelta(self.bot.startup_timestamp, suffix=False)
@@ -1464,6 +1480,7 @@ class Stats(Cog):
         db_lines = [
             f"Total Queries: {fnumb(tracker.total_queries)}",
             f"Avg Duration: `{tracker.avg_duration_ms:.2f}ms`",
+            "Latency: " + " ".join(f"{name} `{ms}ms`" for name, ms in tracker.latency_percentiles().items()),
             f"Slow Queries (>{tracker._threshold_ms:.0f}ms): {len(tracker._slow_queries)}",
         ]
         top_slow = tracker.slow_queries(3)
@@ -1488,6 +1505,18 @@ class Stats(Cog):
         cpu_usage = self.process.cpu_percent() / (psutil.cpu_count() or 1)
         embed.add_field(name="Process", value=f"{memory_usage:.2f} MiB\n{cpu_usage:.2f}% CPU")
 
+        # Outbound HTTP: per-client breaker and concurrency cap, per-pool keep-alive and DNS cache
+        if http_clients:
+            client_value = "\n".join(client.describe() for client in http_clients)
+            embed.add_field(name="HTTP Clients", value=f"```\n{client_value[:1000]}\n```", inline=False)
+        pool_lines = [
+            f"{pool['pool']}: {pool['requests']} req | reuse {pool['keepalive_reuse_ratio'] * 100:.0f}% "
+            f"| DNS hit {pool['dns_hit_ratio'] * 100:.0f}% | queued {pool['queued']} "
+            f"(avg {pool['queue_wait_avg_ms']}ms)"
+            for pool in self.bot.http_pools.summary()
+        ]
+        embed.add_field(name="HTTP Pools", value="\n".join(pool_lines)[:1024], inline=False)
+
         # Extension status
         embed.add_field(name="Extensions", value=f"Loaded: {len(self.bot.extensions)}\nCogs: {len(self.bot.cogs)}")
 
@@ -1,25 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import csv
 import datetime
+import functools
 import io
+import logging
 from typing import TYPE_CHECKING, Annotated, Any, Literal, cast
 
 import asyncpg
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from app.core import Bot, Cog, ConfirmationView, Context, Flags, LayoutView, flag, store_true
 from app.core.models import AppBadArgument, BadArgument, PermissionTemplate, cooldown, describe, group
+from app.core.pagination import KeysetPageSource
 from app.database import BaseRecord
-from app.services import TagFinder
+from app.services import (
+    AUTOCOMPLETE_LIMIT,
+    HotTagCache,
+    TagFinder,
+    TagNameIndex,
+    TagNames,
+    TagNameSearch,
+    TagUseBuffer,
+)
 from app.utils import (
     TabularData,
-    fuzzy,
     get_asset_url,
-    get_shortened_string,
     helpers,
     medal_emoji,
     pluralize,
@@ -29,10 +39,14 @@ from config import Emojis
 
 if TYPE_CHECKING:
     import re
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Sequence
 
     from discord.app_commands import Choice
 
+    from app.core.pagination import PageSource
+
+log = logging.getLogger(__name__)
+
 
 # region Converters & Flags
 
@@ -318,32 +332,48 @@ class TagSuggestView(TagLayoutView):
         if interaction.message:
             with contextlib.suppress(discord.HTTPException):
                 await interaction.message.delete()
-        await tag.add(uses=1)
+        cog.record_use(tag)
         self.stop()
 
 
 class TagListView(TagLayoutView):
-    """Paginated CV2 view for tag list and search results."""
+    """Paginated CV2 view for tag list and search results.
+
+    Rows are read from a :class:`~app.core.pagination.PageSource` one page at a time, so
+    only the pages that are viewed (and the one after) are ever fetched. Call :meth:`show`
+    before sending the view.
+    """
 
     PER_PAGE = 15
 
     def __init__(
         self,
-        entries: list[asyncpg.Record],
+        source: PageSource[asyncpg.Record],
         *,
+        count: int,
         ctx: Context,
         title: str = "Tags",
         description: str = "",
         sort: str = "name",
     ) -> None:
         super().__init__(members=ctx.author)
-        self.entries = entries
+        self.source = source
+        self.count = count
         self.ctx = ctx
         self._title = title
         self._description = description
         self._sort = sort
         self._page = 0
-        self._total_pages = max(1, (len(entries) + self.PER_PAGE - 1) // self.PER_PAGE)
+        self._rows: Sequence[asyncpg.Record] = ()
+        self._total_pages = max(1, source.page_count)
+
+    async def show(self, page: int) -> None:
+        """|coro|
+
+        Reads page ``page`` (zero-based) and lays it out.
+        """
+        self._rows = await self.source.get_page(page)
+        self._page = page
         self._build_page()
 
     def _build_page(self) -> None:
@@ -356,19 +386,15 @@ class TagListView(TagLayoutView):
         container.add_item(discord.ui.TextDisplay(header))
         container.add_item(discord.ui.Separator())
 
-        start = self._page * self.PER_PAGE
-        end = start + self.PER_PAGE
-        page_entries = self.entries[start:end]
-
         lines = []
-        for i, row in enumerate(page_entries, start + 1):
+        for i, row in enumerate(self._rows, self._page * self.PER_PAGE + 1):
             entry = TagPageEntry(record=row)
             lines.append(f"`{i}.` {entry}")
-        container.add_item(discord.ui.TextDisplay("\n".join(lines)))
+        container.add_item(discord.ui.TextDisplay("\n".join(lines) or "*There is nothing on this page anymore.*"))
 
         container.add_item(discord.ui.Separator())
 
-        footer = f"-# Page {self._page + 1}/{self._total_pages} • {pluralize(len(self.entries)):entry|entries} • Sorted by: {self._sort}"
+        footer = f"-# Page {self._page + 1}/{self._total_pages} • {pluralize(self.count):entry|entries} • Sorted by: {self._sort}"
         container.add_item(discord.ui.TextDisplay(footer))
 
         if self._total_pages > 1:
@@ -403,13 +429,11 @@ class TagListView(TagLayoutView):
         self.add_item(container)
 
     async def _prev(self, interaction: discord.Interaction) -> None:
-        self._page = max(0, self._page - 1)
-        self._build_page()
+        await self.show(max(0, self._page - 1))
         await interaction.response.edit_message(view=self)
 
     async def _next(self, interaction: discord.Interaction) -> None:
-        self._page = min(self._total_pages - 1, self._page + 1)
-        self._build_page()
+        await self.show(min(self._total_pages - 1, self._page + 1))
         await interaction.response.edit_message(view=self)
 
     async def _jump(self, interaction: discord.Interaction) -> None:
@@ -417,8 +441,7 @@ class TagListView(TagLayoutView):
         await interaction.response.send_modal(modal)
         if await modal.wait():
             return
-        self._page = modal.page
-        self._build_page()
+        await self.show(modal.page)
         await modal.interaction.response.edit_message(view=self)
 
 
@@ -797,7 +820,7 @@ class Tag(BaseRecord, table="tags", pk="id"):
         connection: asyncpg.Connection | None = None,
     ) -> Tag:
         try:
-            return await super()._update(key, values, connection=connection)
+            updated = await super()._update(key, values, connection=connection)
         except asyncpg.UniqueViolationError:
             raise BadArgument("A Tag with this name already exists.", "name_or_id")
         except asyncpg.StringDataRightTruncationError:
@@ -805,6 +828,10 @@ class Tag(BaseRecord, table="tags", pk="id"):
         except asyncpg.CheckViolationError:
             raise BadArgument("Tag Content is missing.", "name_or_id")
 
+        # Uses are buffered by the cog, so every update here is a change the caches must see.
+        self.bot.db.signals.fire("tags_changed", self.location_id, ("updated", self.id, self.name, self.owner_id))
+        return updated
+
     async def get_rank(self) -> int:
         return await self.bot.db.tags.get_tag_rank(self.id)
 
@@ -864,6 +891,64 @@ class Tags(Cog):
         # Phase 6: free-text question → best-matching tag name (gated on AIFlags.tags).
         self._tag_finder: TagFinder = TagFinder(bot.ai)
 
+        # Names/owners/uses per guild for the autocompletes, patched or dropped on every tag mutation.
+        self._tag_names: TagNameIndex = TagNameIndex()
+        self._tag_name_loads: dict[int, asyncio.Task[TagNames]] = {}
+        # Resolved tags of frequently requested names, served by `send_tag` without a query.
+        self._hot_tags: HotTagCache[Tag] = HotTagCache()
+        self._tag_uses: TagUseBuffer = TagUseBuffer()
+        self._tag_uses_lock = asyncio.Lock()
+
+        signal = bot.db.signals.register("tags_changed")
+        # The index also takes the change a single-tag mutation fires with, to patch itself.
+        signal.connect(self._tag_names, None, None)
+        signal.connect(self._hot_tags, None)
+
+        self.flush_tag_uses.add_exception_type(asyncpg.PostgresConnectionError)
+        self.flush_tag_uses.start()
+
+    async def cog_unload(self) -> None:
+        signal = self.bot.db.signals.register("tags_changed")
+        signal.disconnect(self._tag_names)
+        signal.disconnect(self._hot_tags)
+
+        self.flush_tag_uses.cancel()
+        await self.write_tag_uses()
+
+    def record_use(self, tag: Tag) -> None:
+        """Counts one use of ``tag``; written to the database by :meth:`flush_tag_uses`."""
+        self._tag_uses.add(tag.id)
+        tag.uses += 1
+
+    async def write_tag_uses(self) -> None:
+        """|coro|
+
+        Adds every buffered use count to its tag in a single statement.
+
+        The counts are increments, so they are only put back into the buffer when the
+        statement raised and nothing was added. Writes run one at a time, so the final
+        write on unload also waits for one the cancelled loop left in flight.
+        """
+        async with self._tag_uses_lock:
+            ids, counts = self._tag_uses.drain()
+            if not ids:
+                return
+            try:
+                await self.bot.db.tags.add_tag_uses(ids, counts)
+            except Exception:
+                log.exception("Failed to write %d buffered tag use counts", len(ids))
+                self._tag_uses.restore(ids, counts)
+
+    @tasks.loop(seconds=30.0)
+    async def flush_tag_uses(self) -> None:
+        """|coro|
+
+        A task that writes the buffered tag use counts to the database.
+        """
+        # Shielded: a write cancelled after it committed would otherwise be restored and
+        # added a second time by the next one.
+        await asyncio.shield(self.write_tag_uses())
+
     @contextlib.contextmanager
     def reserve_tag(self, guild_id: int, name: str, /) -> Generator[None, None, None]:
         """Reserves a tag name for a guild."""
@@ -901,36 +986,48 @@ class Tags(Cog):
         """
         repo = self.bot.db.tags
 
-        record = await repo.get_tag_record(name_or_id, owner_id=owner_id, location_id=location_id)
-        parent = Tag(bot=self.bot, record=record) if record else None
-
-        if not parent:
-            record = await repo.get_parent_record_via_alias(name_or_id)
-            parent = Tag(bot=self.bot, record=record) if record else None
-
-        if parent and not exact_match:
-            if not only_parent:
-                aliases = await repo.get_alias_records(parent.id, parent.name, owner_id=owner_id, location_id=location_id)
-                parent.aliases = [AliasTag(parent=parent, record=alias) for alias in aliases]
-
-            return parent
-
-        if not parent and exact_match:
+        if exact_match:
+            record = await repo.get_tag_record(name_or_id, owner_id=owner_id, location_id=location_id)
+            if record:
+                return self._with_pending_uses(Tag(bot=self.bot, record=record))
             alias = await repo.get_alias_record(name_or_id, owner_id=owner_id, location_id=location_id)
             return AliasTag(record=alias) if alias else None
 
-        if similarites and isinstance(name_or_id, str):
+        similar = similarites and isinstance(name_or_id, str)
+        if similar:
             assert location_id is not None
-            rows = await repo.get_similar_aliases(location_id, name_or_id)
-            return [AliasTag(parent=parent, record=row) for row in rows]
+        row = await repo.resolve_tag(
+            name_or_id, owner_id=owner_id, location_id=location_id, aliases=not only_parent, similar=similar
+        )
+
+        if row["parent"] is not None:
+            parent = self._with_pending_uses(Tag(bot=self.bot, record=row["parent"]))
+            parent.aliases = [AliasTag(parent=parent, record=alias) for alias in row["aliases"]]
+            return parent
+
+        if similar:
+            return [AliasTag(parent=None, record=alias) for alias in row["similar"]]
         return None
 
+    def _with_pending_uses(self, tag: Tag) -> Tag:
+        tag.uses += self._tag_uses.pending(tag.id)
+        return tag
+
     async def send_tag(self, ctx: Context, name_or_id: str | int, *, escape_markdown: bool = False) -> None:
         """|coro|
 
         Look up a Tag by name in the given guild. Searching with similarity queries.
         """
         assert ctx.guild is not None
+        key = str(name_or_id).lower()
+        hot = self._hot_tags.get(ctx.guild.id, key)
+        if hot is not None:
+            content = hot.raw_content if escape_markdown else hot.content
+            await ctx.send(content, reference=ctx.replied_reference)
+            self.record_use(hot)
+            return
+
+        generation = self._hot_tags.generation(ctx.guild.id)
         result = await self.get_tag(name_or_id, location_id=ctx.guild.id, similarites=True)
 
         if isinstance(result, list):
@@ -948,11 +1045,8 @@ class Tags(Cog):
         content = tag.raw_content if escape_markdown else tag.content
         await ctx.send(content, reference=ctx.replied_reference)
 
-        _aliases = getattr(tag, "aliases", None)
-        updated = await tag.add(uses=1)
-        tag = updated
-        if _aliases:
-            tag.aliases = _aliases  # type: ignore
+        self.record_use(tag)
+        self._hot_tags.put(ctx.guild.id, key, tag, generation=generation)
 
     @staticmethod
     async def create_tag(ctx: Context, name: str, content: str) -> None:
@@ -1000,48 +1094,60 @@ class Tags(Cog):
             else:
                 return name.lower() in being_made
 
+    async def get_tag_names(self, guild_id: int) -> TagNames:
+        """|coro|
+
+        The autocomplete name index of a guild, loaded on first use. Concurrent keystrokes
+        while a guild loads share one query.
+        """
+        names = self._tag_names.get(guild_id)
+        if names is not None:
+            return names
+
+        task = self._tag_name_loads.get(guild_id)
+        if task is None:
+            task = asyncio.create_task(self._load_tag_names(guild_id))
+            self._tag_name_loads[guild_id] = task
+            task.add_done_callback(lambda _: self._tag_name_loads.pop(guild_id, None))
+        # Shielded so a cancelled autocomplete does not abort the load for the others.
+        return await asyncio.shield(task)
+
+    async def _load_tag_names(self, guild_id: int) -> TagNames:
+        generation = self._tag_names.generation(guild_id)
+        rows = await self.bot.db.tags.get_tag_names(guild_id)
+        return self._tag_names.store(guild_id, TagNames.from_rows(rows), generation=generation)
+
+    @staticmethod
+    def _tag_choices(
+        search: TagNameSearch, current: str, *, owner_id: int | None = None
+    ) -> list[Choice[str | int | float]]:
+        choices = []
+        for entry in search.search(current, owner_id=owner_id, limit=AUTOCOMPLETE_LIMIT):
+            text = entry.choice_text
+            name = text if len(text) <= 100 else text[:99] + "…"
+            choices.append(app_commands.Choice(name=name, value=str(entry.id)))
+        return choices
+
     async def non_aliased_tag_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[Choice[str | int | float]]:
         assert interaction.guild_id is not None
-        tags: list[Tag] = [
-            Tag(bot=self.bot, record=record) for record in await self.bot.db.tags.get_guild_tags(interaction.guild_id)
-        ]
-
-        results = fuzzy.finder(current, tags, key=lambda p: p.choice_text, raw=True)
-        return [
-            app_commands.Choice(name=get_shortened_string(length, start, tag.choice_text), value=str(tag.id))
-            for length, start, tag in results[:20]
-        ]
+        names = await self.get_tag_names(interaction.guild_id)
+        return self._tag_choices(names.tags, current)
 
     async def aliased_tag_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[Choice[str | int | float]]:
         assert interaction.guild_id is not None
-        tags: list[AliasTag] = [
-            AliasTag(record=record) for record in await self.bot.db.tags.get_guild_aliases(interaction.guild_id)
-        ]
-
-        results = fuzzy.finder(current, tags, key=lambda p: p.choice_text, raw=True)
-        return [
-            app_commands.Choice(name=get_shortened_string(length, start, tag.choice_text), value=str(tag.id))
-            for length, start, tag in results[:20]
-        ]
+        names = await self.get_tag_names(interaction.guild_id)
+        return self._tag_choices(names.lookup, current)
 
     async def owned_non_aliased_tag_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[Choice[str | int | float]]:
         assert interaction.guild_id is not None
-        tags: list[Tag] = [
-            Tag(bot=self.bot, record=record)
-            for record in await self.bot.db.tags.get_owned_tags(interaction.guild_id, interaction.user.id)
-        ]
-
-        results = fuzzy.finder(current, tags, key=lambda p: p.choice_text, raw=True)
-        return [
-            app_commands.Choice(name=get_shortened_string(length, start, tag.choice_text), value=str(tag.id))
-            for length, start, tag in results[:20]
-        ]
+        names = await self.get_tag_names(interaction.guild_id)
+        return self._tag_choices(names.tags, current, owner_id=interaction.user.id)
 
     @group("tag", description="Shows a tag from the server.", fallback="show", guild_only=True, hybrid=True)
     @describe(name_or_id="The tag to retrieve")
@@ -1078,11 +1184,11 @@ class Tags(Cog):
         """
         assert ctx.guild is not None
         try:
-            status = await ctx.db.tags.create_alias(new_alias, original_tag, ctx.guild.id, ctx.author.id)
+            record = await ctx.db.tags.create_alias(new_alias, original_tag, ctx.guild.id, ctx.author.id)
         except asyncpg.UniqueViolationError:
             raise BadArgument("This alias is already taken.", "new_alias")
         else:
-            if status[-1] == "0":
+            if record is None:
                 raise BadArgument("The original tag could not be found.", "original_tag")
             else:
                 await ctx.send_success(
@@ -1368,41 +1474,64 @@ class Tags(Cog):
         await self.send_tag(ctx, name_or_id, escape_markdown=True)
 
     @staticmethod
-    async def filter_tags(ctx: Context, flags: TagListFlags | TagSearchFlags, query: str | None = None) -> list[asyncpg.Record]:
-        assert ctx.guild is not None
+    def filter_scope(ctx: Context, flags: TagListFlags | TagSearchFlags, query: str | None = None) -> dict[str, Any]:
+        """The ``query`` and ``owner_id`` filters of a tag listing."""
         member: discord.Member | None = None
         if query is None:
             raw_member = flags.member or ctx.author
             member = raw_member if isinstance(raw_member, discord.Member) else None
+        return {"query": query, "owner_id": member.id if member else None}
+
+    async def send_tag_list(
+        self,
+        ctx: Context,
+        flags: TagListFlags | TagSearchFlags,
+        query: str | None = None,
+        *,
+        empty: str,
+        title: str,
+        description: str,
+    ) -> None:
+        """Sends a tag listing, read one page at a time (or as a text table with ``to_text``)."""
+        assert ctx.guild is not None
+        scope = self.filter_scope(ctx, flags, query)
+        if flags.to_text:
+            rows = await ctx.db.tags.filter_tags(ctx.guild.id, sort=flags.sort, **scope)
+            if not rows:
+                await ctx.send_error(empty)
+                return
+            await self.send_tags_to_text(ctx, rows)
+            return
 
-        return await ctx.db.tags.filter_tags(
-            ctx.guild.id, query=query, owner_id=member.id if member else None, sort=flags.sort
+        count = await ctx.db.tags.count_filtered_tags(ctx.guild.id, **scope)
+        if not count:
+            await ctx.send_error(empty)
+            return
+
+        source = KeysetPageSource(
+            functools.partial(ctx.db.tags.filter_tags_page, ctx.guild.id, sort=flags.sort, **scope),
+            key=lambda row: (row["sort_key"], row["id"]),
+            per_page=TagListView.PER_PAGE,
+            count=count,
         )
+        view = TagListView(source, count=count, ctx=ctx, title=title, description=description, sort=flags.sort)
+        await view.show(0)
+        msg = await ctx.send(view=view)
+        view.message = msg
 
     @tag.command("list", description="Shows a list of Tags owned by yourself or a given member.", guild_only=True)
     @describe(member="The member to list tags of, if not given then it defaults to you.")
     async def tag_list(self, ctx: Context, *, flags: TagListFlags) -> None:
         """Shows a list of Tags owned by yourself or a given member."""
         member = flags.member or ctx.author
-        rows = await self.filter_tags(ctx, flags)
-        if not rows:
-            await ctx.send_error(f"No tags found for **{member}**.")
-            return
-
-        if flags.to_text:
-            await self.send_tags_to_text(ctx, rows)
-            return
-
         guild_name = ctx.guild.name if ctx.guild is not None else "this server"
-        view = TagListView(
-            rows,
-            ctx=ctx,
+        await self.send_tag_list(
+            ctx,
+            flags,
+            empty=f"No tags found for **{member}**.",
             title="Tag List",
             description=f"{member}'s tags in {guild_name}",
-            sort=flags.sort,
         )
-        msg = await ctx.send(view=view)
-        view.message = msg
 
     @tag.command("search", description="Search for tags matching the given query.", guild_only=True)
     @describe(query="The tag name to search for")
@@ -1418,24 +1547,9 @@ class Tags(Cog):
         """Search for tags matching the given query.
         `Note:` To use autocomplete, you have to at least provide three characters.
         """
-        rows = await self.filter_tags(ctx, flags, query)
-        if not rows:
-            await ctx.send_error("No tags found.")
-            return
-
-        if flags.to_text:
-            await self.send_tags_to_text(ctx, rows)
-            return
-
-        view = TagListView(
-            rows,
-            ctx=ctx,
-            title="Tag Search",
-            description=f"Results for \"{query}\"",
-            sort=flags.sort,
+        await self.send_tag_list(
+            ctx, flags, query, empty="No tags found.", title="Tag Search", description=f"Results for \"{query}\""
         )
-        msg = await ctx.send(view=view)
-        view.message = msg
 
     @tag.command("find", description="Find the most relevant tag for a question (AI).", guild_only=True)
     @describe(query="Describe what you're looking for in plain language.")
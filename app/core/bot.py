@@ -14,14 +14,13 @@ from typing import TYPE_CHECKING, Any, Final, TypeVar
 import discord
 import jishaku
 import wavelink
-from aiohttp import ClientSession
 from discord.ext import commands
 from discord.http import Route
 from discord.utils import MISSING
 from expiringdict import ExpiringDict
 
 import config
-from app.clients import OllamaClient
+from app.clients import ConnectionPools, OllamaClient
 from app.cogs import EXTENSIONS
 from app.core.command import Command, GroupCommand, assign_native_permissions
 from app.core.context import Context
@@ -53,7 +52,7 @@ from app.utils import (
     humanize_duration,
 )
 from app.utils.lock import LockedResourceError
-from app.utils.metrics import MetricsCollector
+from app.utils.metrics import MetricsCollector, StartupTimings
 from app.utils.types import RPCAppInfo, RPCAppInfoPayload
 from config import (
     Emojis,
@@ -76,7 +75,11 @@ from config import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable, Generator, Iterable
+    import importlib.machinery
+    from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Iterable
+    from types import ModuleType
+
+    from aiohttp import ClientSession
 
 GuildFeatureT = TypeVar('GuildFeatureT', bound=list[tuple[str, str]] | Any)
 
@@ -101,6 +104,7 @@ class Bot(commands.Bot):
     bot_app_info: discord.AppInfo
     db: Database
     session: ClientSession
+    http_pools: ConnectionPools
     startup_timestamp: datetime.datetime
     context: type[Context]
     timers: TimerManager
@@ -116,12 +120,16 @@ class Bot(commands.Bot):
     log_handler: logging.Handler
     internal_api: InternalAPI
     metrics: MetricsCollector
+    startup: StartupTimings
     feature_flags: FeatureFlags
     i18n: I18n
 
     #: Whether application-command IDs have been resolved onto command objects (for
     #: ``Command.mention``). Set by :meth:`resolve_app_command_ids`, cleared on re-sync.
     _app_command_ids_resolved: bool = False
+    #: Bumped whenever a command is added or removed (extension loads, unloads and
+    #: reloads included). The help command rebuilds its cached mappings when it changes.
+    command_generation: int = 0
 
     if TYPE_CHECKING:
         blacklist: Config[int, bool]
@@ -171,11 +179,13 @@ class Bot(commands.Bot):
         self.context: type[Context] = Context
         self.spam_control: SpamControl = SpamControl(self)
         self.metrics: MetricsCollector = MetricsCollector()
+        self.startup: StartupTimings = StartupTimings()
         self.feature_flags: FeatureFlags = FeatureFlags()
         self.i18n: I18n = I18n()
 
         self.initial_extensions: list[str] = EXTENSIONS
         self._setup_finished: asyncio.Event = asyncio.Event()
+        self._lavalink_connected: asyncio.Event = asyncio.Event()
         #: The URL the AI client talks to (``ollama_config.host``). Used for health logging.
         self._ollama_host: str = ollama_config.host
         #: Throttles AI command-routing so a stream of prefix-misses can't hammer the model.
@@ -202,7 +212,11 @@ class Bot(commands.Bot):
         return commands.when_mentioned_or(*prefixes)(self, message)
 
     async def _load_extensions(self) -> None:
-        """Loads all command extensions, including Jishaku."""
+        """Loads all command extensions, including Jishaku.
+
+        Extensions load concurrently. An extension whose setup waits on the database or
+        the gateway doesn't hold up the others.
+        """
         await self.load_extension('jishaku')
 
         # avoid excessive api requests and reduce load for testing purposes
@@ -212,15 +226,42 @@ class Bot(commands.Bot):
             'app.cogs.comic',
             'app.cogs.anilist',
         )
-        for extension in self.initial_extensions:
-            if beta and extension in DoNotLoadOnBeta:
-                continue
+        await asyncio.gather(*(
+            self._load_initial_extension(extension)
+            for extension in self.initial_extensions
+            if not (beta and extension in DoNotLoadOnBeta)
+        ))
+
+    async def _load_initial_extension(self, extension: str) -> None:
+        try:
+            await self.load_extension(extension)
+        except Exception as exc:
+            self.startup.extension(extension).failed = True
+            self.log.critical('Failed to load extension %s: %s', extension, exc, exc_info=True)
+        else:
+            self.log.debug('Loaded extension: %s', extension)
+
+    async def _load_from_module_spec(self, spec: importlib.machinery.ModuleSpec, key: str) -> None:
+        # discord.py imports the module and awaits its setup() in here. Time the two apart
+        # through the spec's loader, which find_spec creates afresh for every load.
+        timing = self.startup.extension(key)
+        loader: Any = spec.loader
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module: ModuleType) -> None:
+            start = _time.perf_counter()
             try:
-                await self.load_extension(extension)
-            except Exception as exc:
-                self.log.critical('Failed to load extension %s: %s', extension, exc, exc_info=True)
-            else:
-                self.log.debug('Loaded extension: %s', extension)
+                exec_module(module)
+            finally:
+                timing.import_ms = (_time.perf_counter() - start) * 1000
+
+        loader.exec_module = timed_exec_module
+        start = _time.perf_counter()
+        try:
+            await super()._load_from_module_spec(spec, key)
+        finally:
+            del loader.exec_module
+            timing.setup_ms = (_time.perf_counter() - start) * 1000 - timing.import_ms
 
     async def reload_extension(self, name: str, *, package: str | None = None) -> None:
         """Reloads an extension."""
@@ -238,6 +279,13 @@ class Bot(commands.Bot):
                     child.transform_flag_parameters()  # type: ignore
 
         super().add_command(command)
+        self.command_generation += 1
+
+    def remove_command(self, name: str, /) -> Command | None:
+        command = super().remove_command(name)
+        if command is not None:
+            self.command_generation += 1
+        return command  # type: ignore[return-value]
 
     async def setup_hook(self) -> None:
         """Prepares the bot for startup."""
@@ -251,7 +299,10 @@ class Bot(commands.Bot):
 
         self.bypass_checks = False
         self.db = await Database(self, loop=self.loop).wait()
-        self.session = ClientSession()
+        self.http_pools = ConnectionPools.from_config(config.http_pool)
+        # Ollama generations hold a connection for minutes; keep them off the shared pool.
+        self.http_pools.dedicate(ollama_config.host, ollama_config.max_concurrency + 2)
+        self.session = self.http_pools.default
 
         self.klappstuhlme_client = KlappstuhlClient(
             config.klappstuhl_me_api_token,
@@ -267,7 +318,7 @@ class Bot(commands.Bot):
         self._ollama_host = ollama_config.host
         self.ai = AIService(
             OllamaClient(
-                self.session,
+                self.http_pools.session_for(ollama_config.host),
                 host=ollama_config.host,
                 default_model=ollama_config.balanced_model,
                 keep_alive=ollama_config.keep_alive,
@@ -321,7 +372,7 @@ class Bot(commands.Bot):
                 self._ollama_host, report.error or 'no further detail',
             )
 
-    async def _setup_hook_task(self) -> None:
+    async def _connect_lavalink(self) -> None:
         try:
             await wavelink.Pool.connect(
                 nodes=[
@@ -343,16 +394,29 @@ class Bot(commands.Bot):
             )
         except Exception as exc:
             self.log.error('Failed to connect to Lavalink:', exc_info=exc)
+        finally:
+            self._lavalink_connected.set()
 
+    async def _start_internal_api(self) -> None:
         try:
             self.internal_api = InternalAPI(self)
             await self.internal_api.start()
         except Exception as exc:
             self.log.error('Failed to start internal API:', exc_info=exc)
 
-        await self._check_ai_health()
+    async def _startup_stage(self, name: str, stage: Awaitable[None]) -> None:
+        with self.startup.stage(name):
+            await stage
 
-        await self._load_extensions()
+    async def _setup_hook_task(self) -> None:
+        # None of these wait on each other, so a slow Lavalink node or AI engine no
+        # longer delays the cogs. The music extension alone waits for the Lavalink stage.
+        await asyncio.gather(
+            self._startup_stage('lavalink', self._connect_lavalink()),
+            self._startup_stage('internal_api', self._start_internal_api()),
+            self._startup_stage('ai_health', self._check_ai_health()),
+            self._startup_stage('extensions', self._load_extensions()),
+        )
 
         gated = self.apply_native_permissions()
         self.log.info('Applied native slash-command permissions to %d command(s).', gated)
@@ -360,6 +424,9 @@ class Bot(commands.Bot):
         if test_guild_id is not None:
             self.tree.copy_global_to(guild=discord.Object(id=test_guild_id))
 
+        self.startup.finish()
+        slowest = ', '.join(f'{t.name} {t.import_ms + t.setup_ms:.0f}ms' for t in self.startup.slowest_extensions(3))
+        self.log.info('Setup finished after %.0fms; slowest extensions: %s.', self.startup.total_ms, slowest)
         self._setup_finished.set()
 
     async def wait_until_setup_finished(self) -> None:
@@ -369,6 +436,16 @@ class Bot(commands.Bot):
         """
         await self._setup_finished.wait()
 
+    async def wait_until_lavalink_connected(self) -> None:
+        """|coro|
+
+        Waits until the startup attempt to connect the Lavalink nodes has finished.
+
+        This returns whether or not the connect succeeded; check ``wavelink.Pool.get_node()``
+        afterwards.
+        """
+        await self._lavalink_connected.wait()
+
     async def get_context(
             self,
             origin: discord.Message | discord.Interaction,
@@ -1183,9 +1260,11 @@ class Bot(commands.Bot):
             await self.blacklist.remove(obj.id)
 
     async def close(self) -> None:
-        """Closes this bot and it's aiohttp ClientSession."""
-        if hasattr(self, 'session'):
-            await self.session.close()
+        """Closes this bot and its outbound HTTP pools."""
+        if hasattr(self, 'internal_api'):
+            await self.internal_api.stop()
+        if hasattr(self, 'http_pools'):
+            await self.http_pools.close()
         if hasattr(self, 'db'):
             await self.db.close()
 
@@ -741,10 +741,10 @@ def assign_native_permissions(command_iter: Iterable[Any]) -> int:
             continue
 
         spec = getattr(cmd, "permissions", None)
-        if spec is None or not spec.user:
+        if spec is None or not spec.user_mask:
             continue
 
-        app_cmd.default_permissions = discord.Permissions(**dict.fromkeys(spec.user, True))
+        app_cmd.default_permissions = discord.Permissions(spec.user_mask)
         gated += 1
 
     return gated
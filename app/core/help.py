@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools
 import inspect
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import discord
 from discord.ext import commands
@@ -36,7 +36,7 @@ COMMANDS_PER_PAGE = 6
 def create_prefixes(cmd: AnyCommand) -> list[str]:
     """The small status emojis (locked / has-more-help) shown before a command."""
     prefixes = []
-    if getattr(cmd, "is_locked", False):
+    if PaginatedHelpCommand.command_requires_permissions(cmd):
         prefixes.append(Emojis.Command.locked)
     if getattr(cmd, "has_more_help", False):
         prefixes.append(Emojis.Command.more_info)
@@ -295,6 +295,14 @@ class PaginatedHelpCommand(commands.HelpCommand):
 
     context: Context | discord.Interaction
 
+    #: Filtered and sorted category mappings shared by every invocation (each one runs on a
+    #: fresh copy of the help command), keyed by :meth:`_mapping_key`. Rebuilt once the
+    #: bot's :attr:`~app.core.Bot.command_generation` moves on.
+    _mappings: ClassVar[dict[int | None, dict[Cog, list[AnyCommand]]]] = {}
+    _mappings_generation: ClassVar[int] = -1
+    #: Guilds that some command is restricted to; every other guild sees the same mapping.
+    _restricted_guilds: ClassVar[frozenset[int]] = frozenset()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(
             show_hidden=False,
@@ -311,11 +319,59 @@ class PaginatedHelpCommand(commands.HelpCommand):
         #: when help is invoked as a slash command (kept off for prefix invocations).
         self._render_mentions: bool = False
 
-    def get_bot_mapping(self) -> dict[Cog | None, list[Command]]:
-        mapping = super().get_bot_mapping()
-        del mapping[None]
+    def get_bot_mapping(self) -> dict[Cog, list[AnyCommand]]:  # type: ignore[override]
+        """The categories shown to the invoking context and their filtered, sorted commands.
+
+        Computed once per command generation and kind of context (DMs, guilds, and each
+        guild that has commands restricted to it) and shared afterwards, so opening the
+        menu does not walk every command again. Treat the result as read-only.
+
+        The mapping does not depend on the member's permissions: gated commands are
+        listed with a lock rather than hidden.
+        """
+        bot = self.context.bot if isinstance(self.context, commands.Context) else self.context.client
+        cls = type(self)
+        generation = bot.command_generation  # type: ignore[attr-defined]
+        if generation != cls._mappings_generation:
+            cls._mappings = {}
+            cls._mappings_generation = generation
+            cls._restricted_guilds = frozenset(
+                guild_id
+                for command in bot.walk_commands()
+                for guild_id in getattr(command.callback, "__guild_ids__", None) or ()
+            )
+
+        key = self._mapping_key()
+        mapping = cls._mappings.get(key)
+        if mapping is None:
+            mapping = cls._mappings[key] = self._build_mapping(bot)
         return mapping
 
+    def _mapping_key(self) -> int | None:
+        """``None`` in DMs, the guild's ID if commands are restricted to it, else ``0``."""
+        guild = getattr(self.context, "guild", None)
+        if guild is None:
+            return None
+        return guild.id if guild.id in self._restricted_guilds else 0
+
+    def _build_mapping(self, bot: Bot) -> dict[Cog, list[AnyCommand]]:
+        def key(cmd: AnyCommand) -> str:
+            return cmd.cog.qualified_name if cmd.cog else "No Category"
+
+        grouped: dict[Cog, list[AnyCommand]] = {}
+        for command in self._filter_commands(bot.commands, sort=True, key=key):
+            cog: Cog | None = bot.get_cog(key(command))
+            if getattr(cog, "__hidden__", False):
+                continue
+
+            if cog and not command.hidden:
+                grouped.setdefault(cog, []).append(command)
+
+        for cog_commands in grouped.values():
+            cog_commands.sort(key=self._help_sort_key)
+
+        return dict(sorted(grouped.items(), key=lambda x: x[0].qualified_name))
+
     async def total_commands_invoked(self) -> int:
         """Returns the total amount of commands invoked."""
         return await self.context.db.stats.count_all_commands()  # type: ignore
@@ -326,17 +382,16 @@ class PaginatedHelpCommand(commands.HelpCommand):
         if not isinstance(command, (Command, HybridCommand)):
             return False
 
-        spec = command.permissions
-        return bool(spec.user)
+        return bool(command.permissions.user_mask)
 
     @staticmethod
     def _help_sort_key(command: AnyCommand) -> tuple[bool, str]:
         """Sort key for category command lists.
 
         Unrestricted commands come first, then permission-gated ones, each group
-        ordered alphabetically. Relies on ``is_locked`` set in :meth:`_get_all_subcommands`.
+        ordered alphabetically.
         """
-        return bool(getattr(command, "is_locked", False)), command.qualified_name
+        return PaginatedHelpCommand.command_requires_permissions(command), command.qualified_name
 
     def _get_all_subcommands(self, command: AnyCommand | AnyGroup, names: set[str]) -> set[AnyCommand]:
         """Returns all subcommands of a command."""
@@ -345,8 +400,6 @@ class PaginatedHelpCommand(commands.HelpCommand):
         def add_subcommand(cmd: AnyCommand) -> None:
             nonlocal subcommands, names
             if not cmd.hidden and self.is_available(cmd) and cmd.qualified_name not in names:
-                setattr(cmd, "is_locked", self.command_requires_permissions(cmd))
-
                 subcommands.add(cmd)
                 names.add(cmd.qualified_name)
 
@@ -392,6 +445,11 @@ class PaginatedHelpCommand(commands.HelpCommand):
         list[`AnyCommand`]
             The filtered Commands.
         """
+        return self._filter_commands(commands, sort=sort, key=key)
+
+    def _filter_commands(
+        self, commands: Iterable[AnyCommand], /, *, sort: bool = False, key: Callable[[AnyCommand], Any] | None = None
+    ) -> list[AnyCommand]:
         if sort and key is None:
             key = self._help_sort_key
 
@@ -534,28 +592,10 @@ class PaginatedHelpCommand(commands.HelpCommand):
         Parameters
         ----------
         mapping: Mapping[:class:`.Cog`, list[:class:`.commands.Command`]]
-            The mapping of the commands.
+            The mapping of the commands, from :meth:`get_bot_mapping`.
         """
 
-        def key(cmd: AnyCommand) -> str:
-            return cmd.cog.qualified_name if cmd.cog else "No Category"
-
-        entries = await self.filter_commands(self.context.bot.commands, sort=True, key=key)
-
-        grouped: dict[Cog, list[AnyCommand]] = {}
-        for command in entries:
-            cog: Cog | None = self.context.bot.get_cog(key(command))
-            if getattr(cog, "__hidden__", False):
-                continue
-
-            if cog and not command.hidden:
-                grouped.setdefault(cog, []).append(command)
-
-        for cog_commands in grouped.values():
-            cog_commands.sort(key=self._help_sort_key)
-
-        grouped = dict(sorted(grouped.items(), key=lambda x: x[0].qualified_name))
-        await HelpView.start(self, mapping=grouped)
+        await HelpView.start(self, mapping=dict(mapping))  # type: ignore[arg-type]
 
     async def send_cog_help(self, cog: Cog) -> discord.Message | None:
         """|coro|
@@ -655,7 +695,7 @@ class PaginatedHelpCommand(commands.HelpCommand):
         container.add_item(discord.ui.TextDisplay(f"## {emoji} {group.qualified_name}\n{group.description or ''}"))
         container.add_item(discord.ui.Separator())
 
-        is_any_locked = any(getattr(cmd, "is_locked", False) for cmd in entries)
+        is_any_locked = any(self.command_requires_permissions(cmd) for cmd in entries)
         any_has_more_help = any(getattr(cmd, "has_more_help", False) for cmd in entries)
 
         lines: list[str] = []
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import math
 from abc import ABCMeta, abstractmethod
-from typing import TYPE_CHECKING, Any, AnyStr, Literal, NamedTuple, Self, TypeVar, override
+from typing import TYPE_CHECKING, Any, AnyStr, ClassVar, Literal, NamedTuple, Self, TypeVar, override
 
 import discord
 import numpy as np
@@ -13,13 +16,16 @@ from app.utils import aenumerate, fuzzy, helpers
 from config import Emojis
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Collection, Generator
+    from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Collection, Generator, Sequence
 
 __all__ = (
     "BasePaginator",
     "EmbedPaginator",
     "FilePaginator",
+    "KeysetPageSource",
     "LinePaginator",
+    "PageSource",
+    "SourcePaginator",
     "TextPaginator",
     "TextSource",
     "TextSourcePaginator",
@@ -161,6 +167,148 @@ class TextSource:
         return self._pages
 
 
+class PageSource[T](metaclass=ABCMeta):
+    """A listing that is read one page at a time instead of being held in memory.
+
+    Attributes
+    ----------
+    per_page: :class:`int`
+        The number of rows on a page.
+    """
+
+    def __init__(self, *, per_page: int) -> None:
+        self.per_page: int = per_page
+
+    @property
+    @abstractmethod
+    def page_count(self) -> int:
+        """:class:`int`: The number of pages, as far as it is known so far."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(self, index: int, /) -> Sequence[T]:
+        """|coro|
+
+        Returns the rows on page ``index`` (zero-based).
+        """
+        raise NotImplementedError
+
+    async def walk(self, *, limit: int | None = None) -> AsyncIterator[tuple[int, Sequence[T]]]:
+        """Yields every page in order, with its index, until the listing runs out or
+        ``limit`` pages were yielded."""
+        index = 0
+        while index < self.page_count and (limit is None or index < limit):
+            rows = await self.get_page(index)
+            if not rows:
+                return
+            yield index, rows
+            index += 1
+
+
+class KeysetPageSource[T, K](PageSource[T]):
+    """A page source over a keyset query.
+
+    ``fetch`` returns up to ``limit`` rows ordered by ``key``. It continues right
+    behind the row whose key is ``after``, or skips ``offset`` rows when ``after``
+    is ``None``. Each page is read from the key of the last row of the page before
+    it, so paging through a listing never makes the database count past earlier
+    rows. Offsets are only used when someone jumps ahead to a page that hasn't
+    been reached yet.
+
+    After a page is read, the next ``read_ahead`` pages are fetched in the
+    background, so paging forward usually finds its page ready. At most ``keep``
+    pages are held. The least recently viewed one is dropped first, and only its
+    cursor is kept.
+
+    Parameters
+    ----------
+    fetch: Callable[..., Awaitable[Sequence[T]]]
+        Reads a page, called with ``limit``, ``after`` and ``offset`` as keywords.
+    key: Callable[[T], K]
+        The sort key of a row, handed back to ``fetch`` as ``after``.
+    per_page: :class:`int`
+        The number of rows on a page.
+    count: Optional[:class:`int`]
+        The number of rows, if known. Otherwise the page count grows as pages are read.
+    read_ahead: :class:`int`
+        How many pages to fetch ahead of the one being viewed.
+    keep: :class:`int`
+        How many pages to hold at once.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Awaitable[Sequence[T]]],
+        *,
+        key: Callable[[T], K],
+        per_page: int,
+        count: int | None = None,
+        read_ahead: int = 1,
+        keep: int = 4,
+    ) -> None:
+        super().__init__(per_page=per_page)
+        self.fetch: Callable[..., Awaitable[Sequence[T]]] = fetch
+        self.key: Callable[[T], K] = key
+        self.read_ahead: int = read_ahead
+        self.keep: int = max(keep, read_ahead + 1)
+
+        self._pages: dict[int, asyncio.Task[Sequence[T]]] = {}
+        self._cursors: dict[int, K] = {}
+        self._end: int | None = None if count is None else math.ceil(count / per_page)
+        self._reached: int = 0
+
+    @property
+    def page_count(self) -> int:
+        if self._end is not None:
+            return self._end
+        return self._reached + 1
+
+    async def get_page(self, index: int, /) -> Sequence[T]:
+        task = self._pages.pop(index, None)
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = self._load(index)  # not read yet, or the read ahead failed
+        self._pages[index] = task  # most recently viewed last
+        try:
+            rows = await asyncio.shield(task)
+        except Exception:
+            self._pages.pop(index, None)
+            raise
+
+        for ahead in range(index + 1, min(index + 1 + self.read_ahead, self.page_count)):
+            if ahead not in self._pages:
+                self._pages[ahead] = self._load(ahead)
+        self._evict(index)
+        return rows
+
+    def _load(self, index: int) -> asyncio.Task[Sequence[T]]:
+        return asyncio.create_task(self._fetch(index, self._pages.get(index - 1)))
+
+    async def _fetch(self, index: int, previous: asyncio.Task[Sequence[T]] | None) -> Sequence[T]:
+        if previous is not None:
+            # Read ahead of a page that is still loading: continue from its last row.
+            with contextlib.suppress(Exception):
+                await asyncio.shield(previous)
+
+        after = self._cursors.get(index - 1)
+        rows = await self.fetch(
+            limit=self.per_page, after=after, offset=0 if after is not None else index * self.per_page
+        )
+        if rows:
+            self._cursors[index] = self.key(rows[-1])
+            self._reached = max(self._reached, index + 1)
+        if len(rows) < self.per_page and self._end is None:
+            self._end = index + 1 if rows else index
+        return rows
+
+    def _evict(self, viewed: int) -> None:
+        for index in [i for i, task in self._pages.items() if task.done() and i != viewed]:
+            if len(self._pages) <= self.keep:
+                break
+            task = self._pages.pop(index)
+            if not task.cancelled():
+                task.exception()  # a failed read ahead nobody looked at
+
+
 class JumpToModal(discord.ui.Modal, title="Jump to"):
     """Modal that prompts users for the page number to change to"""
 
@@ -291,24 +439,25 @@ class BasePaginator[T](View, metaclass=ABCMeta):
         """:class:`str`: Returns the middle text for the paginator."""
         return f"{self.current_page}/{self.total_pages}"
 
+    @staticmethod
+    def _page_texts(page: Any) -> Generator[str, Any, None]:
+        """The searchable text of a formatted page."""
+        if isinstance(page, discord.Embed):
+            if page.fields:
+                for field in page.fields:
+                    yield f"{field.name}: {field.value}"
+            if page.description:
+                yield page.description
+            if page.title:
+                yield page.title
+        elif isinstance(page, str):
+            yield page
+        else:
+            yield str(page)
+
     async def to_array(self) -> np.ndarray:
         """Returns a 2D array of the pages, their index and the page content."""
-
-        def resolve_entries(e: T) -> Generator[str | Any, Any, None]:
-            if isinstance(e, discord.Embed):
-                if e.fields:
-                    for field in e.fields:
-                        yield f"{field.name}: {field.value}"
-                if e.description:
-                    yield e.description
-                if e.title:
-                    yield e.title
-            elif isinstance(e, str):
-                yield e
-            else:
-                yield str(e)
-
-        result = [(i, list(resolve_entries(page))) async for i, page in aenumerate(self._paged_embeds())]
+        result = [(i, list(self._page_texts(page))) async for i, page in aenumerate(self._paged_embeds())]
         return np.array(result, dtype=object)
 
     def resolve_msg_kwargs(self, page: T) -> dict[str, Any]:
@@ -406,6 +555,7 @@ class BasePaginator[T](View, metaclass=ABCMeta):
 
         Search for a query in all embeds and return the matches.
         This uses a fuzzy search algorithm to find the best match by comparing the previous ratio.
+        Pages are formatted and searched one at a time.
 
         Parameters
         ----------
@@ -420,9 +570,8 @@ class BasePaginator[T](View, metaclass=ABCMeta):
             page_index: int  # named page_index to avoid conflict with NamedTuple.index()
 
         current_result: SearchResult | None = None
-        arr = await self.to_array()
-        for index, item in arr:
-            for entry in item:
+        async for index, page in aenumerate(self._paged_embeds()):
+            for entry in self._page_texts(page):
                 ratio = fuzzy.ratio(query, entry)
                 if current_result is None or ratio > current_result.ratio:
                     current_result = SearchResult(ratio, index)
@@ -629,6 +778,78 @@ class LinePaginator(BasePaginator[T]):
         return self
 
 
+class SourcePaginator[T](LinePaginator[int]):
+    """Subclass of :class:`LinePaginator` that reads its rows from a :class:`PageSource`.
+
+    The entries are page indices, one per page. :meth:`format_page` asks the source
+    for that page's rows and renders each with :meth:`format_row`, so only the pages
+    that are viewed or searched are ever read.
+    """
+
+    #: Shown when a page has no rows left, e.g. because the listing shrank.
+    empty_page: ClassVar[str] = "*There is nothing on this page anymore.*"
+    #: How many pages a search reads at most. A search walks the source from its first
+    #: page, so on a long listing it only covers the beginning.
+    search_pages: ClassVar[int] = 20
+
+    if TYPE_CHECKING:
+        source: PageSource[T]
+
+    def format_row(self, row: T, position: int, /) -> str:
+        """Renders a row. ``position`` counts from 1 across all pages."""
+        return str(row)
+
+    async def format_page(self, entries: list[int], /) -> discord.Embed:
+        index = entries[0]
+        return await self.render_page(index, await self.source.get_page(index))
+
+    async def render_page(self, index: int, rows: Sequence[T], /) -> discord.Embed:
+        lines = [self.format_row(row, position) for position, row in enumerate(rows, index * self.source.per_page + 1)]
+        if len(self.pages) != (page_count := max(self.source.page_count, 1)):
+            self.pages = [[i] for i in range(page_count)]
+            self.update_buttons()
+        return await super().format_page(lines or [self.empty_page])  # type: ignore[arg-type]
+
+    async def _paged_embeds(self) -> AsyncGenerator[discord.Embed, None]:
+        async for index, rows in self.source.walk(limit=self.search_pages):
+            yield await self.render_page(index, rows)
+
+    @classmethod
+    async def start(  # type: ignore[override]
+        cls,
+        context: Context | discord.Interaction,
+        /,
+        *,
+        source: PageSource[T],
+        embed: discord.Embed = discord.Embed(colour=helpers.Colour.white()),
+        location: Literal["field", "description"] = "description",
+        timeout: int = 180,
+        search_for: bool = False,
+        ephemeral: bool = False,
+        **kwargs: Any,
+    ) -> Self:
+        self = cls(entries=range(source.page_count), per_page=1, timeout=timeout)
+        self.ctx = context
+        self.source = source
+        self.embed = embed
+        self.location = location
+        self.numerate = False
+        self.extras.update(kwargs)
+
+        if not self.pages:
+            await cls._send(context, ephemeral, content=f"{Emojis.error} No entries to paginate currently.")
+            return self
+
+        object_kwargs = self.resolve_msg_kwargs(await self.format_page(self.pages[0]))
+        if search_for and self.total_pages > 3:
+            self.add_item(SearchForButton(self))
+        if self.total_pages <= 1:
+            object_kwargs.pop("view")
+
+        self.msg = await cls._send(context, ephemeral, **object_kwargs)
+        return self
+
+
 class TextPaginator(BasePaginator[str]):
     """Subclass of :class:`BasePaginator` that is used to paginate a text."""
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, ClassVar, Literal, NamedTuple, Union
+from typing import TYPE_CHECKING, ClassVar, Literal, Union
 
 import discord
 from discord.ext import commands
@@ -186,7 +186,23 @@ PermissionTemplate.nicknames = PermissionTemplate("manage_nicknames")
 PermissionTemplate.timeout = PermissionTemplate("moderate_members")
 
 
-class PermissionSpec(NamedTuple):
+def _mask(names: Iterable[str]) -> int:
+    """The :class:`discord.Permissions` bitmask of canonical permission names."""
+    value = 0
+    for name in names:
+        value |= VALID_FLAGS[name]
+    return value
+
+
+def _names(mask: int) -> list[str]:
+    """The canonical permission names set in ``mask``, in :class:`discord.Permissions` order."""
+    return [flag for flag, enabled in discord.Permissions(mask) if enabled]
+
+
+ADMINISTRATOR: int = VALID_FLAGS["administrator"]
+
+
+class PermissionSpec:
     """Represents permissions specifications that includes the bot's and user's permissions for a command.
 
     Notes
@@ -199,10 +215,22 @@ class PermissionSpec(NamedTuple):
         The permissions required by the user.
     bot: set[str]
         The permissions required by the bot.
+    user_mask: int
+        :attr:`user` as a :class:`discord.Permissions` bitmask, kept in step by :meth:`update`.
+    bot_mask: int
+        :attr:`bot` as a bitmask.
     """
 
-    user: set[str]
-    bot: set[str]
+    __slots__ = ("bot", "bot_mask", "user", "user_mask")
+
+    def __init__(self, user: set[str], bot: set[str]) -> None:
+        self.user: set[str] = user
+        self.bot: set[str] = bot
+        self.user_mask: int = _mask(user)
+        self.bot_mask: int = _mask(bot)
+
+    def __repr__(self) -> str:
+        return f"PermissionSpec(user={self.user!r}, bot={self.bot!r})"
 
     @classmethod
     def new(cls) -> PermissionSpec:
@@ -234,9 +262,11 @@ class PermissionSpec(NamedTuple):
 
         if destination == "user":
             self.user.update(resolved)
+            self.user_mask |= _mask(resolved)
             return
 
         self.bot.update(resolved)
+        self.bot_mask |= _mask(resolved)
 
     @staticmethod
     def permission_as_str(permission: str) -> str:
@@ -254,36 +284,37 @@ class PermissionSpec(NamedTuple):
 
         return False
 
-    def check_user(self, ctx: Context, required: set[str]) -> None:
-        """Raise :class:`commands.MissingPermissions` if the author lacks ``required``.
+    @staticmethod
+    def check_user(ctx: Context, required: int) -> None:
+        """Raise :class:`commands.MissingPermissions` if the author lacks the ``required`` mask.
 
-        ``required`` is passed explicitly (rather than read from :attr:`user`) so a per-guild
-        :class:`CommandOverride` can substitute a different requirement. Administrators are
-        never blocked.
+        ``required`` is passed explicitly (rather than read from :attr:`user_mask`) so a
+        per-guild :class:`CommandOverride` can substitute a different requirement. Commands
+        without a user requirement never compute the author's permissions. Administrators
+        are never blocked.
         """
-        user = ctx.permissions
-        missing = [perm for perm, value in user if perm in required and not value]
+        if not required:
+            return
 
-        if missing and not user.administrator:
-            raise commands.MissingPermissions(missing)
+        value = ctx.permissions.value
+        if value & required != required and not value & ADMINISTRATOR:
+            raise commands.MissingPermissions(_names(required & ~value))
 
     def check_bot(self, ctx: Context) -> None:
         """Raise :class:`commands.BotMissingPermissions` if the bot lacks its required permissions.
 
         The bot's functional requirements are never overridable — only *user* gating is.
         """
-        bot = ctx.bot_permissions
-        missing = [perm for perm, value in bot if perm in self.bot and not value]
-
-        if missing and not bot.administrator:
-            raise commands.BotMissingPermissions(missing)
+        value = ctx.bot_permissions.value
+        if value & self.bot_mask != self.bot_mask and not value & ADMINISTRATOR:
+            raise commands.BotMissingPermissions(_names(self.bot_mask & ~value))
 
     def check(self, ctx: Context) -> bool:
         """Checks if the given context meets the required permissions (no override applied)."""
         if ctx.bot.bypass_checks or self._is_owner(ctx.bot, ctx.author):
             return True
 
-        self.check_user(ctx, self.user)
+        self.check_user(ctx, self.user_mask)
         self.check_bot(ctx)
         return True
 
@@ -311,11 +342,9 @@ class CommandOverride:
     permissions: int | None = None
     allowed_roles: frozenset[int] = field(default_factory=frozenset)
 
-    def required_user_permissions(self, default: set[str]) -> set[str]:
-        """The user permissions this override demands, falling back to ``default``."""
-        if self.permissions is None:
-            return default
-        return {flag for flag, enabled in discord.Permissions(self.permissions) if enabled}
+    def required_user_mask(self, default: int) -> int:
+        """The user permission bitmask this override demands, falling back to ``default``."""
+        return default if self.permissions is None else self.permissions
 
     def allows_roles(self, member: discord.Member) -> bool:
         """Whether ``member`` holds one of the allow-listed roles."""
@@ -357,7 +386,7 @@ async def command_permission_check(ctx: Context) -> bool:
     if override is not None:
         member = ctx.author
         if not (isinstance(member, discord.Member) and override.allows_roles(member)):
-            spec.check_user(ctx, override.required_user_permissions(spec.user))
+            spec.check_user(ctx, override.required_user_mask(spec.user_mask))
         spec.check_bot(ctx)
         return True
 
@@ -33,6 +33,7 @@ from app.database.repositories import (
     HighlightsRepository,
     IncidentsRepository,
     LevelingRepository,
+    MessageIndexRepository,
     ModerationRepository,
     MusicSessionsRepository,
     PlaylistsRepository,
@@ -44,6 +45,7 @@ from app.database.repositories import (
     TagsRepository,
     TempChannelsRepository,
     TimersRepository,
+    TrackCacheRepository,
     UsersRepository,
     VotesRepository,
 )
@@ -178,13 +180,18 @@ class _Database:
             self._ready.set()
 
     @classmethod
-    async def create_pool(cls) -> asyncpg.Pool:
-        """Creates the connection pool, registering a JSONB text codec on each connection."""
+    async def create_pool(cls, **overrides: Any) -> asyncpg.Pool:
+        """Creates the connection pool, registering a JSONB text codec on each connection.
+
+        ``overrides`` replace individual :meth:`DatabaseConfig.pool_kwargs` entries, e.g. a
+        smaller ``max_size`` for a secondary pool.
+        """
 
         async def init(con: asyncpg.Connection) -> None:
             await con.set_type_codec("jsonb", schema="pg_catalog", encoder=_encode_jsonb, decoder=_decode_jsonb)
 
-        return await asyncpg.create_pool(init=init, **DatabaseConfig.pool_kwargs())  # type: ignore[arg-type]
+        kwargs = {**DatabaseConfig.pool_kwargs(), **overrides}
+        return await asyncpg.create_pool(init=init, **kwargs)  # type: ignore[arg-type]
 
     async def close(self) -> None:
         """Closes the connection pool."""
@@ -292,6 +299,7 @@ class Database(_Database):
     temp_channels: TempChannelsRepository
     playlists: PlaylistsRepository
     music_sessions: MusicSessionsRepository
+    track_cache: TrackCacheRepository
     admin: AdminRepository
     timers: TimersRepository
     comics: ComicsRepository
@@ -305,6 +313,7 @@ class Database(_Database):
     votes: VotesRepository
     event_webhooks: EventWebhooksRepository
     templates: GuildTemplatesRepository
+    message_index: MessageIndexRepository
 
     def __init__(self, bot: Bot, *, loop: asyncio.AbstractEventLoop | None = None) -> None:
         super().__init__(bot, loop=loop)
@@ -323,6 +332,7 @@ class Database(_Database):
         self.temp_channels = TempChannelsRepository(self)
         self.playlists = PlaylistsRepository(self)
         self.music_sessions = MusicSessionsRepository(self)
+        self.track_cache = TrackCacheRepository(self)
         self.admin = AdminRepository(self)
         self.timers = TimersRepository(self)
         self.comics = ComicsRepository(self)
@@ -336,9 +346,16 @@ class Database(_Database):
         self.votes = VotesRepository(self)
         self.event_webhooks = EventWebhooksRepository(self)
         self.templates = GuildTemplatesRepository(self)
+        self.message_index = MessageIndexRepository(self)
 
         self._register_cache_signals()
 
+    async def close(self) -> None:
+        """Writes the buffered game results, then closes the connection pool."""
+        if self._internal_pool is not None:
+            await self.game_stats.flush()
+        await super().close()
+
     def _register_cache_signals(self) -> None:
         """Wire up cache invalidation signals so repositories can fire them on mutation."""
         s = self.signals
@@ -347,6 +364,8 @@ class Database(_Database):
         s.register("sentinel_changed").connect(self.get_guild_sentinel, None)
         s.register("ai_config_changed").connect(self.get_guild_ai_config, None)
         s.register("command_overrides_changed").connect(self.get_command_overrides, None)
+        # Subscribed to by the Tags cog's autocomplete name index.
+        s.register("tags_changed")
 
     @cache.cache()
     async def get_guild_config(self, guild_id: int) -> GuildConfig:
@@ -480,24 +499,6 @@ class Database(_Database):
         record = await self.users.get_balance_record(user_id, guild_id)
         return Balance(bot=self.bot, record=record)
 
-    async def get_guild_balances(self, guild_id: int) -> list[Balance]:
-        """|coro|
-
-        A coroutine that gets the balances of all users in a guild.
-
-        Parameters
-        ----------
-        guild_id: :class:`int`
-            The guild ID to get the balances from.
-
-        Returns
-        -------
-        list[:class:`Balance`]
-            The balances of all users in the guild.
-        """
-        records = await self.users.get_guild_balance_records(guild_id)
-        return [Balance(bot=self.bot, record=record) for record in records]
-
 
 class BaseRecord(ABC):
     """A lightweight ORM mapping an ``asyncpg.Record`` onto a typed Python object.
@@ -1026,6 +1027,9 @@ class GuildConfig(BaseRecord, table="guild_config", pk="id", changed_signal="gui
 
     linked_automod_rules: set[str]
 
+    # Added by V38 migration — accessed via getattr() until migration is applied.
+    message_index_days: int | None
+
     __slots__ = (
         "_cs_alert_webhook",
         "_cs_audit_log_webhook",
@@ -1040,6 +1044,7 @@ class GuildConfig(BaseRecord, table="guild_config", pk="id", changed_signal="gui
         "id",
         "linked_automod_rules",
         "mention_count",
+        "message_index_days",
         "message_log_channel_id",
         "mod_log_channel_id",
         "music_dj_mode",
@@ -16,8 +16,13 @@ from app.database.repositories.content import (
 from app.database.repositories.economy import EconomyRepository, LevelingRepository
 from app.database.repositories.guilds import AdminRepository, GuildsRepository
 from app.database.repositories.integrations import EventWebhooksRepository, GuildTemplatesRepository
-from app.database.repositories.moderation import CasesRepository, IncidentsRepository, ModerationRepository
-from app.database.repositories.music import MusicSessionsRepository
+from app.database.repositories.moderation import (
+    CasesRepository,
+    IncidentsRepository,
+    MessageIndexRepository,
+    ModerationRepository,
+)
+from app.database.repositories.music import MusicSessionsRepository, TrackCacheRepository
 from app.database.repositories.stats import EmojiStatsRepository, GameStatsRepository, StatsRepository
 from app.database.repositories.timers import TimersRepository
 from app.database.repositories.users import (
@@ -44,6 +49,7 @@ __all__ = (
     'HighlightsRepository',
     'IncidentsRepository',
     'LevelingRepository',
+    'MessageIndexRepository',
     'ModerationRepository',
     'MusicSessionsRepository',
     'PlaylistsRepository',
@@ -55,6 +61,7 @@ __all__ = (
     'TagsRepository',
     'TempChannelsRepository',
     'TimersRepository',
+    'TrackCacheRepository',
     'UsersRepository',
     'VotesRepository',
 )
@@ -7,7 +7,7 @@ from app.utils.timetools import ensure_utc
 
 if TYPE_CHECKING:
     import datetime
-    from collections.abc import Iterable
+    from collections.abc import AsyncIterator, Iterable
 
     import asyncpg
     from asyncpg import Record
@@ -187,6 +187,14 @@ class TagsRepository(BaseRepository):
     to report how often the ``tag`` command has been invoked.
     """
 
+    #: The sort key and direction of each tag listing sort.
+    _LISTING_SORTS: ClassVar[dict[str, tuple[str, str]]] = {
+        'id': ('id', 'ASC'),
+        'newest': ('created_at', 'DESC'),
+        'oldest': ('created_at', 'ASC'),
+        'name': ('name', 'ASC'),
+    }
+
     # -- mutation (BaseRecord update hook) --------------------------------
 
     async def update_tag(
@@ -223,46 +231,192 @@ class TagsRepository(BaseRepository):
                     RETURNING id)
             INSERT
             INTO tag_lookup (name, owner_id, location_id, parent_id)
-            VALUES ($1, $3, $4, (SELECT id FROM tag_insert));
+            VALUES ($1, $3, $4, (SELECT id FROM tag_insert))
+            RETURNING id, parent_id;
+        """
+        record = await (connection or self.db).fetchrow(query, name, content, owner_id, location_id)
+        self.invalidate_cache("tags_changed", location_id, ("created", record['parent_id'], record['id'], name, owner_id))
+
+    async def restore_many(
+            self,
+            location_id: int,
+            rows: list[tuple[int, str, str]],
+            *,
+            owner_id: int,
+            connection: asyncpg.Connection,
+    ) -> tuple[int, int]:
+        """Bulk-inserts backup rows ``(ord, name, content)`` with their canonical ``tag_lookup`` entries.
+
+        The rows are staged with ``COPY`` into a temporary table dropped on commit, so this
+        must run inside the caller's transaction (once per transaction); names must already
+        be unique case-insensitively. A name already taken by a tag or an alias is not
+        inserted. Returns ``(created, existing)``, where ``existing`` counts the names that
+        were taken by a tag; the rest of the uninserted rows collided with an alias.
+
+        Fires no cache signal: the caller invalidates ``tags_changed`` once it committed.
+        """
+        if not rows:
+            return 0, 0
+        await connection.execute("""
+            CREATE TEMPORARY TABLE tag_restore
+            (
+                ord     INTEGER,
+                name    TEXT,
+                content TEXT
+            ) ON COMMIT DROP;
+        """)
+        await connection.copy_records_to_table('tag_restore', columns=['ord', 'name', 'content'], records=rows)
+        query = """
+            WITH tag_insert AS (
+                INSERT INTO tags (name, content, owner_id, location_id)
+                    SELECT s.name, s.content, $1, $2
+                    FROM tag_restore s
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM tag_lookup l WHERE l.location_id = $2 AND LOWER(l.name) = LOWER(s.name)
+                    )
+                    ORDER BY s.ord
+                    ON CONFLICT DO NOTHING
+                    RETURNING id, name),
+                 lookup_insert AS (
+                     INSERT INTO tag_lookup (name, owner_id, location_id, parent_id)
+                         SELECT name, $1, $2, id FROM tag_insert
+                         RETURNING 1)
+            SELECT (SELECT COUNT(*) FROM lookup_insert) AS created,
+                   (SELECT COUNT(*)
+                    FROM tag_restore s
+                    WHERE EXISTS (
+                        SELECT 1 FROM tags t WHERE t.location_id = $2 AND LOWER(t.name) = LOWER(s.name)
+                    )) AS existing;
         """
-        await (connection or self.db).execute(query, name, content, owner_id, location_id)
+        record = await connection.fetchrow(query, owner_id, location_id)
+        return record['created'], record['existing']
+
+    async def create_alias(
+            self, new_alias: str, original: str, location_id: int, owner_id: int
+    ) -> asyncpg.Record | None:
+        """Creates an alias that redirects to an existing tag.
 
-    async def create_alias(self, new_alias: str, original: str, location_id: int, owner_id: int) -> str:
-        """Creates an alias that redirects to an existing tag, returning the command status."""
+        Returns the new ``id`` and ``parent_id``, or ``None`` if ``original`` names no tag.
+        """
         query = """
             INSERT INTO tag_lookup (name, owner_id, location_id, parent_id)
             SELECT $1, $4, tag_lookup.location_id, tag_lookup.parent_id
             FROM tag_lookup
             WHERE tag_lookup.location_id = $3
-              AND LOWER(tag_lookup.name) = $2;
+              AND LOWER(tag_lookup.name) = $2
+            RETURNING id, parent_id;
         """
-        return await self.execute(query, new_alias, original.lower(), location_id, owner_id)
+        record = await self.fetchrow(query, new_alias, original.lower(), location_id, owner_id)
+        if record is not None:
+            self.invalidate_cache(
+                "tags_changed", location_id, ("aliased", record['id'], record['parent_id'], new_alias, owner_id))
+        return record
 
     async def delete_tag(self, tag_id: int) -> None:
         """Deletes a tag and every alias that points to it."""
-        await self.execute("DELETE FROM tags WHERE id=$1;", tag_id)
+        location_id = await self.fetchval("DELETE FROM tags WHERE id=$1 RETURNING location_id;", tag_id)
         await self.execute("DELETE FROM tag_lookup WHERE parent_id=$1;", tag_id)
+        self.invalidate_cache("tags_changed", location_id, ("deleted", tag_id))
 
     async def delete_alias(self, alias_id: int) -> None:
         """Deletes a single alias row."""
-        await self.delete_where("tag_lookup", ("id",), (alias_id,))
+        location_id = await self.fetchval("DELETE FROM tag_lookup WHERE id=$1 RETURNING location_id;", alias_id)
+        self.invalidate_cache("tags_changed", location_id, ("alias_deleted", alias_id))
 
     async def transfer_aliases(
             self, tag_id: int, owner_id: int, *, connection: asyncpg.Connection | None = None
     ) -> None:
         """Reassigns ownership of every alias of a tag."""
-        await (connection or self.db).execute(
-            "UPDATE tag_lookup SET owner_id=$1 WHERE parent_id=$2;", owner_id, tag_id)
+        location_id = await (connection or self.db).fetchval(
+            "UPDATE tag_lookup SET owner_id=$1 WHERE parent_id=$2 RETURNING location_id;", owner_id, tag_id)
+        self.invalidate_cache("tags_changed", location_id)
 
     async def transfer_alias(
             self, alias_id: int, owner_id: int, *, connection: asyncpg.Connection | None = None
     ) -> None:
         """Reassigns ownership of a single alias."""
-        await (connection or self.db).execute(
-            "UPDATE tag_lookup SET owner_id=$1 WHERE id=$2;", owner_id, alias_id)
+        location_id = await (connection or self.db).fetchval(
+            "UPDATE tag_lookup SET owner_id=$1 WHERE id=$2 RETURNING location_id;", owner_id, alias_id)
+        self.invalidate_cache("tags_changed", location_id)
+
+    async def add_tag_uses(self, tag_ids: list[int], counts: list[int]) -> None:
+        """Adds buffered use counts to many tags in one statement."""
+        query = """
+            UPDATE tags
+            SET uses = tags.uses + u.count
+            FROM unnest($1::int[], $2::int[]) AS u(id, count)
+            WHERE tags.id = u.id;
+        """
+        await self.execute(query, tag_ids, counts)
 
     # -- lookups ----------------------------------------------------------
 
+    async def resolve_tag(
+            self,
+            name_or_id: str | int,
+            *,
+            owner_id: int | None = None,
+            location_id: int | None = None,
+            aliases: bool = True,
+            similar: bool = False,
+    ) -> asyncpg.Record:
+        """Resolves a tag by name, alias name or ID in a single round trip.
+
+        Returns one row with three columns:
+
+        - ``parent``: the ``tags`` row the name/ID resolves to (canonical names win over
+          aliases), or ``NULL``;
+        - ``aliases``: the parent's ``tag_lookup`` aliases, excluding the canonical entry
+          (empty unless ``aliases`` is set);
+        - ``similar``: up to 25 ``tag_lookup`` rows whose names are trigram-similar, only
+          computed when ``similar`` is set and nothing resolved.
+
+        ``owner_id`` and ``location_id`` narrow both the parent and its aliases.
+        """
+        if _is_id(name_or_id):
+            clause, value = 't.id = $1', int(name_or_id)
+            similar = False
+        else:
+            assert isinstance(name_or_id, str)
+            clause, value = 'LOWER(l.name) = LOWER($1)', name_or_id
+
+        alias_query = """
+            ARRAY(SELECT a
+                  FROM tag_lookup a, parent p
+                  WHERE a.parent_id = (p.t).id
+                    AND a.name != (p.t).name
+                    AND ($2::bigint IS NULL OR a.owner_id = $2)
+                    AND ($3::bigint IS NULL OR a.location_id = $3)
+                  ORDER BY a.id)
+        """ if aliases else "ARRAY[]::tag_lookup[]"
+        similar_query = """
+            ARRAY(SELECT s
+                  FROM tag_lookup s
+                           INNER JOIN tags ON tags.id = s.parent_id
+                  WHERE NOT EXISTS (SELECT 1 FROM parent)
+                    AND s.location_id = $3
+                    AND s.name % $1
+                  ORDER BY similarity(s.name, $1) DESC
+                  LIMIT 25)
+        """ if similar else "ARRAY[]::tag_lookup[]"
+
+        query = f"""
+            WITH parent AS (
+                SELECT t
+                FROM tag_lookup l
+                         INNER JOIN tags t ON t.id = l.parent_id
+                WHERE {clause}
+                  AND ($2::bigint IS NULL OR t.owner_id = $2)
+                  AND ($3::bigint IS NULL OR t.location_id = $3)
+                ORDER BY l.name = t.name DESC
+                LIMIT 1
+            )
+            SELECT (SELECT t FROM parent) AS parent,
+                   {alias_query} AS aliases,
+                   {similar_query} AS similar;
+        """
+        return await self.fetchrow(query, value, owner_id or None, location_id or None)
+
     async def get_tag_record(
             self, name_or_id: str | int, *, owner_id: int | None = None, location_id: int | None = None
     ) -> asyncpg.Record | None:
@@ -283,43 +437,6 @@ class TagsRepository(BaseRepository):
         query = f"SELECT * FROM tags WHERE {where} LIMIT 1;"
         return await self.fetchrow(query, *form.values())
 
-    async def get_parent_record_via_alias(self, name_or_id: str | int) -> asyncpg.Record | None:
-        """Fetches a parent tag by resolving a name/ID against the ``tag_lookup`` table."""
-        if _is_id(name_or_id):
-            clause, value = 'tags.id', name_or_id
-        else:
-            assert isinstance(name_or_id, str)
-            clause, value = 'LOWER(tags.name)', name_or_id.lower()
-
-        query = f"""
-            SELECT tags.*
-            FROM tags
-                     INNER JOIN tag_lookup t on t.parent_id = tags.id
-            WHERE {clause}=$1
-            LIMIT 1;
-        """
-        return await self.fetchrow(query, value)
-
-    async def get_alias_records(
-            self,
-            parent_id: int,
-            parent_name: str,
-            *,
-            owner_id: int | None = None,
-            location_id: int | None = None,
-    ) -> list[asyncpg.Record]:
-        """Fetches every alias of a tag, excluding the canonical entry."""
-        form: dict[str, Any] = {}
-        if location_id:
-            form['location_id'] = location_id
-        if owner_id:
-            form['owner_id'] = owner_id
-        form['parent_id'] = parent_id
-
-        where = ' AND '.join(f'{k}=${i}' for i, k in enumerate(form, 1))
-        query = f"SELECT * FROM tag_lookup WHERE name != ${len(form) + 1} AND {where}"
-        return await self.fetch(query, *form.values(), parent_name)
-
     async def get_alias_record(
             self, name_or_id: str | int, *, owner_id: int | None = None, location_id: int | None = None
     ) -> asyncpg.Record | None:
@@ -340,19 +457,6 @@ class TagsRepository(BaseRepository):
         query = f"SELECT * FROM tag_lookup WHERE {where} LIMIT 1;"
         return await self.fetchrow(query, *form.values())
 
-    async def get_similar_aliases(self, location_id: int, name: str) -> list[asyncpg.Record]:
-        """Fetches up to 25 aliases whose names are similar to ``name``."""
-        query = """
-            SELECT tag_lookup.*
-            FROM tag_lookup
-                     INNER JOIN tags t on t.id = tag_lookup.parent_id
-            WHERE tag_lookup.location_id = $1
-              AND tag_lookup.name % $2
-            ORDER BY similarity(tag_lookup.name, $2) DESC
-            LIMIT 25;
-        """
-        return await self.fetch(query, location_id, name)
-
     async def get_tag_rank(self, tag_id: int) -> int:
         """Returns the use-rank of a tag within its guild."""
         query = """
@@ -367,6 +471,25 @@ class TagsRepository(BaseRepository):
 
     # -- autocomplete sources --------------------------------------------
 
+    async def get_tag_names(self, location_id: int) -> list[asyncpg.Record]:
+        """Fetches every ``tag_lookup`` entry in a guild joined with its parent's name, owner and uses.
+
+        Only the columns the autocomplete name index needs; tag content is never loaded.
+        """
+        query = """
+            SELECT l.id,
+                   l.name,
+                   l.owner_id,
+                   l.parent_id,
+                   t.name     AS parent_name,
+                   t.owner_id AS parent_owner_id,
+                   t.uses
+            FROM tag_lookup l
+                     INNER JOIN tags t ON t.id = l.parent_id
+            WHERE l.location_id = $1;
+        """
+        return await self.fetch(query, location_id)
+
     async def get_guild_tags(self, location_id: int) -> list[asyncpg.Record]:
         """Fetches every parent tag in a guild, ordered by uses."""
         return await self.fetch("SELECT * FROM tags WHERE location_id=$1 ORDER BY uses;", location_id)
@@ -387,16 +510,12 @@ class TagsRepository(BaseRepository):
         """
         return await self.fetch(query, location_id)
 
-    async def filter_tags(
-            self, location_id: int, *, query: str | None = None, owner_id: int | None = None, sort: str = 'name'
-    ) -> list[asyncpg.Record]:
-        """Fetches ``(name, id)`` rows from ``tag_lookup`` for the list/search commands."""
-        order = {
-            'id': 'id',
-            'newest': 'created_at DESC',
-            'oldest': 'created_at ASC',
-            'name': 'name',
-        }.get(sort, 'name')
+    @classmethod
+    def _listing(
+            cls, location_id: int, *, query: str | None, owner_id: int | None, sort: str
+    ) -> tuple[list[str], list[Any], str, str]:
+        """The ``WHERE`` terms and their values, and the sort key and direction of a tag listing."""
+        key, direction = cls._LISTING_SORTS.get(sort, cls._LISTING_SORTS['name'])
 
         values: list[Any] = [location_id]
         where = ['location_id=$1']
@@ -405,13 +524,55 @@ class TagsRepository(BaseRepository):
             values.append(query)
             where.append(f'name % ${len(values)}')
             if sort == 'name':
-                order = f'similarity(name, ${len(values)}) DESC'
+                key, direction = f'similarity(name, ${len(values)})', 'DESC'
 
         if owner_id:
             values.append(owner_id)
             where.append(f'owner_id=${len(values)}')
 
-        sql = f"SELECT name, id FROM tag_lookup WHERE {' AND '.join(where)} ORDER BY {order};"
+        return where, values, key, direction
+
+    async def filter_tags(
+            self, location_id: int, *, query: str | None = None, owner_id: int | None = None, sort: str = 'name'
+    ) -> list[asyncpg.Record]:
+        """Fetches ``(name, id)`` rows from ``tag_lookup`` for the list/search commands."""
+        where, values, key, direction = self._listing(location_id, query=query, owner_id=owner_id, sort=sort)
+        sql = f"SELECT name, id FROM tag_lookup WHERE {' AND '.join(where)} ORDER BY {key} {direction};"
+        return await self.fetch(sql, *values)
+
+    async def count_filtered_tags(
+            self, location_id: int, *, query: str | None = None, owner_id: int | None = None
+    ) -> int:
+        """Counts the rows :meth:`filter_tags` would return."""
+        where, values, _, _ = self._listing(location_id, query=query, owner_id=owner_id, sort='id')
+        return await self.fetchval(f"SELECT COUNT(*) FROM tag_lookup WHERE {' AND '.join(where)};", *values)
+
+    async def filter_tags_page(
+            self,
+            location_id: int,
+            *,
+            query: str | None = None,
+            owner_id: int | None = None,
+            sort: str = 'name',
+            limit: int,
+            after: tuple[Any, int] | None = None,
+            offset: int = 0,
+    ) -> list[asyncpg.Record]:
+        """Fetches one page of :meth:`filter_tags`, each row with its ``sort_key``.
+
+        Ties in the sort are broken by id. Pass the previous page's last ``(sort_key, id)``
+        as ``after`` to continue right behind it (keyset paging); ``offset`` is only for
+        jumping to a page whose predecessor was never fetched.
+        """
+        where, values, key, direction = self._listing(location_id, query=query, owner_id=owner_id, sort=sort)
+        if after is not None:
+            values.extend(after)
+            where.append(f"({key}, id) {'>' if direction == 'ASC' else '<'} (${len(values) - 1}, ${len(values)})")
+        values.extend((limit, offset))
+        sql = (
+            f"SELECT name, id, {key} AS sort_key FROM tag_lookup WHERE {' AND '.join(where)} "
+            f"ORDER BY {key} {direction}, id {direction} LIMIT ${len(values) - 1} OFFSET ${len(values)};"
+        )
         return await self.fetch(sql, *values)
 
     async def export_tags(self, location_id: int, *, owner_id: int | None = None) -> list[asyncpg.Record]:
@@ -424,6 +585,17 @@ class TagsRepository(BaseRepository):
         query = f"SELECT name, content FROM tags WHERE {where};"
         return await self.fetch(query, *form.values())
 
+    async def iter_export(
+            self, location_id: int, *, connection: asyncpg.Connection, prefetch: int = 500
+    ) -> AsyncIterator[asyncpg.Record]:
+        """Streams a guild's ``(name, content)`` rows through a server-side cursor, oldest first.
+
+        ``connection`` must be inside a transaction for as long as the iteration runs.
+        """
+        query = "SELECT name, content FROM tags WHERE location_id=$1 ORDER BY id;"
+        async for record in connection.cursor(query, location_id, prefetch=prefetch):
+            yield record
+
     # -- ownership / bulk operations -------------------------------------
 
     async def count_owned_tags(self, location_id: int, owner_id: int) -> int:
@@ -434,6 +606,7 @@ class TagsRepository(BaseRepository):
     async def delete_owned_tags(self, location_id: int, owner_id: int) -> None:
         """Deletes every tag a member owns in a guild."""
         await self.execute("DELETE FROM tags WHERE location_id=$1 AND owner_id=$2;", location_id, owner_id)
+        self.invalidate_cache("tags_changed", location_id)
 
     # -- statistics -------------------------------------------------------
 
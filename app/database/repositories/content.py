@@ -7,6 +7,8 @@ from app.database.repositories.base import BaseRepository
 from app.utils.timetools import ensure_utc
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     import asyncpg
 
 __all__ = (
@@ -34,6 +36,22 @@ class AutoRespondersRepository(BaseRepository):
         return await self.fetch(
             'SELECT * FROM autoresponders WHERE guild_id = $1 ORDER BY id;', guild_id)
 
+    async def iter_export(
+        self, guild_id: int, *, connection: asyncpg.Connection, prefetch: int = 500
+    ) -> AsyncIterator[asyncpg.Record]:
+        """Streams a guild's autoresponders, oldest first, through a server-side cursor.
+
+        ``connection`` must be inside a transaction for as long as the iteration runs.
+        """
+        query = """
+            SELECT trigger, response, match_type, ignore_case
+            FROM autoresponders
+            WHERE guild_id = $1
+            ORDER BY id;
+        """
+        async for record in connection.cursor(query, guild_id, prefetch=prefetch):
+            yield record
+
     async def get_enabled(self, guild_id: int) -> list[asyncpg.Record]:
         """Fetches only the enabled autoresponders for a guild (the on-message hot path)."""
         return await self.fetch(
@@ -65,6 +83,53 @@ class AutoRespondersRepository(BaseRepository):
         """
         return await self.fetchrow(query, guild_id, trigger, response, match_type, ignore_case, created_by)
 
+    async def restore_many(
+        self,
+        guild_id: int,
+        rows: list[tuple[int, str, str, str, bool]],
+        *,
+        created_by: int,
+        connection: asyncpg.Connection,
+    ) -> int:
+        """Bulk-inserts backup rows ``(ord, trigger, response, match_type, ignore_case)``.
+
+        The rows are staged with ``COPY`` into a temporary table dropped on commit, so this
+        must run inside the caller's transaction (once per transaction). Triggers that
+        already exist, or repeat an earlier row case-insensitively, are skipped like
+        :meth:`create` skips them. Returns how many autoresponders were created.
+        """
+        if not rows:
+            return 0
+        await connection.execute("""
+            CREATE TEMPORARY TABLE autoresponder_restore
+            (
+                ord         INTEGER,
+                trigger     TEXT,
+                response    TEXT,
+                match_type  TEXT,
+                ignore_case BOOLEAN
+            ) ON COMMIT DROP;
+        """)
+        await connection.copy_records_to_table(
+            'autoresponder_restore',
+            columns=['ord', 'trigger', 'response', 'match_type', 'ignore_case'],
+            records=rows,
+        )
+        query = """
+            WITH staged AS (
+                SELECT DISTINCT ON (lower(trigger)) ord, trigger, response, match_type, ignore_case
+                FROM autoresponder_restore
+                ORDER BY lower(trigger), ord
+            )
+            INSERT INTO autoresponders (guild_id, trigger, response, match_type, ignore_case, created_by)
+            SELECT $1, trigger, response, match_type, ignore_case, $2
+            FROM staged
+            ORDER BY ord
+            ON CONFLICT DO NOTHING;
+        """
+        status = await connection.execute(query, guild_id, created_by)
+        return int(status.rsplit(' ', 1)[-1])
+
     async def delete(self, guild_id: int, trigger: str) -> asyncpg.Record | None:
         """Deletes an autoresponder by trigger, returning the deleted row (or ``None``)."""
         query = """
@@ -7,7 +7,7 @@ from app.utils.timetools import ensure_utc
 
 if TYPE_CHECKING:
     import datetime
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
     import asyncpg
 
@@ -17,6 +17,10 @@ __all__ = (
 )
 
 
+class _Overdrawn(Exception):
+    """Raised inside a ledger transaction to roll it back when a wallet is short."""
+
+
 # -- Economy (shop, inventory, boosts, dailies, lottery) --------------------
 
 
@@ -25,10 +29,81 @@ class EconomyRepository(BaseRepository):
 
     Covers ``economy_items`` (the per-guild shop), ``economy_inventory`` (what each
     member owns) and ``economy_dailies`` (daily-claim bookkeeping). Wallet balances
-    remain on the :class:`~app.database.base.Balance` record. Methods return raw
+    are read through the :class:`~app.database.base.Balance` record, but compound
+    changes (deposits, transfers, bets) go through the ledger methods below so the
+    balance check and the write happen in one statement. Methods return raw
     records/scalars.
     """
 
+    # -- wallet ledger -----------------------------------------------------
+
+    async def apply_balance_deltas(
+        self, guild_id: int, deltas: Iterable[tuple[int, int, int]]
+    ) -> dict[int, asyncpg.Record] | None:
+        """Applies ``(user_id, cash, bank)`` deltas to several wallets, all or nothing.
+
+        Deltas for the same member are summed, missing wallets are created, and no
+        column may end below zero. The check runs in SQL against the locked row, so
+        two concurrent bets cannot both spend the same cash. Returns the updated rows
+        keyed by user id, or ``None`` (with nothing written) if a wallet would be
+        overdrawn.
+
+        A single wallet is one statement; several are that same statement inside a
+        transaction, rolled back if any wallet was short.
+        """
+        merged: dict[int, tuple[int, int]] = {}
+        for user_id, cash, bank in deltas:
+            old_cash, old_bank = merged.get(user_id, (0, 0))
+            merged[user_id] = (old_cash + cash, old_bank + bank)
+        if not merged:
+            return {}
+
+        # Rows are locked in user id order whatever the caller passed, so two
+        # transfers between the same members in opposite directions cannot deadlock.
+        user_ids = sorted(merged)
+        args = (guild_id, user_ids, [merged[u][0] for u in user_ids], [merged[u][1] for u in user_ids])
+        query = """
+            INSERT INTO economy AS e (user_id, guild_id, cash, bank)
+            SELECT d.user_id, $1, d.cash, d.bank
+            FROM unnest($2::bigint[], $3::bigint[], $4::bigint[]) AS d(user_id, cash, bank)
+            WHERE (d.cash >= 0 AND d.bank >= 0)
+               OR EXISTS (SELECT 1 FROM economy x WHERE x.user_id = d.user_id AND x.guild_id = $1)
+            ORDER BY d.user_id
+            ON CONFLICT (user_id, guild_id)
+                DO UPDATE SET cash = e.cash + EXCLUDED.cash, bank = e.bank + EXCLUDED.bank
+                WHERE e.cash + EXCLUDED.cash >= 0 AND e.bank + EXCLUDED.bank >= 0
+            RETURNING e.*;
+        """
+        if len(user_ids) == 1:
+            rows = await self.fetch(query, *args)
+            return {row['user_id']: row for row in rows} or None
+
+        try:
+            async with self.acquire() as conn, conn.transaction():
+                rows = await conn.fetch(query, *args)
+                if len(rows) != len(user_ids):
+                    raise _Overdrawn
+        except _Overdrawn:
+            return None
+        return {row['user_id']: row for row in rows}
+
+    async def adjust_balance(
+        self, user_id: int, guild_id: int, *, cash: int = 0, bank: int = 0
+    ) -> asyncpg.Record | None:
+        """Adds the (possibly negative) amounts to one wallet in a single round trip.
+
+        Returns the updated row, or ``None`` if it would go below zero. Moving money
+        between cash and bank is one call, e.g. ``cash=-amount, bank=amount``.
+        """
+        rows = await self.apply_balance_deltas(guild_id, [(user_id, cash, bank)])
+        return rows[user_id] if rows else None
+
+    async def transfer_cash(
+        self, guild_id: int, sender_id: int, recipient_id: int, amount: int
+    ) -> dict[int, asyncpg.Record] | None:
+        """Moves ``amount`` cash between members; ``None`` if the sender is short."""
+        return await self.apply_balance_deltas(guild_id, [(sender_id, -amount, 0), (recipient_id, amount, 0)])
+
     # -- shop items -------------------------------------------------------
 
     async def get_items(self, guild_id: int) -> list[asyncpg.Record]:
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
 __all__ = (
     'CasesRepository',
     'IncidentsRepository',
+    'MessageIndexRepository',
     'ModerationRepository',
 )
 
@@ -550,3 +551,90 @@ class IncidentsRepository(BaseRepository):
     async def unsubscribe(self, guild_id: int) -> None:
         """Removes a guild's subscription."""
         await self.execute("DELETE FROM discord_incidents WHERE guild_id = $1;", guild_id)
+
+
+# -- Message index (message_index) ----------------------------------------
+
+
+class MessageIndexRepository(BaseRepository):
+    """Data access for the opt-in per-guild message metadata index.
+
+    Rows hold only ids, the author, timestamps, attachment/embed counts and a short content
+    snippet — enough to answer "this member's newest messages" and to bulk delete them by id
+    without reading channel history. Writes arrive batched from the message index cog.
+    """
+
+    async def guilds_enabled(self) -> dict[int, int]:
+        """Maps every guild with the index enabled to its retention in days."""
+        rows = await self.fetch("SELECT id, message_index_days FROM guild_config WHERE message_index_days IS NOT NULL;")
+        return {row["id"]: row["message_index_days"] for row in rows}
+
+    async def insert_many(self, rows: Sequence[tuple[Any, ...]]) -> None:
+        """Bulk-inserts ``(id, guild_id, channel_id, author_id, created_at, snippet, attachment_count,
+        embed_count)`` tuples in one statement, ignoring ids that are already indexed."""
+        if not rows:
+            return
+        query = """
+            INSERT INTO message_index
+                (id, guild_id, channel_id, author_id, created_at, snippet, attachment_count, embed_count)
+            SELECT *
+            FROM unnest($1::bigint[], $2::bigint[], $3::bigint[], $4::bigint[], $5::timestamp[],
+                        $6::text[], $7::smallint[], $8::smallint[])
+            ON CONFLICT (id) DO NOTHING;
+        """
+        await self.execute(query, *(list(column) for column in zip(*rows, strict=True)))
+
+    async def update_many(self, rows: Sequence[tuple[int, str, datetime.datetime | None]]) -> None:
+        """Applies a batch of ``(id, snippet, edited_at)`` edits to already indexed messages."""
+        if not rows:
+            return
+        query = """
+            UPDATE message_index m
+            SET snippet = x.snippet, edited_at = x.edited_at
+            FROM unnest($1::bigint[], $2::text[], $3::timestamp[]) AS x(id, snippet, edited_at)
+            WHERE m.id = x.id;
+        """
+        ids, snippets, edited = zip(*rows, strict=True)
+        await self.execute(query, list(ids), list(snippets), list(edited))
+
+    async def delete_many(self, message_ids: Sequence[int]) -> None:
+        """Drops deleted messages from the index."""
+        if message_ids:
+            await self.execute("DELETE FROM message_index WHERE id = ANY($1::bigint[]);", list(message_ids))
+
+    async def get_member_messages(
+            self,
+            guild_id: int,
+            author_id: int,
+            *,
+            limit: int,
+            channel_id: int | None = None,
+            after: datetime.datetime | None = None,
+    ) -> list[asyncpg.Record]:
+        """The newest ``limit`` indexed messages of one member, optionally within one channel
+        and/or created after ``after`` (naive UTC)."""
+        query = """
+            SELECT id, channel_id, author_id, created_at, edited_at, snippet, attachment_count, embed_count
+            FROM message_index
+            WHERE guild_id = $1
+              AND author_id = $2
+              AND ($3::bigint IS NULL OR channel_id = $3)
+              AND ($4::timestamp IS NULL OR created_at > $4)
+            ORDER BY id DESC
+            LIMIT $5;
+        """
+        return await self.fetch(query, guild_id, author_id, channel_id, after, limit)
+
+    async def prune(self) -> str:
+        """Deletes rows past their guild's retention, and every row of guilds that opted out."""
+        query = """
+            DELETE FROM message_index m
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM guild_config g
+                WHERE g.id = m.guild_id
+                  AND g.message_index_days IS NOT NULL
+                  AND m.created_at >= (now() AT TIME ZONE 'utc') - make_interval(days => g.message_index_days)
+            );
+        """
+        return await self.execute(query)
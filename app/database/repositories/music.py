@@ -6,9 +6,13 @@ from typing import TYPE_CHECKING, Any
 from app.database.repositories.base import BaseRepository
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import asyncpg
 
-__all__ = ('MusicSessionsRepository',)
+    from app.services.music_sessions import SessionWrite
+
+__all__ = ('MusicSessionsRepository', 'TrackCacheRepository')
 
 
 class MusicSessionsRepository(BaseRepository):
@@ -27,35 +31,41 @@ class MusicSessionsRepository(BaseRepository):
         """Fetches every persisted session (used to restore players on startup)."""
         return await self.fetch("SELECT * FROM music_sessions;")
 
-    async def upsert_session(
-        self,
-        guild_id: int,
-        *,
-        voice_channel_id: int,
-        text_channel_id: int | None,
-        panel_message_id: int | None,
-        volume: int,
-        paused: bool,
-        queue_mode: int,
-        shuffle: bool,
-        autoplay: int,
-        always_on: bool,
-        always_on_mode: str | None,
-        always_on_source: str | None,
-        current_uri: str | None,
-        position: int,
-        tracks: list[dict[str, Any]],
-    ) -> None:
-        """Inserts or updates the full session snapshot for a guild."""
-        await self.execute(
-            """
+    async def upsert_sessions(self, writes: Sequence[SessionWrite]) -> None:
+        """Applies a batch of session changes in one statement.
+
+        Full writes replace the stored queue; incremental ones drop ``drop`` entries from
+        its front and append ``tracks`` to the rest, so an unchanged queue is never resent.
+        """
+        if not writes:
+            return
+        query = """
             INSERT INTO music_sessions (
                 guild_id, voice_channel_id, text_channel_id, panel_message_id, volume, paused,
                 queue_mode, shuffle, autoplay, always_on, always_on_mode, always_on_source,
-                current_uri, position, tracks, updated_at
+                current_uri, filters, position, tracks, updated_at
             )
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15::jsonb,
-                    (now() AT TIME ZONE 'utc'))
+            SELECT u.guild_id, u.voice_channel_id, u.text_channel_id, u.panel_message_id, u.volume, u.paused,
+                   u.queue_mode, u.shuffle, u.autoplay, u.always_on, u.always_on_mode, u.always_on_source,
+                   u.current_uri, u.filters::jsonb, u.position,
+                   CASE
+                       WHEN u.drop_tracks IS NULL OR m.tracks IS NULL THEN u.tracks::jsonb
+                       WHEN u.drop_tracks = 0 THEN m.tracks || u.tracks::jsonb
+                       ELSE COALESCE(
+                           (SELECT jsonb_agg(t.entry ORDER BY t.ord)
+                            FROM jsonb_array_elements(m.tracks) WITH ORDINALITY AS t(entry, ord)
+                            WHERE t.ord > u.drop_tracks),
+                           '[]'::jsonb
+                       ) || u.tracks::jsonb
+                   END,
+                   (now() AT TIME ZONE 'utc')
+            FROM unnest($1::bigint[], $2::bigint[], $3::bigint[], $4::bigint[], $5::int[], $6::bool[],
+                        $7::smallint[], $8::bool[], $9::smallint[], $10::bool[], $11::text[], $12::text[],
+                        $13::text[], $14::text[], $15::bigint[], $16::text[], $17::int[])
+                AS u(guild_id, voice_channel_id, text_channel_id, panel_message_id, volume, paused,
+                     queue_mode, shuffle, autoplay, always_on, always_on_mode, always_on_source,
+                     current_uri, filters, position, tracks, drop_tracks)
+            LEFT JOIN music_sessions AS m ON m.guild_id = u.guild_id
             ON CONFLICT (guild_id) DO UPDATE SET
                 voice_channel_id = EXCLUDED.voice_channel_id,
                 text_channel_id  = EXCLUDED.text_channel_id,
@@ -69,15 +79,56 @@ class MusicSessionsRepository(BaseRepository):
                 always_on_mode   = EXCLUDED.always_on_mode,
                 always_on_source = EXCLUDED.always_on_source,
                 current_uri      = EXCLUDED.current_uri,
+                filters          = EXCLUDED.filters,
                 position         = EXCLUDED.position,
                 tracks           = EXCLUDED.tracks,
                 updated_at       = EXCLUDED.updated_at;
-            """,
-            guild_id, voice_channel_id, text_channel_id, panel_message_id, volume, paused,
-            queue_mode, shuffle, autoplay, always_on, always_on_mode, always_on_source,
-            current_uri, position, json.dumps(tracks),
-        )
+        """
+        rows = [
+            (
+                w.state.guild_id, w.state.voice_channel_id, w.state.text_channel_id, w.state.panel_message_id,
+                w.state.volume, w.state.paused, w.state.queue_mode, w.state.shuffle, w.state.autoplay,
+                w.state.always_on, w.state.always_on_mode, w.state.always_on_source, w.state.current_uri,
+                w.state.filters, w.position, json.dumps(w.tracks, separators=(',', ':')), w.drop,
+            )
+            for w in writes
+        ]
+        await self.execute(query, *(list(column) for column in zip(*rows, strict=True)))
 
     async def delete_session(self, guild_id: int) -> None:
         """Removes a guild's persisted session (e.g. on disconnect)."""
         await self.delete_where("music_sessions", ("guild_id",), (guild_id,))
+
+
+class TrackCacheRepository(BaseRepository):
+    """Data access for the ``track_cache`` table.
+
+    The persistent tier of :class:`~app.services.track_cache.TrackResolutionCache`: Lavalink
+    load results keyed by normalised query/URL, each with its own expiry.
+    """
+
+    async def get_track_result(self, key: str) -> dict[str, Any] | None:
+        """Fetches the unexpired load result cached for ``key``."""
+        result = await self.fetchval(
+            "SELECT result FROM track_cache WHERE key = $1 AND expires_at > (now() AT TIME ZONE 'utc');", key
+        )
+        if isinstance(result, str):
+            result = json.loads(result)
+        return result
+
+    async def put_track_result(self, key: str, result: dict[str, Any], *, ttl: float) -> None:
+        """Stores (or refreshes) the load result for ``key`` for ``ttl`` seconds."""
+        await self.execute(
+            """
+            INSERT INTO track_cache (key, result, expires_at)
+            VALUES ($1, $2::jsonb, (now() AT TIME ZONE 'utc') + make_interval(secs => $3))
+            ON CONFLICT (key) DO UPDATE SET
+                result     = EXCLUDED.result,
+                expires_at = EXCLUDED.expires_at;
+            """,
+            key, json.dumps(result), ttl,
+        )
+
+    async def prune(self) -> str:
+        """Deletes every expired entry, returning the command status."""
+        return await self.execute("DELETE FROM track_cache WHERE expires_at <= (now() AT TIME ZONE 'utc');")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
+import uuid
 from typing import TYPE_CHECKING, Any, Literal
 
 from app.database.repositories.base import BaseRepository
@@ -11,6 +13,8 @@ if TYPE_CHECKING:
 
     import asyncpg
 
+    from app.database.base import Database
+
 __all__ = (
     'EmojiStatsRepository',
     'GameStatsRepository',
@@ -455,6 +459,7 @@ class EmojiStatsRepository(BaseRepository):
 # -- Game Stats ------------------------------------------------------------
 
 LeaderboardMetric = Literal['won', 'profit', 'played', 'best_streak', 'winrate']
+GameResultKey = tuple[int, int, str]
 
 _METRIC_COLUMN: dict[str, str] = {
     'won': 'won',
@@ -464,17 +469,75 @@ _METRIC_COLUMN: dict[str, str] = {
 }
 
 
+class _PendingResults:
+    """One member's buffered rounds of one game, folded into a single ``game_stats`` delta.
+
+    Counters simply add up, streaks need the order of the rounds. ``lead`` is the signed
+    length of the first win/loss run (positive for wins) and ``tail`` that of the last one,
+    ``best`` the longest win run seen. Once ``broken`` is set the first run ended inside the
+    buffer, so the stored ``current_streak`` no longer decides the new one.
+    """
+
+    __slots__ = (
+        'best', 'biggest_win', 'broken', 'last_played', 'lead', 'lost',
+        'played', 'profit', 'tail', 'tied', 'wagered', 'won',
+    )
+
+    def __init__(self) -> None:
+        self.played = self.won = self.lost = self.tied = 0
+        self.wagered = self.profit = self.biggest_win = 0
+        self.lead = self.tail = self.best = 0
+        self.broken = False
+        self.last_played = datetime.datetime.min
+
+    def add(self, result: Literal['win', 'loss', 'push'], wagered: int, profit: int) -> None:
+        self.played += 1
+        self.wagered += wagered
+        self.profit += profit
+        self.biggest_win = max(self.biggest_win, profit)
+        self.last_played = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        if result == 'push':
+            self.tied += 1
+            return
+
+        step = 1 if result == 'win' else -1
+        if step > 0:
+            self.won += 1
+        else:
+            self.lost += 1
+        self.tail = self.tail + step if self.tail * step > 0 else step
+        if not self.broken:
+            if self.lead * step >= 0:
+                self.lead = self.tail
+            else:
+                self.broken = True
+        self.best = max(self.best, self.tail)
+
+
 class GameStatsRepository(BaseRepository):
     """Data access for per-member game outcome tracking (``game_stats``).
 
-    A single row aggregates one member's lifetime record for one game. Writes go
-    through :meth:`record_result`, which performs an idempotent upsert that also
-    maintains profit, biggest-win and win/loss streak bookkeeping. Reads back the
-    member-facing summaries and the server-wide leaderboards consumed by the
-    ``/stats games`` command group. Methods return raw records/scalars; the cog
-    owns the Discord-side formatting.
+    A single row aggregates one member's lifetime record for one game. Rounds reported
+    through :meth:`record_result` are merged in memory per ``(guild, member, game)`` and
+    written by :meth:`flush` in one set-based statement, which also maintains profit,
+    biggest-win and win/loss streak bookkeeping. The ``Games`` cog flushes on an
+    interval, and the database flushes once more before it closes its pool.
+
+    Reads back the member-facing summaries and the server-wide leaderboards consumed by
+    the ``/stats games`` command group. Every read flushes first, so it includes rounds
+    still in the buffer. Methods return raw records/scalars; the cog owns the
+    Discord-side formatting.
     """
 
+    __slots__ = ('_flush_lock', '_pending', '_unsent')
+
+    def __init__(self, database: Database) -> None:
+        super().__init__(database)
+        self._pending: dict[GameResultKey, _PendingResults] = {}
+        # A drained batch whose write raised or was cancelled, with its flush id.
+        self._unsent: tuple[uuid.UUID, dict[GameResultKey, _PendingResults]] | None = None
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+
     # -- writes -----------------------------------------------------------
 
     async def record_result(
@@ -489,8 +552,9 @@ class GameStatsRepository(BaseRepository):
     ) -> None:
         """Records the outcome of a single round.
 
-        Telemetry must never break gameplay, so any database error here is logged
-        and swallowed rather than propagated to the caller (a game's payout flow).
+        The round is only buffered here; it reaches the database with the next
+        :meth:`flush`. Nothing in this call touches the pool, so telemetry can never
+        slow down or break a game's payout flow.
 
         Parameters
         ----------
@@ -505,46 +569,118 @@ class GameStatsRepository(BaseRepository):
         profit:
             Net coins change for the round; positive on a win, negative on a loss.
         """
-        won = 1 if result == 'win' else 0
-        lost = 1 if result == 'loss' else 0
-        tied = 1 if result == 'push' else 0
-
+        key = (guild_id, user_id, game)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingResults()
+        pending.add(result, wagered, profit)
+
+    async def flush(self) -> None:
+        """Writes every buffered round.
+
+        A batch left over from a failed flush is sent first, then the rounds recorded
+        since, each in one statement. A database error is logged and the batch it hit
+        stays pending. Since the write may have committed before the error or a
+        cancellation reached us, the batch is sent again under the same flush id, and
+        rows already stamped with that id (``last_flush``) are skipped, so no round is
+        counted twice.
+        """
+        async with self._flush_lock:
+            for _ in range(2):
+                if self._unsent is None:
+                    if not self._pending:
+                        return
+                    self._unsent = uuid.uuid4(), self._pending
+                    self._pending = {}
+
+                flush_id, pending = self._unsent
+                try:
+                    await self._write(flush_id, pending)
+                except Exception:
+                    log.exception("Failed to write %d buffered game results", len(pending))
+                    return
+                self._unsent = None
+
+    async def _write(self, flush_id: uuid.UUID, pending: dict[GameResultKey, _PendingResults]) -> None:
+        """Applies one batch in one statement.
+
+        Existing rows are updated and new ones inserted by the same statement, with the
+        buffered streak runs joined onto the stored ``current_streak``.
+        """
+        keys = list(pending)
+        deltas = list(pending.values())
         query = """
-            INSERT INTO game_stats AS gs
+            WITH delta AS (
+                SELECT *
+                FROM unnest($1::bigint[], $2::bigint[], $3::text[], $4::int[], $5::int[], $6::int[],
+                            $7::int[], $8::bigint[], $9::bigint[], $10::bigint[], $11::int[],
+                            $12::int[], $13::boolean[], $14::int[], $15::timestamp[])
+                    AS d(guild_id, user_id, game, played, won, lost, tied, wagered, profit,
+                         biggest_win, lead, tail, broken, best, last_played)
+            ),
+            updated AS (
+                UPDATE game_stats AS gs SET
+                    played      = gs.played + d.played,
+                    won         = gs.won + d.won,
+                    lost        = gs.lost + d.lost,
+                    tied        = gs.tied + d.tied,
+                    wagered     = gs.wagered + d.wagered,
+                    profit      = gs.profit + d.profit,
+                    biggest_win = GREATEST(gs.biggest_win, d.biggest_win),
+                    current_streak = CASE
+                        WHEN d.lead = 0 THEN gs.current_streak
+                        WHEN d.broken THEN d.tail
+                        WHEN SIGN(d.lead) = SIGN(gs.current_streak) THEN gs.current_streak + d.lead
+                        ELSE d.lead END,
+                    best_streak = GREATEST(
+                        gs.best_streak,
+                        d.best,
+                        CASE WHEN d.lead > 0 AND gs.current_streak > 0 THEN gs.current_streak + d.lead
+                             ELSE 0 END),
+                    last_played = d.last_played,
+                    last_flush  = $16
+                FROM delta AS d
+                WHERE gs.guild_id = d.guild_id AND gs.user_id = d.user_id AND gs.game = d.game
+                  AND gs.last_flush IS DISTINCT FROM $16::uuid
+                RETURNING gs.guild_id, gs.user_id, gs.game
+            )
+            INSERT INTO game_stats
                 (guild_id, user_id, game, played, won, lost, tied, wagered, profit,
-                 biggest_win, current_streak, best_streak, last_played)
-            VALUES ($1, $2, $3, 1, $4, $5, $6, $7, $8::BIGINT,
-                    GREATEST($8::BIGINT, 0::BIGINT),
-                    CASE WHEN $4 = 1 THEN 1 WHEN $5 = 1 THEN -1 ELSE 0 END,
-                    CASE WHEN $4 = 1 THEN 1 ELSE 0 END,
-                    (now() AT TIME ZONE 'utc'))
-            ON CONFLICT (guild_id, user_id, game) DO UPDATE SET
-                played      = gs.played + 1,
-                won         = gs.won + $4,
-                lost        = gs.lost + $5,
-                tied        = gs.tied + $6,
-                wagered     = gs.wagered + $7,
-                profit      = gs.profit + $8::BIGINT,
-                biggest_win = GREATEST(gs.biggest_win::BIGINT, $8::BIGINT),
-                current_streak = CASE
-                    WHEN $4 = 1 THEN (CASE WHEN gs.current_streak >= 0 THEN gs.current_streak + 1 ELSE 1 END)
-                    WHEN $5 = 1 THEN (CASE WHEN gs.current_streak <= 0 THEN gs.current_streak - 1 ELSE -1 END)
-                    ELSE gs.current_streak END,
-                best_streak = GREATEST(
-                    gs.best_streak,
-                    CASE WHEN $4 = 1 THEN (CASE WHEN gs.current_streak >= 0 THEN gs.current_streak + 1 ELSE 1 END)
-                         ELSE 0 END),
-                last_played = (now() AT TIME ZONE 'utc');
+                 biggest_win, current_streak, best_streak, last_played, last_flush)
+            SELECT d.guild_id, d.user_id, d.game, d.played, d.won, d.lost, d.tied, d.wagered, d.profit,
+                   d.biggest_win, d.tail, d.best, d.last_played, $16::uuid
+            FROM delta AS d
+            WHERE NOT EXISTS (
+                SELECT 1 FROM updated AS u
+                WHERE u.guild_id = d.guild_id AND u.user_id = d.user_id AND u.game = d.game
+            )
+            ON CONFLICT (guild_id, user_id, game) DO NOTHING;
         """
-        try:
-            await self.execute(query, guild_id, user_id, game, won, lost, tied, wagered, profit)
-        except Exception:
-            log.exception("Failed to record game result (guild=%s user=%s game=%s)", guild_id, user_id, game)
+        await self.execute(
+            query,
+            [guild_id for guild_id, _, _ in keys],
+            [user_id for _, user_id, _ in keys],
+            [game for _, _, game in keys],
+            [d.played for d in deltas],
+            [d.won for d in deltas],
+            [d.lost for d in deltas],
+            [d.tied for d in deltas],
+            [d.wagered for d in deltas],
+            [d.profit for d in deltas],
+            [d.biggest_win for d in deltas],
+            [d.lead for d in deltas],
+            [d.tail for d in deltas],
+            [d.broken for d in deltas],
+            [d.best for d in deltas],
+            [d.last_played for d in deltas],
+            flush_id,
+        )
 
     # -- member reads -----------------------------------------------------
 
     async def get_member_games(self, guild_id: int, user_id: int) -> list[asyncpg.Record]:
         """All per-game rows for a member, most played first."""
+        await self.flush()
         query = """
             SELECT game, played, won, lost, tied, wagered, profit, biggest_win, current_streak, best_streak
             FROM game_stats
@@ -555,6 +691,7 @@ class GameStatsRepository(BaseRepository):
 
     async def get_member_totals(self, guild_id: int, user_id: int) -> asyncpg.Record | None:
         """Member totals summed across every game (``None`` if they've never played)."""
+        await self.flush()
         query = """
             SELECT COALESCE(SUM(played), 0)  AS played,
                    COALESCE(SUM(won), 0)     AS won,
@@ -588,6 +725,7 @@ class GameStatsRepository(BaseRepository):
         member's rows are summed across all games. ``winrate`` ranks by
         wins / played and only includes members with at least ``min_played`` rounds.
         """
+        await self.flush()
         scope = "AND game = $2" if game is not None else ""
         args: list[object] = [guild_id]
         if game is not None:
@@ -619,6 +757,7 @@ class GameStatsRepository(BaseRepository):
 
     async def get_guild_overview(self, guild_id: int) -> list[asyncpg.Record]:
         """Per-game totals across the whole guild (rounds played + unique players)."""
+        await self.flush()
         query = """
             SELECT game,
                    SUM(played)        AS played,
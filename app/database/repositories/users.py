@@ -238,29 +238,55 @@ class UsersRepository(BaseRepository):
     # -- economy ----------------------------------------------------------
 
     async def get_balance_record(self, user_id: int, guild_id: int) -> asyncpg.Record:
-        """Fetches a user's balance row for a guild, inserting an empty one if absent."""
+        """Fetches a user's balance row for a guild, inserting an empty one if absent.
+
+        Another first access, or a ledger upsert for the same new member, may insert the
+        row between the two statements; the no-op update then returns that row instead of
+        violating ``economy_guild_user_key``.
+        """
         record = await self.fetchrow(
             "SELECT * FROM economy WHERE user_id = $1 AND guild_id = $2;", user_id, guild_id)
         if not record:
-            record = await self.fetchrow(
-                "INSERT INTO economy (user_id, guild_id, cash, bank) VALUES ($1, $2, 0, 0) RETURNING *;",
-                user_id, guild_id)
+            query = """
+                INSERT INTO economy (user_id, guild_id, cash, bank) VALUES ($1, $2, 0, 0)
+                ON CONFLICT (user_id, guild_id) DO UPDATE SET user_id = EXCLUDED.user_id
+                RETURNING *;
+            """
+            record = await self.fetchrow(query, user_id, guild_id)
         return record
 
-    async def get_guild_balance_records(self, guild_id: int) -> list[asyncpg.Record]:
-        """Fetches every balance row for a guild."""
-        return await self.fetch("SELECT * FROM economy WHERE guild_id = $1;", guild_id)
-
-    async def get_top_balance_records(self, guild_id: int, limit: int) -> list[asyncpg.Record]:
-        """Fetches the richest members of a guild (by cash + bank), excluding empty wallets.
+    async def get_balance_page(
+        self, guild_id: int, *, limit: int, after: tuple[int, int] | None = None, offset: int = 0
+    ) -> list[asyncpg.Record]:
+        """Fetches one leaderboard page of a guild (by cash + bank), excluding empty wallets.
 
-        A single ordered query - the leaderboard must not loop per-member balance
-        lookups (that was both slow and only sampled an arbitrary subset).
+        Rows come richest first from ``economy_guild_total_idx``, ties broken by user id.
+        Pass the previous page's last ``(total, user_id)`` as ``after`` to continue right
+        behind it (keyset paging); ``offset`` is only for jumping to a page whose
+        predecessor was never fetched.
         """
+        if after is None:
+            return await self.fetch(
+                "SELECT user_id, cash, bank, (cash + bank) AS total FROM economy "
+                "WHERE guild_id = $1 AND cash + bank > 0 "
+                "ORDER BY cash + bank DESC, user_id DESC LIMIT $2 OFFSET $3;",
+                guild_id, limit, offset)
         return await self.fetch(
             "SELECT user_id, cash, bank, (cash + bank) AS total FROM economy "
-            "WHERE guild_id = $1 AND (cash + bank) > 0 ORDER BY total DESC LIMIT $2;",
-            guild_id, limit)
+            "WHERE guild_id = $1 AND cash + bank > 0 AND (cash + bank, user_id) < ($2, $3) "
+            "ORDER BY cash + bank DESC, user_id DESC LIMIT $4;",
+            guild_id, *after, limit)
+
+    async def get_balance_totals(self, guild_id: int) -> asyncpg.Record:
+        """Fetches a guild's money in circulation (``total``) and its ranked wallet count (``ranked``).
+
+        Read from the trigger-maintained ``economy_totals`` slots, so this is at most
+        16 rows whatever the guild's size.
+        """
+        return await self.fetchrow(
+            "SELECT COALESCE(SUM(total), 0)::bigint AS total, COALESCE(SUM(ranked), 0)::int AS ranked "
+            "FROM economy_totals WHERE guild_id = $1;",
+            guild_id)
 
     async def add_cash(self, user_id: int, guild_id: int, amount: int) -> None:
         """Adds (or, with a negative ``amount``, removes) cash from a user's balance."""
@@ -306,16 +332,32 @@ class PlaylistsRepository(BaseRepository):
         return await self.fetch("SELECT * FROM playlist WHERE user_id = $1;", user_id)
 
     async def get_playlist_tracks(self, playlist_id: int) -> list[asyncpg.Record]:
-        """Fetches every track belonging to a playlist."""
-        return await self.fetch("SELECT * FROM playlist_lookup WHERE playlist_id = $1;", playlist_id)
+        """Fetches every track belonging to a playlist, in the order they were added."""
+        return await self.fetch("SELECT * FROM playlist_lookup WHERE playlist_id = $1 ORDER BY id;", playlist_id)
 
-    async def add_track(self, playlist_id: int, name: str, url: str | None) -> asyncpg.Record:
+    async def add_track(
+        self, playlist_id: int, name: str, url: str | None, encoded: str | None = None
+    ) -> asyncpg.Record:
         """Adds a track to a playlist and returns the inserted row."""
         return cast(
             'asyncpg.Record',
             await self.fetchrow(
-                "INSERT INTO playlist_lookup (playlist_id, name, url) VALUES ($1, $2, $3) RETURNING *;",
-                playlist_id, name, url),
+                "INSERT INTO playlist_lookup (playlist_id, name, url, encoded) VALUES ($1, $2, $3, $4) RETURNING *;",
+                playlist_id, name, url, encoded),
+        )
+
+    async def set_track_encodings(self, track_ids: list[int], encoded: list[str]) -> None:
+        """Backfills the Lavalink-encoded track of several tracks in one statement."""
+        if not track_ids:
+            return
+        await self.execute(
+            """
+            UPDATE playlist_lookup AS p
+            SET encoded = u.encoded
+            FROM unnest($1::int[], $2::text[]) AS u(id, encoded)
+            WHERE p.id = u.id;
+            """,
+            track_ids, encoded,
         )
 
     async def remove_track(self, track_id: int) -> None:
@@ -0,0 +1,291 @@
+"""Short-lived response cache with ETag revalidation for the dashboard's polled routes.
+
+The BFF polls the guild-scoped ``GET`` routes of a few routers (:data:`CACHED_ROUTERS`) on a
+fixed interval, and every poll used to rebuild the same JSON from the database or the member
+cache. :class:`ResponseCache` keeps each rendered body for ``ttl`` seconds, keyed by path and
+query, and tags it with a strong ``ETag`` so a poll carrying ``If-None-Match`` is answered with
+``304`` and no body at all. Compressed variants (gzip, or brotli when the optional ``brotli``
+package is installed) are produced once per entry instead of once per response.
+
+Entries are grouped per guild and dropped when:
+
+- one of :data:`INVALIDATING_SIGNALS` fires for that guild (the cache is connected to the
+  database's :class:`~app.utils.signals.CacheSignalHub` like any ``@cache.cache()`` getter);
+- any mutating request for that guild goes through the internal API;
+- they are older than ``ttl``, which bounds staleness for data no signal covers (XP, balances).
+
+Each invalidation bumps the guild's generation, so a response that was being rendered while
+its guild was invalidated is served but not stored.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+__all__ = (
+    'CACHED_ROUTERS',
+    'INVALIDATING_SIGNALS',
+    'ResponseCache',
+)
+
+#: Routers (by their first tag) whose guild-scoped ``GET`` routes are cached.
+CACHED_ROUTERS: frozenset[str] = frozenset({'Stats', 'Guilds', 'Leveling', 'Economy', 'Analytics'})
+
+#: Guild-keyed cache signals that drop every cached response of the guild they fire for.
+INVALIDATING_SIGNALS: tuple[str, ...] = (
+    'guild_config_changed',
+    'sentinel_changed',
+    'ai_config_changed',
+    'command_overrides_changed',
+)
+
+_MUTATING_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    media_type: str | None
+    guild_id: int
+    expires: float
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _RouteCounters:
+    hits: int = 0
+    not_modified: int = 0
+    misses: int = 0
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        if params.strip().replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    # Weak comparison: a client may echo the tag back as ``W/"..."``.
+    return any(candidate.strip().removeprefix('W/') == etag for candidate in header.split(','))
+
+
+class ResponseCache:
+    """Per-guild, TTL-bounded LRU of rendered ``GET`` responses.
+
+    Lookups happen on whichever loop serves HTTP while signals fire on the bot's loop, so
+    every access to the entries is serialised by a lock.
+
+    Parameters
+    ----------
+    ttl: float
+        Seconds an entry stays fresh. ``0`` disables caching (ETags are still computed).
+    max_entries: int
+        Entries kept before the least recently used are evicted.
+    compress_min_size: int
+        Bodies smaller than this many bytes are never compressed.
+    """
+
+    def __init__(self, *, ttl: float = 10.0, max_entries: int = 1024, compress_min_size: int = 1024) -> None:
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self.compress_min_size: int = compress_min_size
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._by_guild: dict[int, set[str]] = {}
+        self._generations: dict[int, int] = {}
+        self._counters: dict[str, _RouteCounters] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(request: Request) -> str:
+        query = '&'.join(sorted(f'{k}={v}' for k, v in request.query_params.multi_items()))
+        return f'{request.url.path}?{query}'
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= time.monotonic():
+                self._discard(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def generation(self, guild_id: int) -> int:
+        with self._lock:
+            return self._generations.get(guild_id, 0)
+
+    def put(self, key: str, body: bytes, *, guild_id: int, media_type: str | None, generation: int) -> CachedResponse:
+        """Caches ``body`` unless the guild was invalidated since ``generation`` was read.
+
+        The entry is returned either way, so the response can still be sent.
+        """
+        entry = CachedResponse(
+            body=body,
+            etag=f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"',
+            media_type=media_type,
+            guild_id=guild_id,
+            expires=time.monotonic() + self.ttl,
+        )
+        if self.ttl <= 0:
+            return entry
+
+        with self._lock:
+            if generation != self._generations.get(guild_id, 0):
+                return entry
+            self._discard(key)
+            self._entries[key] = entry
+            self._by_guild.setdefault(guild_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+        return entry
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._by_guild.get(entry.guild_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_guild[entry.guild_id]
+
+    def invalidate(self, guild_id: int | None) -> bool:
+        """Drops every cached response of ``guild_id``.
+
+        Named and shaped like ``@cache.cache()``'s ``invalidate`` so the cache can be connected
+        to a :class:`~app.utils.signals.CacheSignal` directly.
+        """
+        if guild_id is None:
+            return False
+        with self._lock:
+            self._generations[guild_id] = self._generations.get(guild_id, 0) + 1
+            keys = self._by_guild.pop(guild_id, None)
+            if not keys:
+                return False
+            for key in keys:
+                self._entries.pop(key, None)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_guild.clear()
+
+    def _record(self, router: str, outcome: str) -> None:
+        with self._lock:
+            counters = self._counters.get(router)
+            if counters is None:
+                counters = self._counters[router] = _RouteCounters()
+            setattr(counters, outcome, getattr(counters, outcome) + 1)
+
+    def summary(self) -> dict[str, object]:
+        """Entry count plus hit/304/miss counters and the hit ratio of every cached router."""
+        with self._lock:
+            routers = {}
+            for name, c in sorted(self._counters.items()):
+                total = c.hits + c.not_modified + c.misses
+                routers[name] = {
+                    'hits': c.hits,
+                    'not_modified': c.not_modified,
+                    'misses': c.misses,
+                    'hit_ratio': round((c.hits + c.not_modified) / total, 4) if total else 0.0,
+                }
+            return {'entries': len(self._entries), 'ttl': self.ttl, 'routers': routers}
+
+    def _coding(self, entry: CachedResponse, accept_encoding: str) -> str | None:
+        if len(entry.body) < self.compress_min_size:
+            return None
+        accepted = _accepted_encodings(accept_encoding)
+        if brotli is not None and 'br' in accepted:
+            return 'br'
+        if 'gzip' in accepted:
+            return 'gzip'
+        return None
+
+    @staticmethod
+    def _encode(entry: CachedResponse, coding: str) -> bytes:
+        # Racing requests may both compress; the result is identical, so the last write wins.
+        encoded = entry.encoded.get(coding)
+        if encoded is None:
+            encoded = brotli.compress(entry.body) if coding == 'br' else gzip.compress(entry.body, compresslevel=6)
+            entry.encoded[coding] = encoded
+        return encoded
+
+    def _respond(self, request: Request, entry: CachedResponse, *, hit: bool) -> Response:
+        coding = self._coding(entry, request.headers.get('accept-encoding', ''))
+        etag = entry.etag if coding is None else f'{entry.etag[:-1]}-{coding}"'
+        headers = {
+            'ETag': etag,
+            'Cache-Control': 'private, no-cache',
+            'Vary': 'Accept-Encoding',
+            'X-Cache': 'HIT' if hit else 'MISS',
+        }
+        if _etag_matches(request.headers.get('if-none-match'), etag):
+            return Response(status_code=304, headers=headers)
+
+        if coding is None:
+            return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+        headers['Content-Encoding'] = coding
+        return Response(content=self._encode(entry, coding), media_type=entry.media_type, headers=headers)
+
+    async def serve(self, request: Request, router: str, call: Callable[[Request], Awaitable[Response]]) -> Response:
+        """Answers ``request`` from the cache when possible, otherwise through ``call``.
+
+        Non-cacheable requests pass straight through; mutating requests for a guild invalidate
+        that guild's entries once they succeed.
+        """
+        guild_id = request.path_params.get('guild_id')
+        if guild_id is None:
+            return await call(request)
+        guild_id = int(guild_id)
+
+        if request.method != 'GET' or router not in CACHED_ROUTERS:
+            response = await call(request)
+            if request.method in _MUTATING_METHODS and response.status_code < 400:
+                self.invalidate(guild_id)
+            return response
+
+        key = self.key(request)
+        entry = self.get(key)
+        if entry is not None:
+            response = self._respond(request, entry, hit=True)
+            self._record(router, 'not_modified' if response.status_code == 304 else 'hits')
+            return response
+
+        generation = self.generation(guild_id)
+        response = await call(request)
+        self._record(router, 'misses')
+        if response.status_code != 200 or not isinstance(getattr(response, 'body', None), bytes):
+            return response
+
+        entry = self.put(key, response.body, guild_id=guild_id, media_type=response.media_type, generation=generation)
+        return self._respond(request, entry, hit=False)
@@ -14,11 +14,22 @@ if TYPE_CHECKING:
 
     from app.core import Bot
 
+    from .isolation import GatewayBridge
+
 
 def get_bot(request: Request) -> Bot:
     return request.app.state.bot
 
 
+def get_read_db(request: Request) -> Any:
+    """The pool read-only handlers query: ``bot.db`` inline, the worker's read pool in thread mode."""
+    return request.app.state.read_db
+
+
+def get_bridge(request: Request) -> GatewayBridge:
+    return request.app.state.bridge
+
+
 async def verify_token(authorization: Annotated[str | None, Header()] = None) -> None:
     if not authorization or authorization != f'Bearer {config.internal_api_token}':
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='invalid or missing token')
@@ -27,8 +38,11 @@ async def verify_token(authorization: Annotated[str | None, Header()] = None) ->
 async def resolve_guild(
     guild_id: Annotated[int, Path()],
     bot: Annotated[Any, Depends(get_bot)],
+    bridge: Annotated[Any, Depends(get_bridge)],
 ) -> discord.Guild:
-    guild = bot.get_guild(guild_id)
+    # Looked up on the bot loop so a WorkerRoute handler never reads the guild cache while a
+    # gateway event mutates it; a GatewayRoute handler already runs there and pays no hop.
+    guild = await bridge.run(bot.get_guild, guild_id)
     if guild is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='guild not found')
     return guild
@@ -37,3 +51,5 @@ async def resolve_guild(
 BotDep = Annotated[Any, Depends(get_bot)]
 GuildDep = Annotated[Any, Depends(resolve_guild)]
 AuthDep = Annotated[None, Depends(verify_token)]
+ReadDBDep = Annotated[Any, Depends(get_read_db)]
+BridgeDep = Annotated[Any, Depends(get_bridge)]
@@ -0,0 +1,195 @@
+"""Event-loop isolation for the internal API.
+
+By default the API is served *inline*: uvicorn runs as a task on the bot's own event loop
+and every handler shares ``bot.db``'s pool. In ``thread`` mode (``INTERNAL_API_ISOLATION``)
+the server instead runs on a :class:`WorkerLoop` — a dedicated thread with its own event
+loop — so HTTP parsing, validation and JSON rendering no longer compete with gateway
+heartbeats and command dispatch.
+
+Handlers still need the bot (its caches, its REST client, the memoized config getters), and
+those objects are bound to the bot's loop. Two route classes decide where a handler runs:
+
+- :class:`GatewayRoute` (the default for every router) hops the whole handler onto the bot
+  loop through the :class:`GatewayBridge`, so existing handlers keep their exact semantics.
+- :class:`WorkerRoute` keeps the handler on the worker loop. Such handlers read through the
+  size-capped :class:`~.read_pool.ReadDatabase` (``ReadDBDep``) and use the bridge only for the few calls
+  that need live gateway state.
+
+Only the Analytics router is a :class:`WorkerRoute` so far: its handlers are aggregate
+reads plus one member-cache snapshot taken through the bridge. Every other router stays on
+:class:`GatewayRoute` because its handlers write through ``bot.db`` (whose caches the read
+pool would not bust), call the bot's REST client or voice state, or walk the member and
+channel caches throughout — hopping for each of those would cost more than running the
+whole handler on the bot loop. ``GuildDep`` resolves the guild through the bridge, so it
+is safe from either route class.
+
+A separate *process* is deliberately not offered: the handlers read the live discord.py
+cache, which cannot be shared across a process boundary without re-implementing it.
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from fastapi.routing import APIRoute
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    from fastapi import Request, Response
+
+log = logging.getLogger(__name__)
+
+__all__ = (
+    'GatewayBridge',
+    'GatewayRoute',
+    'WorkerLoop',
+    'WorkerRoute',
+)
+
+
+class WorkerLoop:
+    """A daemon thread running its own asyncio event loop."""
+
+    def __init__(self, name: str = 'percy-internal-api') -> None:
+        self.name: str = name
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._thread: threading.Thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def submit[T](self, coro: Coroutine[Any, Any, T]) -> asyncio.Future[T]:
+        """Schedules ``coro`` on the worker loop; the returned future is awaitable from any loop."""
+        return asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    async def stop(self) -> None:
+        """Stops the worker loop and waits for its thread to exit."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        await asyncio.to_thread(self._thread.join, 10.0)
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+
+class GatewayBridge:
+    """Thread-safe access to objects bound to the bot's event loop.
+
+    Every call resolves on the bot loop. When the caller already runs there (inline mode, or
+    a :class:`GatewayRoute` handler) the call is made directly with no hop.
+    """
+
+    __slots__ = ('loop',)
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop: asyncio.AbstractEventLoop = loop
+
+    @property
+    def on_bot_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    async def call[T](self, func: Callable[..., Coroutine[Any, Any, T]], /, *args: Any, **kwargs: Any) -> T:
+        """|coro| Awaits ``func(*args, **kwargs)`` on the bot loop."""
+        if self.on_bot_loop:
+            return await func(*args, **kwargs)
+        future = asyncio.run_coroutine_threadsafe(func(*args, **kwargs), self.loop)
+        return await asyncio.wrap_future(future)
+
+    async def run[T](self, func: Callable[..., T], /, *args: Any) -> T:
+        """|coro| Runs a synchronous callable on the bot loop, e.g. to snapshot a guild's members.
+
+        Iterating discord.py's caches from another thread can race with gateway events
+        mutating them; evaluating the callable on the bot loop keeps the read consistent.
+        """
+        if self.on_bot_loop:
+            return func(*args)
+
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+
+        def invoke() -> None:
+            try:
+                future.set_result(func(*args))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        self.loop.call_soon_threadsafe(invoke)
+        return await asyncio.wrap_future(future)
+
+
+def _router_name(route: APIRoute) -> str:
+    return str(route.tags[0]) if route.tags else route.path
+
+
+class GatewayRoute(APIRoute):
+    """Route class that runs its handler on the bot's event loop.
+
+    In inline mode this is a plain route. In thread mode the request body is buffered on the
+    worker loop (Starlette caches it on the request, so the handler never touches the
+    worker-bound ``receive``), then the handler runs on the bot loop; the time spent waiting
+    for the bot loop to pick it up is recorded as queue time. Cached responses are answered
+    before the hop, so they never wait for the bot loop.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        router = _router_name(self)
+
+        async def invoke(request: Request) -> Response:
+            state = request.app.state
+            bridge: GatewayBridge = state.bridge
+            received = time.perf_counter()
+            if bridge.on_bot_loop:
+                with state.route_metrics.track(router):
+                    return await handler(request)
+
+            await request.body()
+
+            async def run_on_bot_loop() -> Response:
+                queued_ms = (time.perf_counter() - received) * 1000.0
+                with state.route_metrics.track(router, queued_ms=queued_ms):
+                    return await handler(request)
+
+            return await bridge.call(run_on_bot_loop)
+
+        async def route_handler(request: Request) -> Response:
+            return await request.app.state.response_cache.serve(request, router, invoke)
+
+        return route_handler
+
+
+class WorkerRoute(APIRoute):
+    """Route class for read-heavy handlers that stay on the internal API's own loop.
+
+    Handlers using it must read through ``ReadDBDep`` and reach bot state only through the
+    :class:`GatewayBridge`; in inline mode both resolve to the bot's own objects.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        router = _router_name(self)
+
+        async def invoke(request: Request) -> Response:
+            with request.app.state.route_metrics.track(router):
+                return await handler(request)
+
+        async def route_handler(request: Request) -> Response:
+            return await request.app.state.response_cache.serve(request, router, invoke)
+
+        return route_handler
@@ -0,0 +1,65 @@
+"""The internal API's dedicated read pool, used in ``thread`` isolation mode.
+
+Kept apart from :mod:`.isolation` because it depends on the database package, which in turn
+imports the bot; :class:`~.server.InternalAPI` only imports it once it actually boots a
+worker loop.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from app.database.base import _Database
+from app.database.repositories import (
+    AutoRespondersRepository,
+    GameStatsRepository,
+    GuildsRepository,
+    LevelingRepository,
+    StatsRepository,
+    TagsRepository,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from app.core import Bot
+
+log = logging.getLogger(__name__)
+
+__all__ = ('ReadDatabase',)
+
+
+class ReadDatabase(_Database):
+    """A size-capped, read-only connection pool owned by the internal API's worker loop.
+
+    Exposes the repositories :class:`WorkerRoute` handlers read from. It never runs
+    migrations and keeps its own signal hub, so it must not be used for writes — mutations
+    belong on ``bot.db``, reached through the :class:`GatewayBridge`, where they bust the
+    shared caches.
+    """
+
+    __slots__ = ('autoresponders', 'game_stats', 'guilds', 'leveling', 'max_size', 'stats', 'tags')
+
+    def __init__(self, bot: Bot, *, max_size: int, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.max_size: int = max(1, max_size)
+        super().__init__(bot, loop=loop)
+        self.guilds = GuildsRepository(self)
+        self.stats = StatsRepository(self)
+        self.leveling = LevelingRepository(self)
+        self.game_stats = GameStatsRepository(self)
+        self.tags = TagsRepository(self)
+        self.autoresponders = AutoRespondersRepository(self)
+
+    async def _connect(self) -> None:
+        try:
+            self._internal_pool = await self.create_pool(
+                min_size=1,
+                max_size=self.max_size,
+                server_settings={'application_name': 'percy-internal-api'},
+            )
+        except Exception:
+            log.exception('Failed to create the internal API read pool.')
+        else:
+            log.info('Internal API read pool connected (max=%d).', self.max_size)
+        finally:
+            self._ready.set()
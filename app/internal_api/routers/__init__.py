@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from .analytics import router as analytics_router
 from .backup import router as backup_router
+from .backup import stream_router as backup_stream_router
 from .content import router as content_router
 from .economy import router as economy_router
 from .gallery import router as gallery_router
@@ -31,6 +32,7 @@ ALL_ROUTERS = [
     webhooks_router,
     analytics_router,
     backup_router,
+    backup_stream_router,
     subscriptions_router,
     gallery_router,
 ]
@@ -8,17 +8,25 @@ contiguous series ready to plot. Metrics are sourced from the ``commands`` table
 from __future__ import annotations
 
 import datetime
+from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.services import METRICS, fill_buckets, resolve_granularity, resolve_range
 
-from ..dependencies import BotDep, GuildDep, verify_token
+from ..dependencies import BridgeDep, GuildDep, ReadDBDep, verify_token
+from ..isolation import WorkerRoute
 
+if TYPE_CHECKING:
+    import discord
+
+# Analytics are pure aggregate reads, so they stay on the internal API's own loop and pool;
+# only the member join snapshot is taken on the bot loop.
 router = APIRouter(
     prefix="/guilds/{guild_id}/analytics",
     tags=["Analytics"],
     dependencies=[Depends(verify_token)],
+    route_class=WorkerRoute,
 )
 
 
@@ -27,10 +35,15 @@ def _as_utc(dt: datetime.datetime) -> datetime.datetime:
     return dt if dt.tzinfo else dt.replace(tzinfo=datetime.UTC)
 
 
+def _join_dates(guild: discord.Guild) -> list[datetime.datetime]:
+    return [m.joined_at for m in guild.members if m.joined_at is not None]
+
+
 @router.get("/series")
 async def get_series(
     guild: GuildDep,
-    bot: BotDep,
+    db: ReadDBDep,
+    bridge: BridgeDep,
     metric: str = Query(..., description="One of: commands, command_failures, xp, members"),
     range_: str = Query("30d", alias="range", description="24h, 7d, 30d, 90d, or 1y"),
     granularity: str | None = Query(None, description="hour, day, or week (auto if omitted)"),
@@ -55,7 +68,7 @@ async def get_series(
     values: dict[datetime.datetime, float] = {}
 
     if metric in ("commands", "command_failures"):
-        rows = await bot.db.stats.get_command_series(
+        rows = await db.stats.get_command_series(
             guild.id, days=days, granularity=gran, failures_only=(metric == "command_failures"),
         )
         values = {_as_utc(r["bucket"]): r["value"] for r in rows}
@@ -64,7 +77,7 @@ async def get_series(
         # xp_history is a daily cumulative snapshot; weekly/hourly buckets would sum
         # cumulative totals nonsensically, so this metric is always daily.
         gran = "day"
-        rows = await bot.db.leveling.get_xp_history(guild.id, days=days)
+        rows = await db.leveling.get_xp_history(guild.id, days=days)
         values = {
             datetime.datetime(r["day"].year, r["day"].month, r["day"].day, tzinfo=datetime.UTC): r["total_xp"]
             for r in rows
@@ -72,9 +85,8 @@ async def get_series(
 
     else:  # members — new joins per bucket, from the live member cache
         cutoff = now - datetime.timedelta(days=days)
-        for member in guild.members:
-            joined = member.joined_at
-            if joined is not None and joined >= cutoff:
+        for joined in await bridge.run(_join_dates, guild):
+            if joined >= cutoff:
                 key = _as_utc(joined)
                 values[key] = values.get(key, 0) + 1
 
@@ -91,7 +103,8 @@ async def get_series(
 @router.get("/summary")
 async def get_summary(
     guild: GuildDep,
-    bot: BotDep,
+    db: ReadDBDep,
+    bridge: BridgeDep,
     range_: str = Query("30d", alias="range", description="24h, 7d, 30d, 90d, or 1y"),
 ) -> dict:
     """Headline numbers for a range, each with a delta vs the preceding equal window.
@@ -108,14 +121,14 @@ async def get_summary(
     cutoff = now - datetime.timedelta(days=days)
     prev_cutoff = now - datetime.timedelta(days=days * 2)
 
-    commands_current = await bot.db.stats.get_command_total(guild.id, days=days)
-    commands_window2 = await bot.db.stats.get_command_total(guild.id, days=days * 2)
+    commands_current = await db.stats.get_command_total(guild.id, days=days)
+    commands_window2 = await db.stats.get_command_total(guild.id, days=days * 2)
     commands_previous = max(commands_window2 - commands_current, 0)
 
-    top_rows = await bot.db.stats.get_command_usage(guild_id=guild.id, days=days, group_by="command", limit=5)
+    top_rows = await db.stats.get_command_usage(guild_id=guild.id, days=days, group_by="command", limit=5)
     top_commands = [{"command": r["command"], "uses": r["uses"]} for r in top_rows]
 
-    joins = [m.joined_at for m in guild.members if m.joined_at is not None]
+    joins = await bridge.run(_join_dates, guild)
     new_current = sum(1 for j in joins if j >= cutoff)
     new_previous = sum(1 for j in joins if prev_cutoff <= j < cutoff)
 
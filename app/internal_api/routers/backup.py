@@ -5,26 +5,64 @@ guild scalars, autoresponders, tags); import applies one back — into the same
 (disaster recovery) or a different one (cloning). Publishing a backup as a *template*
 lets other servers apply the same setup by slug. Portability rules live in
 ``app.services.backup``; the actual repo reads/writes live here (they need bot + guild).
+
+The streaming export/import routes live on :data:`stream_router`: their bodies are produced
+and consumed while the response or request is on the wire, on the internal API's own loop,
+so they read through the read pool and hop onto the bot loop only for the guild config
+and the restore itself.
 """
 from __future__ import annotations
 
 import re
+from typing import TYPE_CHECKING, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.services import (
+    NDJSON_MEDIA_TYPE,
     PORTABLE_SECTIONS,
+    BackupStreamError,
+    BackupStreamReader,
     build_backup,
+    gzip_stream,
+    prepare_autoresponders,
+    prepare_tags,
     select_sections,
+    stream_backup,
     summarize_sections,
     validate_backup,
 )
 
-from ..dependencies import BotDep, GuildDep, verify_token
+from ..dependencies import BotDep, BridgeDep, GuildDep, ReadDBDep, verify_token
+from ..isolation import GatewayRoute, WorkerRoute
 from .guild import _build_config_updates
 
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Backup & Templates"], dependencies=[Depends(verify_token)])
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    import asyncpg
+    import discord
+
+    from app.core import Bot
+    from app.database.base import Database
+
+    from ..read_pool import ReadDatabase
+
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Backup & Templates"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
+
+stream_router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Backup & Templates"],
+    dependencies=[Depends(verify_token)],
+    route_class=WorkerRoute,
+)
 
 _SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9-]{1,48}[a-z0-9]$")
 
@@ -53,10 +91,22 @@ class PublishTemplateBody(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-async def _collect_sections(bot, guild) -> dict[str, object]:
-    """Read a guild's portable config into the backup section shape."""
+def _autoresponder_item(record: asyncpg.Record) -> dict:
+    return {
+        "trigger": record["trigger"],
+        "response": record["response"],
+        "match_type": record["match_type"],
+        "ignore_case": record.get("ignore_case", True),
+    }
+
+
+def _tag_item(record: asyncpg.Record) -> dict:
+    return {"name": record["name"], "content": record["content"]}
+
+
+async def _collect_config(bot: Bot, guild: discord.Guild) -> dict:
     gc = await bot.db.get_guild_config(guild.id)
-    config_section = {
+    return {
         "flags": {
             "audit_log": gc.flags.audit_log,
             "raid": gc.flags.raid,
@@ -69,101 +119,76 @@ async def _collect_sections(bot, guild) -> dict[str, object]:
         "use_music_panel": gc.use_music_panel,
     }
 
-    autoresponders = [
-        {
-            "trigger": r["trigger"],
-            "response": r["response"],
-            "match_type": r["match_type"],
-            "ignore_case": r.get("ignore_case", True),
-        }
-        for r in await bot.db.autoresponders.get_all(guild.id)
-    ]
 
-    tags = [{"name": r["name"], "content": r["content"]} for r in await bot.db.tags.export_tags(guild.id)]
+async def _collect_sections(bot, guild) -> dict[str, object]:
+    """Read a guild's portable config into the backup section shape."""
+    return {
+        "config": await _collect_config(bot, guild),
+        "autoresponders": [_autoresponder_item(r) for r in await bot.db.autoresponders.get_all(guild.id)],
+        "tags": [_tag_item(r) for r in await bot.db.tags.export_tags(guild.id)],
+    }
+
 
-    return {"config": config_section, "autoresponders": autoresponders, "tags": tags}
+async def _stream_sections(
+    db: Database | ReadDatabase, guild_id: int, config_section: dict
+) -> AsyncIterator[tuple[str, object]]:
+    """Yield ``(section, item)`` records, reading the list sections through server-side cursors."""
+    yield "config", config_section
+    async with db.acquire() as connection, connection.transaction(isolation="repeatable_read", readonly=True):
+        async for record in db.autoresponders.iter_export(guild_id, connection=connection):
+            yield "autoresponders", _autoresponder_item(record)
+        async for record in db.tags.iter_export(guild_id, connection=connection):
+            yield "tags", _tag_item(record)
 
 
-async def _apply_config(bot, guild, section: object) -> dict:
+async def _apply_config(bot, guild, section: object, *, connection) -> dict:
     if not isinstance(section, dict):
         return {"applied": 0}
     gc = await bot.db.get_guild_config(guild.id)
     updates = _build_config_updates(section, gc)
     if updates:
-        await gc.update(**updates)
+        await gc.update(connection=connection, **updates)
     return {"applied": len(updates)}
 
 
-async def _apply_autoresponders(bot, guild, section: object) -> dict:
-    created = skipped = failed = 0
-    if not isinstance(section, list):
-        return {"created": 0, "skipped": 0, "failed": 0}
-    for item in section[:1000]:
-        if not isinstance(item, dict):
-            failed += 1
-            continue
-        trigger = (item.get("trigger") or "").strip()
-        response = (item.get("response") or "").strip()
-        if not trigger or not response:
-            failed += 1
-            continue
-        result = await bot.db.autoresponders.create(
-            guild.id, trigger, response,
-            match_type=item.get("match_type", "contains"),
-            ignore_case=bool(item.get("ignore_case", True)),
-            created_by=bot.user.id,
-        )
-        if result is None:  # duplicate trigger
-            skipped += 1
-        else:
-            created += 1
-    return {"created": created, "skipped": skipped, "failed": failed}
-
+async def _apply_autoresponders(bot, guild, section: object, *, connection) -> dict:
+    rows, failed = prepare_autoresponders(section)
+    created = await bot.db.autoresponders.restore_many(
+        guild.id, rows, created_by=bot.user.id, connection=connection,
+    )
+    # Duplicate triggers, existing or within the section, are skipped.
+    return {"created": created, "skipped": len(rows) - created, "failed": failed}
 
-async def _apply_tags(bot, guild, section: object) -> dict:
-    created = skipped = failed = 0
-    if not isinstance(section, list):
-        return {"created": 0, "skipped": 0, "failed": 0}
 
+async def _apply_tags(bot, guild, section: object, *, connection) -> dict:
     root = bot.get_command("tag")
-    reserved = set(root.all_commands) if root else set()
-    seen: set[str] = set()
-
-    for item in section[:1000]:
-        if not isinstance(item, dict):
-            failed += 1
-            continue
-        name = (item.get("name") or "").strip()
-        content = (item.get("content") or "").strip()
-        if not name or not content or len(name) > 100 or len(content) > 2000:
-            failed += 1
-            continue
-        lname = name.lower()
-        if lname.partition(" ")[0] in reserved or lname in seen:
-            skipped += 1
-            continue
-        seen.add(lname)
-        if await bot.db.tags.get_tag_record(name, location_id=guild.id) is not None:
-            skipped += 1
-            continue
-        try:
-            await bot.db.tags.create_tag(name, content, bot.user.id, guild.id)
-            created += 1
-        except Exception:
-            failed += 1
-    return {"created": created, "skipped": skipped, "failed": failed}
+    rows, skipped, failed = prepare_tags(section, set(root.all_commands) if root else set())
+    created, existing = await bot.db.tags.restore_many(guild.id, rows, owner_id=bot.user.id, connection=connection)
+    # Names taken by an existing tag are skipped; a name taken by an alias can't be created.
+    return {"created": created, "skipped": skipped + existing, "failed": failed + len(rows) - created - existing}
 
 
 async def _apply_sections(bot, guild, sections: dict[str, object]) -> dict:
-    """Apply selected sections to a guild, returning a per-section result report."""
-    report: dict[str, object] = {}
-    if "config" in sections:
-        report["config"] = await _apply_config(bot, guild, sections["config"])
-    if "autoresponders" in sections:
-        report["autoresponders"] = await _apply_autoresponders(bot, guild, sections["autoresponders"])
-    if "tags" in sections:
-        report["tags"] = await _apply_tags(bot, guild, sections["tags"])
-    return report
+    """Apply selected sections to a guild in one transaction, returning a per-section result report.
+
+    Each list section is staged with ``COPY`` and inserted set-based, so a restore costs a
+    few round trips instead of one per item and either applies completely or not at all.
+    """
+    report: dict[str, dict] = {}
+    async with bot.db.acquire() as connection, connection.transaction():
+        if "autoresponders" in sections:
+            report["autoresponders"] = await _apply_autoresponders(
+                bot, guild, sections["autoresponders"], connection=connection,
+            )
+        if "tags" in sections:
+            report["tags"] = await _apply_tags(bot, guild, sections["tags"], connection=connection)
+        # Last, since it refreshes the cached guild config in place.
+        if "config" in sections:
+            report["config"] = await _apply_config(bot, guild, sections["config"], connection=connection)
+
+    if "tags" in report and report["tags"]["created"]:
+        bot.db.tags.invalidate_cache("tags_changed", guild.id)
+    return {name: report[name] for name in PORTABLE_SECTIONS if name in report}
 
 
 # ---------------------------------------------------------------------------
@@ -208,6 +233,70 @@ async def import_backup(
     return {"ok": True, "dry_run": False, "applied": report}
 
 
+@stream_router.get("/backup/export/stream")
+async def export_backup_stream(
+    guild: GuildDep,
+    bot: BotDep,
+    db: ReadDBDep,
+    bridge: BridgeDep,
+    fmt: Literal["ndjson", "json"] = Query(default="ndjson", alias="format"),
+    gzip: bool = Query(default=False, description="Gzip the stream"),
+) -> StreamingResponse:
+    """Stream the guild's backup without building it in memory.
+
+    ``format=ndjson`` writes the envelope on the first line and one section item per line
+    (importable through ``/backup/import/stream``); ``format=json`` writes the same document
+    as ``/backup/export``. Tags and autoresponders are read through server-side cursors
+    from one consistent snapshot.
+    """
+    config_section = await bridge.call(_collect_config, bot, guild)
+    body = stream_backup(guild.id, _stream_sections(db, guild.id, config_section), fmt=fmt)
+    filename = f"percy-backup-{guild.id}.{fmt}"
+    media_type = NDJSON_MEDIA_TYPE if fmt == "ndjson" else "application/json"
+    if gzip:
+        body, filename, media_type = gzip_stream(body), f"{filename}.gz", "application/gzip"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@stream_router.post("/backup/import/stream")
+async def import_backup_stream(
+    request: Request,
+    guild: GuildDep,
+    bot: BotDep,
+    bridge: BridgeDep,
+    dry_run: bool = Query(default=True, description="Preview counts without writing"),
+    sections: list[str] | None = Query(default=None),
+) -> dict:
+    """Apply an NDJSON backup (optionally gzipped) uploaded as the raw request body.
+
+    The upload is validated line by line as it arrives and only what a restore applies is
+    kept, so its size doesn't bound memory. Otherwise identical to ``/backup/import``.
+    """
+    reader = BackupStreamReader(sections=sections)
+    try:
+        async for chunk in request.stream():
+            reader.feed(chunk)
+        reader.close()
+    except BackupStreamError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from None
+
+    if not reader.sections:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"no applicable sections; expected some of {list(PORTABLE_SECTIONS)}",
+        )
+
+    if dry_run:
+        return {"ok": True, "dry_run": True, "plan": dict(reader.counts)}
+
+    report = await bridge.call(_apply_sections, bot, guild, reader.sections)
+    return {"ok": True, "dry_run": False, "applied": report}
+
+
 # ---------------------------------------------------------------------------
 # Templates
 # ---------------------------------------------------------------------------
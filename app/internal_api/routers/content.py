@@ -12,8 +12,14 @@ from pydantic import BaseModel
 
 from ..dependencies import BotDep, GuildDep, verify_token
 from ..helpers import resolve_channel
-
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Content"], dependencies=[Depends(verify_token)])
+from ..isolation import GatewayRoute
+
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Content"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 
 # ---------------------------------------------------------------------------
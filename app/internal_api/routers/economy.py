@@ -12,8 +12,14 @@ from app.utils import fnumb, get_asset_url
 from config import Emojis
 
 from ..dependencies import BotDep, GuildDep, verify_token
+from ..isolation import GatewayRoute
 
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Economy"], dependencies=[Depends(verify_token)])
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Economy"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -168,7 +174,8 @@ async def get_economy_balances(
     limit: int = Query(default=25, le=100),
     offset: int = Query(default=0, ge=0),
 ) -> dict:
-    records = await bot.db.users.get_top_balance_records(guild.id, limit + offset)
+    records = await bot.db.users.get_balance_page(guild.id, limit=limit, offset=offset)
+    totals = await bot.db.users.get_balance_totals(guild.id)
     entries = []
     for r in records:
         member = guild.get_member(r['user_id'])
@@ -180,9 +187,7 @@ async def get_economy_balances(
             'bank': r['bank'],
             'total': r['total'],
         })
-    total = len(entries)
-    entries = entries[offset:offset + limit]
-    return {'entries': entries, 'total': total}
+    return {'entries': entries, 'total': totals['ranked']}
 
 
 @router.patch("/economy/balances/{user_id}")
@@ -16,11 +16,17 @@ import fastapi
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from ..dependencies import BotDep, GuildDep, verify_token
+from ..isolation import GatewayRoute
 
 if TYPE_CHECKING:
     from app.services.klappstuhl_me import KlappstuhlMeClient
 
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Gallery"], dependencies=[Depends(verify_token)])
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Gallery"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 
 def _client_or_503(bot) -> KlappstuhlMeClient:
@@ -9,13 +9,19 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
 import config
-from app.services import ModelTier, build_dashboard_assistant_system
+from app.services import ModelTier, build_dashboard_assistant_system, validate_retention_days
 from app.utils import truncate
 
 from ..dependencies import BotDep, GuildDep, verify_token
 from ..helpers import resolve_channel, resolve_entity, resolve_role
+from ..isolation import GatewayRoute
 
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Guilds"], dependencies=[Depends(verify_token)])
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Guilds"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -36,6 +42,8 @@ class PatchGuildConfigBody(BaseModel):
     mod_log_channel_id: int | None = None
     message_log_channel_id: int | None = None
     voice_log_channel_id: int | None = None
+    #: Days of message metadata to index for the members view and purge; ``null`` disables it.
+    message_index_days: int | None = None
     flags: dict[str, bool] | None = None
     prefixes: list[str] | None = None
 
@@ -160,7 +168,12 @@ def _build_config_updates(data: dict, guild_config) -> dict[str, object]:
     """Extract valid config updates from a flat dict (shared by PATCH and batch)."""
     updates: dict[str, object] = {}
     for key, value in data.items():
-        if key in _ALLOWED_CONFIG_FIELDS:
+        if key == "message_index_days":
+            try:
+                updates[key] = validate_retention_days(value)
+            except (TypeError, ValueError) as exc:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from None
+        elif key in _ALLOWED_CONFIG_FIELDS:
             updates[key] = value
         elif key == "flags" and isinstance(value, dict):
             new_flags = guild_config.flags.value
@@ -228,6 +241,7 @@ async def get_guild_config(guild: GuildDep, bot: BotDep) -> dict:
         "audit_log_flags": guild_config.audit_log_flags or {},
         "music_panel_channel": resolve_channel(guild, guild_config.music_panel_channel_id),
         "use_music_panel": guild_config.use_music_panel,
+        "message_index_days": getattr(guild_config, "message_index_days", None),
         "prefixes": list(guild_config.prefixes),
         "is_new_config": guild_config.flags.value == 0 and guild_config.audit_log_channel_id is None,
     }
@@ -6,8 +6,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
 from ..dependencies import BotDep, GuildDep, verify_token
+from ..isolation import GatewayRoute
 
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Leveling"], dependencies=[Depends(verify_token)])
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Leveling"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 # Milestone reward roles created by the dashboard "preset" button.
 # (level threshold, role name, RGB colour) — a cool-to-warm gradient up to 100.
@@ -10,20 +10,25 @@ import discord
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
+from app.services import plan_bulk_deletes
+
 from ..dependencies import BotDep, GuildDep, verify_token
 from ..helpers import validate_timeout_duration
+from ..isolation import GatewayRoute
 
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Members"], dependencies=[Depends(verify_token)])
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Members"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
-# Percy keeps no message archive (the gateway cache holds 10 messages), so both the message
-# viewer and the purge action read live channel history. The scan is bounded on both axes:
-# only the most recently active channels are visited, and only a slice of each is read.
+# Guilds that enabled the message index (``message_index_days``) answer the message viewer
+# and the purge action from it. Otherwise both read live channel history, bounded on both
+# axes: only the most recently active channels are visited, and only a slice of each is read.
 MAX_SCAN_CHANNELS = 20
 MAX_SCAN_CONCURRENCY = 5
 
-# Discord refuses to bulk-delete messages older than two weeks.
-BULK_DELETE_MAX_AGE = datetime.timedelta(days=14)
-
 ACTIONS = frozenset(
     {'kick', 'ban', 'unban', 'softban', 'warn', 'mute', 'unmute', 'timeout', 'untimeout', 'purge'}
 )
@@ -93,6 +98,15 @@ async def _scan_member_messages(
     return messages[:limit], len(targets)
 
 
+async def _indexed_member_messages(bot, guild: discord.Guild, user_id: int, *, limit: int) -> list | None:
+    """The member's newest ``limit`` rows from the message index, or ``None`` when the guild
+    has not enabled it."""
+    config = await bot.db.get_guild_config(guild.id)
+    if getattr(config, 'message_index_days', None) is None:
+        return None
+    return await bot.db.message_index.get_member_messages(guild.id, user_id, limit=limit)
+
+
 def _message_payload(message: discord.Message) -> dict:
     return {
         'id': str(message.id),
@@ -103,30 +117,52 @@ def _message_payload(message: discord.Message) -> dict:
         'edited_at': message.edited_at.isoformat() if message.edited_at else None,
         'jump_url': message.jump_url,
         'attachments': [a.url for a in message.attachments],
+        'attachment_count': len(message.attachments),
         'embed_count': len(message.embeds),
     }
 
 
-async def _purge_member_messages(guild: discord.Guild, user_id: int, limit: int, reason: str | None) -> int:
-    """Deletes up to ``limit`` of a member's recent messages. Returns how many were removed."""
-    messages, _ = await _scan_member_messages(guild, user_id, limit=limit)
-    cutoff = datetime.datetime.now(datetime.UTC) - BULK_DELETE_MAX_AGE
+def _indexed_message_payload(guild: discord.Guild, row) -> dict:
+    """Same shape as :func:`_message_payload`, from an index row: ``content`` is the stored
+    snippet and attachment urls are not kept (only their count)."""
+    channel = guild.get_channel_or_thread(row['channel_id'])
+    edited_at = row['edited_at']
+    return {
+        'id': str(row['id']),
+        'channel_id': str(row['channel_id']),
+        'channel_name': getattr(channel, 'name', 'unknown'),
+        'content': row['snippet'],
+        'created_at': row['created_at'].replace(tzinfo=datetime.UTC).isoformat(),
+        'edited_at': edited_at.replace(tzinfo=datetime.UTC).isoformat() if edited_at else None,
+        'jump_url': f'https://discord.com/channels/{guild.id}/{row["channel_id"]}/{row["id"]}',
+        'attachments': [],
+        'attachment_count': row['attachment_count'],
+        'embed_count': row['embed_count'],
+    }
 
-    by_channel: dict[int, list[discord.Message]] = {}
-    for message in messages:
-        if message.created_at > cutoff:
-            by_channel.setdefault(message.channel.id, []).append(message)
+
+async def _purge_member_messages(bot, guild: discord.Guild, user_id: int, limit: int, reason: str | None) -> int:
+    """Deletes up to ``limit`` of a member's recent messages. Returns how many were removed.
+
+    The message ids come from the message index when the guild enabled it, otherwise from a
+    history scan; either way they are bulk-deleted per channel by id.
+    """
+    rows = await _indexed_member_messages(bot, guild, user_id, limit=limit)
+    if rows is not None:
+        targets = [(row['channel_id'], row['id']) for row in rows]
+    else:
+        messages, _ = await _scan_member_messages(guild, user_id, limit=limit)
+        targets = [(message.channel.id, message.id) for message in messages]
 
     deleted = 0
-    for channel_id, batch in by_channel.items():
-        channel = guild.get_channel(channel_id)
+    plan = plan_bulk_deletes(targets, now=datetime.datetime.now(datetime.UTC))
+    for channel_id, chunks in plan.items():
+        channel = guild.get_channel_or_thread(channel_id)
         if channel is None or not channel.permissions_for(guild.me).manage_messages:
             continue
-        # delete_messages chunks internally but caps at 100 per call.
-        for start in range(0, len(batch), 100):
-            chunk = batch[start:start + 100]
+        for chunk in chunks:
             with suppress(discord.HTTPException):
-                await channel.delete_messages(chunk, reason=reason)
+                await channel.delete_messages([discord.Object(id=message_id) for message_id in chunk], reason=reason)
                 deleted += len(chunk)
     return deleted
 
@@ -506,7 +542,7 @@ async def member_action(
                     await member.send(f'\N{WARNING SIGN} You were warned in **{guild.name}**{note}')
             elif body.action == 'purge':
                 extra['deleted'] = await _purge_member_messages(
-                    guild, user_id, max(1, min(500, body.limit)), body.reason
+                    bot, guild, user_id, max(1, min(500, body.limit)), body.reason
                 )
         except discord.Forbidden:
             raise HTTPException(
@@ -527,19 +563,31 @@ async def member_action(
 async def get_member_messages(
     user_id: int,
     guild: GuildDep,
+    bot: BotDep,
     limit: int = Query(default=25, le=100),
     per_channel: int = Query(default=100, le=200),
 ) -> dict:
-    """A member's most recent messages, read live from channel history.
+    """A member's most recent messages.
 
-    Percy stores no message archive, so this is a bounded scan of the guild's most recently
-    active channels (see :data:`MAX_SCAN_CHANNELS`) rather than a complete history.
+    Served from the message index when the guild enabled it (``source: index``; complete
+    within the configured retention). Otherwise this is a bounded scan of the guild's most
+    recently active channels (see :data:`MAX_SCAN_CHANNELS`) rather than a complete history.
     """
+    rows = await _indexed_member_messages(bot, guild, user_id, limit=limit)
+    if rows is not None:
+        return {
+            'messages': [_indexed_message_payload(guild, row) for row in rows],
+            'scanned_channels': 0,
+            'partial': False,
+            'source': 'index',
+        }
+
     messages, scanned = await _scan_member_messages(guild, user_id, limit=limit, per_channel=per_channel)
     return {
         'messages': [_message_payload(m) for m in messages],
         'scanned_channels': scanned,
         'partial': len(guild.text_channels) > scanned,
+        'source': 'history',
     }
 
 
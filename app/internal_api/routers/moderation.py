@@ -9,6 +9,7 @@ from pydantic import BaseModel
 
 from ..dependencies import BotDep, GuildDep, verify_token
 from ..helpers import validate_timeout_duration
+from ..isolation import GatewayRoute
 
 if TYPE_CHECKING:
     import discord
@@ -16,7 +17,12 @@ if TYPE_CHECKING:
     from app.cogs.modlog.cog import ModLog
     from app.cogs.modlog.models import ModerationCase
 
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Moderation"], dependencies=[Depends(verify_token)])
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Moderation"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 BULK_ACTIONS = frozenset({'kick', 'ban', 'unban', 'softban', 'timeout', 'warn', 'add_roles', 'remove_roles'})
 # Actions refused when the target outranks Percy.
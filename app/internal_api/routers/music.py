@@ -10,11 +10,17 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
 from ..dependencies import BotDep, GuildDep, verify_token
+from ..isolation import GatewayRoute
 
 if TYPE_CHECKING:
     from app.core import Bot
 
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Music"], dependencies=[Depends(verify_token)])
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Music"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 # ---------------------------------------------------------------------------
 # Constants
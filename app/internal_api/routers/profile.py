@@ -7,8 +7,14 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from ..dependencies import BotDep, GuildDep, verify_token
-
-router = APIRouter(prefix="/guilds/{guild_id}", tags=["Profile"], dependencies=[Depends(verify_token)])
+from ..isolation import GatewayRoute
+
+router = APIRouter(
+    prefix="/guilds/{guild_id}",
+    tags=["Profile"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -7,11 +7,13 @@ from dataclasses import asdict
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
+from app.clients.base import BaseHTTPClient
 from config import get_full_version
 
 from ..dependencies import BotDep, GuildDep, verify_token
+from ..isolation import GatewayRoute
 
-router = APIRouter(tags=["Stats"], dependencies=[Depends(verify_token)])
+router = APIRouter(tags=["Stats"], dependencies=[Depends(verify_token)], route_class=GatewayRoute)
 
 
 # ---------------------------------------------------------------------------
@@ -162,7 +164,7 @@ async def get_guild_games(bot: BotDep, guild: GuildDep) -> dict:
 
 @router.get("/bot/stats")
 async def get_bot_stats(bot: BotDep) -> dict:
-    """Global bot statistics: guilds, users, latency, uptime, AI engine health."""
+    """Global bot statistics: guilds, users, latency, uptime, AI engine health, startup timings."""
     total_commands = await bot.db.stats.count_all_commands()
 
     # AI engine snapshot (probe is cached internally, so this stays cheap). Guarded in
@@ -181,15 +183,30 @@ async def get_bot_stats(bot: BotDep) -> dict:
         'latency_ms': round(bot.latency * 1000, 1),
         'uptime_seconds': (bot.uptime.total_seconds() if hasattr(bot, 'uptime') else 0),
         'ai': ai_health,
+        'startup': bot.startup.summary(),
     }
 
 
 @router.get("/bot/metrics")
 async def get_bot_metrics(bot: BotDep) -> dict:
-    """Command metrics and query tracker summaries."""
+    """Command metrics, query tracker summaries, internal API router metrics, track cache,
+    music session restore, HTTP client response cache, outbound connection pool and poker
+    equity stats."""
+    music = bot.get_cog('Music')
+    games = bot.get_cog('Games')
     return {
         'commands': bot.metrics.summary(),
         'queries': bot.db.query_tracker.summary(),
+        'internal_api': bot.internal_api.summary(),
+        'track_cache': music.track_cache.summary() if music is not None else None,
+        'music_restore': (
+            music.restore_progress.to_dict()
+            if music is not None and music.restore_progress is not None
+            else None
+        ),
+        'http_cache': BaseHTTPClient.cache_summaries(),
+        'http_pools': bot.http_pools.summary(),
+        'poker_equity': games.equity.summary() if games is not None else None,
     }
 
 
@@ -14,8 +14,14 @@ from pydantic import BaseModel
 from app.services import WEBHOOK_EVENTS, valid_events
 
 from ..dependencies import BotDep, GuildDep, verify_token
-
-router = APIRouter(prefix="/guilds/{guild_id}/webhooks", tags=["Webhooks (Outgoing)"], dependencies=[Depends(verify_token)])
+from ..isolation import GatewayRoute
+
+router = APIRouter(
+    prefix="/guilds/{guild_id}/webhooks",
+    tags=["Webhooks (Outgoing)"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -10,8 +10,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel
 
 from ..dependencies import BotDep, verify_token
-
-router = APIRouter(prefix="/users/{discord_id}", tags=["Users"], dependencies=[Depends(verify_token)])
+from ..isolation import GatewayRoute
+
+router = APIRouter(
+    prefix="/users/{discord_id}",
+    tags=["Users"],
+    dependencies=[Depends(verify_token)],
+    route_class=GatewayRoute,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -16,10 +16,11 @@ from fastapi import APIRouter, HTTPException, Request, status
 import config
 
 from ..dependencies import BotDep  # noqa: TC001 -- FastAPI evaluates handler param annotations at runtime
+from ..isolation import GatewayRoute
 
 log = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/webhooks", tags=["Webhooks"])
+router = APIRouter(prefix="/api/webhooks", tags=["Webhooks"], route_class=GatewayRoute)
 
 #: XP multiplier and window granted (or renewed) per vote.
 VOTE_MULTIPLIER = 1.10
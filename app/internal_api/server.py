@@ -3,19 +3,26 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import uvicorn
 from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
 
 import config
+from app.utils.metrics import RouterMetrics
+
+from .caching import INVALIDATING_SIGNALS, ResponseCache
+from .isolation import GatewayBridge, WorkerLoop
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from app.core import Bot
 
+    from .read_pool import ReadDatabase
+
 log = logging.getLogger(__name__)
 
 __all__ = ('InternalAPI',)
@@ -58,7 +65,7 @@ ERROR_RESPONSES: dict[int | str, dict[str, object]] = {
 }
 
 
-def _create_app(bot: Bot) -> FastAPI:
+def _create_app(bot: Bot, *, read_db: Any, route_metrics: RouterMetrics, response_cache: ResponseCache) -> FastAPI:
     app = FastAPI(
         title='Percy Internal API',
         description='Internal API for the Percy Discord bot, consumed by the klappstuhl.me BFF dashboard.',
@@ -67,6 +74,14 @@ def _create_app(bot: Bot) -> FastAPI:
         redoc_url=None,
     )
     app.state.bot = bot
+    app.state.bridge = GatewayBridge(bot.loop)
+    app.state.read_db = read_db
+    app.state.route_metrics = route_metrics
+    app.state.response_cache = response_cache
+
+    # Uncached responses are compressed here; cached ones arrive already encoded and are
+    # passed through untouched.
+    app.add_middleware(GZipMiddleware, minimum_size=response_cache.compress_min_size)
 
     @app.get('/docs', include_in_schema=False)
     async def scalar_docs() -> HTMLResponse:
@@ -93,22 +108,77 @@ def _create_app(bot: Bot) -> FastAPI:
 
 
 class InternalAPI:
-    """Manages the internal HTTP API server lifecycle."""
+    """Manages the internal HTTP API server lifecycle.
+
+    In ``inline`` mode (the default) uvicorn runs as a task on the bot's loop and handlers
+    read through ``bot.db``. In ``thread`` mode it runs on a :class:`WorkerLoop` with a
+    dedicated, size-capped :class:`ReadDatabase`; see :mod:`.isolation` for how handlers are
+    placed on either loop.
+    """
 
     __hidden__ = True
 
     def __init__(self, bot: Bot) -> None:
         self.bot: Bot = bot
+        self.mode: str = 'inline'
+        self.route_metrics: RouterMetrics = RouterMetrics()
+        self.response_cache: ResponseCache = ResponseCache(ttl=config.internal_api_cache_ttl)
         self._server: uvicorn.Server | None = None
-        self._task: asyncio.Task | None = None
+        self._task: asyncio.Task | asyncio.Future | None = None
+        self._worker: WorkerLoop | None = None
+        self._read_db: ReadDatabase | None = None
 
     async def start(self) -> None:
         if not config.internal_api_token:
             log.warning('Internal API disabled (INTERNAL_API_TOKEN not set)')
             return
 
-        app = _create_app(self.bot)
+        for signal in INVALIDATING_SIGNALS:
+            self.bot.db.signals.register(signal).connect(self.response_cache, None)
+
+        mode = config.internal_api_isolation
+        if mode not in ('inline', 'thread'):
+            log.warning('Unknown INTERNAL_API_ISOLATION %r; serving the internal API inline.', mode)
+
+        if mode != 'thread' or not await self._start_isolated():
+            app = _create_app(
+                self.bot, read_db=self.bot.db, route_metrics=self.route_metrics, response_cache=self.response_cache,
+            )
+            self._server = self._build_server(app)
+            self._task = asyncio.create_task(self._server.serve())
+
+        log.info('Internal API listening on %s:%d (%s)', config.internal_api_host, config.internal_api_port, self.mode)
+
+    async def _start_isolated(self) -> bool:
+        """Boots the worker loop, its read pool and the server on that loop.
+
+        Returns ``False`` (after tearing the worker down) when the read pool cannot connect,
+        so the caller falls back to serving inline.
+        """
+        from .read_pool import ReadDatabase
+
+        worker = WorkerLoop()
+        worker.start()
+
+        async def boot() -> ReadDatabase:
+            return await ReadDatabase(self.bot, max_size=config.internal_api_read_pool_size).wait()
+
+        read_db = await worker.submit(boot())
+        if read_db._internal_pool is None:
+            log.warning('Internal API read pool unavailable; falling back to inline mode.')
+            await worker.stop()
+            return False
+
+        app = _create_app(
+            self.bot, read_db=read_db, route_metrics=self.route_metrics, response_cache=self.response_cache,
+        )
+        self._worker, self._read_db, self._server = worker, read_db, self._build_server(app)
+        self._task = worker.submit(self._server.serve())
+        self.mode = 'thread'
+        return True
 
+    @staticmethod
+    def _build_server(app: FastAPI) -> uvicorn.Server:
         uv_config = uvicorn.Config(
             app,
             host=config.internal_api_host,
@@ -116,12 +186,34 @@ class InternalAPI:
             log_level='warning',
             access_log=False,
         )
-        self._server = uvicorn.Server(uv_config)
-        self._task = asyncio.create_task(self._server.serve())
-        log.info('Internal API listening on %s:%d', config.internal_api_host, config.internal_api_port)
+        return uvicorn.Server(uv_config)
+
+    def summary(self) -> dict[str, Any]:
+        """Serving mode, per-router queue/latency metrics, response cache hit ratios and the read pool's state."""
+        read_db = self._read_db
+        read_pool = None
+        if read_db is not None and read_db._internal_pool is not None:
+            stats = read_db.pool_stats()
+            read_pool = {
+                'size': stats.size,
+                'in_use': stats.in_use,
+                'max_size': stats.max_size,
+                'waiting': stats.waiting,
+                'queries': read_db.query_tracker.summary(),
+            }
+        return {
+            'mode': self.mode,
+            'routers': self.route_metrics.summary(),
+            'response_cache': self.response_cache.summary(),
+            'read_pool': read_pool,
+        }
 
     async def stop(self) -> None:
         if self._server is not None:
             self._server.should_exit = True
         if self._task is not None:
             await self._task
+        if self._worker is not None:
+            if self._read_db is not None:
+                await self._worker.submit(self._read_db.close())
+            await self._worker.stop()
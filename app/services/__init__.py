@@ -46,9 +46,17 @@ from app.services.analytics import (
 from app.services.backup import (
     BACKUP_KIND,
     BACKUP_VERSION,
+    MAX_SECTION_ITEMS,
+    NDJSON_MEDIA_TYPE,
     PORTABLE_SECTIONS,
+    BackupStreamError,
+    BackupStreamReader,
     build_backup,
+    gzip_stream,
+    prepare_autoresponders,
+    prepare_tags,
     select_sections,
+    stream_backup,
     summarize_sections,
     validate_backup,
 )
@@ -56,6 +64,7 @@ from app.services.bot_health import (
     BotHealthReport,
     ConnectionState,
     HealthLevel,
+    HTTPClientState,
     LavalinkMetrics,
     assess_bot_health,
     parse_lavalink_metrics,
@@ -89,8 +98,24 @@ from app.services.economy import (
 )
 from app.services.gateway_stats import GatewayTraffic, summarize_gateway_traffic
 from app.services.lyrics import LyricLine, LyricsResult, SyncedLyrics, clean_track_title, parse_lrc
+from app.services.message_index import (
+    MESSAGE_INDEX_MAX_DAYS,
+    SNIPPET_LENGTH,
+    make_snippet,
+    naive_utc,
+    validate_retention_days,
+)
+from app.services.music_sessions import (
+    POSITION_DRIFT_MS,
+    SessionState,
+    SessionTracker,
+    SessionWrite,
+    compact_track,
+    session_track_uris,
+)
+from app.services.playlist_loader import PLAYLIST_RESOLVE_CONCURRENCY, resolve_ordered
 from app.services.presence_stats import PRESENCE_STATUSES, PresenceBreakdown, summarize_presence
-from app.services.purge import PurgeMessage, PurgePlan, build_purge_predicate
+from app.services.purge import BULK_DELETE_MAX_AGE, PurgeMessage, PurgePlan, build_purge_predicate, plan_bulk_deletes
 from app.services.recurrence import (
     RecurrenceResult,
     advance_recurrence,
@@ -99,7 +124,18 @@ from app.services.recurrence import (
     next_occurrence,
     normalize_interval,
 )
+from app.services.session_restore import RestoreProgress, RestoreScheduler
 from app.services.spam_penalty import compute_spam_penalty
+from app.services.tag_cache import HotTagCache, TagUseBuffer
+from app.services.tag_index import AUTOCOMPLETE_LIMIT, TagName, TagNameIndex, TagNames, TagNameSearch
+from app.services.track_cache import (
+    TRACKING_QUERY_PARAMS,
+    TrackCacheStats,
+    TrackResolutionCache,
+    TrackStore,
+    is_cacheable_result,
+    track_cache_key,
+)
 from app.services.webhooks import (
     SIGNATURE_HEADER,
     WEBHOOK_EVENTS,
@@ -111,22 +147,33 @@ from app.services.webhooks import (
 
 __all__ = (
     'ASSISTANT_SYSTEM',
+    'AUTOCOMPLETE_LIMIT',
     'BACKUP_KIND',
     'BACKUP_VERSION',
+    'BULK_DELETE_MAX_AGE',
     'DASHBOARD_SECTIONS',
     'GRANULARITIES',
     'MAX_CHARACTERS',
+    'MAX_SECTION_ITEMS',
+    'MESSAGE_INDEX_MAX_DAYS',
     'METRICS',
     'MODERATION_CATEGORIES',
     'MUSIC_FILTERS',
+    'NDJSON_MEDIA_TYPE',
     'PERCY_IDENTITY',
+    'PLAYLIST_RESOLVE_CONCURRENCY',
     'PORTABLE_SECTIONS',
+    'POSITION_DRIFT_MS',
     'PRESENCE_STATUSES',
     'RANGES',
     'SIGNATURE_HEADER',
+    'SNIPPET_LENGTH',
+    'TRACKING_QUERY_PARAMS',
     'WEBHOOK_EVENTS',
     'AIHealthReport',
     'AIService',
+    'BackupStreamError',
+    'BackupStreamReader',
     'BotHealthReport',
     'CharInfo',
     'CodeStats',
@@ -137,7 +184,9 @@ __all__ = (
     'EventExtractor',
     'GatewayTraffic',
     'GiveawayRequest',
+    'HTTPClientState',
     'HealthLevel',
+    'HotTagCache',
     'LavalinkMetrics',
     'LyricLine',
     'LyricsResult',
@@ -155,13 +204,26 @@ __all__ = (
     'PurgePlan',
     'Quest',
     'RecurrenceResult',
+    'RestoreProgress',
+    'RestoreScheduler',
     'RouteCommand',
     'RouteDecision',
     'SchemaError',
+    'SessionState',
+    'SessionTracker',
+    'SessionWrite',
     'ShiftResult',
     'SyncedLyrics',
     'TagFinder',
     'TagMatch',
+    'TagName',
+    'TagNameIndex',
+    'TagNameSearch',
+    'TagNames',
+    'TagUseBuffer',
+    'TrackCacheStats',
+    'TrackResolutionCache',
+    'TrackStore',
     'advance_recurrence',
     'assess_bot_health',
     'boost_multiplier',
@@ -173,6 +235,7 @@ __all__ = (
     'build_route_system_prompt',
     'build_tag_find_prompt',
     'clean_track_title',
+    'compact_track',
     'compute_daily',
     'compute_periodic',
     'compute_pet_claim',
@@ -189,27 +252,39 @@ __all__ = (
     'get_char_info',
     'get_job',
     'get_species',
+    'gzip_stream',
     'interval_too_short',
+    'is_cacheable_result',
     'json_instruction',
+    'make_snippet',
+    'naive_utc',
     'next_occurrence',
     'normalize_interval',
     'parse_lavalink_metrics',
     'parse_lrc',
     'pick_search_options',
+    'plan_bulk_deletes',
+    'prepare_autoresponders',
+    'prepare_tags',
     'prestige_multiplier',
     'prestige_requirement',
     'resolve_granularity',
+    'resolve_ordered',
     'resolve_range',
     'resolve_search',
     'roll_lootbox',
     'select_sections',
     'sell_price',
     'serialize_envelope',
+    'session_track_uris',
     'sign_body',
+    'stream_backup',
     'summarize_gateway_traffic',
     'summarize_presence',
     'summarize_sections',
+    'track_cache_key',
     'valid_events',
     'validate_backup',
     'validate_item_effect',
+    'validate_retention_days',
 )
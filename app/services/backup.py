@@ -5,17 +5,37 @@ owns the envelope shape and validation only; the actual data collection (reading
 and restore (writing repos, resolving channel/role IDs against the target guild) live in
 the ``backup`` internal-API router, which needs the bot and guild objects. Everything here
 is Discord-free and unit-testable.
+
+Large guilds can also be exported as a *stream*: NDJSON (the envelope with empty
+``sections`` on the first line, then one ``{"section": ..., "item": ...}`` record per line)
+or the regular JSON document written piece by piece, either optionally gzipped. A
+:class:`BackupStreamReader` validates an NDJSON stream line by line on import and keeps only
+what a restore applies, so a backup's size no longer bounds the memory an import needs.
 """
 from __future__ import annotations
 
+import json
+import zlib
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Collection
 
 __all__ = (
     'BACKUP_KIND',
     'BACKUP_VERSION',
+    'MAX_SECTION_ITEMS',
+    'NDJSON_MEDIA_TYPE',
     'PORTABLE_SECTIONS',
+    'BackupStreamError',
+    'BackupStreamReader',
     'build_backup',
+    'gzip_stream',
+    'prepare_autoresponders',
+    'prepare_tags',
     'select_sections',
+    'stream_backup',
     'summarize_sections',
     'validate_backup',
 )
@@ -37,6 +57,23 @@ PORTABLE_SECTIONS: tuple[str, ...] = (
     'tags',
 )
 
+#: Items restored per list-shaped section; anything past this is ignored.
+MAX_SECTION_ITEMS = 1000
+
+#: Sections holding a single object rather than a list of items.
+_OBJECT_SECTIONS: frozenset[str] = frozenset({'config'})
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+#: Streamed output is flushed in chunks of about this many bytes.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+#: Longest NDJSON line a reader accepts; a tag is at most a few KiB.
+MAX_STREAM_LINE = 1024 * 1024
+
+#: Most (decompressed) bytes a reader accepts, so a small gzip upload can't expand without bound.
+MAX_STREAM_SIZE = 64 * 1024 * 1024
+
 
 def build_backup(guild_id: int, sections: dict[str, object]) -> dict:
     """Wrap collected section data in the versioned backup envelope.
@@ -97,3 +134,270 @@ def summarize_sections(sections: dict[str, object]) -> dict[str, int]:
         else:
             summary[name] = 0
     return summary
+
+
+def prepare_autoresponders(section: object) -> tuple[list[tuple[int, str, str, str, bool]], int]:
+    """Validate an ``autoresponders`` section into rows for the bulk restore.
+
+    Returns ``(rows, failed)``: one ``(ord, trigger, response, match_type, ignore_case)`` row
+    per usable item, in section order, and the number of malformed items. Duplicate
+    triggers are left to the database, which skips them like a single create would.
+    """
+    rows: list[tuple[int, str, str, str, bool]] = []
+    failed = 0
+    if not isinstance(section, list):
+        return rows, failed
+    for item in section[:MAX_SECTION_ITEMS]:
+        if not isinstance(item, dict):
+            failed += 1
+            continue
+        trigger = item.get('trigger')
+        response = item.get('response')
+        match_type = item.get('match_type', 'contains')
+        if not isinstance(trigger, str) or not isinstance(response, str) or not isinstance(match_type, str):
+            failed += 1
+            continue
+        trigger, response = trigger.strip(), response.strip()
+        if not trigger or not response:
+            failed += 1
+            continue
+        rows.append((len(rows), trigger, response, match_type, bool(item.get('ignore_case', True))))
+    return rows, failed
+
+
+def prepare_tags(section: object, reserved: Collection[str]) -> tuple[list[tuple[int, str, str]], int, int]:
+    """Validate a ``tags`` section into rows for the bulk restore.
+
+    Returns ``(rows, skipped, failed)``: one ``(ord, name, content)`` row per usable tag, in
+    section order; the number skipped because the name is a ``tag`` subcommand in
+    ``reserved`` or repeats an earlier tag case-insensitively; and the number malformed
+    (blank, or over the 100/2000 character limits).
+    """
+    rows: list[tuple[int, str, str]] = []
+    skipped = failed = 0
+    if not isinstance(section, list):
+        return rows, skipped, failed
+    seen: set[str] = set()
+    for item in section[:MAX_SECTION_ITEMS]:
+        if not isinstance(item, dict):
+            failed += 1
+            continue
+        name = item.get('name')
+        content = item.get('content')
+        if not isinstance(name, str) or not isinstance(content, str):
+            failed += 1
+            continue
+        name, content = name.strip(), content.strip()
+        if not name or not content or len(name) > 100 or len(content) > 2000:
+            failed += 1
+            continue
+        lname = name.lower()
+        if lname.partition(' ')[0] in reserved or lname in seen:
+            skipped += 1
+            continue
+        seen.add(lname)
+        rows.append((len(rows), name, content))
+    return rows, skipped, failed
+
+
+# -- streaming -------------------------------------------------------------------
+
+
+def _dumps(value: object) -> str:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+async def stream_backup(
+    guild_id: int,
+    records: AsyncIterable[tuple[str, object]],
+    *,
+    fmt: Literal['ndjson', 'json'] = 'ndjson',
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Encode ``(section, item)`` records into a streamed backup, in chunks of ``chunk_size`` bytes.
+
+    ``records`` must be grouped by section, in :data:`PORTABLE_SECTIONS` order; records of
+    other sections are dropped. ``json`` writes the same document :func:`build_backup`
+    returns, with ``[]`` for a list section that had no records; ``ndjson`` writes the
+    line-delimited form a :class:`BackupStreamReader` reads.
+    """
+    header = build_backup(guild_id, {})
+    if fmt == 'ndjson':
+        buffer = [_dumps(header) + '\n']
+    else:
+        del header['sections']
+        buffer = [_dumps(header)[:-1] + ',"sections":{']
+    size = 0
+    current: str | None = None
+    first = True
+    unopened = list(PORTABLE_SECTIONS)
+    written = 0
+    in_list = False
+
+    def open_section(section: str | None) -> str:
+        # Closes the open section, then writes the keys up to ``section`` (all that are left for None).
+        nonlocal first, written, in_list
+        parts = [']'] if in_list else []
+        in_list = False
+        while unopened:
+            name = unopened.pop(0)
+            if name != section and name in _OBJECT_SECTIONS:
+                continue
+            parts.append((',' if written else '') + _dumps(name) + ':')
+            written += 1
+            if name != section:
+                parts.append('[]')
+                continue
+            if name not in _OBJECT_SECTIONS:
+                parts.append('[')
+                in_list = True
+            first = True
+            break
+        return ''.join(parts)
+
+    async for section, item in records:
+        if section not in PORTABLE_SECTIONS:
+            continue
+        if fmt == 'ndjson':
+            part = _dumps({'section': section, 'item': item}) + '\n'
+        else:
+            part = ''
+            if section != current:
+                part, current = open_section(section), section
+            part += ('' if first else ',') + _dumps(item)
+            first = False
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield ''.join(buffer).encode()
+            buffer.clear()
+            size = 0
+
+    if fmt == 'json':
+        buffer.append(open_section(None) + '}}')
+    if buffer:
+        yield ''.join(buffer).encode()
+
+
+async def gzip_stream(chunks: AsyncIterable[bytes], *, level: int = 6) -> AsyncIterator[bytes]:
+    """Gzip a byte stream on the fly."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
+
+
+class BackupStreamError(ValueError):
+    """Raised by :class:`BackupStreamReader` for a stream that isn't a valid NDJSON backup."""
+
+
+class BackupStreamReader:
+    """Incrementally decodes and validates an NDJSON backup, gzipped or not.
+
+    Feed it the upload chunk by chunk. The first line is checked with :func:`validate_backup`
+    as soon as it is complete, and every following record as it arrives, so a bad upload is
+    rejected without reading the rest. Only the selected sections are kept, and of a list
+    section only the first ``max_items`` entries (all a restore applies); :attr:`counts`
+    still reports every item seen, for a dry-run plan. Gzip input is inflated a chunk at a
+    time, and the decoded stream may not exceed ``max_size`` bytes.
+
+    Raises :class:`BackupStreamError` from :meth:`feed` or :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        *,
+        sections: Collection[str] | None = None,
+        max_items: int = MAX_SECTION_ITEMS,
+        max_line: int = MAX_STREAM_LINE,
+        max_size: int = MAX_STREAM_SIZE,
+    ) -> None:
+        self.wanted: frozenset[str] = frozenset(
+            PORTABLE_SECTIONS if sections is None else (s for s in sections if s in PORTABLE_SECTIONS)
+        )
+        self.max_items: int = max_items
+        self.max_line: int = max_line
+        self.max_size: int = max_size
+        self.size: int = 0
+        self.header: dict | None = None
+        self.sections: dict[str, object] = {}
+        self.counts: dict[str, int] = {}
+        self.lines: int = 0
+        self._buffer: bytes = b''
+        self._decompressor: zlib._Decompress | None = None
+        self._started: bool = False
+
+    def feed(self, chunk: bytes) -> None:
+        if not self._started:
+            if not chunk:
+                return
+            self._started = True
+            if chunk[:2] == b'\x1f\x8b':
+                self._decompressor = zlib.decompressobj(31)
+        if self._decompressor is None:
+            self._consume(chunk)
+            return
+        # Inflate at most a chunk's worth at a time, feeding the rest back in from the tail.
+        while chunk:
+            try:
+                data = self._decompressor.decompress(chunk, STREAM_CHUNK_SIZE)
+            except zlib.error as exc:
+                raise BackupStreamError(f'corrupt gzip stream: {exc}') from None
+            chunk = self._decompressor.unconsumed_tail
+            self._consume(data)
+
+    def _consume(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.size > self.max_size:
+            raise BackupStreamError(f'backup is larger than {self.max_size} bytes')
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b'\n')
+        for line in lines:
+            self._line(line)
+        if len(self._buffer) > self.max_line:
+            raise BackupStreamError(f'line {self.lines + 1} is longer than {self.max_line} bytes')
+
+    def close(self) -> dict:
+        """Finish the stream and return the equivalent backup blob, holding the kept sections."""
+        if self._decompressor is not None:
+            if not self._decompressor.eof:
+                raise BackupStreamError('truncated gzip stream')
+            self._consume(self._decompressor.flush())
+        if self._buffer.strip():
+            self._line(self._buffer)
+        self._buffer = b''
+        if self.header is None:
+            raise BackupStreamError('empty backup stream')
+        return {**self.header, 'sections': self.sections}
+
+    def _line(self, raw: bytes) -> None:
+        self.lines += 1
+        if not raw.strip():
+            return
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            raise BackupStreamError(f'line {self.lines} is not valid JSON') from None
+
+        if self.header is None:
+            ok, error = validate_backup(record)
+            if not ok:
+                raise BackupStreamError(error or 'invalid backup header')
+            self.header = record
+            return
+
+        if not isinstance(record, dict) or not isinstance(record.get('section'), str) or 'item' not in record:
+            raise BackupStreamError(f'line {self.lines} is not a {{"section", "item"}} record')
+        section = record['section']
+        if section not in self.wanted:
+            return
+        self.counts[section] = self.counts.get(section, 0) + 1
+        if section in _OBJECT_SECTIONS:
+            self.sections[section] = record['item']
+            return
+        items = self.sections.setdefault(section, [])
+        if not isinstance(items, list):
+            raise BackupStreamError(f'line {self.lines}: section {section!r} must hold a list of items')
+        if len(items) < self.max_items:
+            items.append(record['item'])
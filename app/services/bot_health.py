@@ -12,10 +12,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 __all__ = (
     "BotHealthReport",
     "ConnectionState",
+    "HTTPClientState",
     "HealthLevel",
     "LavalinkMetrics",
     "assess_bot_health",
@@ -49,6 +54,32 @@ class ConnectionState:
         return self.in_use or self.generation != current_generation
 
 
+@dataclass(slots=True)
+class HTTPClientState:
+    """One outbound API client's circuit breaker and concurrency cap state."""
+
+    name: str
+    breaker_open: bool
+    in_flight: int
+    waiting: int
+    max_concurrency: int
+    wait_avg_ms: float
+    wait_max_ms: float
+
+    @property
+    def saturated(self) -> bool:
+        """Requests are queueing behind the client's concurrency cap."""
+        return self.waiting > 0
+
+    def describe(self) -> str:
+        cap = self.max_concurrency or "∞"
+        breaker = "OPEN" if self.breaker_open else "closed"
+        return (
+            f"{self.name}: breaker {breaker} | {self.in_flight}/{cap} in flight, {self.waiting} waiting"
+            f" | wait avg {self.wait_avg_ms:.1f}ms, max {self.wait_max_ms:.1f}ms"
+        )
+
+
 @dataclass(slots=True)
 class BotHealthReport:
     """Derived health metrics for the ``bothealth`` report."""
@@ -56,6 +87,7 @@ class BotHealthReport:
     questionable_connections: int
     warnings: int
     level: HealthLevel
+    open_breakers: int = 0
 
 
 def assess_bot_health(
@@ -66,14 +98,16 @@ def assess_bot_health(
     command_waiters: int,
     has_failed_inner_tasks: bool,
     global_rate_limit: bool,
+    http_clients: Sequence[HTTPClientState] = (),
 ) -> BotHealthReport:
     """Aggregate raw runtime observations into a health verdict.
 
-    Mirrors the original cog logic exactly: each questionable connection counts as one
+    Mirrors the original cog logic: each questionable connection counts as one
     warning; active spammers, any failed inner task, and a backed-up command queue
-    (>= 8 waiters) each add one more. The level is UNHEALTHY when a global rate limit is
-    active or warnings reach 9, WARNING when spammers or a backed-up command queue are
-    present, and HEALTHY otherwise.
+    (>= 8 waiters) each add one more, as does every API client with an open circuit
+    breaker. The level is UNHEALTHY when a global rate limit is active or warnings reach
+    9, WARNING when spammers, a backed-up command queue or an open breaker are present,
+    and HEALTHY otherwise.
     """
     questionable = sum(1 for c in connections if c.is_questionable(current_generation))
 
@@ -85,15 +119,19 @@ def assess_bot_health(
     backed_up_commands = command_waiters >= COMMAND_WAITER_WARNING_THRESHOLD
     if backed_up_commands:
         warnings += 1
+    open_breakers = sum(1 for client in http_clients if client.breaker_open)
+    warnings += open_breakers
 
     if global_rate_limit or warnings >= UNHEALTHY_WARNING_THRESHOLD:
         level = HealthLevel.UNHEALTHY
-    elif is_being_spammed or backed_up_commands:
+    elif is_being_spammed or backed_up_commands or open_breakers:
         level = HealthLevel.WARNING
     else:
         level = HealthLevel.HEALTHY
 
-    return BotHealthReport(questionable_connections=questionable, warnings=warnings, level=level)
+    return BotHealthReport(
+        questionable_connections=questionable, warnings=warnings, level=level, open_breakers=open_breakers
+    )
 
 
 # -- Lavalink Prometheus metrics ------------------------------------------------
@@ -0,0 +1,55 @@
+"""Row shaping for the opt-in per-guild message metadata index.
+
+The message index cog records one row per message in guilds that opted in (see
+``migrations/V38__message_index.sql``). What goes into a row -- a whitespace-collapsed,
+length-capped snippet rather than the full content -- and which retention values a guild
+may pick are plain rules, so they live here free of Discord and are unit-testable.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+__all__ = (
+    "MESSAGE_INDEX_MAX_DAYS",
+    "SNIPPET_LENGTH",
+    "make_snippet",
+    "naive_utc",
+    "validate_retention_days",
+)
+
+#: Characters of content kept per indexed message. The index answers "which messages", not
+#: "what was said"; the full content stays on Discord.
+SNIPPET_LENGTH = 200
+
+#: Longest retention a guild can configure. Purging relies on bulk deletes, which Discord
+#: refuses past 14 days, so anything much longer only serves the message viewer.
+MESSAGE_INDEX_MAX_DAYS = 90
+
+
+def make_snippet(content: str, *, length: int = SNIPPET_LENGTH) -> str:
+    """Collapse whitespace and cap ``content`` at ``length`` characters (with an ellipsis)."""
+    collapsed = " ".join(content.split())
+    if len(collapsed) <= length:
+        return collapsed
+    return collapsed[: length - 1] + "…"
+
+
+def validate_retention_days(days: int | None) -> int | None:
+    """Return ``days`` if it is a valid retention (``None`` disables the index).
+
+    Raises
+    ------
+    ValueError
+        If ``days`` is outside ``1..MESSAGE_INDEX_MAX_DAYS``.
+    """
+    if days is None:
+        return None
+    if not 1 <= days <= MESSAGE_INDEX_MAX_DAYS:
+        raise ValueError(f"message index retention must be between 1 and {MESSAGE_INDEX_MAX_DAYS} days")
+    return days
+
+
+def naive_utc(dt: datetime.datetime) -> datetime.datetime:
+    """Strip the tzinfo of an aware UTC datetime for a ``TIMESTAMP`` column."""
+    return dt.astimezone(datetime.UTC).replace(tzinfo=None) if dt.tzinfo else dt
@@ -0,0 +1,202 @@
+"""Change tracking for persisted music sessions.
+
+Every connected player used to upsert its whole ``music_sessions`` row every 20 seconds,
+re-serialising the entire queue even when nothing had changed. A :class:`SessionTracker`
+remembers what was last written for one player and turns the live state into the smallest
+:class:`SessionWrite` that brings the row up to date, or ``None`` when it already is:
+
+- settings (volume, pause, loop/shuffle/autoplay, 24/7, filters, now playing) are compared
+  as one :class:`SessionState`;
+- the playback position only counts once it drifted ``position_drift`` ms from where the
+  saved one would be now: while playing, it is expected to have moved on by the time since;
+- the queue is compared by track identity. The usual changes — tracks played off the front,
+  tracks added to the back — become "drop ``n``, append these" instead of a full rewrite.
+
+Queued tracks are stored compactly as ``[uri, title, requester_id]`` arrays
+(:func:`compact_track`); :func:`session_track_uris` also reads the older object form.
+Pure and Discord-free: the player supplies the state and the cog batches the writes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Sequence
+
+__all__ = (
+    "POSITION_DRIFT_MS",
+    "SessionState",
+    "SessionTracker",
+    "SessionWrite",
+    "compact_track",
+    "session_track_uris",
+)
+
+#: How far (ms) the playback position may move from the persisted one before it is rewritten.
+POSITION_DRIFT_MS: int = 30_000
+
+
+def compact_track(uri: str | None, title: str | None, requester_id: int | None) -> list[Any]:
+    """The stored form of a queued track."""
+    return [uri, title, requester_id]
+
+
+def session_track_uris(tracks: Iterable[Any] | None) -> list[str]:
+    """The URIs of stored queue entries, compact (``[uri, ...]``) or legacy (``{"uri": ...}``)."""
+    uris: list[str] = []
+    for entry in tracks or ():
+        uri = entry.get("uri") if isinstance(entry, dict) else (entry[0] if entry else None)
+        if uri:
+            uris.append(uri)
+    return uris
+
+
+@dataclass(frozen=True, slots=True)
+class SessionState:
+    """Every ``music_sessions`` column except the position and the queue."""
+
+    guild_id: int
+    voice_channel_id: int
+    text_channel_id: int | None
+    panel_message_id: int | None
+    volume: int
+    paused: bool
+    queue_mode: int
+    shuffle: bool
+    autoplay: int
+    always_on: bool
+    always_on_mode: str | None
+    always_on_source: str | None
+    current_uri: str | None
+    #: The active filters as canonical JSON, ``None`` when none are set.
+    filters: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class SessionWrite:
+    """One row's worth of changes.
+
+    With ``drop`` set to ``None``, ``tracks`` is the whole queue; otherwise the first
+    ``drop`` stored entries are removed and ``tracks`` is appended to what is left.
+    """
+
+    state: SessionState
+    position: int
+    tracks: list[list[Any]]
+    drop: int | None
+    keys: tuple[Hashable, ...]
+    #: The queued tracks ``keys`` were taken from. Held while persisted, so that with the
+    #: default ``key=id`` a freed track's id can't be reused by a new one and mistaken for it.
+    queue: tuple[Any, ...] = ()
+    #: Whether ``position`` advances in real time, and the tracker's clock when it was taken.
+    playing: bool = False
+    taken_at: float = 0.0
+
+    @property
+    def guild_id(self) -> int:
+        return self.state.guild_id
+
+    @property
+    def is_full(self) -> bool:
+        return self.drop is None
+
+
+class SessionTracker:
+    """What was last persisted for one player, and what changed since.
+
+    Writes for the same player must not overlap (an incremental write is relative to the
+    previous one), so callers hold :attr:`lock` from :meth:`diff` until :meth:`commit`.
+    """
+
+    __slots__ = ("_keys", "_playing", "_position", "_queue", "_state", "_taken_at", "clock", "lock", "position_drift")
+
+    def __init__(self, *, position_drift: int = POSITION_DRIFT_MS, clock: Callable[[], float] = time.monotonic) -> None:
+        self.position_drift: int = position_drift
+        self.clock: Callable[[], float] = clock
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self._state: SessionState | None = None
+        self._position: int = 0
+        self._playing: bool = False
+        self._taken_at: float = 0.0
+        self._keys: tuple[Hashable, ...] | None = None
+        self._queue: tuple[Any, ...] = ()
+
+    @property
+    def persisted(self) -> bool:
+        """Whether anything was written yet (the first write is always a full one)."""
+        return self._keys is not None
+
+    def reset(self) -> None:
+        """Forgets the persisted state so the next :meth:`diff` is a full write."""
+        self._state = None
+        self._position = 0
+        self._playing = False
+        self._keys = None
+        self._queue = ()
+
+    def diff[T](
+        self,
+        state: SessionState,
+        position: int,
+        queue: Sequence[T],
+        encode: Callable[[T], list[Any]],
+        *,
+        key: Callable[[T], Hashable] = id,
+        playing: bool = False,
+        force: bool = False,
+    ) -> SessionWrite | None:
+        """The write that persists ``state``, ``position`` and ``queue``, or ``None`` if nothing changed.
+
+        ``playing`` says whether ``position`` advances in real time (a track is playing, not
+        paused, and seekable). ``encode`` is only called for tracks that actually have to be
+        written.
+        """
+        now = self.clock()
+        pinned = tuple(queue)
+        keys = tuple(key(track) for track in pinned)
+        old = self._keys
+        if old is None:
+            tracks = [encode(track) for track in queue]
+            return SessionWrite(state, position, tracks, None, keys, pinned, playing, now)
+
+        expected = self._position
+        if self._playing:
+            expected += int((now - self._taken_at) * 1000)
+        drop = self._shift(old, keys)
+        changed = (
+            force
+            or keys != old
+            or state != self._state
+            or abs(position - expected) >= self.position_drift
+        )
+        if not changed:
+            return None
+        if drop is None:
+            tracks = [encode(track) for track in queue]
+            return SessionWrite(state, position, tracks, None, keys, pinned, playing, now)
+        kept = len(old) - drop
+        return SessionWrite(state, position, [encode(track) for track in queue[kept:]], drop, keys, pinned, playing, now)
+
+    @staticmethod
+    def _shift(old: tuple[Hashable, ...], new: tuple[Hashable, ...]) -> int | None:
+        """How many entries were dropped from the front of ``old`` for ``new`` to continue the rest
+        of it, or ``None`` if the queue was reordered in between."""
+        if not old or not new:
+            return len(old)
+        for drop, key in enumerate(old):
+            if key == new[0] and old[drop:] == new[: len(old) - drop]:
+                return drop
+        return None
+
+    def commit(self, write: SessionWrite) -> None:
+        """Records ``write`` as persisted."""
+        self._state = write.state
+        self._position = write.position
+        self._playing = write.playing
+        self._taken_at = write.taken_at
+        self._keys = write.keys
+        self._queue = write.queue
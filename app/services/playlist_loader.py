@@ -0,0 +1,63 @@
+"""Ordered, bounded-concurrency resolution for saved playlists.
+
+Loading a saved playlist used to search Lavalink for every track one after another before
+anything was queued, so a long 24/7 playlist kept the player silent for minutes.
+:func:`resolve_ordered` resolves a window of up to ``concurrency`` items at once and hands
+results back in their original order as soon as each one (and everything before it) is
+ready, so the caller can start playback on the first track while the rest stream in.
+
+Pure and Lavalink-free: what "resolving" means (bulk-decoded lookup, search) is the caller's.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+__all__ = (
+    "PLAYLIST_RESOLVE_CONCURRENCY",
+    "resolve_ordered",
+)
+
+#: Saved tracks searched at once when a playlist is loaded.
+PLAYLIST_RESOLVE_CONCURRENCY: int = 8
+
+
+async def resolve_ordered[T, R](
+    items: Iterable[T], resolve: Callable[[T], Awaitable[R]], *, concurrency: int = PLAYLIST_RESOLVE_CONCURRENCY
+) -> AsyncIterator[tuple[T, R]]:
+    """Yields ``(item, await resolve(item))`` pairs in the order of ``items``.
+
+    At most ``concurrency`` resolutions run at a time; the next one starts whenever the
+    oldest is handed out. An exception from ``resolve`` is raised at its item's position.
+    Closing the iterator early (or cancelling its consumer) cancels whatever is in flight.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pending = iter(items)
+    window: deque[tuple[T, asyncio.Task[R]]] = deque()
+
+    def fill() -> None:
+        while len(window) < concurrency:
+            try:
+                item = next(pending)
+            except StopIteration:
+                return
+            window.append((item, asyncio.ensure_future(resolve(item))))
+
+    try:
+        fill()
+        while window:
+            item, task = window[0]
+            result = await task
+            window.popleft()
+            fill()
+            yield item, result
+    finally:
+        for _, task in window:
+            task.cancel()
@@ -9,26 +9,40 @@ The predicate operates on Discord messages structurally (via the :class:`PurgeMe
 protocol), so the service never imports ``discord`` at runtime: tests pass lightweight
 fakes and the cog passes real ``discord.Message`` objects, both of which satisfy the
 protocol.
+
+Purges that target one member across channels (the dashboard's purge action) do not read
+history at all when the guild has the message index enabled: the indexed message ids are
+turned into per-channel bulk-delete batches by :func:`plan_bulk_deletes`.
 """
 
 from __future__ import annotations
 
+import datetime
 import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal, Protocol
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sized
+    from collections.abc import Callable, Iterable, Sized
 
 __all__ = (
+    "BULK_DELETE_MAX_AGE",
     "PurgeMessage",
     "PurgePlan",
     "build_purge_predicate",
+    "plan_bulk_deletes",
 )
 
 # Custom emoji form, e.g. ``<:name:1234>`` -- matches the cog's original pattern.
 EMOJI_REGEX = re.compile(r"<:(\w+):(\d+)>")
 
+#: Discord refuses to bulk-delete messages older than two weeks.
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14)
+#: ``delete_messages`` accepts at most this many ids per call.
+BULK_DELETE_CHUNK = 100
+#: Milliseconds between the Unix epoch and the Discord epoch (first second of 2015).
+DISCORD_EPOCH_MS = 1420070400000
+
 
 class PurgeAuthor(Protocol):
     bot: bool
@@ -128,3 +142,31 @@ def build_purge_predicate(
         return op(p(m) for p in predicates)
 
     return PurgePlan(predicate=predicate, require_prompt=require_prompt)
+
+
+def _snowflake_time(snowflake: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(((snowflake >> 22) + DISCORD_EPOCH_MS) / 1000, tz=datetime.UTC)
+
+
+def plan_bulk_deletes(
+    messages: Iterable[tuple[int, int]],
+    *,
+    now: datetime.datetime,
+    max_age: datetime.timedelta = BULK_DELETE_MAX_AGE,
+) -> dict[int, list[list[int]]]:
+    """Group ``(channel_id, message_id)`` pairs into per-channel bulk-delete batches.
+
+    Messages older than ``max_age`` (judged by their snowflake, so no fetch is needed) are
+    skipped because Discord would reject the whole batch. Each channel's ids are split into
+    chunks of at most :data:`BULK_DELETE_CHUNK`, preserving input order.
+    """
+    cutoff = now - max_age
+    by_channel: dict[int, list[int]] = {}
+    for channel_id, message_id in messages:
+        if _snowflake_time(message_id) > cutoff:
+            by_channel.setdefault(channel_id, []).append(message_id)
+
+    return {
+        channel_id: [ids[start:start + BULK_DELETE_CHUNK] for start in range(0, len(ids), BULK_DELETE_CHUNK)]
+        for channel_id, ids in by_channel.items()
+    }
@@ -0,0 +1,184 @@
+"""Paced, concurrent restore of persisted music sessions.
+
+After a restart or a Lavalink outage the music cog used to rebuild players one at a time
+with a one-second pause in between, so with a few hundred persisted sessions the last
+guild waited minutes for its music. :class:`RestoreScheduler` runs restores concurrently
+instead, while a token bucket per rate key (the shard a guild's voice connect goes through)
+keeps voice connects within a configurable budget. Sessions are started in priority order
+(the cog ranks them by listeners in the voice channel), and a :class:`RestoreProgress`
+records counts and timings for logs and ``/bot/metrics``.
+
+Pure and Discord-free: what restoring a session means is the caller's ``restore`` coroutine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Iterable
+
+__all__ = (
+    "RestoreProgress",
+    "RestoreScheduler",
+)
+
+
+@dataclass(slots=True)
+class RestoreProgress:
+    """Counts and timings of one restore run."""
+
+    total: int = 0
+    restored: int = 0
+    skipped: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+    first_restored_at: float | None = None
+    durations: list[float] = field(default_factory=list)
+
+    @property
+    def done(self) -> int:
+        return self.restored + self.skipped + self.failed
+
+    @property
+    def running(self) -> bool:
+        return self.started_at is not None and self.finished_at is None
+
+    def elapsed(self, now: float | None = None) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else (now if now is not None else time.monotonic())
+        return end - self.started_at
+
+    def to_dict(self, now: float | None = None) -> dict[str, Any]:
+        durations = sorted(self.durations)
+        elapsed = self.elapsed(now)
+        return {
+            "total": self.total,
+            "done": self.done,
+            "restored": self.restored,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "in_flight": self.in_flight,
+            "running": self.running,
+            "elapsed_s": round(elapsed, 3),
+            "first_restored_s": (
+                round(self.first_restored_at - self.started_at, 3)
+                if self.first_restored_at is not None and self.started_at is not None
+                else None
+            ),
+            "session_p50_s": round(durations[len(durations) // 2], 3) if durations else None,
+            "session_max_s": round(durations[-1], 3) if durations else None,
+            "sessions_per_s": round(self.done / elapsed, 3) if elapsed else 0.0,
+        }
+
+
+class RestoreScheduler:
+    """Runs session restores concurrently within a voice-connect rate budget.
+
+    Parameters
+    ----------
+    rate: float
+        Restores started per second and rate key, sustained.
+    burst: int
+        Restores a rate key may start back to back before ``rate`` applies.
+    concurrency: int
+        Restores in progress at once, across all keys.
+    clock: Callable[[], float]
+        Monotonic clock, injectable for tests.
+    sleep: Callable[[float], Awaitable[Any]]
+        Sleep used while waiting for the budget, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 2.0,
+        burst: int = 5,
+        concurrency: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        if rate <= 0 or burst < 1 or concurrency < 1:
+            raise ValueError("rate, burst and concurrency must be positive")
+        self.rate: float = rate
+        self.burst: int = burst
+        self.concurrency: int = concurrency
+        self.clock: Callable[[], float] = clock
+        self.sleep: Callable[[float], Awaitable[Any]] = sleep
+        # rate key -> [tokens, last refill]
+        self._buckets: dict[Hashable, list[float]] = {}
+
+    async def acquire(self, key: Hashable = None) -> None:
+        """|coro| Waits until ``key`` may start another restore."""
+        bucket = self._buckets.setdefault(key, [float(self.burst), self.clock()])
+        while True:
+            now = self.clock()
+            bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return
+            await self.sleep((1.0 - bucket[0]) / self.rate)
+
+    async def run[T](
+        self,
+        items: Iterable[T],
+        restore: Callable[[T], Awaitable[bool]],
+        *,
+        priority: Callable[[T], float] | None = None,
+        key: Callable[[T], Hashable] | None = None,
+        progress: RestoreProgress | None = None,
+        on_progress: Callable[[RestoreProgress], Any] | None = None,
+    ) -> RestoreProgress:
+        """|coro|
+
+        Restores every item and returns the run's :class:`RestoreProgress`.
+
+        Items start highest ``priority`` first. ``restore`` returns whether the session came
+        back (``False`` counts as skipped); exceptions count as failures and never stop the
+        run. ``on_progress`` is called after each finished item.
+        """
+        queue = list(items)
+        if priority is not None:
+            queue.sort(key=priority, reverse=True)
+
+        progress = progress if progress is not None else RestoreProgress()
+        progress.total = len(queue)
+        progress.started_at = self.clock()
+        pending = iter(queue)
+
+        async def worker() -> None:
+            for item in pending:
+                await self.acquire(key(item) if key is not None else None)
+                progress.in_flight += 1
+                started = self.clock()
+                try:
+                    ok = await restore(item)
+                except Exception:
+                    progress.failed += 1
+                else:
+                    if ok:
+                        progress.restored += 1
+                        if progress.first_restored_at is None:
+                            progress.first_restored_at = self.clock()
+                    else:
+                        progress.skipped += 1
+                finally:
+                    progress.in_flight -= 1
+                progress.durations.append(self.clock() - started)
+                if on_progress is not None:
+                    on_progress(progress)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(self.concurrency, len(queue))):
+                    group.create_task(worker())
+        finally:
+            progress.finished_at = self.clock()
+        return progress
@@ -0,0 +1,137 @@
+"""Hot-tag cache and use-count buffer for the ``tag`` command.
+
+Showing a tag used to cost one to four lookups plus an ``UPDATE tags SET uses = uses + 1``
+awaited before the command returned. Most invocations in a guild hit the same handful of
+tags (rules, FAQs, links), so the ``Tags`` cog now:
+
+- keeps the resolved tag of names that keep being asked for in a :class:`HotTagCache`,
+  so repeated lookups are answered without touching Postgres;
+- counts uses in a :class:`TagUseBuffer` and writes them in one batched ``UPDATE``.
+
+Both are pure and Discord-free. A key is admitted to the cache only once it was looked up
+``promote_after`` times within the tracking window, so one-off lookups never push hot tags
+out; entries expire after ``ttl`` and a guild's entries are dropped whenever its tags change.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter, OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+__all__ = (
+    "HotTagCache",
+    "TagUseBuffer",
+)
+
+
+class HotTagCache[T]:
+    """Bounded LRU of resolved tags keyed by ``(guild_id, lookup key)``.
+
+    Parameters
+    ----------
+    max_entries: int
+        Cached tags kept before the least recently used are evicted.
+    ttl: float
+        Seconds an entry is served before it has to be resolved again.
+    promote_after: int
+        Lookups of a key (hits excluded) before its result is admitted.
+    track: int
+        Keys whose lookup counts are tracked for admission.
+    """
+
+    def __init__(self, *, max_entries: int = 512, ttl: float = 600.0, promote_after: int = 2, track: int = 4096) -> None:
+        self.max_entries: int = max_entries
+        self.ttl: float = ttl
+        self.promote_after: int = promote_after
+        self.track: int = track
+        self._entries: OrderedDict[tuple[int, Hashable], tuple[float, T]] = OrderedDict()
+        self._seen: OrderedDict[tuple[int, Hashable], int] = OrderedDict()
+        self._generations: dict[int, int] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, guild_id: int, key: Hashable) -> T | None:
+        entry = self._entries.get((guild_id, key))
+        if entry is not None:
+            expires, value = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end((guild_id, key))
+                self.hits += 1
+                return value
+            del self._entries[(guild_id, key)]
+
+        self.misses += 1
+        seen = self._seen.pop((guild_id, key), 0) + 1
+        self._seen[(guild_id, key)] = seen
+        while len(self._seen) > self.track:
+            self._seen.popitem(last=False)
+        return None
+
+    def generation(self, guild_id: int) -> int:
+        return self._generations.get(guild_id, 0)
+
+    def put(self, guild_id: int, key: Hashable, value: T, *, generation: int) -> bool:
+        """Caches ``value`` if ``key`` is hot and the guild's tags did not change since ``generation``."""
+        if generation != self.generation(guild_id) or self._seen.get((guild_id, key), 0) < self.promote_after:
+            return False
+
+        self._entries[(guild_id, key)] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end((guild_id, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, guild_id: int | None) -> bool:
+        """Drops every cached tag of ``guild_id`` (signal-compatible, like ``@cache.cache()``)."""
+        if guild_id is None:
+            return False
+        self._generations[guild_id] = self.generation(guild_id) + 1
+        keys = [key for key in self._entries if key[0] == guild_id]
+        for key in keys:
+            del self._entries[key]
+        return bool(keys)
+
+    def summary(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class TagUseBuffer:
+    """Pending ``uses`` increments per tag id, drained into one batched ``UPDATE``."""
+
+    __slots__ = ("_pending",)
+
+    def __init__(self) -> None:
+        self._pending: Counter[int] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, tag_id: int, count: int = 1) -> None:
+        self._pending[tag_id] += count
+
+    def pending(self, tag_id: int) -> int:
+        """Uses recorded for ``tag_id`` that are not written yet."""
+        return self._pending.get(tag_id, 0)
+
+    def drain(self) -> tuple[list[int], list[int]]:
+        """Takes every pending increment as parallel ``(ids, counts)`` lists and resets the buffer."""
+        pending, self._pending = self._pending, Counter()
+        return list(pending.keys()), list(pending.values())
+
+    def restore(self, ids: list[int], counts: list[int]) -> None:
+        """Puts drained increments back, e.g. after the write failed."""
+        for tag_id, count in zip(ids, counts, strict=True):
+            self._pending[tag_id] += count
@@ -0,0 +1,257 @@
+"""In-memory tag name index backing the tag autocompletes.
+
+Autocomplete fires on every keystroke and Discord drops the response after three seconds.
+Loading every tag of a guild (content included) and fuzzy-scanning the lot per keystroke
+does not fit that budget in guilds with tens of thousands of tags, so the ``Tags`` cog keeps
+one :class:`TagNames` per guild instead: ids, names, owners and use counts only, sorted by
+lower-cased name so prefix matches are a binary search. A subsequence ("fuzzy") pass over
+the names only runs when the prefix matches do not fill the result page.
+
+Pure and Discord-free: rows in, ranked :class:`TagName` entries out. Loading, invalidation
+wiring and turning entries into ``app_commands.Choice`` objects are left to the cog.
+
+Creating, deleting and renaming a single tag or alias is applied to a loaded index in place
+(:meth:`TagNames.apply`): reloading a guild reads and sorts every one of its names, which in
+large guilds costs far more than moving a few entries around in the sorted lists.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Container, Iterable, Mapping
+
+__all__ = (
+    "AUTOCOMPLETE_LIMIT",
+    "TagName",
+    "TagNameIndex",
+    "TagNameSearch",
+    "TagNames",
+)
+
+#: Discord accepts at most 25 choices; the tag autocompletes have always offered 20.
+AUTOCOMPLETE_LIMIT = 20
+
+
+@dataclass(slots=True, frozen=True)
+class TagName:
+    """One searchable name: a parent tag (``tags``) or a lookup entry (``tag_lookup``)."""
+
+    id: int
+    name: str
+    owner_id: int
+    uses: int
+
+    @property
+    def choice_text(self) -> str:
+        return f"[{self.id}] {self.name}"
+
+
+class TagNameSearch:
+    """A name-sorted, searchable list of :class:`TagName` entries."""
+
+    __slots__ = ("_keys", "entries")
+
+    def __init__(self, entries: Iterable[TagName]) -> None:
+        self.entries: list[TagName] = sorted(entries, key=lambda e: (e.name.lower(), e.id))
+        self._keys: list[str] = [e.name.lower() for e in self.entries]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, entry_id: int) -> TagName | None:
+        return next((e for e in self.entries if e.id == entry_id), None)
+
+    def add(self, entry: TagName) -> None:
+        """Inserts ``entry`` at its place in name order."""
+        index = bisect.bisect(self.entries, (entry.name.lower(), entry.id), key=lambda e: (e.name.lower(), e.id))
+        self.entries.insert(index, entry)
+        self._keys.insert(index, entry.name.lower())
+
+    def remove(self, ids: Container[int]) -> list[TagName]:
+        """Removes the entries whose id is in ``ids`` and returns them."""
+        removed = [e for e in self.entries if e.id in ids]
+        if removed:
+            self.entries = [e for e in self.entries if e.id not in ids]
+            self._keys = [e.name.lower() for e in self.entries]
+        return removed
+
+    def search(self, query: str, *, owner_id: int | None = None, limit: int = AUTOCOMPLETE_LIMIT) -> list[TagName]:
+        """The best ``limit`` matches for ``query``.
+
+        Ranking: names starting with ``query`` (most used first), then ids starting with
+        ``query`` when it is numeric, then names containing the query's characters in order
+        (tightest and earliest match first, ties broken by uses). An empty query returns
+        the most used entries. ``owner_id`` restricts the results to one owner's entries.
+        """
+        query = query.strip().lower()
+        candidates = self.entries if owner_id is None else [e for e in self.entries if e.owner_id == owner_id]
+        if not query:
+            return heapq.nlargest(limit, candidates, key=lambda e: e.uses)
+
+        start = bisect.bisect_left(self._keys, query)
+        stop = bisect.bisect_left(self._keys, query + "\U0010ffff", lo=start)
+        prefixed = self.entries[start:stop]
+        if owner_id is not None:
+            prefixed = [e for e in prefixed if e.owner_id == owner_id]
+        results = heapq.nlargest(limit, prefixed, key=lambda e: e.uses)
+        if len(results) >= limit:
+            return results
+
+        seen = {e.id for e in results}
+        if query.isdigit():
+            by_id = [e for e in candidates if e.id not in seen and str(e.id).startswith(query)]
+            for entry in heapq.nsmallest(limit - len(results), by_id, key=lambda e: e.id):
+                results.append(entry)
+                seen.add(entry.id)
+            if len(results) >= limit:
+                return results
+
+        pattern = re.compile(".*?".join(map(re.escape, query)))
+        scored: list[tuple[int, int, int, TagName]] = []
+        for entry in candidates:
+            if entry.id in seen:
+                continue
+            match = pattern.search(entry.name.lower())
+            if match is not None:
+                scored.append((len(match.group()), match.start(), -entry.uses, entry))
+        results.extend(row[3] for row in heapq.nsmallest(limit - len(results), scored, key=lambda row: row[:3]))
+        return results
+
+
+class TagNames:
+    """The two name lists of one guild: parent tags and every lookup entry (aliases included)."""
+
+    __slots__ = ("_parents", "lookup", "tags")
+
+    def __init__(self, tags: Iterable[TagName], lookup: Iterable[TagName], parents: dict[int, int] | None = None) -> None:
+        self.tags: TagNameSearch = TagNameSearch(tags)
+        self.lookup: TagNameSearch = TagNameSearch(lookup)
+        # Lookup entry id -> parent tag id, to find the aliases of a deleted tag.
+        self._parents: dict[int, int] = parents or {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, object]]) -> TagNames:
+        """Builds both lists from ``tag_lookup`` rows joined with their parent tag.
+
+        Each row needs ``id``, ``name``, ``owner_id``, ``parent_id``, ``parent_name``,
+        ``parent_owner_id`` and ``uses`` (the parent's use count).
+        """
+        tags: dict[int, TagName] = {}
+        lookup: list[TagName] = []
+        parents: dict[int, int] = {}
+        for row in rows:
+            uses = int(row["uses"] or 0)  # type: ignore[arg-type]
+            lookup.append(TagName(int(row["id"]), str(row["name"]), int(row["owner_id"]), uses))  # type: ignore[arg-type]
+            parent_id = int(row["parent_id"])  # type: ignore[arg-type]
+            parents[lookup[-1].id] = parent_id
+            if parent_id not in tags:
+                tags[parent_id] = TagName(
+                    parent_id, str(row["parent_name"]), int(row["parent_owner_id"]), uses  # type: ignore[arg-type]
+                )
+        return cls(tags.values(), lookup, parents)
+
+    def apply(self, change: tuple[Any, ...]) -> bool:
+        """Applies one change fired with ``tags_changed``; ``False`` if the guild must be reloaded instead.
+
+        ``change`` is one of ``("created", tag_id, lookup_id, name, owner_id)``,
+        ``("aliased", lookup_id, parent_id, name, owner_id)``, ``("deleted", tag_id)``,
+        ``("alias_deleted", lookup_id)`` and ``("updated", tag_id, name, owner_id)``.
+        """
+        kind, *args = change
+        if kind == "created":
+            tag_id, lookup_id, name, owner_id = args
+            self.tags.add(TagName(tag_id, name, owner_id, 0))
+            self.lookup.add(TagName(lookup_id, name, owner_id, 0))
+            self._parents[lookup_id] = tag_id
+        elif kind == "aliased":
+            lookup_id, parent_id, name, owner_id = args
+            parent = self.tags.get(parent_id)
+            if parent is None:
+                return False
+            self.lookup.add(TagName(lookup_id, name, owner_id, parent.uses))
+            self._parents[lookup_id] = parent_id
+        elif kind == "deleted":
+            (tag_id,) = args
+            aliases = {lookup_id for lookup_id, parent_id in self._parents.items() if parent_id == tag_id}
+            self.tags.remove({tag_id})
+            self.lookup.remove(aliases)
+            for lookup_id in aliases:
+                del self._parents[lookup_id]
+        elif kind == "alias_deleted":
+            (lookup_id,) = args
+            self.lookup.remove({lookup_id})
+            self._parents.pop(lookup_id, None)
+        elif kind == "updated":
+            tag_id, name, owner_id = args
+            removed = self.tags.remove({tag_id})
+            if not removed:
+                return False
+            self.tags.add(TagName(tag_id, name, owner_id, removed[0].uses))
+        else:
+            return False
+        return True
+
+
+class TagNameIndex:
+    """Per-guild :class:`TagNames`, least recently used guilds evicted past ``max_guilds``.
+
+    Every mutation of a guild's tags reaches :meth:`invalidate` (shaped like
+    ``@cache.cache()``'s so it connects to a :class:`~app.utils.signals.CacheSignal`). A
+    single-tag change is applied to the loaded entry; anything else (transfers, bulk deletes,
+    backup restores) drops it and the next autocomplete reloads it. Each invalidation bumps
+    the guild's generation, so a load that was already in flight when the tags changed is
+    not stored. Use counts are not signalled (every tag use would change the index), so
+    entries also expire after ``ttl``.
+    """
+
+    def __init__(self, *, max_guilds: int = 256, ttl: float = 300.0) -> None:
+        self.max_guilds: int = max_guilds
+        self.ttl: float = ttl
+        self._guilds: OrderedDict[int, tuple[float, TagNames]] = OrderedDict()
+        self._generations: dict[int, int] = {}
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._guilds
+
+    def __len__(self) -> int:
+        return len(self._guilds)
+
+    def get(self, guild_id: int) -> TagNames | None:
+        entry = self._guilds.get(guild_id)
+        if entry is None:
+            return None
+        expires, names = entry
+        if expires <= time.monotonic():
+            del self._guilds[guild_id]
+            return None
+        self._guilds.move_to_end(guild_id)
+        return names
+
+    def generation(self, guild_id: int) -> int:
+        return self._generations.get(guild_id, 0)
+
+    def store(self, guild_id: int, names: TagNames, *, generation: int) -> TagNames:
+        """Caches ``names`` unless the guild was invalidated since ``generation`` was read."""
+        if generation == self.generation(guild_id):
+            self._guilds[guild_id] = (time.monotonic() + self.ttl, names)
+            self._guilds.move_to_end(guild_id)
+            while len(self._guilds) > self.max_guilds:
+                self._guilds.popitem(last=False)
+        return names
+
+    def invalidate(self, guild_id: int | None, change: tuple[Any, ...] | None = None) -> bool:
+        if guild_id is None:
+            return False
+        self._generations[guild_id] = self.generation(guild_id) + 1
+        entry = self._guilds.get(guild_id)
+        if entry is not None and change is not None and entry[1].apply(change):
+            return True
+        return self._guilds.pop(guild_id, None) is not None
@@ -0,0 +1,278 @@
+"""Two-tier resolution cache in front of Lavalink's ``/loadtracks``.
+
+Every ``Player.search`` used to be a Lavalink round trip, including the ones that ask the
+same thing over and over: 24/7 playlist refills, Spotify listen-along lookups, the handful of
+songs a guild requests all day. :class:`TrackResolutionCache` maps a normalised query or URL
+(:func:`track_cache_key`) to the load result Lavalink returned for it, in Lavalink's own
+``{"loadType": ..., "data": ...}`` shape so the encoded tracks can be rebuilt without asking
+the node again.
+
+Lookups go memory (bounded LRU) → persistent store (the ``track_cache`` table) → Lavalink,
+and concurrent lookups of the same key share one load. Streams, empty results and sources
+configured as bypassed are never cached. Pure and Lavalink-free: building ``wavelink``
+objects from the payloads is left to the player.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+import yarl
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+__all__ = (
+    "TRACKING_QUERY_PARAMS",
+    "TrackCacheStats",
+    "TrackResolutionCache",
+    "TrackStore",
+    "is_cacheable_result",
+    "track_cache_key",
+)
+
+log = logging.getLogger(__name__)
+
+#: Query parameters that identify who shared a link rather than what it points to.
+TRACKING_QUERY_PARAMS: frozenset[str] = frozenset({"si", "feature", "pp", "nd", "context", "ab_channel", "utm_source"})
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def track_cache_key(query: str, source: str | None = None) -> str:
+    """Normalises a search term or URL into a cache key.
+
+    URLs keep their path and meaningful parameters but drop the scheme's case, a ``www.``
+    prefix, the fragment and share/tracking parameters, so ``https://www.youtube.com/watch?
+    v=x&si=abc`` and ``https://youtube.com/watch?v=x`` share a key. Search terms are
+    case-folded with whitespace collapsed and keyed by their search prefix (``ytmsearch``...).
+    """
+    query = query.strip().strip("<>")
+    url = yarl.URL(query)
+    if url.host and url.scheme:
+        host = url.host.lower().removeprefix("www.")
+        params = sorted(
+            (k, v) for k, v in url.query.items() if k not in TRACKING_QUERY_PARAMS and not k.startswith("utm_")
+        )
+        normalised = url.with_scheme(url.scheme.lower()).with_host(host).with_fragment(None).with_query(params)
+        return f"url:{normalised}"
+
+    prefix = (source or "").removesuffix(":").lower()
+    return f"search:{prefix}:{_WHITESPACE.sub(' ', query).casefold()}"
+
+
+def is_cacheable_result(result: dict[str, Any] | None) -> bool:
+    """Whether a ``{"loadType", "data"}`` load result may be cached.
+
+    Errors, empty results and anything containing a live stream (radio, Twitch) are not:
+    a stream's track data is only valid while the stream is.
+    """
+    if not result:
+        return False
+
+    load_type, data = result.get("loadType"), result.get("data")
+    if load_type == "track":
+        tracks = [data]
+    elif load_type == "search":
+        tracks = data
+    elif load_type == "playlist":
+        tracks = data.get("tracks") if isinstance(data, dict) else None
+    else:
+        return False
+
+    if not tracks:
+        return False
+    return not any(track.get("info", {}).get("isStream") for track in tracks)
+
+
+class TrackStore(Protocol):
+    """The persistent tier, implemented by ``TrackCacheRepository``."""
+
+    async def get_track_result(self, key: str) -> dict[str, Any] | None: ...
+
+    async def put_track_result(self, key: str, result: dict[str, Any], *, ttl: float) -> None: ...
+
+
+@dataclass(slots=True)
+class TrackCacheStats:
+    memory_hits: int = 0
+    store_hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    store_errors: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.store_hits + self.coalesced + self.misses
+
+    @property
+    def saved(self) -> int:
+        """Lavalink round trips avoided."""
+        return self.memory_hits + self.store_hits + self.coalesced
+
+    def to_dict(self) -> dict[str, Any]:
+        lookups = self.lookups
+        return {
+            "lookups": lookups,
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "store_errors": self.store_errors,
+            "lavalink_requests_saved": self.saved,
+            "hit_ratio": round(self.saved / lookups, 4) if lookups else 0.0,
+        }
+
+
+class TrackResolutionCache:
+    """Memory + persistent cache of Lavalink load results, keyed by :func:`track_cache_key`.
+
+    Parameters
+    ----------
+    store: :class:`TrackStore` | None
+        The persistent tier; ``None`` keeps the cache memory-only.
+    max_entries: int
+        Load results kept in memory before the least recently used are evicted.
+    ttl: float
+        Seconds a result is served from memory.
+    store_ttl: float
+        Seconds a result is kept in the persistent tier.
+    bypass: Iterable[str]
+        Hosts (matched with their subdomains) and search prefixes that always go to Lavalink.
+    """
+
+    def __init__(
+        self,
+        *,
+        store: TrackStore | None = None,
+        max_entries: int = 2048,
+        ttl: float = 6 * 3600.0,
+        store_ttl: float = 7 * 86400.0,
+        bypass: Iterable[str] = (),
+    ) -> None:
+        self.store: TrackStore | None = store
+        self.max_entries: int = max_entries
+        self.ttl: float = ttl
+        self.store_ttl: float = store_ttl
+        self.bypass: frozenset[str] = frozenset(b.strip().lower().removesuffix(":") for b in bypass if b.strip())
+        self.stats: TrackCacheStats = TrackCacheStats()
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def is_bypassed(self, key: str) -> bool:
+        """Whether ``key`` targets a bypassed host or search prefix."""
+        if not self.bypass:
+            return False
+        kind, _, rest = key.partition(":")
+        if kind == "search":
+            return rest.partition(":")[0] in self.bypass
+        host = (yarl.URL(rest).host or "").lower()
+        return any(host == b or host.endswith(f".{b}") for b in self.bypass)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """The in-memory result for ``key``, if fresh. Does not touch the counters."""
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires <= time.monotonic():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        self._memory[key] = (time.monotonic() + self.ttl, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def invalidate(self, key: str) -> bool:
+        return self._memory.pop(key, None) is not None
+
+    async def resolve(
+        self, key: str, load: Callable[[], Awaitable[dict[str, Any] | None]]
+    ) -> dict[str, Any] | None:
+        """|coro|
+
+        The load result for ``key``: from memory, the store, a load already in flight for
+        the same key, or ``load()`` itself. Exceptions from ``load`` propagate to every
+        caller waiting on it and nothing is cached.
+        """
+        if self.is_bypassed(key):
+            self.stats.bypassed += 1
+            return await load()
+
+        result = self.get(key)
+        if result is not None:
+            self.stats.memory_hits += 1
+            return result
+
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The caller that started the load was cancelled; take over.
+                continue
+            self.stats.coalesced += 1
+            return result
+
+        future: asyncio.Future[dict[str, Any] | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._load(key, load)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; mark it retrieved so an unawaited future does not warn.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load(self, key: str, load: Callable[[], Awaitable[dict[str, Any] | None]]) -> dict[str, Any] | None:
+        if self.store is not None:
+            try:
+                stored = await self.store.get_track_result(key)
+            except Exception as exc:
+                self.stats.store_errors += 1
+                log.debug("Track cache store lookup failed for %r: %s", key, exc)
+                stored = None
+            if stored is not None:
+                self.stats.store_hits += 1
+                self.put(key, stored)
+                return stored
+
+        self.stats.misses += 1
+        result = await load()
+        if is_cacheable_result(result):
+            assert result is not None
+            self.put(key, result)
+            if self.store is not None:
+                try:
+                    await self.store.put_track_result(key, result, ttl=self.store_ttl)
+                except Exception as exc:
+                    self.stats.store_errors += 1
+                    log.debug("Track cache store write failed for %r: %s", key, exc)
+        return result
+
+    def summary(self) -> dict[str, Any]:
+        return {"entries": len(self._memory), "persistent": self.store is not None, **self.stats.to_dict()}
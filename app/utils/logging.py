@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import queue
+from logging.handlers import QueueHandler
 from typing import Any
 
-__all__ = ("JSONFormatter",)
+__all__ = ("BoundedQueueHandler", "JSONFormatter")
 
 
 class JSONFormatter(logging.Formatter):
@@ -30,3 +33,41 @@ class JSONFormatter(logging.Formatter):
                 entry[key] = getattr(record, key)
 
         return json.dumps(entry, default=str)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Hands records to a :class:`logging.handlers.QueueListener` without ever blocking.
+
+    Only the message is rendered on the calling thread, so later changes to its
+    arguments can't leak into the log. Timestamps, tracebacks and writing to disk
+    are left to the handlers behind the listener, on its thread. When the queue is
+    full the record is dropped and counted in :attr:`dropped`. Once there is room
+    again, a warning says how many were lost.
+    """
+
+    def __init__(self, queue: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(queue)
+        self.dropped: int = 0
+        self._unreported: int = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self._unreported:
+                self.queue.put_nowait(self._drop_notice())
+                self._unreported = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+
+    def _drop_notice(self) -> logging.LogRecord:
+        return logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0,
+            f"Dropped {self._unreported} log record(s): the log writer fell behind.", None, None,
+        )
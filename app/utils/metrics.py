@@ -1,32 +1,139 @@
 from __future__ import annotations
 
+import contextlib
+import heapq
+import math
+import threading
 import time
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
 
-__all__ = ("MetricsCollector",)
+if TYPE_CHECKING:
+    from collections.abc import Generator
 
+__all__ = ("ExtensionTiming", "Histogram", "MetricsCollector", "RollingHistogram", "RouterMetrics", "StartupTimings")
 
-@dataclass(slots=True)
-class CommandMetric:
-    """A single command execution measurement."""
-    command: str
-    duration_ms: float
-    guild_id: int | None
-    user_id: int
-    success: bool
-    timestamp: float = field(default_factory=time.time)
+
+class Histogram:
+    """Sample counts in log-linear buckets, the way HDR histograms keep them.
+
+    Every power of two between ``2 ** MIN_EXPONENT`` and ``2 ** MAX_EXPONENT`` is split
+    into :attr:`SUB_BUCKETS` equal buckets. Recording a sample is a constant-time
+    counter bump and the memory is fixed however many samples are recorded. A
+    percentile read back is the middle of its bucket, within 1/128 (under 1%) of the
+    sample it stands for. Samples are milliseconds, so the range resolves about half a
+    microsecond to over an hour. Smaller and larger samples share the end buckets.
+    """
+
+    SUB_BUCKETS: Final[int] = 64
+    MIN_EXPONENT: Final[int] = -10
+    MAX_EXPONENT: Final[int] = 22
+    BUCKETS: Final[int] = (MAX_EXPONENT - MIN_EXPONENT + 1) * SUB_BUCKETS
+
+    __slots__ = ("count", "counts", "max", "min", "total")
+
+    def __init__(self) -> None:
+        self.counts: list[int] = [0] * self.BUCKETS
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+
+    @classmethod
+    def bucket(cls, value: float) -> int:
+        """The index of the bucket ``value`` is counted in."""
+        mantissa, exponent = math.frexp(value)  # value == mantissa * 2 ** exponent, 0.5 <= mantissa < 1
+        if exponent < cls.MIN_EXPONENT or value <= 0:
+            return 0
+        if exponent > cls.MAX_EXPONENT:
+            return cls.BUCKETS - 1
+        return (exponent - cls.MIN_EXPONENT) * cls.SUB_BUCKETS + int((mantissa - 0.5) * 2 * cls.SUB_BUCKETS)
+
+    @classmethod
+    def bucket_value(cls, index: int) -> float:
+        """The value a sample counted in bucket ``index`` is read back as: the bucket's middle."""
+        exponent, sub = divmod(index, cls.SUB_BUCKETS)
+        return math.ldexp(0.5 + (sub + 0.5) / (2 * cls.SUB_BUCKETS), exponent + cls.MIN_EXPONENT)
+
+    def record(self, value: float) -> None:
+        """Counts a sample."""
+        self.counts[self.bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+
+class RollingHistogram:
+    """A :class:`Histogram` over the most recent samples, in constant memory.
+
+    Samples go into a current histogram. Once it holds ``window`` samples it replaces
+    the previous one and a fresh one starts. Reads cover both, so between ``window`` and
+    ``2 * window`` of the latest samples once the first window has filled.
+    """
+
+    __slots__ = ("_current", "_previous", "window")
+
+    def __init__(self, *, window: int) -> None:
+        self.window: int = window
+        self._current: Histogram = Histogram()
+        self._previous: Histogram = Histogram()
+
+    @property
+    def count(self) -> int:
+        """The number of samples the reads cover."""
+        return self._current.count + self._previous.count
+
+    def record(self, value: float) -> bool:
+        """Counts a sample. Returns whether this started a new window."""
+        self._current.record(value)
+        if self._current.count < self.window:
+            return False
+        self._previous, self._current = self._current, Histogram()
+        return True
+
+    def percentiles(self, *points: float) -> dict[str, float]:
+        """Nearest-rank percentiles, p50/p95/p99 by default, rounded for display."""
+        points = points or (50, 95, 99)
+        count = self.count
+        if not count:
+            return {f"p{p:g}": 0.0 for p in points}
+
+        current, previous = self._current, self._previous
+        low, high = min(current.min, previous.min), max(current.max, previous.max)
+        # Walk both histograms' buckets together, filling in the ranks in increasing order.
+        ranks = iter(sorted((min(int(count * p / 100), count - 1), p) for p in points))
+        rank, point = next(ranks)
+        found: dict[float, float] = {}
+        seen = 0
+        for index, (a, b) in enumerate(zip(current.counts, previous.counts, strict=True)):
+            seen += a + b
+            while seen > rank:
+                found[point] = round(min(max(Histogram.bucket_value(index), low), high), 2)
+                rank, point = next(ranks, (count, 0))
+            if rank == count:
+                break
+        return {f"p{p:g}": found[p] for p in points}
 
 
 class MetricsCollector:
     """Lightweight in-memory metrics collector for command latency and cache stats.
 
-    Keeps a rolling window of recent command executions and exposes
-    summary statistics that the internal API can surface to the dashboard.
+    Keeps a latency histogram of recent command executions, plus the few slowest of
+    them by name, and exposes summary statistics that the internal API can surface to
+    the dashboard.
     """
 
+    #: How many of the slowest commands are kept per window.
+    SLOWEST: Final[int] = 10
+
     def __init__(self, *, window_size: int = 1000) -> None:
-        self._commands: deque[CommandMetric] = deque(maxlen=window_size)
+        self._latency: RollingHistogram = RollingHistogram(window=window_size)
+        self._slowest: list[tuple[float, str]] = []  # min-heaps of (duration_ms, command)
+        self._previous_slowest: list[tuple[float, str]] = []
         self._error_counts: defaultdict[str, int] = defaultdict(int)
         self._total_commands: int = 0
 
@@ -41,13 +148,12 @@ class MetricsCollector:
     ) -> None:
         """Record a command execution."""
         self._total_commands += 1
-        self._commands.append(CommandMetric(
-            command=command,
-            duration_ms=duration_ms,
-            guild_id=guild_id,
-            user_id=user_id,
-            success=success,
-        ))
+        if len(self._slowest) < self.SLOWEST:
+            heapq.heappush(self._slowest, (duration_ms, command))
+        elif duration_ms > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, (duration_ms, command))
+        if self._latency.record(duration_ms):
+            self._previous_slowest, self._slowest = self._slowest, []
 
     def record_error(self, error_type: str) -> None:
         """Increment the counter for a given error type."""
@@ -58,29 +164,15 @@ class MetricsCollector:
         return self._total_commands
 
     def latency_percentiles(self) -> dict[str, float]:
-        """Return p50, p95, p99 latency in milliseconds from the rolling window."""
-        if not self._commands:
-            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
-
-        durations = sorted(m.duration_ms for m in self._commands)
-        n = len(durations)
-
-        def percentile(p: float) -> float:
-            idx = int(n * p / 100)
-            return durations[min(idx, n - 1)]
-
-        return {
-            "p50": round(percentile(50), 2),
-            "p95": round(percentile(95), 2),
-            "p99": round(percentile(99), 2),
-        }
+        """Return p50, p95, p99 latency in milliseconds over the recent window."""
+        return self._latency.percentiles()
 
     def slowest_commands(self, top_n: int = 10) -> list[dict[str, float | str]]:
-        """Return the top N slowest commands from the rolling window."""
-        sorted_cmds = sorted(self._commands, key=lambda m: m.duration_ms, reverse=True)
+        """Return the top N slowest commands from the recent window."""
+        slowest = heapq.nlargest(top_n, self._slowest + self._previous_slowest)
         return [
-            {"command": m.command, "duration_ms": round(m.duration_ms, 2)}
-            for m in sorted_cmds[:top_n]
+            {"command": command, "duration_ms": round(duration_ms, 2)}
+            for duration_ms, command in slowest
         ]
 
     def error_summary(self) -> dict[str, int]:
@@ -91,8 +183,142 @@ class MetricsCollector:
         """Return a full metrics summary for the dashboard."""
         return {
             "total_commands": self._total_commands,
-            "window_size": len(self._commands),
+            "window_size": self._latency.count,
             "latency": self.latency_percentiles(),
             "slowest": self.slowest_commands(5),
             "errors": self.error_summary(),
         }
+
+
+@dataclass(slots=True)
+class _RouterWindow:
+    """Recent request timings for one router."""
+    queued_ms: RollingHistogram
+    handled_ms: RollingHistogram
+    requests: int = 0
+    failed: int = 0
+    in_flight: int = 0
+
+
+class RouterMetrics:
+    """Per-router request latency, queue time and concurrency for the internal API.
+
+    *Queue time* is how long a request waited for the event loop that runs its handler to
+    pick it up (non-zero only when the API is served from its own worker thread); *handled*
+    time is the handler itself. Requests are recorded from the API's worker thread and read
+    from the bot's loop, so all access is serialised by a lock.
+    """
+
+    def __init__(self, *, window_size: int = 500) -> None:
+        self._window_size = window_size
+        self._routers: dict[str, _RouterWindow] = {}
+        self._lock = threading.Lock()
+
+    def _window(self, router: str) -> _RouterWindow:
+        window = self._routers.get(router)
+        if window is None:
+            window = self._routers[router] = _RouterWindow(
+                queued_ms=RollingHistogram(window=self._window_size),
+                handled_ms=RollingHistogram(window=self._window_size),
+            )
+        return window
+
+    @contextlib.contextmanager
+    def track(self, router: str, *, queued_ms: float = 0.0) -> Generator[None, None, None]:
+        """Times the wrapped handler and records it against ``router``."""
+        with self._lock:
+            self._window(router).in_flight += 1
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            handled_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                window = self._window(router)
+                window.in_flight -= 1
+                window.requests += 1
+                window.failed += failed
+                window.queued_ms.record(queued_ms)
+                window.handled_ms.record(handled_ms)
+
+    def summary(self) -> dict[str, dict]:
+        """Per-router counters plus queue/handler percentiles over the recent window."""
+        with self._lock:
+            return {
+                name: {
+                    "requests": w.requests,
+                    "failed": w.failed,
+                    "in_flight": w.in_flight,
+                    "queued": w.queued_ms.percentiles(),
+                    "latency": w.handled_ms.percentiles(),
+                }
+                for name, w in sorted(self._routers.items())
+            }
+
+
+@dataclass(slots=True)
+class ExtensionTiming:
+    """How long one extension took to load.
+
+    ``import_ms`` is the module's own execution. ``setup_ms`` runs from the end of the
+    import until its ``setup()`` returned. Extensions load concurrently, so it also
+    covers time the loop spent on other extensions meanwhile.
+    """
+    name: str
+    import_ms: float = 0.0
+    setup_ms: float = 0.0
+    failed: bool = False
+
+
+class StartupTimings:
+    """Wall-clock times of the bot's startup stages and of each extension load.
+
+    The clock starts when the collector is created, with the bot. Stages run
+    concurrently, so their times overlap and don't add up to :attr:`total_ms`.
+    """
+
+    def __init__(self) -> None:
+        self._started: float = time.perf_counter()
+        self.stages: dict[str, float] = {}
+        self.extensions: dict[str, ExtensionTiming] = {}
+        self.total_ms: float | None = None
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Generator[None, None, None]:
+        """Times the wrapped block as the startup stage ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = (time.perf_counter() - start) * 1000
+
+    def extension(self, name: str) -> ExtensionTiming:
+        """The timing record of extension ``name``, created on first use."""
+        timing = self.extensions.get(name)
+        if timing is None:
+            timing = self.extensions[name] = ExtensionTiming(name)
+        return timing
+
+    def finish(self) -> None:
+        """Marks startup as finished."""
+        self.total_ms = (time.perf_counter() - self._started) * 1000
+
+    def slowest_extensions(self, top_n: int = 5) -> list[ExtensionTiming]:
+        """The extensions that took longest to import and set up."""
+        return sorted(self.extensions.values(), key=lambda t: t.import_ms + t.setup_ms, reverse=True)[:top_n]
+
+    def summary(self) -> dict:
+        """Stage and per-extension timings for the health endpoint."""
+        return {
+            "finished": self.total_ms is not None,
+            "total_ms": round(self.total_ms, 1) if self.total_ms is not None else None,
+            "stages": {name: round(ms, 1) for name, ms in self.stages.items()},
+            "extensions": {
+                t.name: {"import_ms": round(t.import_ms, 1), "setup_ms": round(t.setup_ms, 1), "failed": t.failed}
+                for t in self.slowest_extensions(len(self.extensions))
+            },
+        }
@@ -6,6 +6,8 @@ from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
+from app.utils.metrics import RollingHistogram
+
 __all__ = ("QueryTracker", "SlowQuery")
 
 log = logging.getLogger(__name__)
@@ -27,6 +29,9 @@ class SlowQuery:
 class QueryTracker:
     """Tracks database query execution times and logs slow queries.
 
+    Latency percentiles come from a :class:`~app.utils.metrics.RollingHistogram` over the
+    last ``window_size`` to twice that many queries.
+
     Usage::
 
         tracker = QueryTracker(threshold_ms=100)
@@ -34,8 +39,9 @@ class QueryTracker:
         # -> logs a warning and stores it in the slow queries buffer
     """
 
-    def __init__(self, *, threshold_ms: float = 100.0, buffer_size: int = 50) -> None:
+    def __init__(self, *, threshold_ms: float = 100.0, buffer_size: int = 50, window_size: int = 10_000) -> None:
         self._threshold_ms = threshold_ms
+        self._latency = RollingHistogram(window=window_size)
         self._slow_queries: deque[SlowQuery] = deque(maxlen=buffer_size)
         self._total_queries: int = 0
         self._total_time_ms: float = 0.0
@@ -44,6 +50,7 @@ class QueryTracker:
         """Record a query execution. Logs if it exceeds the threshold."""
         self._total_queries += 1
         self._total_time_ms += duration_ms
+        self._latency.record(duration_ms)
 
         if duration_ms >= self._threshold_ms:
             slow = SlowQuery(query=query, duration_ms=duration_ms)
@@ -64,6 +71,10 @@ class QueryTracker:
             return 0.0
         return self._total_time_ms / self._total_queries
 
+    def latency_percentiles(self) -> dict[str, float]:
+        """Return p50, p95, p99 query latency in milliseconds over the recent window."""
+        return self._latency.percentiles()
+
     def slow_queries(self, limit: int = 10) -> list[dict[str, Any]]:
         """Return the most recent slow queries for inspection."""
         sorted_q = sorted(self._slow_queries, key=lambda q: q.duration_ms, reverse=True)
@@ -77,6 +88,7 @@ class QueryTracker:
         return {
             "total_queries": self._total_queries,
             "avg_duration_ms": round(self.avg_duration_ms, 2),
+            "latency": self.latency_percentiles(),
             "slow_query_count": len(self._slow_queries),
             "threshold_ms": self._threshold_ms,
             "slowest_queries": self.slow_queries(5),
@@ -35,6 +35,10 @@ class CacheSignal:
         """
         self._subscribers.append((cached_func, args))
 
+    def disconnect(self, cached_func: Any) -> None:
+        """Remove every subscription of ``cached_func``, e.g. when the cog owning it unloads."""
+        self._subscribers = [(func, args) for func, args in self._subscribers if func is not cached_func]
+
     def fire(self, *dynamic_args: Any) -> int:
         """Fire the signal, invalidating all connected caches.
 
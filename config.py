@@ -106,6 +106,58 @@ lavalink_nodes: Collection[SimpleNamespace] = [
     SimpleNamespace(uri='https://lavalink.klappstuhl.me/', password=env('LAVALINK_NODE_1_PASSWORD')),
 ]
 
+# Track resolution cache in front of Lavalink (see app/services/track_cache.py). Results live
+# in memory for TRACK_CACHE_TTL seconds and in the `track_cache` table for TRACK_CACHE_STORE_TTL.
+# TRACK_CACHE_BYPASS lists hosts and search prefixes (e.g. `twitch.tv,spsearch`) never cached.
+track_cache = SimpleNamespace(
+    max_entries=int(env('TRACK_CACHE_MAX_ENTRIES') or '2048'),
+    ttl=float(env('TRACK_CACHE_TTL') or 6 * 3600),
+    store_ttl=float(env('TRACK_CACHE_STORE_TTL') or 7 * 86400),
+    bypass=tuple(filter(None, (env('TRACK_CACHE_BYPASS') or 'twitch.tv').split(','))),
+)
+
+# Restoring persisted music sessions after a restart or Lavalink outage (see
+# app/services/session_restore.py): voice connects started per second and shard, how many
+# may start back to back, and how many restores run at once.
+music_restore = SimpleNamespace(
+    rate=float(env('MUSIC_RESTORE_RATE') or 2),
+    burst=int(env('MUSIC_RESTORE_BURST') or '5'),
+    concurrency=int(env('MUSIC_RESTORE_CONCURRENCY') or '8'),
+)
+
+
+def _host_limits(value: str | None) -> dict[str, int]:
+    """Parse ``host=limit,host=limit`` into a mapping, skipping malformed entries."""
+    limits: dict[str, int] = {}
+    for entry in filter(None, (value or '').split(',')):
+        host, _, limit = entry.strip().partition('=')
+        if host and limit.isdigit():
+            limits[host.lower()] = int(limit)
+    return limits
+
+
+# Outbound HTTP connection pools (see app/clients/pool.py). Hosts in HTTP_POOL_HOSTS
+# (`host=limit,...`) and the Ollama host get a pool of their own, so a slow upstream can't
+# hold the connections the shared pool's clients need. DNS answers are cached for
+# HTTP_DNS_CACHE_TTL seconds and idle connections kept for HTTP_KEEPALIVE_TIMEOUT.
+http_pool = SimpleNamespace(
+    limit=int(env('HTTP_POOL_LIMIT') or '100'),
+    limit_per_host=int(env('HTTP_POOL_LIMIT_PER_HOST') or '16'),
+    dns_ttl=int(env('HTTP_DNS_CACHE_TTL') or '300'),
+    keepalive_timeout=float(env('HTTP_KEEPALIVE_TIMEOUT') or 30),
+    hosts=_host_limits(env('HTTP_POOL_HOSTS')),
+)
+
+# Poker odds (see app/cogs/games/engine/equity.py) run in POKER_EQUITY_WORKERS processes.
+# Streets with more than POKER_EQUITY_EXACT_LIMIT runouts are sampled POKER_EQUITY_SAMPLES
+# times; up to POKER_PREFLOP_CACHE_SIZE pre-flop results are kept in data/.
+poker_equity = SimpleNamespace(
+    workers=int(env('POKER_EQUITY_WORKERS') or '2'),
+    samples=int(env('POKER_EQUITY_SAMPLES') or '150000'),
+    exact_limit=int(env('POKER_EQUITY_EXACT_LIMIT') or '50000'),
+    cache_size=int(env('POKER_PREFLOP_CACHE_SIZE') or '4096'),
+)
+
 
 class DatabaseConfig:
     """Represents the configuration for the database."""
@@ -157,6 +209,12 @@ class DatabaseConfig:
 internal_api_token: str | None = env('INTERNAL_API_TOKEN')
 internal_api_port: int = int(env('INTERNAL_API_PORT') or '8090')
 internal_api_host: str = env('INTERNAL_API_HOST') or '127.0.0.1'
+# 'inline' serves the API on the bot's event loop and pool; 'thread' moves it to a worker
+# thread with its own loop and a dedicated read pool capped at INTERNAL_API_READ_POOL_SIZE.
+internal_api_isolation: str = (env('INTERNAL_API_ISOLATION') or 'inline').strip().lower()
+internal_api_read_pool_size: int = int(env('INTERNAL_API_READ_POOL_SIZE') or '4')
+# Seconds a polled dashboard GET stays cached (ETag/304 revalidation); 0 disables the cache.
+internal_api_cache_ttl: float = float(env('INTERNAL_API_CACHE_TTL') or '10')
 
 # https://klappstuhl.me/api/docs
 # Personal account API key. For *guild galleries* this is only a legacy fallback —
@@ -3,8 +3,9 @@ import contextlib
 import logging
 import traceback
 from collections.abc import Awaitable, Callable, Generator
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueListener, RotatingFileHandler
 from pathlib import Path
+from queue import Queue
 from typing import Any, ClassVar
 
 import asyncpg
@@ -81,6 +82,7 @@ class _ColourFormatter(logging.Formatter):
 @contextlib.contextmanager
 def setup_logging() -> Generator[None, Any, None]:
     root_log = logging.getLogger()
+    listener: QueueListener | None = None
 
     try:
         dt_fmt = '%Y-%m-%d %H:%M:%S'
@@ -104,9 +106,8 @@ def setup_logging() -> Generator[None, Any, None]:
             backupCount=5,
         )
         handler.setFormatter(fmt)
-        root_log.addHandler(handler)
 
-        from app.utils.logging import JSONFormatter
+        from app.utils.logging import BoundedQueueHandler, JSONFormatter
         json_handler = RotatingFileHandler(
             filename=Path(logs_path, 'percy.json.log'),
             encoding='utf-8',
@@ -115,13 +116,24 @@ def setup_logging() -> Generator[None, Any, None]:
             backupCount=3,
         )
         json_handler.setFormatter(JSONFormatter())
-        root_log.addHandler(json_handler)
+
+        # Formatting and writing the log files (rotation included) happens on the
+        # listener's thread, off the event loop.
+        records: Queue[logging.LogRecord] = Queue(maxsize=10_000)
+        listener = QueueListener(records, handler, json_handler, respect_handler_level=True)
+        root_log.addHandler(BoundedQueueHandler(records))
+        listener.start()
 
         yield
     finally:
         for hdlr in root_log.handlers[:]:
             hdlr.close()
             root_log.removeHandler(hdlr)
+        if listener is not None:
+            listener.queue.join()  # type: ignore[attr-defined]  # write out what is still queued
+            listener.stop()
+            for hdlr in listener.handlers:
+                hdlr.close()
 
 
 async def run_bot() -> None:
@@ -0,0 +1,32 @@
+-- Revises: V37
+-- Creation Date: 2026-07-12 00:00:00.000000+00:00 UTC
+-- Reason: message_index
+
+-- Opt-in, per-guild message metadata index. When `message_index_days` is set on a
+-- guild, the message index cog (app/cogs/message_index.py) records every new message's
+-- ids, author, timestamp and a short content snippet, keeps it in sync on edit/delete,
+-- and prunes rows older than the configured retention. NULL (the default) disables
+-- indexing and lets the prune job drop whatever the guild had stored.
+ALTER TABLE guild_config
+    ADD COLUMN IF NOT EXISTS message_index_days SMALLINT;
+
+CREATE TABLE IF NOT EXISTS message_index
+(
+    id               BIGINT PRIMARY KEY,
+    guild_id         BIGINT    NOT NULL,
+    channel_id       BIGINT    NOT NULL,
+    author_id        BIGINT    NOT NULL,
+    created_at       TIMESTAMP NOT NULL,
+    edited_at        TIMESTAMP,
+    snippet          TEXT      NOT NULL DEFAULT '',
+    attachment_count SMALLINT  NOT NULL DEFAULT 0,
+    embed_count      SMALLINT  NOT NULL DEFAULT 0
+);
+
+-- Message ids are snowflakes, so ordering by id is ordering by creation time: the
+-- member messages view and purge are both "newest N of this author" lookups.
+CREATE INDEX IF NOT EXISTS message_index_author_idx
+    ON message_index (guild_id, author_id, id DESC);
+
+CREATE INDEX IF NOT EXISTS message_index_retention_idx
+    ON message_index (guild_id, created_at);
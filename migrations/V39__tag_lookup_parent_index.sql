@@ -0,0 +1,7 @@
+-- Revises: V38
+-- Creation Date: 2026-07-14 00:00:00.000000+00:00 UTC
+-- Reason: tag_lookup_parent_index
+
+-- Single-query tag resolution collects a tag's aliases by `parent_id`, and deleting a tag
+-- deletes its lookup rows the same way; neither had an index to use.
+CREATE INDEX IF NOT EXISTS tag_lookup_parent_id_idx ON tag_lookup (parent_id);
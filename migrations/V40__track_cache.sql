@@ -0,0 +1,14 @@
+-- Revises: V39
+-- Creation Date: 2026-07-16 00:00:00.000000+00:00 UTC
+-- Reason: track_cache
+
+-- Persistent tier of the music track resolution cache: a normalised search term or URL
+-- mapped to the Lavalink load result (`{"loadType": ..., "data": ...}`, encoded tracks
+-- included) it resolved to, so repeated lookups survive restarts without a Lavalink trip.
+CREATE TABLE IF NOT EXISTS track_cache (
+    key        TEXT PRIMARY KEY,
+    result     JSONB     NOT NULL,
+    expires_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS track_cache_expires_at_idx ON track_cache (expires_at);
@@ -0,0 +1,8 @@
+-- Revises: V40
+-- Creation Date: 2026-07-18 00:00:00.000000+00:00 UTC
+-- Reason: playlist_track_encoded
+
+-- Lavalink's encoded track string for each saved playlist track, so a playlist can be
+-- rebuilt with one bulk `/v4/decodetracks` request instead of one search per track.
+-- Rows saved before this column existed are backfilled the first time they are resolved.
+ALTER TABLE playlist_lookup ADD COLUMN IF NOT EXISTS encoded TEXT;
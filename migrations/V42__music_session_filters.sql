@@ -0,0 +1,8 @@
+-- Revises: V41
+-- Creation Date: 2026-07-19 00:00:00.000000+00:00 UTC
+-- Reason: music_session_filters
+
+-- Active Lavalink filters of a persisted player (the `filters` payload), re-applied on restore.
+-- Queued tracks written from now on use the compact `[uri, title, requester_id]` array form;
+-- rows in the older `{"uri": ..., ...}` object form stay readable.
+ALTER TABLE music_sessions ADD COLUMN IF NOT EXISTS filters JSONB;
@@ -0,0 +1,29 @@
+-- Revises: V42
+-- Creation Date: 2026-10-18 00:00:00.000000+00:00 UTC
+-- Reason: economy_wallet_key
+
+-- The balance ledger (EconomyRepository.apply_balance_deltas) upserts wallets with
+-- `ON CONFLICT (user_id, guild_id)`, which needs a unique key. The old
+-- select-then-insert in get_balance_record could race and create a second row for
+-- the same member; fold any such duplicates into the oldest row first.
+WITH duplicate AS (
+    SELECT id,
+           MIN(id) OVER w AS keep_id,
+           SUM(cash) OVER w AS cash,
+           SUM(bank) OVER w AS bank
+    FROM economy
+    WINDOW w AS (PARTITION BY user_id, guild_id)
+)
+UPDATE economy e
+SET cash = d.cash, bank = d.bank
+FROM duplicate d
+WHERE e.id = d.id AND d.id = d.keep_id AND (e.cash, e.bank) IS DISTINCT FROM (d.cash, d.bank);
+
+DELETE FROM economy e
+USING economy keep
+WHERE keep.user_id = e.user_id AND keep.guild_id = e.guild_id AND keep.id < e.id;
+
+-- Same (guild_id, user_id) column order as the index it replaces, so per-guild scans
+-- keep using it.
+CREATE UNIQUE INDEX IF NOT EXISTS economy_guild_user_key ON economy (guild_id, user_id);
+DROP INDEX IF EXISTS economy_guild_user_idx;
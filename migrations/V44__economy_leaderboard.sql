@@ -0,0 +1,91 @@
+-- Revises: V43
+-- Creation Date: 2026-10-18 00:00:00.000000+00:00 UTC
+-- Reason: economy_leaderboard
+
+-- The leaderboard pages through a guild's wallets richest first
+-- (UsersRepository.get_balance_page). Keyset pages walk this index backwards instead
+-- of loading and sorting the whole guild. Empty wallets are never ranked, so they
+-- are left out of the index.
+CREATE INDEX IF NOT EXISTS economy_guild_total_idx
+    ON economy (guild_id, (cash + bank), user_id) WHERE cash + bank > 0;
+
+-- Running per-guild totals, kept up to date by the statement triggers below, so the
+-- leaderboard footer and page count no longer SUM the whole guild. Each guild's total
+-- is spread over 16 slots by user id. Concurrent payouts to different members then
+-- mostly update different rows instead of queueing on one.
+CREATE TABLE IF NOT EXISTS economy_totals
+(
+    guild_id BIGINT   NOT NULL,
+    slot     SMALLINT NOT NULL,
+    total    BIGINT   NOT NULL DEFAULT 0,
+    ranked   INTEGER  NOT NULL DEFAULT 0,  -- wallets with cash + bank > 0
+    PRIMARY KEY (guild_id, slot)
+);
+
+CREATE OR REPLACE FUNCTION economy_totals_apply() RETURNS trigger
+    LANGUAGE plpgsql AS
+$$
+BEGIN
+    -- One row per changed wallet state: +1 for the new row, -1 for the old one.
+    -- Slots are written in key order so concurrent statements cannot deadlock.
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO economy_totals AS t (guild_id, slot, total, ranked)
+        SELECT guild_id, (user_id % 16)::smallint, SUM(cash + bank)::bigint, COUNT(*) FILTER (WHERE cash + bank > 0)
+        FROM new_rows
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+        ON CONFLICT (guild_id, slot) DO UPDATE
+            SET total = t.total + EXCLUDED.total, ranked = t.ranked + EXCLUDED.ranked;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO economy_totals AS t (guild_id, slot, total, ranked)
+        SELECT guild_id, (user_id % 16)::smallint, SUM(sign * amount)::bigint,
+               COALESCE(SUM(sign) FILTER (WHERE amount > 0), 0)
+        FROM (
+            SELECT guild_id, user_id, cash + bank AS amount, 1 AS sign FROM new_rows
+            UNION ALL
+            SELECT guild_id, user_id, cash + bank, -1 FROM old_rows
+        ) AS change
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+        ON CONFLICT (guild_id, slot) DO UPDATE
+            SET total = t.total + EXCLUDED.total, ranked = t.ranked + EXCLUDED.ranked;
+    ELSE
+        UPDATE economy_totals AS t
+        SET total = t.total - change.total, ranked = t.ranked - change.ranked
+        FROM (
+            SELECT guild_id, (user_id % 16)::smallint AS slot, SUM(cash + bank)::bigint AS total,
+                   COUNT(*) FILTER (WHERE cash + bank > 0) AS ranked
+            FROM old_rows
+            GROUP BY 1, 2
+        ) AS change
+        WHERE t.guild_id = change.guild_id AND t.slot = change.slot;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS economy_totals_insert ON economy;
+CREATE TRIGGER economy_totals_insert
+    AFTER INSERT ON economy
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION economy_totals_apply();
+
+DROP TRIGGER IF EXISTS economy_totals_update ON economy;
+CREATE TRIGGER economy_totals_update
+    AFTER UPDATE ON economy
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION economy_totals_apply();
+
+DROP TRIGGER IF EXISTS economy_totals_delete ON economy;
+CREATE TRIGGER economy_totals_delete
+    AFTER DELETE ON economy
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION economy_totals_apply();
+
+-- Backfill. The triggers above already hold a lock on economy, so no write can land
+-- between them and this snapshot.
+INSERT INTO economy_totals (guild_id, slot, total, ranked)
+SELECT guild_id, (user_id % 16)::smallint, SUM(cash + bank)::bigint, COUNT(*) FILTER (WHERE cash + bank > 0)
+FROM economy
+GROUP BY 1, 2
+ON CONFLICT (guild_id, slot) DO UPDATE SET total = EXCLUDED.total, ranked = EXCLUDED.ranked;
@@ -0,0 +1,8 @@
+-- Revises: V44
+-- Creation Date: 2026-10-19 00:00:00.000000+00:00 UTC
+-- Reason: game_stats_last_flush
+
+-- GameStatsRepository.flush adds buffered rounds onto the stored counters. A flush
+-- that raised or was cancelled may still have committed, so it is sent again with the
+-- same id; rows already stamped with that id are left alone instead of counted twice.
+ALTER TABLE game_stats ADD COLUMN IF NOT EXISTS last_flush UUID;
@@ -0,0 +1,175 @@
+"""Benchmark: wall time until the bot's setup finishes, sequential vs. concurrent startup.
+
+Runs ``Bot._setup_hook_task`` against stand-ins and reports the time until
+``_setup_finished`` is set, plus the stage and slowest-extension timings it records in
+:class:`~app.utils.metrics.StartupTimings`. The baseline is the previous order, kept below
+for comparison only: connect Lavalink, start the internal API, probe the AI engine, then
+load the extensions one at a time.
+
+Every dependency is stubbed. Lavalink, the internal API and Ollama wait a fixed time
+each. The Discord gateway becomes ready after ``--ready`` milliseconds. The extensions
+are ``--extensions`` generated modules. Each spends ``--import`` milliseconds of CPU at
+import and waits ``--setup`` milliseconds in its setup, like a cog loading its state
+from the database. One of them waits for the gateway first, like the music cog. Jishaku
+loads for real. Not collected by pytest. Run it with::
+
+    python -m tests.bench_bot_startup --extensions 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import wavelink
+
+import app.core.bot
+from app.core import Bot
+
+EXTENSION = '''
+import asyncio
+import time
+
+from discord.ext import commands
+
+_end = time.perf_counter() + {import_ms} / 1000
+while time.perf_counter() < _end:  # the cost of importing a cog's dependencies
+    pass
+
+
+class Cog{index}(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        if {waits_for_gateway}:
+            await self.bot.wait_until_ready()
+        await asyncio.sleep({setup_ms} / 1000)
+
+    @commands.command(name='bench{index}')
+    async def command(self, ctx):
+        pass
+
+
+async def setup(bot):
+    await bot.add_cog(Cog{index}(bot))
+'''
+
+
+def write_extensions(root: Path, count: int, import_ms: float, setup_ms: float) -> list[str]:
+    names = []
+    for index in range(count):
+        name = f'bench_startup_ext_{index:02}'
+        source = EXTENSION.format(index=index, import_ms=import_ms, setup_ms=setup_ms, waits_for_gateway=index == 0)
+        (root / f'{name}.py').write_text(source)
+        names.append(name)
+    return names
+
+
+class InternalAPI:
+    delay = 0.0
+
+    def __init__(self, bot: Bot) -> None:
+        self.bot = bot
+
+    async def start(self) -> None:
+        await asyncio.sleep(self.delay)
+
+
+class AIService:
+    enabled = True
+    delay = 0.0
+
+    async def health(self) -> SimpleNamespace:
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(reachable=True, models={}, version='stub', latency_ms=self.delay * 1000, error=None)
+
+
+# -- the old startup ----------------------------------------------------------
+
+
+async def legacy_setup(bot: Bot) -> None:
+    await bot._connect_lavalink()
+    await bot._start_internal_api()
+    await bot._check_ai_health()
+
+    await bot.load_extension('jishaku')
+    for extension in bot.initial_extensions:
+        try:
+            await bot.load_extension(extension)
+        except Exception as exc:
+            bot.log.critical('Failed to load extension %s: %s', extension, exc, exc_info=True)
+
+    bot.apply_native_permissions()
+    bot.startup.finish()
+    bot._setup_finished.set()
+
+
+# -- runs ---------------------------------------------------------------------
+
+
+async def run(setup: Any, extensions: list[str], args: argparse.Namespace) -> Bot:
+    bot = Bot()
+    bot.initial_extensions = extensions
+    bot.ai = AIService()  # type: ignore[assignment]
+
+    async def wait_until_ready() -> None:
+        await asyncio.sleep(max(0.0, ready_at - time.perf_counter()))
+
+    bot.wait_until_ready = wait_until_ready  # type: ignore[method-assign]
+
+    started = time.perf_counter()
+    ready_at = started + args.ready / 1000
+    bot.startup._started = started
+    await setup(bot)
+    return bot
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--extensions", type=int, default=30)
+    parser.add_argument("--import", dest="import_ms", type=float, default=3.0, help="CPU milliseconds per import")
+    parser.add_argument("--setup", type=float, default=25.0, help="milliseconds each setup waits")
+    parser.add_argument("--ready", type=float, default=800.0, help="milliseconds until the gateway is ready")
+    parser.add_argument("--lavalink", type=float, default=300.0)
+    parser.add_argument("--api", type=float, default=150.0)
+    parser.add_argument("--ollama", type=float, default=400.0)
+    args = parser.parse_args()
+
+    async def connect(**_: Any) -> None:
+        await asyncio.sleep(args.lavalink / 1000)
+
+    wavelink.Pool.connect = connect  # type: ignore[method-assign]
+    app.core.bot.InternalAPI = InternalAPI  # type: ignore[misc]
+    InternalAPI.delay = args.api / 1000
+    AIService.delay = args.ollama / 1000
+
+    with tempfile.TemporaryDirectory() as root:
+        sys.path.insert(0, root)
+        extensions = write_extensions(Path(root), args.extensions, args.import_ms, args.setup)
+
+        print(
+            f"extensions: {args.extensions} ({args.import_ms} ms import, {args.setup} ms setup)  "
+            f"gateway ready: {args.ready} ms  lavalink: {args.lavalink} ms  api: {args.api} ms  ollama: {args.ollama} ms"
+        )
+        results = {}
+        for name, setup in (("sequential", legacy_setup), ("concurrent", Bot._setup_hook_task)):
+            bot = await run(setup, extensions, args)
+            results[name] = bot.startup
+            print(f"{name:<12}setup finished after {bot.startup.total_ms:8.1f} ms")
+
+        timings = results["concurrent"]
+        print("concurrent stages: " + ", ".join(f"{name} {ms:.0f} ms" for name, ms in timings.stages.items()))
+        print("slowest extensions:")
+        for timing in timings.slowest_extensions(3):
+            print(f"  {timing.name:<22} import {timing.import_ms:6.1f} ms  setup {timing.setup_ms:6.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
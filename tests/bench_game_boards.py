@@ -0,0 +1,182 @@
+"""Benchmark: minesweeper and mines boards, per-cell objects vs. the packed engines.
+
+Plays ``--games`` minesweeper games per board size to the end, revealing random hidden
+cells the way players click, and reports games per second and memory per live game. The
+baseline is the old engine: nested lists of ``MSField`` dataclasses, a fresh neighbour
+list on every lookup and a full scan for the win check. It is kept below for comparison
+only. The current :class:`~app.cogs.games.engine.minesweeper.Board` keeps one byte per
+cell in a :class:`bytearray`, shares a neighbour table per board shape and counts the
+hidden safe cells instead of scanning for the win.
+
+Mines games are timed and measured the same way, the old set-based state against the
+bitmasks of :class:`~app.cogs.games.engine.mines.Mines`.
+
+Memory is what :mod:`tracemalloc` sees allocated for ``--live`` boards held at once,
+divided by their number. Not collected by pytest. Run it with::
+
+    python -m tests.bench_game_boards --games 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
+
+from app.cogs.games.engine import mines
+from app.cogs.games.engine.minesweeper import NEIGHBOURS, Board
+
+SIZES = [(5, 5, 3), (9, 9, 10), (16, 16, 40), (16, 30, 99), (50, 50, 300)]
+
+
+# -- the old engines ----------------------------------------------------------
+
+
+@dataclass
+class MSField:
+    x: int
+    y: int
+    value: int = 0
+    revealed: bool = False
+    mine: bool = False
+
+
+class LegacyBoard:
+    def __init__(self, count: int, rows: int, cols: int, rng: random.Random) -> None:
+        self.rows, self.cols = rows, cols
+        self.board = [[MSField(x=x, y=y) for x in range(cols)] for y in range(rows)]
+        for field in rng.sample(list(chain.from_iterable(self.board)), count):
+            field.mine = True
+            for x, y in self.get_neighbours(field):
+                if not self.board[y][x].mine:
+                    self.board[y][x].value += 1
+
+    def get_neighbours(self, field: MSField) -> list[tuple[int, int]]:
+        return [
+            (field.x + i, field.y + j)
+            for i, j in NEIGHBOURS
+            if (0 <= field.x + i < self.cols) and (0 <= field.y + j < self.rows)
+        ]
+
+    def reveal(self, index: int) -> bool:
+        stack = [self.board[index // self.cols][index % self.cols]]
+        while stack:
+            current = stack.pop()
+            if current.revealed:
+                continue
+            current.revealed = True
+            if current.mine:
+                return False
+            if current.value == 0:
+                for x, y in self.get_neighbours(current):
+                    if not self.board[y][x].revealed:
+                        stack.append(self.board[y][x])
+        return True
+
+    def is_revealed(self, index: int) -> bool:
+        return self.board[index // self.cols][index % self.cols].revealed
+
+    @property
+    def is_won(self) -> bool:
+        return all(all(field.revealed for field in row if not field.mine) for row in self.board)
+
+
+class LegacyMines:
+    def __init__(self, mine_count: int, rng: random.Random) -> None:
+        self.mine_count = mine_count
+        self.mine_positions = set(rng.sample(range(mines.TILES), mine_count))
+        self.revealed: set[int] = set()
+
+    @property
+    def multiplier(self) -> float:
+        fair = 1.0
+        for i in range(len(self.revealed)):
+            fair *= (mines.TILES - i) / (mines.TILES - self.mine_count - i)
+        return round(fair * mines.HOUSE_EDGE, 2)
+
+    def reveal(self, index: int) -> bool:
+        if index in self.mine_positions:
+            return False
+        self.revealed.add(index)
+        return True
+
+
+# -- runs ---------------------------------------------------------------------
+
+
+def play_minesweeper(make: Any, games: int, rows: int, cols: int, count: int) -> float:
+    rng = random.Random(0)
+    started = time.perf_counter()
+    for _ in range(games):
+        board = make(count, rows, cols, rng)
+        hidden = list(range(rows * cols))
+        rng.shuffle(hidden)
+        for index in hidden:
+            if board.is_revealed(index):
+                continue
+            if not board.reveal(index) or board.is_won:
+                break
+    return time.perf_counter() - started
+
+
+def play_mines(make: Any, games: int) -> float:
+    rng = random.Random(0)
+    started = time.perf_counter()
+    for _ in range(games):
+        game = make(5, rng)
+        for index in rng.sample(range(mines.TILES), mines.TILES):
+            if not game.reveal(index):
+                break
+            game.multiplier  # rendered after every reveal
+    return time.perf_counter() - started
+
+
+def bytes_per_game(make: Any, live: int) -> float:
+    rng = random.Random(0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    boards = [make(rng) for _ in range(live)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del boards
+    return (after - before) / live
+
+
+def new_board(count: int, rows: int, cols: int, rng: random.Random) -> Board:
+    return Board(count, rows=rows, cols=cols, rng=rng)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=2_000)
+    parser.add_argument("--live", type=int, default=1_000, help="boards held at once for the memory figures")
+    args = parser.parse_args()
+
+    print(f"games: {args.games} per size  memory: {args.live} live boards")
+    print(f"{'board':<14}{'legacy games/s':>16}{'packed games/s':>16}{'speed-up':>10}{'legacy B':>10}{'packed B':>10}")
+    for rows, cols, count in SIZES:
+        legacy = play_minesweeper(LegacyBoard, args.games, rows, cols, count)
+        packed = play_minesweeper(new_board, args.games, rows, cols, count)
+        legacy_bytes = bytes_per_game(lambda rng: LegacyBoard(count, rows, cols, rng), args.live)
+        packed_bytes = bytes_per_game(lambda rng: new_board(count, rows, cols, rng), args.live)
+        print(
+            f"{f'{rows}x{cols}/{count}':<14}{args.games / legacy:16,.0f}{args.games / packed:16,.0f}"
+            f"{legacy / packed:9.1f}x{legacy_bytes:10,.0f}{packed_bytes:10,.0f}"
+        )
+
+    legacy = play_mines(LegacyMines, args.games * 10)
+    packed = play_mines(lambda count, rng: mines.Mines(count, rng), args.games * 10)
+    legacy_bytes = bytes_per_game(lambda rng: LegacyMines(5, rng), args.live)
+    packed_bytes = bytes_per_game(lambda rng: mines.Mines(5, rng), args.live)
+    print(
+        f"{'mines 5x4/5':<14}{args.games * 10 / legacy:16,.0f}{args.games * 10 / packed:16,.0f}"
+        f"{legacy / packed:9.1f}x{legacy_bytes:10,.0f}{packed_bytes:10,.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
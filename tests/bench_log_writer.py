@@ -0,0 +1,131 @@
+"""Benchmark: event-loop lag while logging, file handlers on the loop vs. a queued writer.
+
+Emits ``--records`` log records from a coroutine, in bursts of ``--burst`` with a yield to
+the loop after each burst, and reports how late a 1 ms ticker on the same loop ran. The
+baseline is the previous setup: a text and a JSON
+:class:`~logging.handlers.RotatingFileHandler` attached directly, so every record is
+formatted and written (and rotated) on the loop. The current setup puts a
+:class:`~app.utils.logging.BoundedQueueHandler` on the logger and the same two handlers
+behind a :class:`~logging.handlers.QueueListener` thread. The queue holds ``--queue``
+records, as in ``main.py``. Records that don't fit are dropped and counted.
+
+The files rotate every ``--rotate-kb`` KiB so renames are part of the cost, and one
+record in a hundred carries a traceback. Point ``--dir`` at the disk the bot logs to, as
+a ``tmpfs`` makes writes nearly free and flatters the baseline. Not collected by pytest.
+Run it with::
+
+    python -m tests.bench_log_writer --records 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import queue
+import statistics
+import tempfile
+import time
+from logging.handlers import QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any
+
+from app.utils.logging import BoundedQueueHandler, JSONFormatter
+
+
+def file_handlers(root: Path, rotate_bytes: int) -> list[logging.Handler]:
+    root.mkdir()
+    text = RotatingFileHandler(root / 'percy.log', encoding='utf-8', maxBytes=rotate_bytes, backupCount=5)
+    text.setFormatter(logging.Formatter('[{asctime}] | {levelname:<7} - {name}: {message}', style='{'))
+    json_handler = RotatingFileHandler(root / 'percy.json.log', encoding='utf-8', maxBytes=rotate_bytes, backupCount=3)
+    json_handler.setFormatter(JSONFormatter())
+    return [text, json_handler]
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + 0.001
+        await asyncio.sleep(0.001)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def produce(log: logging.Logger, records: int, burst: int) -> float:
+    try:
+        raise RuntimeError('gateway hiccup')
+    except RuntimeError as exc:
+        error = exc
+
+    started = time.perf_counter()
+    for n in range(records):
+        if n % 100 == 0:
+            log.error('Shard %d failed to resume', n % 16, exc_info=error)
+        else:
+            log.info('Dispatching event %s for guild %d', 'MESSAGE_CREATE', n, extra={'guild_id': n})
+        if n % burst == burst - 1:
+            await asyncio.sleep(0)
+    return time.perf_counter() - started
+
+
+async def run(log: logging.Logger, args: argparse.Namespace) -> tuple[float, list[float]]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    tick = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0.01)
+    elapsed = await produce(log, args.records, args.burst)
+    stop.set()
+    await tick
+    return elapsed, lags
+
+
+def report(name: str, elapsed: float, lags: list[float], dropped: Any) -> None:
+    lags_ms = sorted(lag * 1e3 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{name:<10}{elapsed * 1e3:12.0f}{statistics.fmean(lags_ms):11.2f}{p99:11.2f}{lags_ms[-1]:11.2f}{dropped:>10}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--burst", type=int, default=500, help="records logged between yields to the loop")
+    parser.add_argument("--queue", type=int, default=10_000)
+    parser.add_argument("--rotate-kb", type=int, default=4096)
+    parser.add_argument("--dir", default=None, help="where to write the logs (default: a temporary directory)")
+    args = parser.parse_args()
+
+    print(f"records: {args.records:,}  burst: {args.burst}  queue: {args.queue:,}  rotate: {args.rotate_kb} KiB")
+    print(f"{'setup':<10}{'emit ms':>12}{'lag avg':>11}{'lag p99':>11}{'lag max':>11}{'dropped':>10}")
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as root:
+        log = logging.getLogger('bench.inline')
+        log.propagate = False
+        handlers = file_handlers(Path(root, 'inline'), args.rotate_kb * 1024)
+        for handler in handlers:
+            log.addHandler(handler)
+        elapsed, lags = await run(log, args)
+        for handler in handlers:
+            handler.close()
+        report('inline', elapsed, lags, '-')
+
+        log = logging.getLogger('bench.queued')
+        log.propagate = False
+        records: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=args.queue)
+        handlers = file_handlers(Path(root, 'queued'), args.rotate_kb * 1024)
+        listener = QueueListener(records, *handlers, respect_handler_level=True)
+        queue_handler = BoundedQueueHandler(records)
+        log.addHandler(queue_handler)
+        listener.start()
+        elapsed, lags = await run(log, args)
+        started = time.perf_counter()
+        records.join()
+        drained = time.perf_counter() - started
+        listener.stop()
+        for handler in handlers:
+            handler.close()
+        report('queued', elapsed, lags, queue_handler.dropped)
+        print(f"the writer thread finished {drained * 1e3:.0f} ms after the last record was queued")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
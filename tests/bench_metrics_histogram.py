@@ -0,0 +1,137 @@
+"""Benchmark: latency metrics kept as raw samples in a deque vs. in a histogram.
+
+Records ``--samples`` command timings, drawn from a log-normal distribution with a slow
+tail, into a :class:`~app.utils.metrics.MetricsCollector`. It then reads the percentiles
+and the slowest commands ``--reads`` times, as the dashboard polls ``/bot/metrics``. For
+each collector it reports the cost per recorded sample, the cost of one read, the
+memory held, and how far its p50/p95/p99 are from the exact ones over the samples it
+covers. The baseline is the previous collector, kept below for comparison only. It
+keeps a :class:`~collections.deque` of the last ``--window`` measurements and sorts it
+on every read. Not collected by pytest. Run it with::
+
+    python -m tests.bench_metrics_histogram --samples 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.utils.metrics import MetricsCollector
+
+# -- the old collector ---------------------------------------------------------
+
+
+@dataclass(slots=True)
+class CommandMetric:
+    command: str
+    duration_ms: float
+    guild_id: int | None
+    user_id: int
+    success: bool
+    timestamp: float = field(default_factory=time.time)
+
+
+class DequeCollector:
+    def __init__(self, *, window_size: int = 1000) -> None:
+        self._window: deque[CommandMetric] = deque(maxlen=window_size)
+        self._error_counts: defaultdict[str, int] = defaultdict(int)
+        self._total_commands = 0
+
+    def record_command(
+        self, command: str, duration_ms: float, *, guild_id: int | None = None, user_id: int = 0, success: bool = True
+    ) -> None:
+        self._total_commands += 1
+        self._window.append(CommandMetric(command, duration_ms, guild_id, user_id, success))
+
+    def latency_percentiles(self) -> dict[str, float]:
+        if not self._window:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        ordered = sorted(m.duration_ms for m in self._window)
+        n = len(ordered)
+        return {f"p{p}": round(ordered[min(int(n * p / 100), n - 1)], 2) for p in (50, 95, 99)}
+
+    def slowest_commands(self, top_n: int = 10) -> list[dict[str, float | str]]:
+        ordered = sorted(self._window, key=lambda m: m.duration_ms, reverse=True)
+        return [{"command": m.command, "duration_ms": round(m.duration_ms, 2)} for m in ordered[:top_n]]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "total_commands": self._total_commands,
+            "window_size": len(self._window),
+            "latency": self.latency_percentiles(),
+            "slowest": self.slowest_commands(5),
+            "errors": dict(self._error_counts),
+        }
+
+
+# -- runs ----------------------------------------------------------------------
+
+
+def samples(count: int) -> list[tuple[str, float]]:
+    rng = random.Random(0)
+    names = [f"cmd{n}" for n in range(64)]
+    # Most commands answer in tens of milliseconds; one in fifty waits on something slow.
+    return [
+        (rng.choice(names), rng.lognormvariate(3, 0.6) * (40 if rng.random() < 0.02 else 1)) for _ in range(count)
+    ]
+
+
+def exact(durations: list[float]) -> dict[str, float]:
+    ordered = sorted(durations)
+    n = len(ordered)
+    return {f"p{p}": ordered[min(int(n * p / 100), n - 1)] for p in (50, 95, 99)}
+
+
+def record_all(collector: Any, timings: list[tuple[str, float]]) -> None:
+    for command, duration_ms in timings:
+        collector.record_command(command, duration_ms, guild_id=1, user_id=2)
+
+
+def run(make: Any, timings: list[tuple[str, float]], reads: int) -> tuple[float, float, int, dict[str, Any]]:
+    collector = make()
+    started = time.perf_counter()
+    record_all(collector, timings)
+    record = (time.perf_counter() - started) / len(timings)
+
+    started = time.perf_counter()
+    for _ in range(reads):
+        summary = collector.summary()
+    read = (time.perf_counter() - started) / reads
+
+    # A second collector under tracemalloc, so its overhead stays out of the timings.
+    tracemalloc.start()
+    collector = make()
+    record_all(collector, timings)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return record, read, held, summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    parser.add_argument("--window", type=int, default=1000, help="the collectors' window_size")
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+
+    timings = samples(args.samples)
+    print(f"samples: {args.samples:,}  window: {args.window:,}  reads: {args.reads}")
+    print(f"{'collector':<11}{'record ns':>11}{'read us':>10}{'held KiB':>10}   {'p50 / p95 / p99 error':<25}")
+    for name, collector in (("deque", DequeCollector), ("histogram", MetricsCollector)):
+        record, read, held, summary = run(lambda: collector(window_size=args.window), timings, args.reads)
+        # Each collector is scored against the exact percentiles of the samples it covers.
+        truth = exact([duration_ms for _, duration_ms in timings[-summary["window_size"]:]])
+        errors = " / ".join(
+            f"{abs(summary['latency'][p] - truth[p]) / truth[p]:6.2%}" for p in ("p50", "p95", "p99")
+        )
+        print(f"{name:<11}{record * 1e9:11.0f}{read * 1e6:10.1f}{held / 1024:10,.0f}   {errors}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark: a long listing in a paginator, read up front vs. from a keyset page source.
+
+Pages through a ``--rows`` long leaderboard and reports the time until the first page is
+rendered, the time to turn to the next page, and the peak memory :mod:`tracemalloc` sees
+along the way. The baseline is the list-backed path every listing used: fetch all rows,
+format them into lines and hand them to :class:`~app.core.pagination.LinePaginator`. The
+current path is :class:`~app.core.pagination.SourcePaginator` over a
+:class:`~app.core.pagination.KeysetPageSource`, which reads one page and the one after.
+
+The database is a stand-in. A sorted list plays the index, each query waits
+``--latency`` milliseconds, and every returned row becomes a fresh :class:`dict`, the way
+asyncpg builds a record per row. Not collected by pytest. Run it with::
+
+    python -m tests.bench_paginator_sources --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import gc
+import time
+import tracemalloc
+from typing import Any
+
+import discord
+
+from app.core.pagination import KeysetPageSource, LinePaginator, SourcePaginator
+
+PER_PAGE = 15
+
+
+class Table:
+    """Wallets ordered richest first, queried by offset or keyset like ``get_balance_page``."""
+
+    def __init__(self, rows: int, latency: float) -> None:
+        self.latency = latency
+        # Ascending (-total, -user_id) is the descending (total, user_id) order of the index.
+        self.keys = sorted((-(user_id * 7919 % 1_000_003), -user_id) for user_id in range(1, rows + 1))
+
+    async def query(self, start: int, stop: int) -> list[dict[str, int]]:
+        await asyncio.sleep(self.latency)
+        return [{'user_id': -user_id, 'total': -total} for total, user_id in self.keys[start:stop]]
+
+    async def fetch_all(self) -> list[dict[str, int]]:
+        return await self.query(0, len(self.keys))
+
+    async def fetch(self, *, limit: int, after: tuple[int, int] | None, offset: int) -> list[dict[str, int]]:
+        start = offset if after is None else bisect.bisect_right(self.keys, (-after[0], -after[1]))
+        return await self.query(start, start + limit)
+
+
+def line(row: dict[str, int], position: int) -> str:
+    return f"**{position}.** <@{row['user_id']}> • **{row['total']:,}**"
+
+
+class Leaderboard(SourcePaginator[dict[str, int]]):
+    def format_row(self, row: dict[str, int], position: int, /) -> str:
+        return line(row, position)
+
+
+async def list_backed(table: Table) -> tuple[LinePaginator[str], Any]:
+    rows = await table.fetch_all()
+    paginator: LinePaginator[str] = LinePaginator(
+        entries=[line(row, position) for position, row in enumerate(rows, 1)], per_page=PER_PAGE
+    )
+    paginator.embed, paginator.location, paginator.numerate = discord.Embed(), 'description', False
+    return paginator, await paginator.format_page(paginator.pages[0])
+
+
+async def source_backed(table: Table) -> tuple[Leaderboard, Any]:
+    source = KeysetPageSource(
+        table.fetch, key=lambda row: (row['total'], row['user_id']), per_page=PER_PAGE, count=len(table.keys)
+    )
+    paginator = Leaderboard(entries=range(source.page_count), per_page=1)
+    paginator.source, paginator.embed, paginator.location, paginator.numerate = source, discord.Embed(), 'description', False
+    return paginator, await paginator.format_page(paginator.pages[0])
+
+
+async def run(make: Any, table: Table) -> tuple[float, float, int]:
+    gc.collect()  # don't bill one path for collecting the other's garbage
+    tracemalloc.start()
+    started = time.perf_counter()
+    paginator, _ = await make(table)
+    first = time.perf_counter() - started
+
+    await asyncio.sleep(table.latency * 2)  # the user reads the first page
+    started = time.perf_counter()
+    await paginator.format_page(paginator.switch_page(1))
+    second = time.perf_counter() - started
+
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    paginator.stop()
+    return first, second, peak
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--latency", type=float, default=2.0, help="milliseconds per query")
+    args = parser.parse_args()
+
+    table = Table(args.rows, args.latency / 1000)
+    print(f"rows: {args.rows:,}  per page: {PER_PAGE}  latency: {args.latency} ms/query")
+    print(f"{'path':<14}{'first page ms':>15}{'next page ms':>14}{'peak KiB':>12}")
+    for name, make in (("list-backed", list_backed), ("keyset source", source_backed)):
+        first, second, peak = await run(make, table)
+        print(f"{name:<14}{first * 1e3:15.2f}{second * 1e3:14.2f}{peak / 1024:12,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
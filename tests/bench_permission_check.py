@@ -0,0 +1,113 @@
+"""Benchmark: per-invoke cost of :func:`command_permission_check`, name sets vs. bitmasks.
+
+Runs the check ``--calls`` times for a few typical commands: an ungated one (most
+commands), one gated on :attr:`PermissionTemplate.moderator` that the member passes, the
+same command under a per-guild :class:`CommandOverride`, and a member who is refused.
+The baseline is the previous check, kept below for comparison only. It walked every flag
+of the member's and the bot's :class:`discord.Permissions` into a ``missing`` list on
+each call, and an override converted its bitmask back into names. The current check
+compares the precompiled masks with one ``&`` and only names the flags when it refuses.
+
+The context is a stand-in with fixed permissions, so the figures leave out the
+``permissions_for`` call discord.py makes when ``ctx.permissions`` is first read. The
+current check skips that call for commands without a user gate. Not collected by pytest.
+Run it with::
+
+    python -m tests.bench_permission_check --calls 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import discord
+from discord.ext import commands
+
+from app.core.command import command as make_command
+from app.core.permissions import CommandOverride, PermissionSpec, PermissionTemplate, command_permission_check
+
+
+async def legacy_check(ctx: Any) -> bool:
+    spec = ctx.command.permissions
+    if ctx.bot.bypass_checks or PermissionSpec._is_owner(ctx.bot, ctx.author):
+        return True
+
+    overrides = await ctx.bot.db.get_command_overrides(ctx.guild.id)
+    override = overrides.get(ctx.command.qualified_name)
+    required = spec.user
+    if override is not None and override.permissions is not None:
+        required = {flag for flag, enabled in discord.Permissions(override.permissions) if enabled}
+
+    user = ctx.permissions
+    missing = [perm for perm, value in user if perm in required and not value]
+    if missing and not user.administrator:
+        raise commands.MissingPermissions(missing)
+
+    bot = ctx.bot_permissions
+    missing = [perm for perm, value in bot if perm in spec.bot and not value]
+    if missing and not bot.administrator:
+        raise commands.BotMissingPermissions(missing)
+    return True
+
+
+def make_ctx(cmd: Any, user_perms: discord.Permissions, overrides: dict[str, CommandOverride]) -> SimpleNamespace:
+    class DB:
+        async def get_command_overrides(self, _guild_id: int) -> dict[str, CommandOverride]:
+            return overrides
+
+    bot = SimpleNamespace(bypass_checks=False, owner_id=999, owner_ids=None, db=DB())
+    return SimpleNamespace(
+        command=cmd,
+        bot=bot,
+        guild=SimpleNamespace(id=1),
+        author=SimpleNamespace(id=5),
+        permissions=user_perms,
+        bot_permissions=discord.Permissions(
+            read_message_history=True, view_channel=True, send_messages=True, embed_links=True
+        ),
+    )
+
+
+async def timed(check: Any, ctx: Any, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        try:
+            await check(ctx)
+        except commands.CheckFailure:
+            pass
+    return (time.perf_counter() - started) / calls
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    async def callback(ctx: Any) -> None: ...
+
+    ungated = make_command("ping")(callback)  # type: ignore[arg-type]
+    gated = make_command("ban", user_permissions=PermissionTemplate.moderator)(callback)  # type: ignore[arg-type]
+    moderator = discord.Permissions(kick_members=True, ban_members=True, manage_messages=True, send_messages=True)
+    override = {"ban": CommandOverride("ban", permissions=discord.Permissions(manage_messages=True).value)}
+
+    cases = [
+        ("ungated", make_ctx(ungated, discord.Permissions(send_messages=True), {})),
+        ("gated, passes", make_ctx(gated, moderator, {})),
+        ("override, passes", make_ctx(gated, moderator, override)),
+        ("gated, refused", make_ctx(gated, discord.Permissions(send_messages=True), {})),
+    ]
+
+    print(f"calls: {args.calls} per case")
+    print(f"{'case':<18}{'legacy µs':>11}{'masks µs':>11}{'speed-up':>10}")
+    for name, ctx in cases:
+        legacy = await timed(legacy_check, ctx, args.calls)
+        masks = await timed(command_permission_check, ctx, args.calls)
+        print(f"{name:<18}{legacy * 1e6:11.2f}{masks * 1e6:11.2f}{legacy / masks:9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""Benchmark: 7-card hand evaluation, :class:`Ranker` vs. the :class:`HandEvaluator` tables.
+
+Deals ``--hands`` random 7-card hands and ranks them the way the odds simulation does:
+the old path ranks all 21 five-card combinations of every hand with ``Ranker.rank_all_hands``,
+the new one looks each hand up in the memory-mapped tables. Also reports how long building
+and loading the tables takes. Not collected by pytest. Run it with::
+
+    python -m tests.bench_poker_eval --hands 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.cogs.games.engine.evaluator import HandEvaluator
+from app.cogs.games.engine.poker import Ranker, comb_index
+
+
+def deal(count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    deck = np.array([[value, suit] for value in range(2, 15) for suit in range(4)])
+    return deck[np.argsort(rng.random((count, len(deck))), axis=1)[:, :7]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hands", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3, help="evaluator runs, best one counts")
+    args = parser.parse_args()
+
+    hands = deal(args.hands)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tables.npy"
+        started = time.perf_counter()
+        HandEvaluator.load(path)
+        built = time.perf_counter() - started
+        started = time.perf_counter()
+        evaluator = HandEvaluator.load(path)
+        loaded = time.perf_counter() - started
+
+        started = time.perf_counter()
+        Ranker.rank_all_hands(hands[:, comb_index(7, 5), :].copy())
+        baseline = time.perf_counter() - started
+
+        fastest = min(_timed(evaluator, hands) for _ in range(args.repeat))
+
+    print(f"hands: {args.hands}  (7 cards, 21 combinations each)")
+    print(f"tables: built in {built * 1000:.0f} ms, memory-mapped in {loaded * 1000:.2f} ms")
+    print(f"Ranker:        {args.hands / baseline:14,.0f} hands/s  ({baseline:.3f}s)")
+    print(f"HandEvaluator: {args.hands / fastest:14,.0f} hands/s  ({fastest:.3f}s)")
+    print(f"speed-up:      {baseline / fastest:14.1f}x")
+
+
+def _timed(evaluator: HandEvaluator, hands: np.ndarray) -> float:
+    started = time.perf_counter()
+    evaluator.evaluate(hands)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    main()
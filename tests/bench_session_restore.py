@@ -0,0 +1,113 @@
+"""Benchmark: restoring persisted music sessions, sequential vs. :class:`RestoreScheduler`.
+
+Starts a local stand-in Lavalink node (an aiohttp app answering ``/v4/loadtracks`` after a
+configurable delay) and restores ``--sessions`` fake sessions against it. Each restore waits
+``--connect`` seconds for the voice handshake, then resolves the session's current track
+and queue from the node, which is the work ``Player.restore`` does.
+
+The baseline is the old loop: one session at a time, with ``--stagger`` seconds between them.
+It defaults to the production value of one second, so keep ``--sessions`` small or lower
+``--stagger`` to keep runs short. Not collected by pytest. Run it with::
+
+    python -m tests.bench_session_restore --sessions 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from aiohttp import ClientSession, web
+
+from app.services.session_restore import RestoreProgress, RestoreScheduler
+
+
+async def start_node(latency: float) -> tuple[web.AppRunner, str]:
+    async def loadtracks(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        identifier = request.query.get("identifier", "")
+        return web.json_response({"loadType": "track", "data": {"encoded": identifier, "info": {}, "pluginInfo": {}}})
+
+    app = web.Application()
+    app.router.add_get("/v4/loadtracks", loadtracks)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def make_sessions(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "guild_id": n,
+            "shard_id": n % 4,
+            "listeners": rng.choice((0, 0, 1, 2, 5, 12)),
+            "tracks": [f"https://example.com/{n}/{t}" for t in range(rng.randint(1, 12))],
+        }
+        for n in range(count)
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=40)
+    parser.add_argument("--connect", type=float, default=0.35, help="simulated voice handshake (s)")
+    parser.add_argument("--latency", type=float, default=0.02, help="stand-in node load latency (s)")
+    parser.add_argument("--stagger", type=float, default=1.0, help="baseline pause between sessions (s)")
+    parser.add_argument("--rate", type=float, default=2.0)
+    parser.add_argument("--burst", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    runner, base = await start_node(args.latency)
+    sessions = make_sessions(args.sessions)
+    try:
+        async with ClientSession() as http:
+
+            async def restore(session: dict) -> bool:
+                await asyncio.sleep(args.connect)
+                for uri in session["tracks"]:
+                    async with http.get(f"{base}/v4/loadtracks", params={"identifier": uri}) as resp:
+                        await resp.json()
+                return True
+
+            # Baseline: the previous sequential, staggered loop.
+            started = time.perf_counter()
+            first = None
+            for session in sessions:
+                await restore(session)
+                first = first if first is not None else time.perf_counter() - started
+                await asyncio.sleep(args.stagger)
+            baseline = time.perf_counter() - started
+
+            scheduler = RestoreScheduler(rate=args.rate, burst=args.burst, concurrency=args.concurrency)
+            progress = await scheduler.run(
+                sessions,
+                restore,
+                priority=lambda s: s["listeners"],
+                key=lambda s: s["shard_id"],
+                progress=RestoreProgress(),
+            )
+    finally:
+        await runner.cleanup()
+
+    summary = progress.to_dict()
+    print(
+        f"sessions: {args.sessions}  "
+        f"(4 shards, rate {args.rate}/s/shard, burst {args.burst}, concurrency {args.concurrency})"
+    )
+    print(f"sequential: {baseline:8.2f}s total, first session after {first:.2f}s")
+    print(
+        f"scheduler:  {summary['elapsed_s']:8.2f}s total, first session after {summary['first_restored_s']}s, "
+        f"p50 {summary['session_p50_s']}s, max {summary['session_max_s']}s"
+    )
+    print(f"speed-up:   {baseline / summary['elapsed_s']:8.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""Tests that the streamed backup export matches ``/backup/export``."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.internal_api.routers.backup import export_backup, export_backup_stream
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+CONFIG = SimpleNamespace(
+    flags=SimpleNamespace(audit_log=True, raid=False, alerts=False, sentinel=True, mentions=False),
+    prefixes=['?', '!'],
+    mention_count=5,
+    use_music_panel=False,
+)
+AUTORESPONDERS = [{'trigger': 'hi', 'response': 'hello', 'match_type': 'contains', 'ignore_case': True}]
+TAGS = [{'name': 'rules', 'content': 'be nice'}, {'name': 'faq', 'content': 'see pins'}]
+
+
+def make_db(autoresponders: list[dict], tags: list[dict]) -> MagicMock:
+    def rows(records: list[dict]) -> Any:
+        async def iterate(*_: Any, **__: Any) -> AsyncIterator[dict]:
+            for record in records:
+                yield record
+
+        return iterate
+
+    @contextlib.asynccontextmanager
+    async def acquire() -> AsyncIterator[MagicMock]:
+        yield MagicMock()  # its transaction() is a MagicMock, which works as an async context manager
+
+    db = MagicMock()
+    db.get_guild_config = AsyncMock(return_value=CONFIG)
+    db.autoresponders.get_all = AsyncMock(return_value=autoresponders)
+    db.autoresponders.iter_export = rows(autoresponders)
+    db.tags.export_tags = AsyncMock(return_value=tags)
+    db.tags.iter_export = rows(tags)
+    db.acquire = acquire
+    return db
+
+
+class Bridge:
+    async def call(self, fn: Any, *args: Any) -> Any:
+        return await fn(*args)
+
+
+@pytest.mark.parametrize(('autoresponders', 'tags'), [(AUTORESPONDERS, TAGS), ([], TAGS), ([], [])])
+async def test_streamed_json_matches_the_export(autoresponders: list[dict], tags: list[dict]) -> None:
+    db = make_db(autoresponders, tags)
+    bot = SimpleNamespace(db=db)
+    guild = SimpleNamespace(id=7)
+
+    exported = await export_backup(guild, bot)
+    response = await export_backup_stream(guild, bot, db, Bridge(), fmt='json', gzip=False)
+    streamed = json.loads(b''.join([chunk async for chunk in response.body_iterator]))
+
+    del exported['created_at'], streamed['created_at']
+    assert streamed == exported
@@ -1,5 +1,12 @@
 """Tests for the pure backup/template helpers in :mod:`app.services.backup`."""
 
+import gzip
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
 from app.services import backup
 
 
@@ -66,3 +73,146 @@ class TestSummarizeSections:
             {"tags": [1, 2, 3], "config": {"a": 1, "b": 2}, "weird": 5}
         )
         assert summary == {"tags": 3, "config": 2, "weird": 0}
+
+
+class TestPrepareAutoresponders:
+    def test_rows_keep_order_and_defaults(self) -> None:
+        rows, failed = backup.prepare_autoresponders([
+            {"trigger": " hi ", "response": " hello "},
+            {"trigger": "bye", "response": "cya", "match_type": "exact", "ignore_case": False},
+        ])
+        assert rows == [(0, "hi", "hello", "contains", True), (1, "bye", "cya", "exact", False)]
+        assert failed == 0
+
+    def test_malformed_items_fail(self) -> None:
+        rows, failed = backup.prepare_autoresponders(
+            ["nope", {"trigger": "", "response": "x"}, {"trigger": 5, "response": "x"}, {"trigger": "a", "response": "b"}]
+        )
+        assert [row[1] for row in rows] == ["a"]
+        assert failed == 3
+
+    def test_non_list_and_item_cap(self) -> None:
+        assert backup.prepare_autoresponders({"trigger": "a"}) == ([], 0)
+        rows, _ = backup.prepare_autoresponders(
+            [{"trigger": f"t{n}", "response": "r"} for n in range(backup.MAX_SECTION_ITEMS + 5)]
+        )
+        assert len(rows) == backup.MAX_SECTION_ITEMS
+
+
+class TestPrepareTags:
+    def test_reserved_and_repeated_names_are_skipped(self) -> None:
+        rows, skipped, failed = backup.prepare_tags(
+            [
+                {"name": "rules", "content": "be nice"},
+                {"name": "RULES", "content": "dupe"},
+                {"name": "create thing", "content": "reserved"},
+                {"name": "faq", "content": "see pins"},
+            ],
+            {"create", "edit"},
+        )
+        assert rows == [(0, "rules", "be nice"), (1, "faq", "see pins")]
+        assert (skipped, failed) == (2, 0)
+
+    def test_limits_and_blanks_fail(self) -> None:
+        rows, skipped, failed = backup.prepare_tags(
+            [{"name": "x" * 101, "content": "c"}, {"name": "ok", "content": "c" * 2001}, {"name": " ", "content": "c"}, 3],
+            set(),
+        )
+        assert rows == []
+        assert (skipped, failed) == (0, 4)
+
+
+async def _records(tags: int = 3) -> AsyncIterator[tuple[str, object]]:
+    yield "config", {"prefixes": ["?"]}
+    yield "autoresponders", {"trigger": "hi", "response": "hello"}
+    yield "secrets", {"nope": True}
+    for n in range(tags):
+        yield "tags", {"name": f"t{n}", "content": "c"}
+
+
+async def _collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestStreamBackup:
+    async def test_json_stream_is_the_regular_document(self) -> None:
+        raw = await _collect(backup.stream_backup(7, _records(), fmt="json", chunk_size=16))
+        blob = json.loads(raw)
+
+        assert backup.validate_backup(blob) == (True, None)
+        assert blob["guild_id"] == "7"
+        assert blob["sections"] == {
+            "config": {"prefixes": ["?"]},
+            "autoresponders": [{"trigger": "hi", "response": "hello"}],
+            "tags": [{"name": "t0", "content": "c"}, {"name": "t1", "content": "c"}, {"name": "t2", "content": "c"}],
+        }
+
+    async def test_empty_json_stream(self) -> None:
+        async def nothing() -> AsyncIterator[tuple[str, object]]:
+            return
+            yield
+
+        blob = json.loads(await _collect(backup.stream_backup(7, nothing(), fmt="json")))
+        assert blob["sections"] == {"autoresponders": [], "tags": []}
+
+    async def test_ndjson_round_trips_through_the_reader(self) -> None:
+        raw = await _collect(backup.gzip_stream(backup.stream_backup(7, _records(), chunk_size=16)))
+        assert gzip.decompress(raw).count(b"\n") == 6  # header + 5 portable records
+
+        reader = backup.BackupStreamReader()
+        for start in range(0, len(raw), 5):
+            reader.feed(raw[start:start + 5])
+        blob = reader.close()
+
+        assert backup.validate_backup(blob) == (True, None)
+        assert blob["sections"]["config"] == {"prefixes": ["?"]}
+        assert reader.counts == {"config": 1, "autoresponders": 1, "tags": 3}
+
+
+class TestBackupStreamReader:
+    @staticmethod
+    def _read(raw: bytes, **kwargs: Any) -> backup.BackupStreamReader:
+        reader = backup.BackupStreamReader(**kwargs)
+        reader.feed(raw)
+        reader.close()
+        return reader
+
+    async def test_keeps_selected_sections_up_to_the_cap(self) -> None:
+        raw = await _collect(backup.stream_backup(1, _records(tags=5)))
+
+        reader = self._read(raw, sections=["tags", "bogus"], max_items=2)
+
+        assert list(reader.sections) == ["tags"]
+        assert len(reader.sections["tags"]) == 2
+        assert reader.counts == {"tags": 5}
+
+    def test_bad_header_is_rejected_before_the_records(self) -> None:
+        reader = backup.BackupStreamReader()
+        with pytest.raises(backup.BackupStreamError, match="Percy backup"):
+            reader.feed(b'{"kind": "other", "version": 1, "sections": {}}\n')
+
+    def test_malformed_records_and_lines(self) -> None:
+        header = json.dumps(backup.build_backup(1, {})).encode() + b"\n"
+        with pytest.raises(backup.BackupStreamError, match="line 2"):
+            self._read(header + b"not json\n")
+        with pytest.raises(backup.BackupStreamError, match="record"):
+            self._read(header + b'{"tags": []}\n')
+        with pytest.raises(backup.BackupStreamError, match="longer"):
+            backup.BackupStreamReader(max_line=10).feed(header[:-1])
+
+    def test_empty_and_truncated_streams(self) -> None:
+        with pytest.raises(backup.BackupStreamError, match="empty"):
+            self._read(b"")
+        header = json.dumps(backup.build_backup(1, {})).encode() + b"\n"
+        with pytest.raises(backup.BackupStreamError, match="truncated"):
+            self._read(gzip.compress(header)[:-8])
+
+    def test_gzip_bomb_is_cut_off(self) -> None:
+        header = json.dumps(backup.build_backup(1, {})).encode() + b"\n"
+        raw = gzip.compress(header + b"\n" * (8 * 1024 * 1024))
+        assert len(raw) < 16 * 1024
+
+        reader = backup.BackupStreamReader(max_size=1024 * 1024)
+        with pytest.raises(backup.BackupStreamError, match="larger"):
+            reader.feed(raw)
+        assert reader.size <= 1024 * 1024 + backup.STREAM_CHUNK_SIZE
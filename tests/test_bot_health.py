@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from app.services import BotHealthReport, ConnectionState, HealthLevel, assess_bot_health
+from app.services import BotHealthReport, ConnectionState, HealthLevel, HTTPClientState, assess_bot_health
 from app.services.bot_health import parse_lavalink_metrics, parse_prometheus_samples
 
 GEN = 5
@@ -109,6 +109,33 @@ def test_warnings_accumulate_across_sources() -> None:
     assert report.level == HealthLevel.WARNING
 
 
+def _client(name: str, *, breaker_open: bool = False, waiting: int = 0) -> HTTPClientState:
+    return HTTPClientState(
+        name=name,
+        breaker_open=breaker_open,
+        in_flight=2,
+        waiting=waiting,
+        max_concurrency=4,
+        wait_avg_ms=1.25,
+        wait_max_ms=12.0,
+    )
+
+
+def test_open_http_breakers_add_warnings_and_raise_to_warning_level() -> None:
+    report = _assess(http_clients=[_client('LRCLib', breaker_open=True), _client('Translate', waiting=3)])
+
+    assert report.open_breakers == 1
+    assert report.warnings == 1
+    assert report.level == HealthLevel.WARNING
+
+
+def test_http_client_state_describes_breaker_and_waits() -> None:
+    state = _client('AniList', waiting=3)
+
+    assert state.saturated
+    assert state.describe() == "AniList: breaker closed | 2/4 in flight, 3 waiting | wait avg 1.2ms, max 12.0ms"
+
+
 # -- Lavalink metrics parsing ---------------------------------------------------
 
 # A trimmed but faithful sample of a real Lavalink ``/metrics`` payload, including the
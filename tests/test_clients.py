@@ -1,19 +1,25 @@
 """Tests for :class:`~app.clients.base.BaseHTTPClient`.
 
 These exercise the shared resilience behaviour every API client inherits — rate-limit
-retries, transport-error backoff, standardized errors and the circuit breaker — using a
-lightweight fake :class:`aiohttp.ClientSession` so no network or real sleeping happens.
+retries, transport-error backoff, standardized errors, the circuit breaker and the
+response cache — using a lightweight fake :class:`aiohttp.ClientSession` so no network or
+real sleeping happens.
 """
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import aiohttp
 import pytest
+from aiohttp import web
 
 from app.clients import BaseHTTPClient, CircuitBreakerOpen, HTTPClientError, TransportError
+from app.clients.base import StaleResult
+from app.clients.cache import CachedResponse, ResponseCache, request_key
 from app.clients.ollama import OllamaClient, OllamaResponseError
+from app.clients.pool import ConnectionPools, PoolStats
 
 
 class FakeResponse:
@@ -244,6 +250,223 @@ async def test_should_retry_hook_can_back_off_on_custom_signal() -> None:
     assert len(session.calls) == 2
 
 
+# -- response cache --------------------------------------------------------------
+
+
+class CachingClient(Client):
+    CACHE_TTL = 60.0
+
+
+def cached_client(responses: list[FakeResponse]) -> tuple[CachingClient, FakeSession]:
+    session = FakeSession(responses)
+    return CachingClient(session), session  # type: ignore[arg-type]
+
+
+def test_request_key_covers_params_body_and_headers() -> None:
+    base = request_key('GET', 'https://x/search', params={'q': 'a'})
+
+    assert base == request_key('get', 'https://x/search', params={'q': 'a'})
+    assert base != request_key('GET', 'https://x/search', params={'q': 'b'})
+    assert base != request_key('GET', 'https://x/search', params={'q': 'a'}, headers={'Authorization': 'u1'})
+    assert request_key('POST', 'https://x', json_body={'a': 1, 'b': 2}) == request_key(
+        'POST', 'https://x', json_body={'b': 2, 'a': 1}
+    )
+
+
+async def test_fresh_response_is_served_from_cache_per_params() -> None:
+    client, session = cached_client([
+        FakeResponse(json_data={'q': 'a'}),
+        FakeResponse(json_data={'q': 'b'}),
+    ])
+
+    assert await client.fetch('GET', 'search', params={'q': 'a'}) == {'q': 'a'}
+    assert await client.fetch('GET', 'search', params={'q': 'b'}) == {'q': 'b'}
+    assert await client.fetch('GET', 'search', params={'q': 'a'}) == {'q': 'a'}
+
+    assert len(session.calls) == 2
+    summary = client.cache_summary()
+    assert summary is not None
+    assert (summary['hits'], summary['misses'], summary['entries']) == (1, 2, 2)
+
+
+async def test_cache_control_max_age_and_no_store() -> None:
+    client, session = cached_client([
+        FakeResponse(json_data=1, headers={'Cache-Control': 'no-store'}),
+        FakeResponse(json_data=2, headers={'Cache-Control': 'public, max-age=0'}),
+        FakeResponse(json_data=3),
+    ])
+
+    assert await client.fetch('GET', 'a') == 1
+    assert await client.fetch('GET', 'a') == 2  # no-store: nothing was kept
+    assert await client.fetch('GET', 'a') == 3  # max-age=0 overrides CACHE_TTL
+    assert len(session.calls) == 3
+
+
+async def test_expired_entry_with_etag_is_revalidated() -> None:
+    client, session = cached_client([
+        FakeResponse(json_data={'v': 1}, headers={'ETag': '"abc"', 'Cache-Control': 'max-age=0'}),
+        FakeResponse(status=304, headers={'Cache-Control': 'max-age=30'}),
+    ])
+
+    assert await client.fetch('GET', 'item') == {'v': 1}
+    assert await client.fetch('GET', 'item') == {'v': 1}
+    assert await client.fetch('GET', 'item') == {'v': 1}  # fresh again after the 304
+
+    assert len(session.calls) == 2
+    assert session.calls[1][2]['headers']['If-None-Match'] == '"abc"'
+    assert client.cache is not None and client.cache.stats.revalidated == 1
+
+
+async def test_concurrent_identical_requests_are_coalesced() -> None:
+    entered, release = asyncio.Event(), asyncio.Event()
+
+    class SlowResponse(FakeResponse):
+        async def __aenter__(self) -> FakeResponse:
+            entered.set()
+            await release.wait()
+            return self
+
+    client, session = cached_client([SlowResponse(json_data={'ok': True})])
+
+    tasks = [asyncio.create_task(client.fetch('GET', 'slow')) for _ in range(5)]
+    await entered.wait()  # asyncio.sleep is patched out; by now every task is waiting
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [{'ok': True}] * 5
+    assert len(session.calls) == 1
+    assert client.cache is not None and client.cache.stats.coalesced == 4
+
+
+async def test_uncacheable_methods_and_opt_out_bypass_the_cache() -> None:
+    client, session = cached_client([FakeResponse(json_data=n) for n in range(4)])
+
+    assert [await client.fetch('POST', 'x') for _ in range(2)] == [0, 1]
+    assert [await client.fetch('GET', 'x', cache=False) for _ in range(2)] == [2, 3]
+    assert len(session.calls) == 4
+
+
+async def test_stale_entry_served_while_breaker_open() -> None:
+    client, _session = cached_client(
+        [FakeResponse(json_data={'v': 1}, headers={'Cache-Control': 'max-age=0'})]
+        + [FakeResponse(status=500, json_data={}) for _ in range(Client.BREAKER_THRESHOLD)]
+    )
+
+    await client.fetch('GET', 'item')
+    for _ in range(Client.BREAKER_THRESHOLD):
+        with pytest.raises(HTTPClientError):
+            await client.fetch('GET', 'item')
+    assert client.breaker_open
+
+    result = await client.fetch('GET', 'item')
+
+    assert isinstance(result, StaleResult) and result.data == {'v': 1}
+    with pytest.raises(CircuitBreakerOpen):
+        await client.fetch('GET', 'other')
+
+
+def test_response_cache_is_bounded_by_entries_and_bytes() -> None:
+    def entry(size: int) -> CachedResponse:
+        return CachedResponse(payload=None, size=size, stored_at=0.0, expires_at=1.0)
+
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    cache.put('a', entry(10))
+    cache.put('b', entry(10))
+    cache.get('a')  # 'b' is now least recently used
+    cache.put('c', entry(10))
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+
+    cache.put('d', entry(95))
+    assert list(cache._entries) == ['d'] and cache.size == 95
+    assert not cache.put('e', entry(101))
+    assert cache.stats.evictions == 3
+
+
+async def test_cache_summaries_cover_live_clients() -> None:
+    client, _ = cached_client([FakeResponse(json_data={})])
+    client.name = 'Summarised'
+    await client.fetch('GET', 'x')
+
+    summaries = {entry['client']: entry for entry in BaseHTTPClient.cache_summaries()}
+
+    assert summaries['Summarised']['misses'] == 1
+    assert summaries['Summarised']['entries'] == 1
+
+
+# -- concurrency cap and connection pools ------------------------------------------
+
+
+async def test_concurrency_cap_queues_requests_and_records_waits() -> None:
+    release = asyncio.Event()
+    entered = 0
+
+    class HeldResponse(FakeResponse):
+        async def __aenter__(self) -> FakeResponse:
+            nonlocal entered
+            entered += 1
+            await release.wait()
+            return self
+
+    class CappedClient(Client):
+        MAX_CONCURRENCY = 2
+
+    client = CappedClient(FakeSession([HeldResponse(json_data=n) for n in range(3)]))  # type: ignore[arg-type]
+    tasks = [asyncio.create_task(client.fetch('GET', f'item/{n}')) for n in range(3)]
+    while entered < 2:
+        await asyncio.wait(tasks, timeout=0.01)
+
+    assert (client.stats.in_flight, client.stats.waiting) == (2, 1)
+
+    release.set()
+    assert sorted(await asyncio.gather(*tasks)) == [0, 1, 2]
+    assert (client.stats.in_flight, client.stats.waiting, client.stats.requests) == (0, 0, 3)
+    assert client.stats.wait_max > 0
+
+
+def test_pool_stats_summary() -> None:
+    stats = PoolStats(requests=4, connections_created=1, connections_reused=3, dns_hits=3, dns_misses=1)
+    stats.record_queue_wait(0.01)
+    stats.record_queue_wait(0.03)
+
+    summary = stats.to_dict()
+
+    assert summary['keepalive_reuse_ratio'] == 0.75
+    assert summary['dns_hit_ratio'] == 0.75
+    assert summary['queued'] == 2
+    assert summary['queue_wait_avg_ms'] == 20.0
+    assert summary['queue_wait_max_ms'] == 30.0
+
+
+async def test_dedicated_hosts_get_their_own_session_and_connections_are_reused() -> None:
+    async def ok(_request: web.Request) -> web.Response:
+        return web.json_response({'ok': True})
+
+    app = web.Application()
+    app.router.add_get('/', ok)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    pools = ConnectionPools(hosts={'ollama.internal': 2})
+    try:
+        assert pools.session_for('http://Ollama.internal:11434/api') is not pools.default
+        assert pools.session_for('https://lrclib.net/api/get') is pools.default
+
+        for _ in range(3):
+            async with pools.default.get(f'http://127.0.0.1:{port}/') as response:
+                await response.read()
+    finally:
+        await pools.close()
+        await runner.cleanup()
+
+    summary = {entry['pool']: entry for entry in pools.summary()}
+    assert summary['default']['requests'] == 3
+    assert summary['default']['connections_created'] == 1
+    assert summary['default']['connections_reused'] == 2
+    assert summary['ollama.internal']['limit'] == 2
+
+
 # -- OllamaClient ----------------------------------------------------------------
 
 
@@ -0,0 +1,88 @@
+"""Tests for the paged economy leaderboard.
+
+Covers the keyset/offset queries on :class:`~app.database.repositories.users.UsersRepository`
+and how :class:`~app.cogs.economy.ui.LeaderboardPaginator` reads them through a keyset
+page source.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from app.cogs.economy.ui import LeaderboardPaginator
+from app.database.repositories import UsersRepository
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def wallet(user_id: int, total: int) -> dict[str, int]:
+    return {'user_id': user_id, 'cash': total, 'bank': 0, 'total': total}
+
+
+async def test_first_page_uses_offset(mock_db: MagicMock) -> None:
+    repo = UsersRepository(mock_db)
+
+    await repo.get_balance_page(5, limit=15)
+
+    query, *params = mock_db.fetch.await_args.args
+    assert 'cash + bank > 0' in query  # matches the partial index predicate
+    assert 'ORDER BY cash + bank DESC, user_id DESC LIMIT $2 OFFSET $3' in query
+    assert params == [5, 15, 0]
+
+
+async def test_next_page_continues_after_the_cursor(mock_db: MagicMock) -> None:
+    repo = UsersRepository(mock_db)
+
+    await repo.get_balance_page(5, limit=15, after=(900, 42))
+
+    query, *params = mock_db.fetch.await_args.args
+    assert '(cash + bank, user_id) < ($2, $3)' in query
+    assert 'OFFSET' not in query
+    assert params == [5, 900, 42, 15]
+
+
+async def test_totals_come_from_the_aggregate(mock_db: MagicMock) -> None:
+    repo = UsersRepository(mock_db)
+
+    await repo.get_balance_totals(5)
+
+    query, *params = mock_db.fetchrow.await_args.args
+    assert 'FROM economy_totals' in query
+    assert 'FROM economy ' not in query
+    assert params == [5]
+
+
+async def start(
+    monkeypatch: pytest.MonkeyPatch, pages: list[list[dict[str, int]]], ranked: int
+) -> tuple[LeaderboardPaginator, AsyncMock]:
+    ctx = MagicMock()
+    ctx.db.users.get_balance_page = get_page = AsyncMock(side_effect=pages)
+    monkeypatch.setattr(LeaderboardPaginator, '_send', AsyncMock())
+    paginator = await LeaderboardPaginator.start(ctx, guild_id=5, ranked=ranked, embed=discord.Embed(), per_page=2)
+    return paginator, get_page
+
+
+async def test_paginator_walks_pages_by_keyset(monkeypatch: pytest.MonkeyPatch) -> None:
+    paginator, get_page = await start(monkeypatch, [[wallet(1, 500), wallet(2, 300)], [wallet(3, 100)]], ranked=3)
+
+    second = await paginator.format_page(paginator.switch_page(1))
+
+    assert paginator.msg is not None
+    assert second.description is not None and second.description.startswith('**3.** <@3>')
+    assert get_page.await_args_list[0].args == (5,)
+    assert get_page.await_args_list[0].kwargs == {'limit': 2, 'after': None, 'offset': 0}
+    assert get_page.await_args_list[1].kwargs == {'limit': 2, 'after': (300, 2), 'offset': 0}
+    assert get_page.await_count == 2  # the second page was read ahead
+
+
+async def test_paginator_jumps_by_offset(monkeypatch: pytest.MonkeyPatch) -> None:
+    pages = [[wallet(1, 500), wallet(2, 300)], [wallet(3, 200), wallet(4, 100)], [wallet(9, 50)]]
+    paginator, get_page = await start(monkeypatch, pages, ranked=8)
+
+    await paginator.format_page([3])
+
+    assert {'limit': 2, 'after': None, 'offset': 6} in [call.kwargs for call in get_page.await_args_list]
@@ -0,0 +1,122 @@
+"""Tests for the wallet ledger on :class:`~app.database.repositories.economy.EconomyRepository`.
+
+These confirm deltas are merged and locked in a stable order, that the balance check
+lives in the SQL itself, and that a multi-wallet change is rolled back as a whole
+when any wallet is short.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+import pytest
+
+from app.database.repositories import EconomyRepository, UsersRepository
+
+
+def make_repo(mock_db: MagicMock) -> EconomyRepository:
+    return EconomyRepository(mock_db)
+
+
+@pytest.fixture
+def transaction(mock_db: MagicMock) -> MagicMock:
+    """``conn.transaction()`` as an async context manager that records how it exited."""
+    cm = MagicMock(name='Transaction')
+    cm.__aenter__ = AsyncMock(return_value=None)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    mock_db.connection.transaction = MagicMock(return_value=cm)
+    return cm
+
+
+def row(user_id: int, cash: int, bank: int = 0) -> dict[str, int]:
+    return {'user_id': user_id, 'guild_id': 1, 'cash': cash, 'bank': bank}
+
+
+async def test_single_wallet_is_one_statement(mock_db: MagicMock) -> None:
+    repo = make_repo(mock_db)
+    mock_db.fetch.return_value = [row(7, 50, 150)]
+
+    result = await repo.adjust_balance(7, 1, cash=-100, bank=100)
+
+    assert result == row(7, 50, 150)
+    mock_db.fetch.assert_awaited_once()
+    mock_db.acquire.assert_not_called()
+    query, *params = mock_db.fetch.await_args.args
+    assert 'ON CONFLICT (user_id, guild_id)' in query
+    # The overdraft check is part of the write, not a prior SELECT.
+    assert 'WHERE e.cash + EXCLUDED.cash >= 0 AND e.bank + EXCLUDED.bank >= 0' in query
+    assert params == [1, [7], [-100], [100]]
+
+
+async def test_overdrawn_single_wallet_returns_none(mock_db: MagicMock) -> None:
+    repo = make_repo(mock_db)
+    mock_db.fetch.return_value = []
+
+    assert await repo.adjust_balance(7, 1, cash=-100) is None
+
+
+async def test_deltas_are_merged_and_sorted(mock_db: MagicMock, transaction: MagicMock) -> None:
+    repo = make_repo(mock_db)
+    mock_db.connection.fetch.return_value = [row(1, 5), row(2, 4)]
+
+    result = await repo.apply_balance_deltas(1, [(2, -5, 0), (1, 5, 0), (2, -1, 0)])
+
+    assert result == {1: row(1, 5), 2: row(2, 4)}
+    _, *params = mock_db.connection.fetch.await_args.args
+    # One row per member, in user id order so concurrent transfers lock alike.
+    assert params == [1, [1, 2], [5, -6], [0, 0]]
+    mock_db.fetch.assert_not_awaited()
+
+
+async def test_short_wallet_rolls_back_everything(mock_db: MagicMock, transaction: MagicMock) -> None:
+    repo = make_repo(mock_db)
+    # The sender's row was filtered out by the balance check; the recipient's went through.
+    mock_db.connection.fetch.return_value = [row(2, 100)]
+
+    result = await repo.transfer_cash(1, sender_id=3, recipient_id=2, amount=100)
+
+    assert result is None
+    exc_type, *_ = transaction.__aexit__.await_args.args
+    assert exc_type is not None  # the transaction exited with an error, so it rolled back
+
+
+async def test_transfer_debits_the_sender(mock_db: MagicMock, transaction: MagicMock) -> None:
+    repo = make_repo(mock_db)
+    mock_db.connection.fetch.return_value = [row(2, 100), row(3, 0)]
+
+    result = await repo.transfer_cash(1, sender_id=3, recipient_id=2, amount=100)
+
+    assert result is not None and set(result) == {2, 3}
+    _, *params = mock_db.connection.fetch.await_args.args
+    assert params == [1, [2, 3], [100, -100], [0, 0]]
+    assert transaction.__aexit__.await_args.args[0] is None
+
+
+async def test_no_deltas_skip_the_database(mock_db: MagicMock) -> None:
+    repo = make_repo(mock_db)
+
+    assert await repo.apply_balance_deltas(1, []) == {}
+    mock_db.fetch.assert_not_awaited()
+    mock_db.acquire.assert_not_called()
+
+
+async def test_concurrent_first_access_shares_one_wallet(mock_db: MagicMock) -> None:
+    wallet = row(7, 0)
+    # Both callers find no wallet, then both create it: the second create meets the first's row.
+    replies = iter([None, None, wallet, wallet])
+
+    async def fetchrow(*_: Any, **__: Any) -> dict[str, int] | None:
+        await asyncio.sleep(0)  # both callers read before either writes
+        return next(replies)
+
+    mock_db.fetchrow = AsyncMock(side_effect=fetchrow)
+    repo = UsersRepository(mock_db)
+
+    first, second = await asyncio.gather(repo.get_balance_record(7, 1), repo.get_balance_record(7, 1))
+
+    assert first is second is wallet
+    # A read and a create each; neither caller had to retry after a conflict.
+    assert mock_db.fetchrow.await_count == 4
@@ -1,4 +1,4 @@
-"""Unit tests for the new game engines (Higher/Lower, Dice, Mines, Wordle, Horse Race, Trivia).
+"""Unit tests for the new game engines (Higher/Lower, Dice, Mines, Minesweeper, Wordle, Horse Race, Trivia).
 
 These exercise the pure logic — odds, multipliers, scoring and payouts — without a bot.
 """
@@ -7,11 +7,12 @@ from __future__ import annotations
 
 import datetime
 import random
+from typing import Any
 
 import numpy as np
 import pytest
 
-from app.cogs.games.engine import dice, higherlower, horserace, mines
+from app.cogs.games.engine import dice, higherlower, horserace, mines, minesweeper
 from app.cogs.games.engine.blackjack import Hand
 from app.cogs.games.engine.cards import BaseCard
 from app.cogs.games.engine.trivia import build_round
@@ -144,6 +145,78 @@ def test_mines_clear_board() -> None:
     assert game.cleared is True
 
 
+def test_mines_multiplier_table_matches_fair_odds() -> None:
+    table = mines.multipliers(3)
+    assert len(table) == mines.TILES - 3 + 1
+    assert table[0] == 1.0
+    assert table[1] == round(mines.TILES / (mines.TILES - 3) * mines.HOUSE_EDGE, 2)
+
+
+# -- Minesweeper ------------------------------------------------------------
+
+
+def _counts(board: minesweeper.Board) -> list[int]:
+    """Neighbouring mines of every cell, counted the slow way."""
+    return [
+        sum(
+            board.is_mine(board.index(r + dr, c + dc))
+            for dr, dc in minesweeper.NEIGHBOURS
+            if 0 <= r + dr < board.rows and 0 <= c + dc < board.cols
+        )
+        for r in range(board.rows)
+        for c in range(board.cols)
+    ]
+
+
+@pytest.mark.parametrize(("rows", "cols", "count"), [(5, 5, 3), (4, 7, 6), (16, 30, 99)])
+def test_minesweeper_values_count_neighbouring_mines(rows: int, cols: int, count: int) -> None:
+    board = minesweeper.Board(count, rows=rows, cols=cols, rng=random.Random(rows * cols))
+    assert sum(board.is_mine(i) for i in range(rows * cols)) == count
+    assert [board.value(i) for i in range(rows * cols)] == _counts(board)
+
+
+def test_minesweeper_neighbour_table_is_shared() -> None:
+    table = minesweeper.neighbour_table(3, 4)
+    assert table is minesweeper.neighbour_table(3, 4)
+    assert sorted(table[0]) == [1, 4, 5]  # a corner has three neighbours
+    assert len(table[5]) == 8
+
+
+class PlacedMines(random.Random):
+    """Puts the mines on the given cells instead of random ones."""
+
+    def __init__(self, *cells: int) -> None:
+        super().__init__(0)
+        self.cells = list(cells)
+
+    def sample(self, population: Any, k: int, **_: Any) -> list[int]:
+        return self.cells[:k]
+
+
+def test_minesweeper_flood_fill_opens_the_empty_region() -> None:
+    board = minesweeper.Board(1, rows=4, cols=4, rng=PlacedMines(0))
+    start = next(i for i in range(16) if not board.is_mine(i) and board.value(i) == 0)
+
+    assert board.reveal(start) is True
+    # With the only mine in a corner, the cells without neighbouring mines are all connected,
+    # so the flood reaches every safe cell.
+    assert all(board.is_revealed(i) != (i == 0) for i in range(16))
+    assert board.is_won
+
+
+def test_minesweeper_hitting_a_mine() -> None:
+    board = minesweeper.Board(3, rng=random.Random(2))
+    mine = next(i for i in range(len(board.cells)) if board.is_mine(i))
+    assert board.reveal(mine) is False
+    assert board.is_revealed(mine)
+    assert not board.is_won
+
+
+def test_minesweeper_rejects_a_full_board() -> None:
+    with pytest.raises(ValueError):
+        minesweeper.Board(25)
+
+
 # -- Wordle -----------------------------------------------------------------
 
 
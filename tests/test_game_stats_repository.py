@@ -1,13 +1,16 @@
 """Tests for :class:`~app.database.repositories.game_stats.GameStatsRepository`.
 
-These confirm the repository forwards the right SQL and win/loss/push flags to the
-shared pool helpers, and that recording is fail-safe (a database error during
-telemetry must never bubble up into a game's payout flow).
+These confirm rounds are buffered and merged per member and game, that a flush
+forwards them as one set-based statement, and that recording is fail-safe (a
+database error during telemetry must never bubble up into a game's payout flow).
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
 
 from app.database.repositories import GameStatsRepository
 
@@ -19,42 +22,137 @@ def make_repo(mock_db: MagicMock) -> GameStatsRepository:
     return GameStatsRepository(mock_db)
 
 
-async def test_record_win_sets_win_flags(mock_db: MagicMock) -> None:
+def delta(params: list[Any]) -> list[Any]:
+    """The flushed arrays for the first buffered key, minus ``last_played`` and the flush id."""
+    return [column[0] for column in params[:-2]]
+
+
+async def test_record_is_buffered_until_flush(mock_db: MagicMock) -> None:
     repo = make_repo(mock_db)
 
     await repo.record_result(1, 2, 'poker', 'win', wagered=100, profit=250)
+    mock_db.execute.assert_not_awaited()
+
+    await repo.flush()
 
     mock_db.execute.assert_awaited_once()
     query, *params = mock_db.execute.await_args.args
     assert 'INSERT INTO game_stats' in query
-    # guild, user, game, won, lost, tied, wagered, profit
-    assert params == [1, 2, 'poker', 1, 0, 0, 100, 250]
+    assert 'UPDATE game_stats' in query
+    # guild, user, game, played, won, lost, tied, wagered, profit, biggest_win, lead, tail, broken, best
+    assert delta(params) == [1, 2, 'poker', 1, 1, 0, 0, 100, 250, 250, 1, 1, False, 1]
 
 
 async def test_record_loss_sets_loss_flags(mock_db: MagicMock) -> None:
     repo = make_repo(mock_db)
 
     await repo.record_result(1, 2, 'slots', 'loss', wagered=50, profit=-50)
+    await repo.flush()
 
     _, *params = mock_db.execute.await_args.args
-    assert params == [1, 2, 'slots', 0, 1, 0, 50, -50]
+    assert delta(params) == [1, 2, 'slots', 1, 0, 1, 0, 50, -50, 0, -1, -1, False, 0]
 
 
 async def test_record_push_sets_tied_flag(mock_db: MagicMock) -> None:
     repo = make_repo(mock_db)
 
     await repo.record_result(1, 2, 'blackjack', 'push')
+    await repo.flush()
+
+    _, *params = mock_db.execute.await_args.args
+    assert delta(params) == [1, 2, 'blackjack', 1, 0, 0, 1, 0, 0, 0, 0, 0, False, 0]
+
 
+async def test_rounds_merge_per_member_and_game(mock_db: MagicMock) -> None:
+    repo = make_repo(mock_db)
+
+    # W W L W W W: the first run of two wins is broken, the member ends on three.
+    for result in ('win', 'win', 'loss', 'win', 'win', 'win'):
+        await repo.record_result(1, 2, 'tower', result, wagered=10, profit=10 if result == 'win' else -10)
+    await repo.record_result(1, 3, 'tower', 'loss', wagered=10, profit=-10)
+    await repo.flush()
+
+    mock_db.execute.assert_awaited_once()
     _, *params = mock_db.execute.await_args.args
-    assert params == [1, 2, 'blackjack', 0, 0, 1, 0, 0]
+    assert params[1] == [2, 3]
+    assert delta(params) == [1, 2, 'tower', 6, 5, 1, 0, 60, 40, 10, 2, 3, True, 3]
 
 
-async def test_record_swallows_database_errors(mock_db: MagicMock) -> None:
+async def test_failed_flush_is_retried_before_newer_rounds(mock_db: MagicMock) -> None:
     repo = make_repo(mock_db)
-    mock_db.execute.side_effect = RuntimeError("pool exploded")
+    await repo.record_result(1, 2, 'tower', 'win')
+    await repo.record_result(1, 2, 'tower', 'win')
+
+    async def fail(*_: Any, **__: Any) -> None:
+        # A round that lands while the write is in flight.
+        await repo.record_result(1, 2, 'tower', 'win')
+        raise RuntimeError("pool exploded")
 
+    mock_db.execute.side_effect = fail
     # Must not raise — telemetry failures cannot break gameplay.
+    await repo.flush()
+
+    mock_db.execute.side_effect = None
+    await repo.flush()
+
+    failed, retried, newer = (call.args[1:] for call in mock_db.execute.await_args_list)
+    assert retried == failed  # the same rounds under the same flush id
+    assert delta(retried) == [1, 2, 'tower', 2, 2, 0, 0, 0, 0, 0, 2, 2, False, 2]
+    assert delta(newer) == [1, 2, 'tower', 1, 1, 0, 0, 0, 0, 0, 1, 1, False, 1]
+    assert newer[-1] != retried[-1]
+
+
+async def test_cancelled_flush_is_not_applied_twice(mock_db: MagicMock) -> None:
+    repo = make_repo(mock_db)
     await repo.record_result(1, 2, 'tower', 'win')
+    committed = asyncio.Event()
+    played: dict[Any, int] = {}
+    stamped: dict[Any, Any] = {}
+    replies = False
+
+    async def apply(query: str, guild_ids: list[int], user_ids: list[int], games: list[str], counts: list[int],
+                    *columns: Any, **__: Any) -> None:
+        # Stands in for the statement: rows already stamped with this flush id are skipped.
+        flush_id = columns[-1]
+        for key, count in zip(zip(guild_ids, user_ids, games, strict=True), counts, strict=True):
+            if stamped.get(key) != flush_id:
+                played[key] = played.get(key, 0) + count
+                stamped[key] = flush_id
+        committed.set()
+        if not replies:
+            await asyncio.Event().wait()  # committed, but the reply never arrives
+
+    mock_db.execute.side_effect = apply
+    flush = asyncio.create_task(repo.flush())
+    await committed.wait()
+    flush.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await flush
+
+    replies = True
+    await repo.flush()
+    await repo.flush()
+
+    assert mock_db.execute.await_count == 2  # the cancelled batch was sent once more, then nothing was left
+    assert played == {(1, 2, 'tower'): 1}
+
+
+async def test_flush_without_rounds_skips_the_database(mock_db: MagicMock) -> None:
+    repo = make_repo(mock_db)
+
+    await repo.flush()
+
+    mock_db.execute.assert_not_awaited()
+
+
+async def test_reads_include_buffered_rounds(mock_db: MagicMock) -> None:
+    repo = make_repo(mock_db)
+    await repo.record_result(1, 2, 'slots', 'win')
+
+    await repo.get_member_totals(1, 2)
+
+    mock_db.execute.assert_awaited_once()
+    mock_db.fetchrow.assert_awaited_once()
 
 
 async def test_leaderboard_scopes_to_game(mock_db: MagicMock) -> None:
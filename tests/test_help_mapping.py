@@ -0,0 +1,121 @@
+"""Tests for the cached help mapping (:meth:`app.core.help.PaginatedHelpCommand.get_bot_mapping`)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from discord.ext import commands
+
+from app.core.command import command as make_command
+from app.core.command import guilds
+from app.core.help import PaginatedHelpCommand
+from app.core.permissions import PermissionTemplate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.command_generation = 0
+        self.cogs: dict[str, commands.Cog] = {}
+        self.commands: set[Any] = set()
+        self.walks = 0
+
+    def add(self, cog_name: str, cmd: Any) -> Any:
+        cog = self.cogs.setdefault(cog_name, type(cog_name, (commands.Cog,), {})())
+        cmd.cog = cog
+        self.commands.add(cmd)
+        self.command_generation += 1
+        return cmd
+
+    def walk_commands(self) -> Iterator[Any]:
+        self.walks += 1
+        yield from self.commands
+
+    def get_cog(self, name: str) -> commands.Cog | None:
+        return self.cogs.get(name)
+
+
+def make(name: str, *, guild_ids: tuple[int, ...] = (), **kwargs: Any) -> Any:
+    async def callback(ctx: Any) -> None: ...
+
+    if guild_ids:
+        callback = guilds(*guild_ids)(callback)
+    return make_command(name, **kwargs)(callback)
+
+
+def helper(bot: FakeBot, guild_id: int | None) -> PaginatedHelpCommand:
+    help_command = PaginatedHelpCommand()
+    guild = SimpleNamespace(id=guild_id) if guild_id is not None else None
+    help_command.context = SimpleNamespace(client=bot, guild=guild)  # type: ignore[assignment]
+    return help_command
+
+
+@pytest.fixture(autouse=True)
+def reset_cache() -> Iterator[None]:
+    yield
+    PaginatedHelpCommand._mappings = {}
+    PaginatedHelpCommand._mappings_generation = -1
+    PaginatedHelpCommand._restricted_guilds = frozenset()
+
+
+@pytest.fixture
+def bot() -> FakeBot:
+    bot = FakeBot()
+    bot.add('Mod', make('ban', user_permissions=PermissionTemplate.moderator))
+    bot.add('Mod', make('av'))
+    bot.add('Fun', make('roll'))
+    return bot
+
+
+def names(mapping: dict[commands.Cog, list[Any]]) -> dict[str, list[str]]:
+    return {cog.qualified_name: [cmd.name for cmd in cmds] for cog, cmds in mapping.items()}
+
+
+def test_mapping_is_grouped_and_sorted(bot: FakeBot) -> None:
+    mapping = helper(bot, 1).get_bot_mapping()
+
+    # Categories by name; unrestricted commands before gated ones.
+    assert names(mapping) == {'Fun': ['roll'], 'Mod': ['av', 'ban']}
+
+
+def test_mapping_is_shared_between_invocations(bot: FakeBot) -> None:
+    first = helper(bot, 1).get_bot_mapping()
+    second = helper(bot, 2).get_bot_mapping()
+
+    assert second is first
+    assert bot.walks == 1
+
+
+def test_gated_commands_are_not_marked_on_the_command(bot: FakeBot) -> None:
+    helper(bot, 1).get_bot_mapping()
+
+    assert not any(hasattr(cmd, 'is_locked') for cmd in bot.commands)
+
+
+def test_new_generation_rebuilds_the_mapping(bot: FakeBot) -> None:
+    first = helper(bot, 1).get_bot_mapping()
+    bot.add('Fun', make('coin'))
+
+    second = helper(bot, 1).get_bot_mapping()
+
+    assert second is not first
+    assert names(second)['Fun'] == ['coin', 'roll']
+
+
+def test_dms_drop_guild_only_commands(bot: FakeBot) -> None:
+    kick = bot.add('Mod', make('kick'))
+    kick.guild_only = True  # as read off hybrid commands
+
+    assert names(helper(bot, None).get_bot_mapping())['Mod'] == ['av', 'ban']
+    assert names(helper(bot, 1).get_bot_mapping())['Mod'] == ['av', 'kick', 'ban']
+
+
+def test_restricted_guilds_get_their_own_mapping(bot: FakeBot) -> None:
+    bot.add('Fun', make('secret', guild_ids=(7,)))
+
+    assert names(helper(bot, 7).get_bot_mapping())['Fun'] == ['roll', 'secret']
+    assert names(helper(bot, 1).get_bot_mapping())['Fun'] == ['roll']
@@ -0,0 +1,155 @@
+"""Tests for the internal API's ETag response cache."""
+
+import gzip
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from app.internal_api.caching import ResponseCache
+from app.utils.signals import CacheSignalHub
+
+
+def make_request(
+    method: str = 'GET',
+    path: str = '/api/v1/guilds/1/stats',
+    *,
+    guild_id: int | None = 1,
+    query: str = '',
+    headers: dict[str, str] | None = None,
+) -> Request:
+    return Request({
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'query_string': query.encode(),
+        'headers': [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        'path_params': {} if guild_id is None else {'guild_id': str(guild_id)},
+    })
+
+
+class Handler:
+    def __init__(self, payload: object = None, status_code: int = 200) -> None:
+        self.calls = 0
+        self.payload = payload if payload is not None else {'members': 42}
+        self.status_code = status_code
+
+    async def __call__(self, request: Request) -> JSONResponse:
+        self.calls += 1
+        return JSONResponse(self.payload, status_code=self.status_code)
+
+
+class TestResponseCache:
+    async def test_second_get_is_served_from_cache(self) -> None:
+        cache, handler = ResponseCache(), Handler()
+        first = await cache.serve(make_request(), 'Stats', handler)
+        second = await cache.serve(make_request(), 'Stats', handler)
+
+        assert handler.calls == 1
+        assert first.headers['x-cache'] == 'MISS'
+        assert second.headers['x-cache'] == 'HIT'
+        assert first.headers['etag'] == second.headers['etag']
+        assert second.body == first.body
+
+    async def test_if_none_match_answers_304(self) -> None:
+        cache, handler = ResponseCache(), Handler()
+        etag = (await cache.serve(make_request(), 'Stats', handler)).headers['etag']
+
+        response = await cache.serve(make_request(headers={'If-None-Match': f'W/{etag}'}), 'Stats', handler)
+        assert response.status_code == 304
+        assert response.body == b''
+        assert cache.summary()['routers']['Stats'] == {'hits': 0, 'not_modified': 1, 'misses': 1, 'hit_ratio': 0.5}
+
+    async def test_query_is_part_of_the_key(self) -> None:
+        cache, handler = ResponseCache(), Handler()
+        await cache.serve(make_request(query='range=7d&x=1'), 'Analytics', handler)
+        await cache.serve(make_request(query='x=1&range=7d'), 'Analytics', handler)
+        await cache.serve(make_request(query='range=30d'), 'Analytics', handler)
+        assert handler.calls == 2
+
+    async def test_uncached_router_and_non_guild_routes_pass_through(self) -> None:
+        cache, handler = ResponseCache(), Handler()
+        for _ in range(2):
+            await cache.serve(make_request(), 'Music', handler)
+            await cache.serve(make_request(path='/api/v1/bot/metrics', guild_id=None), 'Stats', handler)
+        assert handler.calls == 4
+        assert len(cache) == 0
+
+    async def test_errors_are_not_cached(self) -> None:
+        cache, handler = ResponseCache(), Handler({'detail': 'nope'}, status_code=404)
+        await cache.serve(make_request(), 'Guilds', handler)
+        await cache.serve(make_request(), 'Guilds', handler)
+        assert handler.calls == 2
+
+    async def test_mutation_invalidates_guild(self) -> None:
+        cache, handler = ResponseCache(), Handler()
+        await cache.serve(make_request(), 'Economy', handler)
+        await cache.serve(make_request(guild_id=2, path='/api/v1/guilds/2/stats'), 'Economy', handler)
+        await cache.serve(make_request('PATCH', '/api/v1/guilds/1/economy/settings'), 'Economy', handler)
+
+        assert len(cache) == 1
+        await cache.serve(make_request(), 'Economy', handler)
+        assert handler.calls == 4
+
+    async def test_signal_invalidates_guild(self) -> None:
+        cache, handler = ResponseCache(), Handler()
+        hub = CacheSignalHub()
+        hub.register('guild_config_changed').connect(cache, None)
+
+        await cache.serve(make_request(), 'Guilds', handler)
+        assert hub.fire('guild_config_changed', 1) == 1
+        assert hub.fire('guild_config_changed', 1) == 0
+        await cache.serve(make_request(), 'Guilds', handler)
+        assert handler.calls == 2
+
+    async def test_expired_entries_are_refreshed(self) -> None:
+        cache, handler = ResponseCache(ttl=0), Handler()
+        await cache.serve(make_request(), 'Stats', handler)
+        await cache.serve(make_request(), 'Stats', handler)
+        assert handler.calls == 2
+
+    async def test_lru_bound(self) -> None:
+        cache, handler = ResponseCache(max_entries=2), Handler()
+        for page in range(3):
+            await cache.serve(make_request(query=f'page={page}'), 'Leveling', handler)
+        assert len(cache) == 2
+
+    async def test_large_bodies_are_gzipped_once(self) -> None:
+        cache = ResponseCache(compress_min_size=64)
+        handler = Handler({'rows': list(range(200))})
+        headers = {'Accept-Encoding': 'gzip, deflate'}
+
+        first = await cache.serve(make_request(headers=headers), 'Leveling', handler)
+        second = await cache.serve(make_request(headers=headers), 'Leveling', handler)
+        plain = await cache.serve(make_request(), 'Leveling', handler)
+
+        assert first.headers['content-encoding'] == 'gzip'
+        assert second.body is first.body
+        assert gzip.decompress(first.body) == plain.body
+        assert 'content-encoding' not in plain.headers
+
+    async def test_each_encoding_has_its_own_etag(self) -> None:
+        cache = ResponseCache(compress_min_size=64)
+        handler = Handler({'rows': list(range(200))})
+
+        gzipped = await cache.serve(make_request(headers={'Accept-Encoding': 'gzip'}), 'Leveling', handler)
+        plain = await cache.serve(make_request(), 'Leveling', handler)
+
+        assert gzipped.headers['etag'] != plain.headers['etag']
+        assert gzipped.headers['vary'] == plain.headers['vary'] == 'Accept-Encoding'
+        # A tag only revalidates the representation it was served with.
+        headers = {'Accept-Encoding': 'gzip', 'If-None-Match': plain.headers['etag']}
+        assert (await cache.serve(make_request(headers=headers), 'Leveling', handler)).status_code == 200
+        headers['If-None-Match'] = gzipped.headers['etag']
+        assert (await cache.serve(make_request(headers=headers), 'Leveling', handler)).status_code == 304
+
+    async def test_response_rendered_during_an_invalidation_is_not_stored(self) -> None:
+        cache = ResponseCache()
+
+        async def handler(request: Request) -> JSONResponse:
+            cache.invalidate(1)  # e.g. a config change while the stale rows were being read
+            return JSONResponse({'members': 41})
+
+        response = await cache.serve(make_request(), 'Guilds', handler)
+
+        assert response.status_code == 200
+        assert len(cache) == 0
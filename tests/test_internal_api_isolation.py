@@ -0,0 +1,96 @@
+"""Tests for the internal API's worker-loop isolation primitives and router metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.internal_api.isolation import GatewayBridge, WorkerLoop
+from app.utils.metrics import RouterMetrics
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+@pytest.fixture
+async def worker() -> AsyncIterator[WorkerLoop]:
+    loop = WorkerLoop(name='test-worker')
+    loop.start()
+    yield loop
+    await loop.stop()
+
+
+class TestGatewayBridge:
+    async def test_direct_call_on_bot_loop(self) -> None:
+        bridge = GatewayBridge(asyncio.get_running_loop())
+        assert bridge.on_bot_loop
+
+        async def double(x: int) -> int:
+            return x * 2
+
+        assert await bridge.call(double, 21) == 42
+        assert await bridge.run(len, [1, 2, 3]) == 3
+
+    async def test_call_from_worker_runs_on_bot_loop(self, worker: WorkerLoop) -> None:
+        bot_thread = threading.get_ident()
+        bridge = GatewayBridge(asyncio.get_running_loop())
+
+        async def where() -> int:
+            return threading.get_ident()
+
+        async def from_worker() -> tuple[bool, int, int]:
+            return bridge.on_bot_loop, await bridge.call(where), await bridge.run(threading.get_ident)
+
+        on_bot_loop, called_on, ran_on = await worker.submit(from_worker())
+        assert not on_bot_loop
+        assert called_on == bot_thread
+        assert ran_on == bot_thread
+
+    async def test_run_propagates_exceptions(self, worker: WorkerLoop) -> None:
+        bridge = GatewayBridge(asyncio.get_running_loop())
+
+        def boom() -> None:
+            raise KeyError('missing')
+
+        with pytest.raises(KeyError):
+            await worker.submit(bridge.run(boom))
+
+    async def test_stop_joins_thread(self) -> None:
+        loop = WorkerLoop(name='test-stop')
+        loop.start()
+        assert loop.is_alive
+        await loop.stop()
+        assert not loop.is_alive
+
+
+class TestRouterMetrics:
+    def test_tracks_requests_and_failures(self) -> None:
+        metrics = RouterMetrics()
+        with metrics.track('Stats', queued_ms=3.0):
+            pass
+        with pytest.raises(RuntimeError), metrics.track('Stats'):
+            raise RuntimeError
+
+        summary = metrics.summary()['Stats']
+        assert summary['requests'] == 2
+        assert summary['failed'] == 1
+        assert summary['in_flight'] == 0
+        assert summary['queued']['p99'] == 3.0
+
+    def test_in_flight_while_tracking(self) -> None:
+        metrics = RouterMetrics()
+        with metrics.track('Guilds'):
+            assert metrics.summary()['Guilds']['in_flight'] == 1
+        assert metrics.summary()['Guilds']['in_flight'] == 0
+
+    def test_window_is_bounded(self) -> None:
+        metrics = RouterMetrics(window_size=3)
+        for _ in range(10):
+            with metrics.track('Music'):
+                pass
+        assert metrics.summary()['Music']['requests'] == 10
+        # Two windows of three at most: the finished one and the one being filled.
+        assert metrics._routers['Music'].handled_ms.count <= 6
@@ -0,0 +1,89 @@
+"""Tests for the off-loop log writer (:class:`app.utils.logging.BoundedQueueHandler`)."""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+from logging.handlers import QueueListener
+
+from app.utils.logging import BoundedQueueHandler, JSONFormatter
+
+
+def make_logger(handler: logging.Handler) -> logging.Logger:
+    log = logging.getLogger(f'test_log_queue.{id(handler)}')
+    log.propagate = False
+    log.setLevel(logging.INFO)
+    log.addHandler(handler)
+    return log
+
+
+def test_message_is_rendered_when_logged() -> None:
+    records: queue.Queue[logging.LogRecord] = queue.Queue()
+    log = make_logger(BoundedQueueHandler(records))
+    members = ['a']
+
+    log.info('members: %s', members)
+    members.append('b')
+
+    record = records.get_nowait()
+    assert record.getMessage() == "members: ['a']"
+    assert record.args is None
+
+
+def test_exception_is_left_for_the_writer() -> None:
+    records: queue.Queue[logging.LogRecord] = queue.Queue()
+    log = make_logger(BoundedQueueHandler(records))
+
+    try:
+        raise ValueError('boom')
+    except ValueError:
+        log.exception('failed')
+
+    record = records.get_nowait()
+    assert record.exc_info is not None and record.exc_text is None
+
+
+def test_full_queue_drops_and_reports_later() -> None:
+    records: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(records)
+    log = make_logger(handler)
+
+    for n in range(5):
+        log.info('record %d', n)
+    assert handler.dropped == 3
+
+    records.get_nowait()
+    records.get_nowait()
+    log.info('after')
+
+    notice, after = records.get_nowait(), records.get_nowait()
+    assert notice.levelno == logging.WARNING and 'Dropped 3 log record(s)' in notice.getMessage()
+    assert after.getMessage() == 'after'
+    assert handler.dropped == 3
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+
+
+def test_listener_formats_on_its_thread() -> None:
+    records: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=100)
+    target = ListHandler()
+    target.setFormatter(JSONFormatter())
+    listener = QueueListener(records, target, respect_handler_level=True)
+    log = make_logger(BoundedQueueHandler(records))
+
+    listener.start()
+    log.info('hello %s', 'world', extra={'guild_id': 5})
+    records.join()
+    listener.stop()
+
+    entry = json.loads(target.lines[0])
+    assert entry['msg'] == 'hello world'
+    assert entry['guild_id'] == 5
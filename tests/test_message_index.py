@@ -0,0 +1,40 @@
+"""Tests for :mod:`app.services.message_index`."""
+
+from __future__ import annotations
+
+import datetime
+
+import pytest
+
+from app.services import MESSAGE_INDEX_MAX_DAYS, make_snippet, naive_utc, validate_retention_days
+
+
+def test_snippet_collapses_whitespace() -> None:
+    assert make_snippet("hello\n\n  world\tagain") == "hello world again"
+
+
+def test_snippet_is_capped_with_ellipsis() -> None:
+    snippet = make_snippet("x" * 500, length=10)
+    assert snippet == "x" * 9 + "…"
+    assert len(snippet) == 10
+
+
+def test_short_snippet_is_untouched() -> None:
+    assert make_snippet("gg", length=2) == "gg"
+
+
+@pytest.mark.parametrize("days", [None, 1, 30, MESSAGE_INDEX_MAX_DAYS])
+def test_valid_retention(days: int | None) -> None:
+    assert validate_retention_days(days) == days
+
+
+@pytest.mark.parametrize("days", [0, -3, MESSAGE_INDEX_MAX_DAYS + 1])
+def test_invalid_retention_raises(days: int) -> None:
+    with pytest.raises(ValueError):
+        validate_retention_days(days)
+
+
+def test_naive_utc_converts_offsets() -> None:
+    aware = datetime.datetime(2026, 7, 12, 14, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+    assert naive_utc(aware) == datetime.datetime(2026, 7, 12, 12, 0)
+    assert naive_utc(datetime.datetime(2026, 1, 1)) == datetime.datetime(2026, 1, 1)
@@ -0,0 +1,116 @@
+"""Tests for the message index write buffer (``MessageIndex.flush``)."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.cogs import message_index
+from app.cogs.message_index import MessageIndex
+
+
+class FakeRepo:
+    def __init__(self) -> None:
+        self.fail = False
+        self.block: asyncio.Event | None = None
+        self.inserted: list[tuple[Any, ...]] = []
+
+    async def insert_many(self, rows: list[tuple[Any, ...]]) -> None:
+        if self.block is not None:
+            await self.block.wait()
+        if self.fail:
+            raise RuntimeError('database down')
+        self.inserted.extend(rows)
+
+    async def update_many(self, rows: list[tuple[int, str, Any]]) -> None:
+        pass
+
+    async def delete_many(self, message_ids: list[int]) -> None:
+        pass
+
+
+def make_cog(repo: FakeRepo) -> MessageIndex:
+    bot = MagicMock()
+    bot.db.message_index = repo
+    cog = MessageIndex(bot)
+    # The background loops only call flush() and prune(); the tests drive flush() themselves.
+    cog.flush_index.cancel()
+    cog.prune_index.cancel()
+    cog._enabled = {1: 30}
+    cog._enabled_loaded_at = time.monotonic()
+    cog._pending_inserts[1] = (1, 'first')
+    return cog
+
+
+def message(message_id: int) -> Any:
+    return SimpleNamespace(
+        id=message_id,
+        guild=SimpleNamespace(id=1),
+        channel=SimpleNamespace(id=2),
+        author=SimpleNamespace(id=3),
+        created_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC),
+        content='hello',
+        attachments=[],
+        embeds=[],
+        is_system=lambda: False,
+    )
+
+
+async def test_failed_write_requeues_the_drained_changes() -> None:
+    repo = FakeRepo()
+    repo.fail = True
+    cog = make_cog(repo)
+
+    await cog.flush()
+
+    assert cog._pending_inserts == {1: (1, 'first')}
+    repo.fail = False
+    await cog.flush()
+    assert repo.inserted == [(1, 'first')]
+    assert not cog._pending_inserts
+
+
+async def test_cancelled_flush_requeues_and_newer_events_win() -> None:
+    repo = FakeRepo()
+    repo.block = asyncio.Event()
+    cog = make_cog(repo)
+
+    task = asyncio.create_task(cog.flush())
+    await asyncio.sleep(0)
+    cog._pending_inserts[2] = (2, 'second')
+    cog._pending_edits[1] = (1, 'edited', None)
+    cog._pending_deletes.add(3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert cog._pending_inserts == {1: (1, 'first'), 2: (2, 'second')}
+    assert cog._pending_edits == {1: (1, 'edited', None)}
+    assert cog._pending_deletes == {3}
+
+
+async def test_full_buffer_drops_and_reports_new_events(monkeypatch: pytest.MonkeyPatch, caplog: Any) -> None:
+    monkeypatch.setattr(message_index, '_MAX_PENDING', 2)
+    repo = FakeRepo()
+    repo.fail = True
+    cog = make_cog(repo)
+
+    for message_id in (2, 3, 4):
+        await cog.on_message(message(message_id))
+    await cog.flush()
+
+    assert set(cog._pending_inserts) == {1, 2}
+    assert cog.dropped == 2
+
+    repo.fail = False
+    with caplog.at_level(logging.WARNING, logger=message_index.__name__):
+        await cog.flush()
+    assert [row[0] for row in repo.inserted] == [1, 2]
+    assert 'Dropped 2 message index change(s)' in caplog.text
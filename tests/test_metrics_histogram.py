@@ -0,0 +1,81 @@
+"""Tests for the histogram-backed latency metrics (:mod:`app.utils.metrics`, :mod:`app.utils.query_tracker`)."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app.utils.metrics import Histogram, MetricsCollector, RollingHistogram
+from app.utils.query_tracker import QueryTracker
+
+
+def exact(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+
+@pytest.mark.parametrize('value', [0.001, 0.5, 1.0, 3.0, 17.25, 250.0, 99_999.0])
+def test_bucket_value_is_within_one_percent(value: float) -> None:
+    assert Histogram.bucket_value(Histogram.bucket(value)) == pytest.approx(value, rel=0.01)
+
+
+def test_out_of_range_samples_share_the_end_buckets() -> None:
+    assert Histogram.bucket(0.0) == Histogram.bucket(-1.0) == Histogram.bucket(1e-9) == 0
+    assert Histogram.bucket(1e12) == Histogram.BUCKETS - 1
+
+
+def test_percentiles_match_the_sorted_samples() -> None:
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(3, 1) for _ in range(5000)]
+    histogram = RollingHistogram(window=10_000)
+    for sample in samples:
+        histogram.record(sample)
+
+    result = histogram.percentiles(50, 95, 99, 99.9)
+    assert list(result) == ['p50', 'p95', 'p99', 'p99.9']
+    for p in (50, 95, 99, 99.9):
+        assert result[f'p{p:g}'] == pytest.approx(exact(samples, p), rel=0.01)
+
+
+def test_percentiles_are_clamped_to_the_recorded_range() -> None:
+    histogram = RollingHistogram(window=10)
+    histogram.record(3.0)
+
+    assert histogram.percentiles() == {'p50': 3.0, 'p95': 3.0, 'p99': 3.0}
+    assert RollingHistogram(window=10).percentiles() == {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+
+def test_rolling_window_forgets_old_samples() -> None:
+    histogram = RollingHistogram(window=100)
+    for _ in range(100):
+        histogram.record(1000.0)
+    for _ in range(200):
+        assert histogram.count <= 200
+        histogram.record(1.0)
+
+    assert histogram.percentiles()['p99'] == 1.0
+
+
+def test_collector_keeps_the_slowest_commands_of_the_window() -> None:
+    metrics = MetricsCollector(window_size=50)
+    metrics.record_command('ancient', 900.0)
+    for n in range(120):
+        metrics.record_command(f'cmd{n}', float(n))
+
+    slowest = metrics.slowest_commands(3)
+    assert [entry['command'] for entry in slowest] == ['cmd119', 'cmd118', 'cmd117']
+    summary = metrics.summary()
+    assert summary['total_commands'] == 121
+    assert summary['window_size'] == 71  # the last full window of 50 and the 21 since
+    assert summary['latency']['p50'] == pytest.approx(84, rel=0.01)
+
+
+def test_query_tracker_reports_latency_percentiles() -> None:
+    tracker = QueryTracker(threshold_ms=1000)
+    for ms in range(1, 101):
+        tracker.record('SELECT 1', float(ms))
+
+    latency = tracker.summary()['latency']
+    assert latency['p50'] == pytest.approx(51, rel=0.01)
+    assert latency['p99'] == pytest.approx(100, rel=0.01)
@@ -41,41 +41,38 @@ async def test_get_all_sessions_selects_all(mock_db: MagicMock) -> None:
     assert "WHERE" not in query  # restore reads every row
 
 
-async def test_upsert_session_serialises_tracks_and_upserts(mock_db: MagicMock) -> None:
+async def test_delete_session_removes_guild_row(mock_db: MagicMock) -> None:
     repo = make_repo(mock_db)
-    tracks = [{"uri": "spotify:track:1", "title": "A", "requester_id": 7}]
-
-    await repo.upsert_session(
-        999,
-        voice_channel_id=10,
-        text_channel_id=20,
-        panel_message_id=30,
-        volume=80,
-        paused=True,
-        queue_mode=2,
-        shuffle=True,
-        autoplay=0,
-        always_on=True,
-        always_on_mode="radio",
-        always_on_source="https://stream.example/lofi",
-        current_uri="spotify:track:0",
-        position=12345,
-        tracks=tracks,
-    )
+
+    await repo.delete_session(555)
 
     query, *params = mock_db.execute.await_args.args
-    assert "INSERT INTO music_sessions" in query
-    assert "ON CONFLICT (guild_id) DO UPDATE" in query
-    # guild_id first, tracks serialised to a JSON string for the ::jsonb cast.
-    assert params[0] == 999
-    assert json.loads(params[-1]) == tracks
+    assert "DELETE FROM" in query and "music_sessions" in query
+    assert params == [555]
 
 
-async def test_delete_session_removes_guild_row(mock_db: MagicMock) -> None:
+async def test_upsert_sessions_batches_rows_into_one_statement(mock_db: MagicMock) -> None:
+    from app.services.music_sessions import SessionState, SessionWrite
+
     repo = make_repo(mock_db)
+    state = SessionState(
+        guild_id=1, voice_channel_id=2, text_channel_id=None, panel_message_id=None, volume=70, paused=False,
+        queue_mode=0, shuffle=False, autoplay=1, always_on=False, always_on_mode=None, always_on_source=None,
+        current_uri=None, filters=None,
+    )
+    writes = [
+        SessionWrite(state, 100, [["https://a", "A", None]], None, (1,)),
+        SessionWrite(state, 200, [], 1, ()),
+    ]
 
-    await repo.delete_session(555)
+    await repo.upsert_sessions(writes)
+    await repo.upsert_sessions([])
 
+    mock_db.execute.assert_awaited_once()
     query, *params = mock_db.execute.await_args.args
-    assert "DELETE FROM" in query and "music_sessions" in query
-    assert params == [555]
+    assert "unnest(" in query
+    assert "ON CONFLICT (guild_id) DO UPDATE" in query
+    assert len(params) == 17
+    assert params[0] == [1, 1]
+    assert [json.loads(tracks) for tracks in params[15]] == [[["https://a", "A", None]], []]
+    assert params[16] == [None, 1]
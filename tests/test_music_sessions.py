@@ -0,0 +1,165 @@
+"""Tests for music session change tracking."""
+
+from dataclasses import replace
+
+from app.services.music_sessions import SessionState, SessionTracker, compact_track, session_track_uris
+
+STATE = SessionState(
+    guild_id=1,
+    voice_channel_id=2,
+    text_channel_id=3,
+    panel_message_id=4,
+    volume=70,
+    paused=False,
+    queue_mode=0,
+    shuffle=False,
+    autoplay=1,
+    always_on=False,
+    always_on_mode=None,
+    always_on_source=None,
+    current_uri='https://example.com/0',
+    filters=None,
+)
+
+
+class Encoder:
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def __call__(self, track: str) -> list:
+        self.encoded.append(track)
+        return compact_track(f'https://example.com/{track}', track, None)
+
+
+def persisted(queue: list[str], *, position: int = 0) -> SessionTracker:
+    tracker = SessionTracker(position_drift=10_000)
+    tracker.commit(tracker.diff(STATE, position, queue, Encoder()))
+    return tracker
+
+
+def test_first_write_is_full() -> None:
+    tracker = SessionTracker()
+    encode = Encoder()
+
+    write = tracker.diff(STATE, 0, ['a', 'b'], encode)
+
+    assert write is not None and write.is_full
+    assert write.tracks == [['https://example.com/a', 'a', None], ['https://example.com/b', 'b', None]]
+    assert not tracker.persisted
+
+
+def test_unchanged_session_is_not_written() -> None:
+    tracker = persisted(['a', 'b'])
+    encode = Encoder()
+
+    assert tracker.diff(STATE, 5_000, ['a', 'b'], encode) is None
+    assert encode.encoded == []
+
+
+def test_position_drift_beyond_threshold_is_written() -> None:
+    tracker = persisted(['a'], position=1_000)
+
+    write = tracker.diff(STATE, 11_000, ['a'], Encoder())
+
+    assert write is not None
+    assert write.drop == 0 and write.tracks == []
+    assert write.position == 11_000
+
+
+def test_playing_position_is_expected_to_advance() -> None:
+    now = [100.0]
+    tracker = SessionTracker(position_drift=10_000, clock=lambda: now[0])
+    tracker.commit(tracker.diff(STATE, 1_000, ['a'], Encoder(), playing=True))
+
+    now[0] += 60
+    assert tracker.diff(STATE, 61_000, ['a'], Encoder(), playing=True) is None
+    # A seek moves the position away from where playback would be by now.
+    write = tracker.diff(STATE, 5_000, ['a'], Encoder(), playing=True)
+    assert write is not None and write.position == 5_000
+
+
+def test_setting_changes_are_written_without_the_queue() -> None:
+    tracker = persisted(['a', 'b'])
+    encode = Encoder()
+
+    for change in ({'volume': 40}, {'queue_mode': 2}, {'filters': '{"timescale":{"pitch":1.2}}'}, {'paused': True}):
+        write = tracker.diff(replace(STATE, **change), 0, ['a', 'b'], encode)
+        assert write is not None and write.drop == 0 and write.tracks == []
+    assert encode.encoded == []
+
+
+def test_played_and_appended_tracks_are_incremental() -> None:
+    tracker = persisted(['a', 'b', 'c'])
+    encode = Encoder()
+
+    write = tracker.diff(STATE, 0, ['b', 'c', 'd', 'e'], encode)
+
+    assert write is not None
+    assert write.drop == 1
+    assert [entry[1] for entry in write.tracks] == ['d', 'e']
+    assert encode.encoded == ['d', 'e']
+
+
+def test_emptied_queue_drops_everything() -> None:
+    tracker = persisted(['a', 'b'])
+
+    write = tracker.diff(STATE, 0, [], Encoder())
+
+    assert write is not None and write.drop == 2 and write.tracks == []
+
+
+def test_reordered_queue_is_rewritten() -> None:
+    tracker = persisted(['a', 'b', 'c'])
+
+    write = tracker.diff(STATE, 0, ['a', 'c', 'b'], Encoder())
+
+    assert write is not None and write.is_full
+    assert [entry[1] for entry in write.tracks] == ['a', 'c', 'b']
+
+
+def test_diff_is_relative_to_the_last_commit() -> None:
+    tracker = persisted(['a', 'b'])
+    first = tracker.diff(STATE, 0, ['b'], Encoder())
+    assert first is not None
+    tracker.commit(first)
+
+    second = tracker.diff(STATE, 0, ['b', 'c'], Encoder())
+
+    assert second is not None and second.drop == 0
+    assert [entry[1] for entry in second.tracks] == ['c']
+
+
+def test_force_and_reset() -> None:
+    tracker = persisted(['a'])
+
+    forced = tracker.diff(STATE, 0, ['a'], Encoder(), force=True)
+    assert forced is not None and forced.drop == 0
+
+    tracker.reset()
+    full = tracker.diff(STATE, 0, ['a'], Encoder())
+    assert full is not None and full.is_full
+
+
+def test_persisted_tracks_are_held_so_their_ids_are_not_reused() -> None:
+    class Track:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    tracker = SessionTracker()
+    queue = [Track('a')]
+    tracker.commit(tracker.diff(STATE, 0, queue, lambda track: [track.name]))
+    first = id(queue[0])
+    queue.clear()
+
+    # Had the tracker let go of the first track, CPython would hand its id to this one.
+    write = tracker.diff(STATE, 0, [Track('b')], lambda track: [track.name])
+
+    assert write is not None and write.tracks == [['b']]
+    assert write.keys != (first,)
+
+
+def test_session_track_uris_reads_both_forms() -> None:
+    tracks = [{'uri': 'https://old', 'title': 'x'}, ['https://new', 'y', 5], {'title': 'no uri'}, [None, 'z', None]]
+
+    assert session_track_uris(tracks) == ['https://old', 'https://new']
+    assert session_track_uris(None) == []
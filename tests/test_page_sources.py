@@ -0,0 +1,184 @@
+"""Tests for the lazily read paginator sources (:mod:`app.core.pagination`)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from app.core.pagination import KeysetPageSource, SourcePaginator
+
+ROWS = [(total, user_id) for user_id, total in enumerate(range(1000, 0, -10))]  # 100 rows, richest first
+
+
+class Table:
+    """A keyset query over :data:`ROWS` that records how it was called."""
+
+    def __init__(self, rows: list[tuple[int, int]] = ROWS) -> None:
+        self.rows = rows
+        self.calls: list[dict[str, Any]] = []
+        self.fail = 0
+
+    async def fetch(self, *, limit: int, after: tuple[int, int] | None, offset: int) -> list[tuple[int, int]]:
+        self.calls.append({'limit': limit, 'after': after, 'offset': offset})
+        if self.fail:
+            self.fail -= 1
+            raise RuntimeError('connection lost')
+        rows = self.rows if after is None else [row for row in self.rows if row < after]
+        return rows[offset : offset + limit]
+
+
+def source(table: Table, **kwargs: Any) -> KeysetPageSource[tuple[int, int], tuple[int, int]]:
+    kwargs.setdefault('per_page', 10)
+    return KeysetPageSource(table.fetch, key=lambda row: row, **kwargs)
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_pages_continue_from_the_previous_last_row() -> None:
+    table = Table()
+    pages = source(table, read_ahead=0)
+
+    first = await pages.get_page(0)
+    second = await pages.get_page(1)
+
+    assert first == ROWS[:10] and second == ROWS[10:20]
+    assert table.calls == [
+        {'limit': 10, 'after': None, 'offset': 0},
+        {'limit': 10, 'after': ROWS[9], 'offset': 0},
+    ]
+
+
+async def test_jumping_ahead_uses_an_offset() -> None:
+    table = Table()
+    pages = source(table, read_ahead=0)
+
+    assert await pages.get_page(4) == ROWS[40:50]
+    assert table.calls == [{'limit': 10, 'after': None, 'offset': 40}]
+
+
+async def test_next_page_is_read_ahead() -> None:
+    table = Table()
+    pages = source(table, count=len(ROWS))
+
+    await pages.get_page(0)
+    await settle()
+    assert len(table.calls) == 2
+
+    assert await pages.get_page(1) == ROWS[10:20]
+    assert table.calls[1] == {'limit': 10, 'after': ROWS[9], 'offset': 0}
+    await settle()
+    assert len(table.calls) == 3  # only page 2 was read, ahead of page 1
+
+
+async def test_read_ahead_chains_behind_pages_still_loading() -> None:
+    table = Table()
+    pages = source(table, read_ahead=3, count=len(ROWS))
+
+    await pages.get_page(0)
+    await settle()
+
+    assert [call['after'] for call in table.calls] == [None, ROWS[9], ROWS[19], ROWS[29]]
+
+
+async def test_read_ahead_stops_at_the_last_page() -> None:
+    table = Table()
+    pages = source(table, count=len(ROWS))
+
+    await pages.get_page(9)
+    await settle()
+
+    assert len(table.calls) == 1
+
+
+async def test_unknown_count_grows_until_a_short_page() -> None:
+    table = Table(ROWS[:25])
+    pages = source(table, read_ahead=0)
+    assert pages.page_count == 1
+
+    await pages.get_page(0)
+    assert pages.page_count == 2
+    await pages.get_page(1)
+    await pages.get_page(2)
+    assert pages.page_count == 3
+
+
+async def test_holds_at_most_keep_pages() -> None:
+    table = Table()
+    pages = source(table, read_ahead=0, keep=2)
+
+    for index in range(5):
+        await pages.get_page(index)
+
+    assert sorted(pages._pages) == [3, 4]
+    await pages.get_page(0)  # dropped, read again from the start
+    assert table.calls[-1] == {'limit': 10, 'after': None, 'offset': 0}
+
+
+async def test_failed_read_ahead_is_retried_when_viewed() -> None:
+    table = Table()
+    pages = source(table, count=len(ROWS))
+
+    await pages.get_page(0)
+    table.fail = 1  # the read ahead of page 1
+    await settle()
+
+    assert await pages.get_page(1) == ROWS[10:20]
+
+
+async def test_walk_yields_every_page() -> None:
+    pages = source(Table(ROWS[:25]))
+
+    walked = [(index, list(rows)) async for index, rows in pages.walk()]
+
+    assert walked == [(0, ROWS[:10]), (1, ROWS[10:20]), (2, ROWS[20:25])]
+
+
+def make_paginator(pages: KeysetPageSource[Any, Any]) -> SourcePaginator[Any]:
+    paginator: SourcePaginator[Any] = SourcePaginator(entries=range(pages.page_count), per_page=1)
+    paginator.source = pages
+    paginator.embed = discord.Embed()
+    paginator.location = 'description'
+    paginator.numerate = False
+    return paginator
+
+
+async def test_paginator_numbers_rows_across_pages() -> None:
+    paginator = make_paginator(source(Table(), count=len(ROWS)))
+
+    page = await paginator.format_page(paginator.switch_page(2))
+
+    assert page.description is not None
+    assert page.description.splitlines()[0] == str(ROWS[20])
+
+
+async def test_paginator_search_reads_pages_through_the_source() -> None:
+    paginator = make_paginator(source(Table(), per_page=1, count=len(ROWS)))
+    paginator.search_pages = len(ROWS)
+    paginator.format_row = lambda row, position: f'{position}: user {row[1]}'  # type: ignore[method-assign]
+    interaction = MagicMock()
+    interaction.message.edit = AsyncMock()
+
+    await paginator.search_for_query('57: user 56', interaction)
+
+    assert paginator.current_page == 57
+    embed = interaction.message.edit.await_args.kwargs['embed']
+    assert '57: user 56' in embed.description
+
+
+async def test_paginator_search_reads_at_most_search_pages() -> None:
+    table = Table()
+    paginator = make_paginator(source(table, per_page=1, count=len(ROWS), read_ahead=0))
+    paginator.search_pages = 5
+    interaction = MagicMock()
+    interaction.message.edit = AsyncMock()
+
+    await paginator.search_for_query('user 90', interaction)
+
+    assert len(table.calls) == 5
+    assert paginator.current_page <= 5
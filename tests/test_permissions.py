@@ -70,6 +70,17 @@ def test_update_expands_multi_flag_permissions_object() -> None:
     assert spec.user == {"kick_members", "ban_members"}
 
 
+def test_masks_follow_the_name_sets() -> None:
+    spec = PermissionSpec.new()
+    assert spec.user_mask == 0
+    assert spec.bot_mask == discord.Permissions(**dict.fromkeys(PermissionTemplate.bot, True)).value
+
+    spec.update(PermissionTemplate.mod, "user")
+    spec.update(discord.Permissions.manage_roles, "bot")
+    assert spec.user_mask == discord.Permissions(ban_members=True, manage_messages=True).value
+    assert spec.bot_mask & discord.Permissions.manage_roles.flag
+
+
 def test_base_bot_set_is_a_fresh_copy_per_command() -> None:
     # Mutating one spec's bot set must not leak into the shared template or other specs.
     a = PermissionSpec.new()
@@ -101,12 +112,12 @@ def test_template_is_immutable() -> None:
 
 
 def test_override_required_permissions() -> None:
-    default = {"ban_members"}
+    default = discord.Permissions(ban_members=True).value
     # No explicit permissions -> keep the command's default requirement.
-    assert CommandOverride("ban").required_user_permissions(default) == default
+    assert CommandOverride("ban").required_user_mask(default) == default
     # Explicit bitmask -> replace it.
     ov = CommandOverride("ban", permissions=discord.Permissions(manage_messages=True).value)
-    assert ov.required_user_permissions(default) == {"manage_messages"}
+    assert ov.required_user_mask(default) == discord.Permissions(manage_messages=True).value
 
 
 def test_override_allows_roles() -> None:
@@ -153,6 +164,31 @@ async def test_check_passes_and_fails_against_default_gate() -> None:
         await command_permission_check(lacking)  # type: ignore[arg-type]
 
 
+async def test_missing_permissions_are_named_in_flag_order() -> None:
+    cmd = _make_command(user_permissions=PermissionTemplate.moderator)
+    ctx = _make_ctx(cmd, user_perms=discord.Permissions(ban_members=True))
+
+    with pytest.raises(dpy_commands.MissingPermissions) as exc:
+        await command_permission_check(ctx)  # type: ignore[arg-type]
+    assert exc.value.missing_permissions == ["kick_members", "manage_messages"]
+
+
+async def test_administrator_passes_any_user_gate() -> None:
+    cmd = _make_command(user_permissions=PermissionTemplate.moderator)
+    ctx = _make_ctx(cmd, user_perms=discord.Permissions(administrator=True))
+    assert await command_permission_check(ctx) is True  # type: ignore[arg-type]
+
+
+async def test_ungated_command_skips_the_author_permissions() -> None:
+    cmd = _make_command()
+    ctx = _make_ctx(cmd, user_perms=None)  # type: ignore[arg-type]  # never read
+    assert await command_permission_check(ctx) is True  # type: ignore[arg-type]
+
+    ctx.bot_permissions = discord.Permissions(send_messages=True)
+    with pytest.raises(dpy_commands.BotMissingPermissions):
+        await command_permission_check(ctx)  # type: ignore[arg-type]
+
+
 async def test_override_can_loosen_the_requirement() -> None:
     # Command defaults to needing ban_members; guild override drops it to send_messages.
     cmd = _make_command(user_permissions=PermissionTemplate.ban)
@@ -0,0 +1,90 @@
+"""Tests for ordered, bounded-concurrency playlist resolution."""
+
+import asyncio
+
+import pytest
+
+from app.services.playlist_loader import resolve_ordered
+
+
+class Resolver:
+    def __init__(self, delays: dict[int, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.running = 0
+        self.peak = 0
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+
+    async def __call__(self, item: int) -> str:
+        self.started.append(item)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(item, 0.0))
+        except asyncio.CancelledError:
+            self.cancelled.append(item)
+            raise
+        finally:
+            self.running -= 1
+        if item < 0:
+            raise LookupError(item)
+        return f'track-{item}'
+
+
+async def test_results_keep_input_order() -> None:
+    resolver = Resolver({0: 0.03, 1: 0.01, 2: 0.0, 3: 0.02})
+
+    results = [pair async for pair in resolve_ordered(range(4), resolver, concurrency=4)]
+
+    assert results == [(0, 'track-0'), (1, 'track-1'), (2, 'track-2'), (3, 'track-3')]
+
+
+async def test_concurrency_is_bounded() -> None:
+    resolver = Resolver(dict.fromkeys(range(20), 0.005))
+
+    results = [result async for _, result in resolve_ordered(range(20), resolver, concurrency=3)]
+
+    assert len(results) == 20
+    assert resolver.peak == 3
+
+
+async def test_first_result_is_yielded_before_the_rest_resolve() -> None:
+    resolver = Resolver({0: 0.0, **dict.fromkeys(range(1, 10), 0.05)})
+    iterator = resolve_ordered(range(10), resolver, concurrency=2)
+
+    first = await asyncio.wait_for(anext(iterator), 0.03)
+
+    assert first == (0, 'track-0')
+    await asyncio.sleep(0)
+    assert resolver.started == [0, 1, 2]
+    await iterator.aclose()
+
+
+async def test_error_surfaces_at_its_position_and_cancels_the_rest() -> None:
+    resolver = Resolver({0: 0.0, -1: 0.0, 2: 1.0})
+    seen = []
+
+    with pytest.raises(LookupError):
+        async for item, _ in resolve_ordered([0, -1, 2], resolver, concurrency=3):
+            seen.append(item)
+    await asyncio.sleep(0)
+
+    assert seen == [0]
+    assert resolver.cancelled == [2]
+
+
+async def test_closing_early_cancels_in_flight_work() -> None:
+    resolver = Resolver({0: 0.0, 1: 1.0, 2: 1.0})
+    iterator = resolve_ordered(range(3), resolver, concurrency=3)
+
+    await anext(iterator)
+    await iterator.aclose()
+    await asyncio.sleep(0)
+
+    assert sorted(resolver.cancelled) == [1, 2]
+
+
+async def test_invalid_concurrency_rejected() -> None:
+    with pytest.raises(ValueError):
+        await anext(resolve_ordered([1], Resolver(), concurrency=0))
+
@@ -0,0 +1,164 @@
+"""Tests for the off-loop poker equity engine."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from app.cogs.games.engine.equity import EquityService, EquitySpot, compute_equity, preflop_key
+from app.cogs.games.engine.evaluator import HandEvaluator
+from app.cogs.games.engine.poker import TableState, TexasHoldem
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+FULL_DECK = [(value, suit) for value in range(2, 15) for suit in range(4)]
+
+
+def spot(
+    holes: list[list[tuple[int, int]]], board: list[tuple[int, int]] | None = None, active: tuple[int, ...] | None = None
+) -> EquitySpot:
+    board = board or []
+    used = {card for hole in holes for card in hole} | set(board)
+    return EquitySpot(
+        hole_cards=np.array(holes),
+        board=np.array(board, dtype=int).reshape(-1, 2),
+        deck=np.array([card for card in FULL_DECK if card not in used]),
+        active=tuple(range(len(holes))) if active is None else active,
+    )
+
+
+ACES_VS_KINGS = [[(14, 0), (14, 1)], [(13, 2), (13, 3)]]
+
+
+@pytest.fixture(autouse=True)
+def _in_memory_tables(monkeypatch: pytest.MonkeyPatch) -> None:
+    if HandEvaluator._default is None:
+        monkeypatch.setattr(HandEvaluator, "_default", HandEvaluator.load())
+
+
+@pytest.fixture
+def service() -> Iterator[EquityService]:
+    with ThreadPoolExecutor(2) as executor:
+        yield EquityService(executor=executor, preflop_samples=20_000)
+
+
+def test_flop_is_enumerated_exactly() -> None:
+    result = compute_equity(spot(ACES_VS_KINGS, [(2, 0), (7, 1), (9, 2)]))
+
+    assert result.exact is True
+    assert result.scenarios == 990  # C(45, 2) turn and river cards
+    assert result.margin == 0.0
+    assert result.full["Player 1 Win"] + result.full["Player 2 Win"] + result.full["Player 1 Tie"] == pytest.approx(100, abs=0.05)
+
+
+def test_river_has_a_single_runout() -> None:
+    result = compute_equity(spot(ACES_VS_KINGS, [(2, 0), (7, 1), (9, 2), (13, 0), (4, 3)]))
+
+    assert result.scenarios == 1
+    assert result.full["Player 2 Win"] == 100.0
+    assert result.hand_strength[2] == {"Three of a Kind": 100.0}
+
+
+def test_preflop_is_sampled_with_a_margin() -> None:
+    result = compute_equity(spot(ACES_VS_KINGS), samples=20_000, seed=7)
+
+    assert result.exact is False
+    assert result.scenarios == 20_000
+    assert 0 < result.margin < 1
+    # Aces hold about 82% against kings.
+    assert result.full["Player 1 Win"] == pytest.approx(82, abs=2)
+
+
+def test_folded_seats_have_no_live_odds() -> None:
+    result = compute_equity(spot([*ACES_VS_KINGS, [(2, 1), (7, 2)]], [(3, 0), (8, 1), (10, 2)], active=(1, 2)))
+
+    assert result.live["Player 1 Win"] == 0.0
+    assert result.full["Player 1 Win"] > 0.0
+    assert result.live["Player 2 Win"] > result.full["Player 2 Win"]
+
+
+def test_preflop_key_ignores_suit_labels() -> None:
+    relabelled = [[(14, 2), (14, 3)], [(13, 0), (13, 1)]]
+
+    assert preflop_key(spot(ACES_VS_KINGS)) == preflop_key(spot(relabelled))
+    assert preflop_key(spot(ACES_VS_KINGS)) != preflop_key(spot(ACES_VS_KINGS[::-1]))
+    assert preflop_key(spot(ACES_VS_KINGS, [(2, 0), (7, 1), (9, 2)])) is None
+
+
+async def test_preflop_results_are_cached_and_coalesced(service: EquityService) -> None:
+    first, second = await asyncio.gather(service.compute(spot(ACES_VS_KINGS)), service.compute(spot(ACES_VS_KINGS)))
+    third = await service.compute(spot([[(14, 2), (14, 3)], [(13, 0), (13, 1)]]))
+
+    assert first is second is third
+    assert service.stats.computed == 1
+    assert service.stats.coalesced == 1
+    assert service.stats.cache_hits == 1
+
+
+async def test_cancelling_the_first_caller_leaves_coalesced_waiters(service: EquityService) -> None:
+    owner = asyncio.create_task(service.compute(spot(ACES_VS_KINGS)))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(service.compute(spot(ACES_VS_KINGS)))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    result = await waiter
+
+    assert owner.cancelled()
+    assert result.scenarios == 20_000
+    assert service.stats.coalesced == 1
+    assert service.summary()["cached"] == 1
+
+
+async def test_later_streets_are_not_cached(service: EquityService) -> None:
+    flop = spot(ACES_VS_KINGS, [(2, 0), (7, 1), (9, 2)])
+
+    await service.compute(flop)
+    await service.compute(flop)
+
+    assert service.stats.computed == 2
+    assert service.summary()["cached"] == 0
+
+
+async def test_preflop_cache_is_saved_and_loaded(tmp_path) -> None:
+    path = tmp_path / "preflop.json"
+    with ThreadPoolExecutor(1) as executor:
+        first = EquityService(executor=executor, preflop_samples=5_000, cache_path=path)
+        result = await first.compute(spot(ACES_VS_KINGS))
+        first.close()
+
+        second = EquityService(executor=executor, cache_path=path)
+        cached = await second.compute(spot(ACES_VS_KINGS))
+
+    assert second.stats.cache_hits == 1
+    assert cached.full == result.full
+    assert cached.hand_strength == result.hand_strength
+
+
+@pytest.mark.parametrize("contents", ['{"not": "a list"}', "[[1, 2]]", "[[[52, [0, 1], []], [1, 2, [], 3, 0.5]]]"])
+def test_malformed_preflop_cache_is_discarded(tmp_path, contents: str) -> None:
+    path = tmp_path / "preflop.json"
+    path.write_text(contents)
+
+    service = EquityService(cache_path=path)
+
+    assert service.summary()["cached"] == 0
+
+
+def test_table_queues_streets_instead_of_computing() -> None:
+    engine = TexasHoldem(first_buy_in=1000)
+    engine.add_player("a", 500)
+    engine.add_player("b", 500)
+
+    engine.start()
+
+    assert engine.state is TableState.RUNNING
+    assert engine.analysis == []
+    assert len(engine.equity_spots) == 1
+    assert engine.equity_spots[0].hole_cards.shape == (2, 2, 2)
+    assert len(engine.equity_spots[0].deck) == 48
@@ -0,0 +1,138 @@
+"""Tests for the lookup-table poker hand evaluator."""
+
+from __future__ import annotations
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from app.cogs.games.engine.evaluator import CATEGORY_BASE, HandEvaluator, five_card_value
+from app.cogs.games.engine.poker import Hand, Ranker
+
+# (value, suit) rows; suits: 0 diamonds, 1 clubs, 2 spades, 3 hearts.
+HANDS_BY_CATEGORY = [
+    [(2, 0), (5, 1), (9, 2), (11, 3), (13, 0)],  # high card
+    [(4, 0), (4, 1), (9, 2), (11, 3), (13, 0)],  # one pair
+    [(4, 0), (4, 1), (9, 2), (9, 3), (13, 0)],  # two pairs
+    [(4, 0), (4, 1), (4, 2), (9, 3), (13, 0)],  # three of a kind
+    [(5, 0), (6, 1), (7, 2), (8, 3), (9, 0)],  # straight
+    [(2, 2), (5, 2), (9, 2), (11, 2), (13, 2)],  # flush
+    [(4, 0), (4, 1), (4, 2), (9, 3), (9, 0)],  # full house
+    [(4, 0), (4, 1), (4, 2), (4, 3), (13, 0)],  # four of a kind
+    [(5, 3), (6, 3), (7, 3), (8, 3), (9, 3)],  # straight flush
+]
+
+
+@pytest.fixture(scope="module")
+def evaluator() -> HandEvaluator:
+    return HandEvaluator.load()
+
+
+@pytest.fixture(autouse=True)
+def _in_memory_default(evaluator: HandEvaluator, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(HandEvaluator, "_default", evaluator)
+
+
+def deal(count: int, size: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    deck = np.array([[value, suit] for value in range(2, 15) for suit in range(4)])
+    return deck[np.argsort(rng.random((count, len(deck))), axis=1)[:, :size]]
+
+
+def test_categories_follow_named_hand_order(evaluator: HandEvaluator) -> None:
+    values = evaluator.evaluate(np.array(HANDS_BY_CATEGORY))
+
+    assert list(values // CATEGORY_BASE) == list(range(9))
+    assert list(values) == sorted(values)
+
+
+@pytest.mark.parametrize(
+    ("better", "worse"),
+    [
+        ([2, 2, 5, 11, 14], [2, 2, 5, 11, 13]),  # kicker decides
+        ([13, 13, 3, 5, 12], [2, 2, 5, 11, 14]),  # the pair counts before the kickers
+        ([7, 7, 11, 11, 2], [6, 6, 10, 10, 14]),
+        ([3, 3, 3, 2, 2], [2, 2, 2, 14, 14]),
+        ([2, 3, 4, 5, 6], [14, 2, 3, 4, 5]),  # the wheel is the lowest straight
+        ([14, 2, 3, 4, 6], [13, 12, 11, 9, 8]),  # ace high beats king high
+    ],
+)
+def test_ranks_within_a_category(better: list[int], worse: list[int]) -> None:
+    assert five_card_value(better) > five_card_value(worse)
+
+
+def test_seven_cards_rank_as_their_best_five(evaluator: HandEvaluator) -> None:
+    hands = deal(400, 7)
+
+    expected = [
+        max(five_card_value(tuple(combo[:, 0]), len(set(combo[:, 1])) == 1) for combo in hand[list(combinations(range(7), 5))])
+        for hand in hands
+    ]
+
+    assert evaluator.evaluate(hands).tolist() == expected
+    assert evaluator.evaluate(hands[:, :6]).tolist() == [int(evaluator.best_five(hand[:6])[0]) for hand in hands]
+
+
+def test_flush_among_seven_cards(evaluator: HandEvaluator) -> None:
+    # Six spades plus a pair: the best hand is the ace-high spade flush, not the pair.
+    hand = np.array([(14, 2), (2, 2), (9, 2), (11, 2), (5, 2), (3, 2), (9, 0)])
+
+    value, cards = evaluator.best_five(hand)
+
+    assert value // CATEGORY_BASE == 5
+    assert sorted(cards[:, 0].tolist()) == [3, 5, 9, 11, 14]
+    assert evaluator.hand_name(value, cards) == "Spades"
+
+
+def test_categories_match_the_ranker(evaluator: HandEvaluator) -> None:
+    for hand in [*HANDS_BY_CATEGORY, *deal(50, 5, seed=3).tolist()]:
+        cards = np.array(hand)
+        legacy = Ranker.rank_all_hands(cards[np.newaxis, np.newaxis].copy())
+        assert int(np.asarray(legacy).ravel()[0]) // CATEGORY_BASE == int(evaluator.evaluate(cards)) // CATEGORY_BASE
+
+
+@pytest.mark.parametrize(
+    ("hand", "name", "category"),
+    [
+        (HANDS_BY_CATEGORY[0], "High Card, King High", 0),
+        (HANDS_BY_CATEGORY[2], "Two Pairs, 4s and 9s", 2),
+        (HANDS_BY_CATEGORY[6], "Full House, 4s over 9s", 6),
+        (HANDS_BY_CATEGORY[7], "Four of a Kind, 4s", 7),
+        ([(14, 3), (2, 3), (3, 3), (4, 3), (5, 3), (9, 0), (13, 1)], "Straight Flush, Ace Low", 8),
+    ],
+)
+def test_hand_result(hand: list[tuple[int, int]], name: str, category: int) -> None:
+    player = Hand()
+    player.add(np.array(hand[:2]))
+
+    result = player.evaluate(np.array(hand[2:]))
+
+    assert result.name == name
+    assert result.value // CATEGORY_BASE == category
+    assert sorted((card.value, card.suit) for card in result.cards) == sorted(hand[:5])
+
+
+def test_tables_are_saved_and_memory_mapped(tmp_path) -> None:
+    path = tmp_path / "tables.npy"
+
+    built = HandEvaluator.load(path)
+    loaded = HandEvaluator.load(path)
+
+    assert path.exists()
+    assert isinstance(loaded.tables, np.memmap)
+    assert np.array_equal(built.tables, loaded.tables)
+
+
+def test_corrupt_tables_are_rebuilt(tmp_path) -> None:
+    path = tmp_path / "tables.npy"
+    path.write_bytes(b"not a table")
+
+    evaluator = HandEvaluator.load(path)
+
+    assert int(evaluator.evaluate(np.array(HANDS_BY_CATEGORY[8]))) // CATEGORY_BASE == 8
+
+
+def test_rejects_other_hand_sizes(evaluator: HandEvaluator) -> None:
+    with pytest.raises(ValueError):
+        evaluator.evaluate(np.zeros((1, 4, 2), dtype=int))
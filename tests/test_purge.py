@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import datetime
 from dataclasses import dataclass, field
 
-from app.services import build_purge_predicate
+from app.services import build_purge_predicate, plan_bulk_deletes
+from app.services.purge import DISCORD_EPOCH_MS
 
 
 @dataclass(eq=False)  # identity equality, like a real discord.User/Member
@@ -120,3 +122,30 @@ def test_require_all_versus_any() -> None:
     assert require_all.predicate(only_embed) is False
     assert require_all.predicate(both) is True
     assert require_any.predicate(only_embed) is True
+
+
+NOW = datetime.datetime(2026, 7, 12, tzinfo=datetime.UTC)
+
+
+def snowflake_at(dt: datetime.datetime, seq: int = 0) -> int:
+    return (int(dt.timestamp() * 1000) - DISCORD_EPOCH_MS) << 22 | seq
+
+
+def test_plan_bulk_deletes_groups_by_channel_in_order() -> None:
+    recent = NOW - datetime.timedelta(hours=1)
+    pairs = [(1, snowflake_at(recent, 1)), (2, snowflake_at(recent, 2)), (1, snowflake_at(recent, 3))]
+    plan = plan_bulk_deletes(pairs, now=NOW)
+    assert plan == {1: [[pairs[0][1], pairs[2][1]]], 2: [[pairs[1][1]]]}
+
+
+def test_plan_bulk_deletes_skips_messages_past_the_bulk_delete_window() -> None:
+    old = snowflake_at(NOW - datetime.timedelta(days=15))
+    fresh = snowflake_at(NOW - datetime.timedelta(days=13))
+    assert plan_bulk_deletes([(1, old), (1, fresh)], now=NOW) == {1: [[fresh]]}
+
+
+def test_plan_bulk_deletes_chunks_at_100() -> None:
+    recent = NOW - datetime.timedelta(minutes=5)
+    pairs = [(7, snowflake_at(recent, seq)) for seq in range(250)]
+    chunks = plan_bulk_deletes(pairs, now=NOW)[7]
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
@@ -0,0 +1,122 @@
+"""Tests for the paced music session restore scheduler."""
+
+import asyncio
+
+import pytest
+
+from app.services.session_restore import RestoreProgress, RestoreScheduler
+
+
+class FakeClock:
+    """A clock that only moves when the scheduler sleeps for its budget."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+def scheduler(clock: FakeClock, **kwargs: float) -> RestoreScheduler:
+    return RestoreScheduler(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+async def test_restores_start_highest_priority_first() -> None:
+    started = []
+
+    async def restore(item: tuple[str, int]) -> bool:
+        started.append(item[0])
+        return True
+
+    items = [('quiet', 0), ('busy', 9), ('some', 3)]
+    progress = await scheduler(FakeClock(), concurrency=1).run(items, restore, priority=lambda item: item[1])
+
+    assert started == ['busy', 'some', 'quiet']
+    assert progress.restored == 3 and progress.done == progress.total == 3
+
+
+async def test_starts_are_paced_by_the_budget() -> None:
+    clock = FakeClock()
+    starts: list[float] = []
+
+    async def restore(item: int) -> bool:
+        starts.append(clock())
+        return True
+
+    await scheduler(clock, rate=2.0, burst=2, concurrency=4).run(range(6), restore)
+
+    # Two start immediately, then one every half second.
+    assert starts == pytest.approx([0.0, 0.0, 0.5, 1.0, 1.5, 2.0])
+
+
+async def test_each_rate_key_has_its_own_budget() -> None:
+    clock = FakeClock()
+    starts: dict[int, list[float]] = {0: [], 1: []}
+
+    async def restore(item: tuple[int, int]) -> bool:
+        starts[item[0]].append(clock())
+        return True
+
+    items = [(shard, n) for n in range(3) for shard in (0, 1)]
+    await scheduler(clock, rate=1.0, burst=1, concurrency=2).run(items, restore, key=lambda item: item[0])
+
+    assert starts[0] == pytest.approx([0.0, 1.0, 2.0])
+    assert starts[1] == pytest.approx([0.0, 1.0, 2.0])
+
+
+async def test_concurrency_is_bounded() -> None:
+    running = peak = 0
+
+    async def restore(item: int) -> bool:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return True
+
+    progress = await RestoreScheduler(rate=1000.0, burst=100, concurrency=3).run(range(12), restore)
+
+    assert peak == 3
+    assert progress.restored == 12
+    assert progress.in_flight == 0
+
+
+async def test_failures_and_skips_do_not_stop_the_run() -> None:
+    async def restore(item: int) -> bool:
+        if item == 1:
+            raise ConnectionError
+        return item != 2
+
+    seen: list[int] = []
+    progress = await RestoreScheduler(rate=1000.0, burst=10).run(
+        range(4), restore, on_progress=lambda p: seen.append(p.done)
+    )
+
+    assert (progress.restored, progress.skipped, progress.failed) == (2, 1, 1)
+    assert sorted(seen) == [1, 2, 3, 4]
+    assert not progress.running
+
+
+def test_progress_summary() -> None:
+    progress = RestoreProgress(total=4, restored=2, skipped=1, failed=1, started_at=10.0, finished_at=12.0)
+    progress.first_restored_at = 10.5
+    progress.durations = [0.2, 0.4, 0.3, 0.1]
+
+    summary = progress.to_dict()
+
+    assert summary['done'] == 4
+    assert summary['elapsed_s'] == 2.0
+    assert summary['first_restored_s'] == 0.5
+    assert summary['session_p50_s'] == 0.3
+    assert summary['session_max_s'] == 0.4
+    assert summary['sessions_per_s'] == 2.0
+
+
+def test_invalid_budget_rejected() -> None:
+    with pytest.raises(ValueError):
+        RestoreScheduler(rate=0)
@@ -0,0 +1,105 @@
+"""Tests for concurrent, timed startup (:class:`app.utils.metrics.StartupTimings` and ``Bot._load_extensions``)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import wavelink
+
+from app.cogs import music
+from app.core.bot import Bot
+from app.utils.metrics import StartupTimings
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_stages_and_extensions_are_summarised() -> None:
+    timings = StartupTimings()
+
+    with timings.stage('lavalink'):
+        pass
+    timings.extension('app.cogs.fast').import_ms = 2.0
+    slow = timings.extension('app.cogs.slow')
+    slow.import_ms, slow.setup_ms = 5.0, 40.0
+    timings.finish()
+
+    summary = timings.summary()
+    assert summary['finished'] and summary['total_ms'] is not None
+    assert set(summary['stages']) == {'lavalink'}
+    assert list(summary['extensions']) == ['app.cogs.slow', 'app.cogs.fast']  # slowest first
+    assert summary['extensions']['app.cogs.slow'] == {'import_ms': 5.0, 'setup_ms': 40.0, 'failed': False}
+
+
+def test_unfinished_startup_has_no_total() -> None:
+    assert StartupTimings().summary()['total_ms'] is None
+
+
+def make_bot(extensions: list[str], delays: dict[str, float]) -> tuple[Bot, list[str]]:
+    events: list[str] = []
+
+    async def load_extension(name: str, *, package: str | None = None) -> None:
+        events.append(f'start {name}')
+        if name == 'broken':
+            raise RuntimeError('no setup')
+        await asyncio.sleep(delays.get(name, 0))
+        events.append(f'done {name}')
+
+    bot = Bot()
+    bot.initial_extensions = extensions
+    bot.load_extension = load_extension  # type: ignore[method-assign]
+    return bot, events
+
+
+async def test_extensions_load_concurrently() -> None:
+    bot, events = make_bot(['slow', 'fast'], {'slow': 0.05})
+
+    await bot._load_extensions()
+
+    assert events[0] == 'start jishaku'
+    # The slow extension's setup doesn't hold up the one after it.
+    assert events.index('done fast') < events.index('done slow')
+
+
+async def test_failed_extension_is_recorded_and_the_rest_load() -> None:
+    bot, events = make_bot(['broken', 'fine'], {})
+
+    await bot._load_extensions()
+
+    assert 'done fine' in events
+    assert bot.startup.extensions['broken'].failed
+
+
+async def test_music_waits_for_a_pending_lavalink_connect(monkeypatch: pytest.MonkeyPatch) -> None:
+    handshake = asyncio.Event()
+    nodes: list[str] = []
+
+    async def connect(**_: Any) -> None:
+        await handshake.wait()
+        nodes.append('node')
+
+    def get_node() -> str:
+        if not nodes:
+            raise wavelink.InvalidNodeException
+        return nodes[0]
+
+    bot = Bot()
+    added: list[Any] = []
+
+    async def add_cog(cog: Any) -> None:
+        added.append(cog)
+
+    monkeypatch.setattr(wavelink.Pool, 'connect', connect)
+    monkeypatch.setattr(wavelink.Pool, 'get_node', get_node)
+    monkeypatch.setattr(music.cog, 'Music', lambda bot: 'music')
+    monkeypatch.setattr(bot, 'add_cog', add_cog)
+
+    connecting = asyncio.create_task(bot._connect_lavalink())
+    loading = asyncio.create_task(music.setup(bot))
+    await asyncio.sleep(0.01)
+    assert not loading.done()
+
+    handshake.set()
+    await asyncio.gather(connecting, loading)
+    assert added == ['music']
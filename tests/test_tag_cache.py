@@ -0,0 +1,75 @@
+"""Tests for the hot-tag cache and the tag use buffer."""
+
+from app.services.tag_cache import HotTagCache, TagUseBuffer
+from app.utils.signals import CacheSignalHub
+
+
+class TestHotTagCache:
+    def test_admits_only_repeated_lookups(self) -> None:
+        cache: HotTagCache[str] = HotTagCache(promote_after=2)
+        assert cache.get(1, "rules") is None
+        assert not cache.put(1, "rules", "tag", generation=0)
+
+        assert cache.get(1, "rules") is None
+        assert cache.put(1, "rules", "tag", generation=0)
+        assert cache.get(1, "rules") == "tag"
+        assert cache.summary() == {"entries": 1, "hits": 1, "misses": 2, "hit_ratio": 0.3333}
+
+    def test_guilds_are_separate(self) -> None:
+        cache: HotTagCache[str] = HotTagCache(promote_after=1)
+        cache.get(1, "faq")
+        cache.put(1, "faq", "one", generation=0)
+        assert cache.get(2, "faq") is None
+
+    def test_invalidate_drops_guild_and_stale_puts(self) -> None:
+        cache: HotTagCache[str] = HotTagCache(promote_after=1)
+        cache.get(1, "faq")
+        cache.put(1, "faq", "old", generation=0)
+        cache.get(2, "faq")
+        cache.put(2, "faq", "other", generation=0)
+
+        generation = cache.generation(1)
+        assert cache.invalidate(1)
+        assert not cache.invalidate(1)
+        assert cache.get(1, "faq") is None
+        assert not cache.put(1, "faq", "old", generation=generation)
+        assert cache.get(2, "faq") == "other"
+
+    def test_ttl_and_bound(self) -> None:
+        cache: HotTagCache[int] = HotTagCache(promote_after=1, max_entries=2)
+        for key in range(3):
+            cache.get(1, key)
+            cache.put(1, key, key, generation=0)
+        assert len(cache) == 2
+        assert cache.get(1, 0) is None
+
+        expired: HotTagCache[int] = HotTagCache(promote_after=1, ttl=0)
+        expired.get(1, "x")
+        expired.put(1, "x", 1, generation=0)
+        assert expired.get(1, "x") is None
+
+    def test_signal(self) -> None:
+        cache: HotTagCache[str] = HotTagCache(promote_after=1)
+        hub = CacheSignalHub()
+        hub.register("tags_changed").connect(cache, None)
+        cache.get(1, "faq")
+        cache.put(1, "faq", "tag", generation=0)
+        assert hub.fire("tags_changed", 1) == 1
+        assert len(cache) == 0
+
+
+class TestTagUseBuffer:
+    def test_drain_and_restore(self) -> None:
+        buffer = TagUseBuffer()
+        for tag_id in (1, 2, 1, 1):
+            buffer.add(tag_id)
+        assert buffer.pending(1) == 3
+
+        ids, counts = buffer.drain()
+        assert dict(zip(ids, counts, strict=True)) == {1: 3, 2: 1}
+        assert len(buffer) == 0
+
+        buffer.add(2)
+        buffer.restore(ids, counts)
+        assert buffer.pending(2) == 2
+        assert buffer.pending(1) == 3
@@ -0,0 +1,149 @@
+"""Tests for the tag autocomplete name index."""
+
+from app.services.tag_index import TagName, TagNameIndex, TagNames, TagNameSearch
+from app.utils.signals import CacheSignalHub
+
+
+def row(id: int, name: str, parent_id: int, *, owner_id: int = 1, parent_name: str | None = None, uses: int = 0) -> dict:
+    return {
+        "id": id,
+        "name": name,
+        "owner_id": owner_id,
+        "parent_id": parent_id,
+        "parent_name": parent_name or name,
+        "parent_owner_id": owner_id,
+        "uses": uses,
+    }
+
+
+def search_of(*names: tuple[int, str, int], owner_id: int = 1) -> TagNameSearch:
+    return TagNameSearch(TagName(id, name, owner_id, uses) for id, name, uses in names)
+
+
+class TestTagNameSearch:
+    def test_empty_query_returns_most_used(self) -> None:
+        search = search_of((1, "alpha", 5), (2, "beta", 50), (3, "gamma", 10))
+        assert [e.id for e in search.search("", limit=2)] == [2, 3]
+
+    def test_prefix_matches_rank_by_uses(self) -> None:
+        search = search_of((1, "rules", 3), (2, "Rule34", 0), (3, "roles", 100), (4, "ruleset", 9))
+        assert [e.id for e in search.search("rule")] == [4, 1, 2]
+
+    def test_fuzzy_fallback_after_prefix(self) -> None:
+        search = search_of((1, "install guide", 0), (2, "guide", 0), (3, "gui", 0), (4, "unrelated", 0))
+        # Prefix matches first, then the tightest subsequence match.
+        assert [e.id for e in search.search("guide")] == [2, 1]
+        assert [e.id for e in search.search("gde")] == [2, 1]
+
+    def test_numeric_query_matches_ids(self) -> None:
+        search = search_of((123, "faq", 0), (45, "1st place", 0), (7, "misc", 0))
+        assert [e.id for e in search.search("1")] == [45, 123]
+
+    def test_owner_filter(self) -> None:
+        search = TagNameSearch([TagName(1, "mine", 10, 0), TagName(2, "minecraft", 20, 99)])
+        assert [e.id for e in search.search("min", owner_id=10)] == [1]
+        assert [e.id for e in search.search("", owner_id=20)] == [2]
+
+    def test_limit(self) -> None:
+        search = search_of(*((i, f"tag{i}", i) for i in range(50)))
+        assert len(search.search("tag", limit=20)) == 20
+        assert len(search.search("t", limit=20)) == 20
+
+    def test_regex_characters_are_literal(self) -> None:
+        search = search_of((1, "c++", 0), (2, "c", 0))
+        assert [e.id for e in search.search("c+")] == [1]
+
+
+class TestTagNames:
+    def test_from_rows_splits_parents_and_lookup(self) -> None:
+        names = TagNames.from_rows([
+            row(10, "docs", 1, uses=7),
+            row(11, "documentation", 1, parent_name="docs", uses=7),
+            row(12, "faq", 2, owner_id=5),
+        ])
+        assert [(e.id, e.name) for e in names.tags.entries] == [(1, "docs"), (2, "faq")]
+        assert [e.id for e in names.lookup.entries] == [10, 11, 12]
+        assert names.tags.entries[0].uses == 7
+        assert names.tags.entries[1].owner_id == 5
+
+    def test_changes_are_applied_in_place(self) -> None:
+        names = TagNames.from_rows([row(10, "docs", 1, uses=7), row(12, "faq", 2)])
+
+        assert names.apply(("created", 3, 13, "beta", 1))
+        assert names.apply(("aliased", 14, 1, "manual", 4))
+        assert [e.name for e in names.tags.entries] == ["beta", "docs", "faq"]
+        assert [(e.name, e.uses) for e in names.lookup.entries] == [("beta", 0), ("docs", 7), ("faq", 0), ("manual", 7)]
+        assert [e.id for e in names.lookup.search("man")] == [14]
+
+        assert names.apply(("updated", 2, "answers", 5))
+        assert [(e.name, e.owner_id) for e in names.tags.entries] == [("answers", 5), ("beta", 1), ("docs", 1)]
+
+        assert names.apply(("deleted", 1))
+        assert names.apply(("alias_deleted", 13))
+        assert [e.id for e in names.tags.entries] == [2, 3]
+        assert [e.id for e in names.lookup.entries] == [12]
+
+    def test_changes_it_cannot_place_ask_for_a_reload(self) -> None:
+        names = TagNames.from_rows([row(10, "docs", 1)])
+
+        assert not names.apply(("aliased", 11, 99, "orphan", 1))
+        assert not names.apply(("updated", 99, "gone", 1))
+        assert not names.apply(("transferred", 1))
+        assert [e.id for e in names.lookup.entries] == [10]
+
+
+class TestTagNameIndex:
+    def test_store_and_invalidate(self) -> None:
+        index = TagNameIndex()
+        index.store(1, TagNames([], []), generation=index.generation(1))
+        assert index.get(1) is not None
+        assert index.invalidate(1)
+        assert index.get(1) is None
+        assert not index.invalidate(1)
+
+    def test_stale_load_is_not_stored(self) -> None:
+        index = TagNameIndex()
+        generation = index.generation(1)
+        index.invalidate(1)  # tags changed while the load was running
+        names = index.store(1, TagNames([], []), generation=generation)
+        assert names is not None
+        assert 1 not in index
+
+    def test_lru_and_ttl(self) -> None:
+        index = TagNameIndex(max_guilds=2)
+        for guild_id in (1, 2):
+            index.store(guild_id, TagNames([], []), generation=0)
+        index.get(1)
+        index.store(3, TagNames([], []), generation=0)
+        assert 1 in index and 3 in index and 2 not in index
+
+        expired = TagNameIndex(ttl=0)
+        expired.store(1, TagNames([], []), generation=0)
+        assert expired.get(1) is None
+
+    def test_signal_connect_and_disconnect(self) -> None:
+        index, hub = TagNameIndex(), CacheSignalHub()
+        signal = hub.register("tags_changed")
+        signal.connect(index, None)
+        index.store(1, TagNames([], []), generation=0)
+        assert hub.fire("tags_changed", 1) == 1
+
+        signal.disconnect(index)
+        index.store(1, TagNames([], []), generation=index.generation(1))
+        assert hub.fire("tags_changed", 1) == 0
+        assert 1 in index
+
+    def test_signalled_change_patches_the_loaded_guild(self) -> None:
+        index, hub = TagNameIndex(), CacheSignalHub()
+        hub.register("tags_changed").connect(index, None, None)
+        names = TagNames.from_rows([row(10, "docs", 1)])
+        index.store(1, names, generation=0)
+        generation = index.generation(1)
+
+        hub.fire("tags_changed", 1, ("created", 2, 11, "faq", 1))
+        assert index.get(1) is names
+        assert [e.name for e in names.tags.entries] == ["docs", "faq"]
+        assert index.generation(1) > generation  # a load already running may have missed it
+
+        hub.fire("tags_changed", 1)  # no change attached: reload
+        assert 1 not in index
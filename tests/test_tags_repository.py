@@ -0,0 +1,59 @@
+"""Tests for :class:`~app.database.repositories.TagsRepository`: the paged tag listings and
+the changes its mutations signal to the autocomplete index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.database.repositories import TagsRepository
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+
+async def test_first_page_skips_by_offset(mock_db: MagicMock) -> None:
+    repo = TagsRepository(mock_db)
+
+    await repo.filter_tags_page(1, owner_id=2, sort='newest', limit=15, offset=30)
+
+    query, *params = mock_db.fetch.await_args.args
+    assert 'ORDER BY created_at DESC, id DESC' in query
+    assert params == [1, 2, 15, 30]
+
+
+async def test_next_page_continues_behind_the_last_row(mock_db: MagicMock) -> None:
+    repo = TagsRepository(mock_db)
+
+    await repo.filter_tags_page(1, query='foo', limit=15, after=(0.5, 9))
+
+    query, *params = mock_db.fetch.await_args.args
+    # A name-sorted search ranks by similarity, best first.
+    assert '(similarity(name, $2), id) < ($3, $4)' in query
+    assert params == [1, 'foo', 0.5, 9, 15, 0]
+
+
+async def test_count_uses_the_same_filter(mock_db: MagicMock) -> None:
+    repo = TagsRepository(mock_db)
+
+    await repo.count_filtered_tags(1, query='foo', owner_id=2)
+
+    query, *params = mock_db.fetchval.await_args.args
+    assert 'name % $2 AND owner_id=$3' in query
+    assert params == [1, 'foo', 2]
+
+
+async def test_alias_signals_the_new_entry(mock_db: MagicMock) -> None:
+    repo = TagsRepository(mock_db)
+    mock_db.fetchrow.return_value = {'id': 14, 'parent_id': 3}
+
+    record = await repo.create_alias('manual', 'Docs', 1, 2)
+
+    assert record == {'id': 14, 'parent_id': 3}
+    mock_db.signals.fire.assert_called_once_with('tags_changed', 1, ('aliased', 14, 3, 'manual', 2))
+
+
+async def test_alias_of_a_missing_tag_changes_nothing(mock_db: MagicMock) -> None:
+    repo = TagsRepository(mock_db)
+
+    assert await repo.create_alias('manual', 'nope', 1, 2) is None
+    mock_db.signals.fire.assert_not_called()
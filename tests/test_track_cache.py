@@ -0,0 +1,151 @@
+"""Tests for the music track resolution cache."""
+
+import asyncio
+
+import pytest
+
+from app.services.track_cache import TrackResolutionCache, is_cacheable_result, track_cache_key
+
+
+def track(identifier: str, *, stream: bool = False) -> dict:
+    return {'encoded': f'enc-{identifier}', 'info': {'identifier': identifier, 'isStream': stream}, 'pluginInfo': {}}
+
+
+def search_result(*identifiers: str) -> dict:
+    return {'loadType': 'search', 'data': [track(i) for i in identifiers]}
+
+
+class MemoryStore:
+    def __init__(self) -> None:
+        self.rows: dict[str, dict] = {}
+        self.fail = False
+
+    async def get_track_result(self, key: str) -> dict | None:
+        if self.fail:
+            raise ConnectionError
+        return self.rows.get(key)
+
+    async def put_track_result(self, key: str, result: dict, *, ttl: float) -> None:
+        if self.fail:
+            raise ConnectionError
+        self.rows[key] = result
+
+
+class Loader:
+    def __init__(self, result: dict | None, *, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.result = result
+        self.delay = delay
+
+    async def __call__(self) -> dict | None:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+class TestTrackCacheKey:
+    def test_url_normalisation(self) -> None:
+        a = track_cache_key('<https://www.YouTube.com/watch?v=abc&si=share#t=3>')
+        b = track_cache_key('https://youtube.com/watch?v=abc')
+        assert a == b == 'url:https://youtube.com/watch?v=abc'
+        assert track_cache_key('https://youtube.com/watch?v=other') != a
+
+    def test_search_normalisation(self) -> None:
+        assert track_cache_key('  Never   Gonna ', 'ytmsearch') == track_cache_key('never gonna', 'ytmsearch:')
+        assert track_cache_key('never gonna', 'ytmsearch') != track_cache_key('never gonna', 'scsearch')
+
+
+class TestCacheability:
+    def test_rules(self) -> None:
+        assert is_cacheable_result(search_result('a'))
+        assert is_cacheable_result({'loadType': 'playlist', 'data': {'tracks': [track('a')]}})
+        assert not is_cacheable_result({'loadType': 'search', 'data': []})
+        assert not is_cacheable_result({'loadType': 'empty', 'data': {}})
+        assert not is_cacheable_result({'loadType': 'track', 'data': track('radio', stream=True)})
+        assert not is_cacheable_result(None)
+
+
+class TestTrackResolutionCache:
+    async def test_memory_hit(self) -> None:
+        cache, load = TrackResolutionCache(), Loader(search_result('a'))
+        key = track_cache_key('song', 'ytmsearch')
+        assert await cache.resolve(key, load) == await cache.resolve(key, load)
+        assert load.calls == 1
+        assert cache.summary()['memory_hits'] == 1
+        assert cache.summary()['lavalink_requests_saved'] == 1
+
+    async def test_store_tier_survives_memory_loss(self) -> None:
+        store = MemoryStore()
+        key = track_cache_key('https://youtu.be/x')
+        await TrackResolutionCache(store=store).resolve(key, Loader(search_result('x')))
+
+        fresh, load = TrackResolutionCache(store=store), Loader(search_result('x'))
+        assert await fresh.resolve(key, load) == search_result('x')
+        assert load.calls == 0
+        assert fresh.stats.store_hits == 1
+        assert len(fresh) == 1
+
+    async def test_store_errors_fall_back_to_lavalink(self) -> None:
+        store = MemoryStore()
+        store.fail = True
+        cache, load = TrackResolutionCache(store=store), Loader(search_result('a'))
+        assert await cache.resolve('search:ytmsearch:a', load) == search_result('a')
+        assert cache.stats.store_errors == 2
+        assert load.calls == 1
+
+    async def test_concurrent_lookups_are_coalesced(self) -> None:
+        cache, load = TrackResolutionCache(), Loader(search_result('a'), delay=0.01)
+        results = await asyncio.gather(*(cache.resolve('search:ytmsearch:a', load) for _ in range(5)))
+        assert load.calls == 1
+        assert all(r == search_result('a') for r in results)
+        assert cache.stats.coalesced == 4
+
+    async def test_errors_propagate_to_waiters_and_are_not_cached(self) -> None:
+        cache = TrackResolutionCache()
+
+        async def boom() -> dict:
+            await asyncio.sleep(0.01)
+            raise RuntimeError('node down')
+
+        results = await asyncio.gather(
+            cache.resolve('k', boom), cache.resolve('k', boom), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(cache) == 0
+
+    async def test_cancelled_leader_hands_over(self) -> None:
+        cache, load = TrackResolutionCache(), Loader(search_result('a'), delay=0.05)
+        leader = asyncio.create_task(cache.resolve('k', load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.resolve('k', load))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == search_result('a')
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_streams_empty_and_bypassed_are_not_cached(self) -> None:
+        cache = TrackResolutionCache(bypass=['twitch.tv', 'spsearch'])
+        stream = Loader({'loadType': 'track', 'data': track('radio', stream=True)})
+        for _ in range(2):
+            await cache.resolve(track_cache_key('https://ice.somafm.com/fluid'), stream)
+        assert stream.calls == 2
+
+        bypassed = Loader(search_result('live'))
+        for key in (track_cache_key('https://www.twitch.tv/someone'), track_cache_key('song', 'spsearch')):
+            await cache.resolve(key, bypassed)
+            await cache.resolve(key, bypassed)
+        assert bypassed.calls == 4
+        assert cache.stats.bypassed == 4
+        assert len(cache) == 0
+
+    async def test_lru_and_ttl(self) -> None:
+        cache = TrackResolutionCache(max_entries=2)
+        for name in 'abc':
+            await cache.resolve(f'search::{name}', Loader(search_result(name)))
+        assert len(cache) == 2
+        assert cache.get('search::a') is None
+
+        expired = TrackResolutionCache(ttl=0)
+        await expired.resolve('k', Loader(search_result('a')))
+        assert expired.get('k') is None